@@ -0,0 +1,216 @@
+"""Scaling benchmark for the position-tracking chunkers.
+
+Generates Markdown of increasing size (headings, prose paragraphs, lists and
+fenced code) and chunks it with each strategy in
+:mod:`all2md.chunking.primitives`, reporting wall time and throughput. Time per
+megabyte should stay flat as the input grows; a strategy whose MB/s falls with
+size has a superlinear step somewhere.
+
+With ``--baseline`` the same runs are repeated with line/column lookups done the
+old way (slicing the text up to each offset and splitting it on newlines), up to
+``--baseline-max-bytes``, to show what the shared :class:`LineIndex` saves.
+
+Usage
+-----
+Default run (10 KB to 10 MB, whitespace token counter)::
+
+    python -m benchmarks.chunking_scaling
+
+Compare against slice-and-split lookups, or include token-boundary chunking
+(needs the ``tiktoken`` encoding files) with JSON output::
+
+    python -m benchmarks.chunking_scaling --sizes 10k 100k 1m --baseline
+    python -m benchmarks.chunking_scaling --counter tiktoken --strategies tokens --out chunking_results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from all2md.chunking import primitives
+from all2md.chunking.tokenization import get_counter
+
+_WORDS = (
+    "data model chunk token section paragraph document window offset index line column parser render "
+    "query vector search embed store result source page table figure list code block text"
+).split()
+
+
+@dataclass
+class RunResult:
+    """Time for one strategy on one input size."""
+
+    strategy: str
+    size_bytes: int
+    lookup: str
+    chunks: int
+    seconds: float
+    mb_per_second: float
+
+
+def _parse_size(value: str) -> int:
+    units = {"k": 1000, "m": 1000**2}
+    suffix = value[-1].lower()
+    if suffix in units:
+        return int(float(value[:-1]) * units[suffix])
+    return int(value)
+
+
+def _build_markdown(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts: list[str] = []
+    length = 0
+    section = 0
+    while length < size:
+        section += 1
+        block = [f"## Section {section}", ""]
+        for _ in range(rng.randint(2, 4)):
+            sentences = [
+                " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 16))).capitalize() + "."
+                for _ in range(rng.randint(2, 6))
+            ]
+            block.extend([" ".join(sentences), ""])
+        if section % 3 == 0:
+            block.extend(f"- {rng.choice(_WORDS)} {rng.choice(_WORDS)}" for _ in range(4))
+            block.append("")
+        if section % 5 == 0:
+            block.extend(["```python", "def handler(event):", "    return event", "```", ""])
+        text = "\n".join(block) + "\n"
+        parts.append(text)
+        length += len(text)
+    return "".join(parts)[:size]
+
+
+class _SlicingLineIndex(primitives.LineIndex):
+    """The lookup the chunkers used before the index: slice, then split on newlines."""
+
+    def line_column(self, position: int) -> Tuple[int, int]:
+        position = min(position, len(self.text))
+        lines = self.text[:position].split("\n")
+        return len(lines), len(lines[-1]) + 1
+
+
+@contextmanager
+def _slicing_lookups() -> Iterator[None]:
+    original = primitives.LineIndex
+    primitives.LineIndex = _SlicingLineIndex  # type: ignore[misc]
+    try:
+        yield
+    finally:
+        primitives.LineIndex = original  # type: ignore[misc]
+
+
+def _time_chunking(strategy: str, text: str, max_tokens: int, counter_name: str) -> tuple[int, float]:
+    counter = get_counter(counter_name)
+    chunker = primitives.ChunkerFactory.create_chunker(strategy, max_tokens, counter=counter)
+    start = time.perf_counter()
+    chunks = chunker.chunk(text)
+    return len(chunks), time.perf_counter() - start
+
+
+def run_chunking_benchmark(
+    sizes: list[int],
+    strategies: list[str],
+    *,
+    max_tokens: int = 256,
+    counter_name: str = "whitespace",
+    baseline: bool = False,
+    baseline_max_bytes: int = 1_000_000,
+) -> list[RunResult]:
+    """Chunk generated Markdown of each size with each strategy and return the measurements."""
+    results: list[RunResult] = []
+    for size in sizes:
+        text = _build_markdown(size)
+        for strategy in strategies:
+            lookups = ["index"] + (["slicing"] if baseline and size <= baseline_max_bytes else [])
+            for lookup in lookups:
+                if lookup == "slicing":
+                    with _slicing_lookups():
+                        chunks, seconds = _time_chunking(strategy, text, max_tokens, counter_name)
+                else:
+                    chunks, seconds = _time_chunking(strategy, text, max_tokens, counter_name)
+                mb_per_second = (size / 1_000_000) / seconds if seconds else float("inf")
+                results.append(RunResult(strategy, size, lookup, chunks, seconds, mb_per_second))
+                print(f"{size:>10} B  {strategy:<12}{lookup:<9}{seconds:>8.2f}s", flush=True)
+    return results
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'strategy':<12}{'lookup':<9}{'size (B)':>11}{'chunks':>9}{'time (s)':>10}{'MB/s':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.strategy:<12}{r.lookup:<9}{r.size_bytes:>11}{r.chunks:>9}{r.seconds:>10.3f}{r.mb_per_second:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_size,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000, 10_000_000],
+        help="Input sizes in bytes; k/m suffixes accepted (default: 10k 100k 1m 10m)",
+    )
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=["lines", "paragraphs", "sentences", "sections"],
+        choices=primitives.ChunkerFactory.list_methods(),
+        help="Chunkers to run (default: lines paragraphs sentences sections)",
+    )
+    parser.add_argument("--max-tokens", type=int, default=256, help="Token budget per chunk (default: 256)")
+    parser.add_argument(
+        "--counter",
+        choices=["whitespace", "tiktoken"],
+        default="whitespace",
+        help="Token counter; 'tokens' and 'characters' need tiktoken (default: whitespace)",
+    )
+    parser.add_argument(
+        "--baseline", action="store_true", help="Also time slice-and-split line/column lookups for comparison"
+    )
+    parser.add_argument(
+        "--baseline-max-bytes",
+        type=_parse_size,
+        default=1_000_000,
+        help="Largest input to run the quadratic baseline on (default: 1m)",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_chunking_benchmark(
+        args.sizes,
+        args.strategies,
+        max_tokens=args.max_tokens,
+        counter_name=args.counter,
+        baseline=args.baseline,
+        baseline_max_bytes=args.baseline_max_bytes,
+    )
+
+    print()
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+"""Scaling benchmark for ``compare_documents`` against :mod:`difflib`.
+
+Builds a synthetic document of numbered sections (a heading and a few
+paragraphs of ordinary prose each), then a revision in which a fraction of the
+sections has edited, inserted or deleted sentences. For each size it diffs the
+two at the chosen granularity with all2md's engine and with
+``difflib.SequenceMatcher`` on the same extracted lines, and reports wall time
+and the number of changed lines each produced (fewer is a tighter diff).
+
+difflib runs in a child process so a size it cannot finish is cut off at
+``--difflib-timeout`` and reported as such instead of stalling the run.
+
+Usage
+-----
+Default run (word granularity, 50 to 3200 sections)::
+
+    python -m benchmarks.diff_scaling
+
+A quick run, or block granularity with JSON output::
+
+    python -m benchmarks.diff_scaling --sizes 50 200 --difflib-timeout 10
+    python -m benchmarks.diff_scaling --granularity block --out benchmarks/diff_results/run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import multiprocessing
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from all2md.ast.nodes import Document, Heading, Node, Paragraph, Text
+from all2md.diff.text_diff import Granularity, compare_documents
+
+_WORDS = (
+    "the of and to in a is that for it as was with be by on not he this are or his from at which but have an they "
+    "you were her she there been one all we their has would when if so no will more can said who about other time "
+    "shall may section pursuant provided applicable requirement report submit annual operator facility"
+).split()
+
+
+@dataclass
+class RunResult:
+    """Timings and diff sizes for one document size."""
+
+    sections: int
+    old_lines: int
+    new_lines: int
+    engine_seconds: float
+    engine_changed: int
+    timed_out: bool
+    difflib_seconds: float | None
+    difflib_changed: int | None
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+
+
+def _build_documents(sections: int, change_rate: float, seed: int) -> tuple[Document, Document]:
+    rng = random.Random(seed)
+    old: list[Node] = []
+    new: list[Node] = []
+    for number in range(sections):
+        heading = f"Section {number}"
+        paragraphs = [[_sentence(rng) for _ in range(rng.randint(2, 5))] for _ in range(rng.randint(2, 4))]
+        old.append(Heading(level=1, content=[Text(heading)]))
+        old.extend(Paragraph(content=[Text(" ".join(sentences))]) for sentences in paragraphs)
+
+        if rng.random() < change_rate:
+            paragraphs = [list(sentences) for sentences in paragraphs]
+            target = rng.choice(paragraphs)
+            action = rng.random()
+            if action < 0.4:
+                target[rng.randrange(len(target))] = _sentence(rng)
+            elif action < 0.7:
+                target.insert(rng.randint(0, len(target)), _sentence(rng))
+            elif len(target) > 1:
+                del target[rng.randrange(len(target))]
+        new.append(Heading(level=1, content=[Text(heading)]))
+        new.extend(Paragraph(content=[Text(" ".join(sentences))]) for sentences in paragraphs)
+    return Document(children=old), Document(children=new)
+
+
+def _changed_lines(opcodes: Sequence[tuple[str, int, int, int, int]]) -> int:
+    return sum((i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+
+
+def _difflib_worker(old_lines: list[str], new_lines: list[str], results: multiprocessing.Queue) -> None:
+    start = time.perf_counter()
+    opcodes = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes()
+    results.put((time.perf_counter() - start, _changed_lines(opcodes)))
+
+
+def _run_difflib(old_lines: list[str], new_lines: list[str], timeout: float) -> tuple[float | None, int | None]:
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_difflib_worker, args=(old_lines, new_lines, results))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return None, None
+    return results.get()
+
+
+def run_diff_benchmark(
+    sizes: list[int],
+    granularity: Granularity = "word",
+    change_rate: float = 0.05,
+    difflib_timeout: float = 60.0,
+    seed: int = 0,
+) -> list[RunResult]:
+    """Diff generated document pairs of each size with both engines and return the measurements."""
+    results: list[RunResult] = []
+    for sections in sizes:
+        old_doc, new_doc = _build_documents(sections, change_rate, seed)
+
+        start = time.perf_counter()
+        diff = compare_documents(old_doc, new_doc, granularity=granularity, timeout=None)
+        operations = list(diff.iter_operations())
+        engine_seconds = time.perf_counter() - start
+        engine_changed = sum(len(op.old_slice) + len(op.new_slice) for op in operations if op.tag != "equal")
+
+        print(f"{sections} sections: {len(diff.old_lines)} lines, engine {engine_seconds:.2f}s", flush=True)
+        difflib_seconds, difflib_changed = _run_difflib(diff.old_lines, diff.new_lines, difflib_timeout)
+        results.append(
+            RunResult(
+                sections=sections,
+                old_lines=len(diff.old_lines),
+                new_lines=len(diff.new_lines),
+                engine_seconds=engine_seconds,
+                engine_changed=engine_changed,
+                timed_out=diff.timed_out,
+                difflib_seconds=difflib_seconds,
+                difflib_changed=difflib_changed,
+            )
+        )
+    return results
+
+
+def _format_table(results: list[RunResult], difflib_timeout: float) -> str:
+    header = f"{'sections':>9}{'lines':>10}{'engine (s)':>12}{'changed':>9}{'difflib (s)':>13}{'changed':>9}"
+    lines = [header]
+    for result in results:
+        if result.difflib_seconds is None:
+            difflib_time, difflib_changed = f">{difflib_timeout:g}", "-"
+        else:
+            difflib_time, difflib_changed = f"{result.difflib_seconds:.2f}", str(result.difflib_changed)
+        lines.append(
+            f"{result.sections:>9}{result.old_lines:>10}{result.engine_seconds:>12.2f}{result.engine_changed:>9}"
+            f"{difflib_time:>13}{difflib_changed:>9}"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[50, 200, 800, 3200],
+        help="Section counts to benchmark (default: 50 200 800 3200)",
+    )
+    parser.add_argument(
+        "--granularity",
+        choices=["block", "sentence", "word"],
+        default="word",
+        help="Diff granularity (default: word)",
+    )
+    parser.add_argument(
+        "--change-rate", type=float, default=0.05, help="Fraction of sections edited in the revision (default: 0.05)"
+    )
+    parser.add_argument(
+        "--difflib-timeout", type=float, default=60.0, help="Seconds before a difflib run is cut off (default: 60)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the generated documents (default: 0)")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_diff_benchmark(
+        args.sizes,
+        granularity=args.granularity,
+        change_rate=args.change_rate,
+        difflib_timeout=args.difflib_timeout,
+        seed=args.seed,
+    )
+
+    print()
+    print(_format_table(results, args.difflib_timeout))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+"""Throughput and parity check for the HTML parser's direct lxml tree.
+
+Converts HTML to an AST with ``html_parser="lxml"`` twice per document: once
+through a BeautifulSoup tree built by bs4's lxml builder
+(``direct_lxml_tree=False``) and once walking lxml's own tree through the
+read-only view in ``all2md.parsers._html_lxml_tree``. The two ASTs are
+compared; any difference fails the run, so the timings are only reported for
+identical output.
+
+The corpus is the repository's HTML fixtures, HTML rendered from the other
+fixture documents, and generated scraped-page-like HTML at each ``--sizes``
+entry (the generator from ``benchmarks.html_sanitize``). Pass ``--files`` to
+add real pages. Each conversion is timed end to end (parse plus AST build) and
+the best of ``--repeat`` runs is kept.
+
+Usage
+-----
+Default run (fixtures plus generated pages from 100 KB to 5 MB)::
+
+    python -m benchmarks.html_backend
+
+Your own pages, with JSON output::
+
+    python -m benchmarks.html_backend --files saved/*.html --sizes 1m --out backend_results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from all2md import from_ast, to_ast
+from all2md.ast import Document
+from all2md.options.html import HtmlOptions
+from all2md.parsers.html import HtmlToAstConverter
+from benchmarks.html_sanitize import _build_html, _parse_size
+
+_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "documents"
+
+
+@dataclass
+class RunResult:
+    """Conversion time for one document, BeautifulSoup tree versus direct lxml tree."""
+
+    name: str
+    size_bytes: int
+    bs4_seconds: float
+    direct_seconds: float
+    speedup: float
+
+
+def _fixture_corpus() -> dict[str, str]:
+    corpus: dict[str, str] = {}
+    for path in sorted(_FIXTURES.glob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix.lower() in {".html", ".htm"}:
+            corpus[path.name] = path.read_text(encoding="utf-8", errors="replace")
+            continue
+        try:
+            corpus[f"{path.name} (rendered)"] = str(from_ast(to_ast(path), "html"))
+        except Exception:  # noqa: BLE001 - a fixture some optional dependency cannot read
+            continue
+    return corpus
+
+
+def _convert(html: str, direct: bool, repeat: int) -> tuple[Document, float]:
+    options = HtmlOptions(html_parser="lxml", direct_lxml_tree=direct)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document = HtmlToAstConverter(options).convert_to_ast(html)
+        best = min(best, time.perf_counter() - start)
+    return document, best
+
+
+def run_backend_benchmark(corpus: dict[str, str], repeat: int) -> list[RunResult]:
+    """Convert each document with both trees, check the ASTs match and return the timings."""
+    results: list[RunResult] = []
+    for name, html in corpus.items():
+        bs4_document, bs4_seconds = _convert(html, direct=False, repeat=repeat)
+        direct_document, direct_seconds = _convert(html, direct=True, repeat=repeat)
+        if direct_document != bs4_document:
+            raise AssertionError(f"Direct lxml tree produced a different AST for {name}")
+        size = len(html.encode("utf-8"))
+        speedup = bs4_seconds / direct_seconds if direct_seconds else float("inf")
+        results.append(RunResult(name, size, bs4_seconds, direct_seconds, speedup))
+        print(f"{name:<40.40} {size:>10} B  bs4 {bs4_seconds:>7.3f}s  direct {direct_seconds:>7.3f}s", flush=True)
+    return results
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'document':<40}{'size (B)':>11}{'bs4 (s)':>10}{'direct (s)':>12}{'speedup':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<40.40}{r.size_bytes:>11}{r.bs4_seconds:>10.3f}{r.direct_seconds:>12.3f}{r.speedup:>8.1f}x"
+        )
+    total_bytes = sum(r.size_bytes for r in results)
+    bs4_total = sum(r.bs4_seconds for r in results)
+    direct_total = sum(r.direct_seconds for r in results)
+    lines.append(
+        f"{'throughput (MB/s)':<40}{total_bytes:>11}{total_bytes / bs4_total / 1e6:>10.2f}"
+        f"{total_bytes / direct_total / 1e6:>12.2f}{bs4_total / direct_total:>8.1f}x"
+    )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_size,
+        nargs="*",
+        default=[100_000, 1_000_000, 5_000_000],
+        help="Sizes of generated pages in bytes; k/m suffixes accepted (default: 100k 1m 5m)",
+    )
+    parser.add_argument("--files", type=Path, nargs="*", default=[], help="Extra HTML files to include")
+    parser.add_argument("--no-fixtures", action="store_true", help="Leave the repository fixtures out of the corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per document; the best is kept (default: 3)")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    corpus = {} if args.no_fixtures else _fixture_corpus()
+    for path in args.files:
+        corpus[path.name] = path.read_text(encoding="utf-8", errors="replace")
+    for size in args.sizes:
+        corpus[f"generated {size} B"] = _build_html(size)
+    results = run_backend_benchmark(corpus, args.repeat)
+
+    print()
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,254 @@
+"""Benchmark and parity check for the HTML parser's allowlist sanitization.
+
+Generates scraped-page-like HTML of increasing size -- nested containers,
+tables, links and images, sprinkled with scripts, styles, iframes, forms,
+event handlers, ``javascript:`` URLs and framework attributes -- and sanitizes
+it with ``HtmlToAstConverter._apply_custom_sanitization`` (one walk over the
+tree) and with the chain it replaced (script/style removal, a dangerous-element
+pass, the element allowlist, the attribute allowlist and a final security pass,
+each its own ``find_all()``).
+
+Both are run on separately parsed copies of the same page and the sanitized
+trees are compared serialized; any difference fails the run, so the timings
+are only reported for identical security behaviour. Parsing is excluded from
+the timings.
+
+Usage
+-----
+Default run (100 KB to 5 MB, dangerous-element stripping plus both allowlists)::
+
+    python -m benchmarks.html_sanitize
+
+Smaller sizes, attribute allowlist only, with JSON output::
+
+    python -m benchmarks.html_sanitize --sizes 100k 1m --no-element-allowlist --out sanitize_results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup
+
+from all2md.constants import DANGEROUS_HTML_ELEMENTS
+from all2md.options.html import HtmlOptions
+from all2md.parsers.html import HtmlToAstConverter
+
+_WORDS = (
+    "page article section news update report market data price index review story author share comment "
+    "reader link image table cell row header footer menu search result"
+).split()
+
+_ALLOWED_ELEMENTS = (
+    "html",
+    "body",
+    "p",
+    "div",
+    "a",
+    "img",
+    "table",
+    "tbody",
+    "tr",
+    "td",
+    "th",
+    "ul",
+    "li",
+    "h2",
+    "strong",
+    "em",
+)
+
+_ALLOWED_ATTRIBUTES = {
+    "a": ("href", "title"),
+    "img": ("src", "alt"),
+    "td": ("colspan", "rowspan"),
+    "div": ("class",),
+}
+
+
+@dataclass
+class RunResult:
+    """Sanitization time for one input size, single pass versus the old chain."""
+
+    size_bytes: int
+    elements: int
+    chain_seconds: float
+    single_pass_seconds: float
+    speedup: float
+
+
+def _parse_size(value: str) -> int:
+    units = {"k": 1000, "m": 1000**2}
+    suffix = value[-1].lower()
+    if suffix in units:
+        return int(float(value[:-1]) * units[suffix])
+    return int(value)
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 14))).capitalize() + "."
+
+
+def _build_html(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    blocks: list[str] = []
+    length = 0
+    item = 0
+    while length < size:
+        item += 1
+        parts = [f'<div class="card" id="c{item}" data-track="{item}">', f"<h2>{_sentence(rng)}</h2>"]
+        for _ in range(rng.randint(1, 3)):
+            handler = ' onclick="track()"' if rng.random() < 0.1 else ""
+            parts.append(
+                f'<p{handler}><span class="lead">{_sentence(rng)}</span> '
+                f'<a href="/story/{item}" title="more" rel="nofollow">{rng.choice(_WORDS)}</a> '
+                f"<strong>{_sentence(rng)}</strong> <em>{rng.choice(_WORDS)}</em></p>"
+            )
+        if item % 4 == 0:
+            rows = "".join(
+                f'<tr><td colspan="1" style="color: red">{rng.choice(_WORDS)}</td><td>{rng.randint(1, 99)}</td></tr>'
+                for _ in range(4)
+            )
+            parts.append(f"<table><tbody>{rows}</tbody></table>")
+        if item % 5 == 0:
+            parts.append(f'<img src="/img/{item}.png" alt="{rng.choice(_WORDS)}" loading="lazy" onerror="x()">')
+        if item % 6 == 0:
+            parts.append(f"<script>window.ads.push({item});</script>")
+        if item % 7 == 0:
+            parts.append('<a href="javascript:void(0)">share</a>')
+        if item % 9 == 0:
+            parts.append('<section x-data="{open: false}"><p>Toggle</p></section>')
+        if item % 11 == 0:
+            parts.append('<form action="/s"><input name="q"><button>Go</button></form>')
+        if item % 13 == 0:
+            parts.append('<iframe src="https://ads.example.com/frame"></iframe><style>.card{margin:0}</style>')
+        parts.append("</div>")
+        block = "".join(parts)
+        blocks.append(block)
+        length += len(block)
+    return f"<html><head><title>Bench</title></head><body>{''.join(blocks)}</body></html>"
+
+
+def _chained_sanitize(converter: HtmlToAstConverter, soup: Any) -> Any:
+    """Sanitize with the five-walk chain ``_apply_custom_sanitization`` replaced."""
+    options = converter.options
+    if options.strip_dangerous_elements:
+        for tag in soup.find_all(["script", "style"]):
+            tag.decompose()
+        doomed = [
+            element
+            for element in soup.find_all()
+            if element.name in DANGEROUS_HTML_ELEMENTS or not converter._sanitize_element(element)
+        ]
+        for element in doomed:
+            element.decompose()
+
+    if options.allowed_elements is not None:
+        for element in [e for e in soup.find_all() if e.name not in options.allowed_elements]:
+            element.unwrap()
+
+    if options.allowed_attributes is not None:
+        for element in soup.find_all():
+            if isinstance(options.allowed_attributes, dict):
+                allowed = options.allowed_attributes.get(element.name, ())
+            else:
+                allowed = options.allowed_attributes
+            for attr in [a for a in element.attrs if a not in allowed]:
+                del element.attrs[attr]
+
+    if options.strip_dangerous_elements:
+        for element in [e for e in soup.find_all() if not converter._sanitize_element(e)]:
+            element.decompose()
+    return soup
+
+
+def _time(sanitize: Callable[[Any], Any], html: str, parser: str) -> tuple[str, float]:
+    soup = BeautifulSoup(html, parser)
+    start = time.perf_counter()
+    soup = sanitize(soup)
+    return str(soup), time.perf_counter() - start
+
+
+def run_sanitize_benchmark(sizes: list[int], options: HtmlOptions) -> list[RunResult]:
+    """Sanitize generated HTML of each size both ways, check parity and return the timings."""
+    converter = HtmlToAstConverter(options)
+    results: list[RunResult] = []
+    for size in sizes:
+        html = _build_html(size)
+        elements = len(BeautifulSoup(html, options.html_parser).find_all())
+        chained, chain_seconds = _time(lambda soup: _chained_sanitize(converter, soup), html, options.html_parser)
+        single, single_seconds = _time(converter._apply_custom_sanitization, html, options.html_parser)
+        if single != chained:
+            raise AssertionError(f"Single-pass sanitization differs from the chain at {size} bytes")
+        speedup = chain_seconds / single_seconds if single_seconds else float("inf")
+        results.append(RunResult(size, elements, chain_seconds, single_seconds, speedup))
+        print(f"{size:>10} B  chain {chain_seconds:>7.3f}s  single pass {single_seconds:>7.3f}s", flush=True)
+    return results
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'size (B)':>11}{'elements':>10}{'chain (s)':>11}{'1-pass (s)':>12}{'speedup':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.size_bytes:>11}{r.elements:>10}{r.chain_seconds:>11.3f}{r.single_pass_seconds:>12.3f}"
+            f"{r.speedup:>8.1f}x"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_size,
+        nargs="+",
+        default=[100_000, 1_000_000, 5_000_000],
+        help="Input sizes in bytes; k/m suffixes accepted (default: 100k 1m 5m)",
+    )
+    parser.add_argument(
+        "--html-parser",
+        choices=["html.parser", "lxml", "html5lib"],
+        default="html.parser",
+        help="BeautifulSoup parser used to build the trees (default: html.parser)",
+    )
+    parser.add_argument(
+        "--no-strip-dangerous", action="store_true", help="Run the allowlists without dangerous-element stripping"
+    )
+    parser.add_argument("--no-element-allowlist", action="store_true", help="Do not set allowed_elements")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    options = HtmlOptions(
+        html_parser=args.html_parser,
+        strip_dangerous_elements=not args.no_strip_dangerous,
+        strip_framework_attributes=True,
+        allowed_elements=None if args.no_element_allowlist else _ALLOWED_ELEMENTS,
+        allowed_attributes=_ALLOWED_ATTRIBUTES,
+    )
+    results = run_sanitize_benchmark(args.sizes, options)
+
+    print()
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""Throughput benchmark for parsing many small Markdown documents.
+
+MCP tools and ``all2md serve`` parse a steady stream of short Markdown
+snippets, where building the mistune instance (registering every plugin's
+rules) used to cost more than the parse itself. This benchmark parses a fixed
+set of small documents with ``MarkdownToAstConverter`` and reports documents
+per second and mean latency, once with the per-thread parser cache as shipped
+and once with the cache cleared before every parse, which reproduces the old
+build-per-call behaviour.
+
+Usage
+-----
+Default run (5000 parses of ~300-byte documents)::
+
+    python -m benchmarks.markdown_small_docs
+
+More iterations, with JSON output::
+
+    python -m benchmarks.markdown_small_docs --iterations 20000 --out benchmarks/markdown_results/run.json
+
+Requires ``mistune`` (installed with all2md).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from all2md.parsers import markdown as markdown_parser
+from all2md.parsers.markdown import MarkdownToAstConverter
+
+_SNIPPETS = (
+    "# Release notes\n\nThis release adds **streaming** output and fixes `--out` handling.\n",
+    "- [x] parse tables\n- [ ] parse footnotes\n- [ ] ~~drop~~ keep admonitions\n",
+    "| Name | Value |\n|------|------:|\n| rows | 12 |\n| cols | 4 |\n\nSee [the docs](https://example.com).\n",
+    "Inline math $e^{i\\pi} + 1 = 0$ and a note[^1].\n\n[^1]: Footnote text.\n",
+    '!!! note "Heads up"\n    Admonition body with *emphasis*.\n\nTerm\n:   Definition.\n',
+    "```python\nprint('hello')\n```\n\n> Quoted ==highlighted== text.\n",
+)
+
+
+@dataclass
+class RunResult:
+    """Throughput of one parser-cache mode."""
+
+    mode: str
+    documents: int
+    seconds: float
+    docs_per_s: float
+    mean_us: float
+
+
+def _clear_parser_cache() -> None:
+    getattr(markdown_parser._thread_parsers, "parsers", {}).clear()
+
+
+def _run(iterations: int, cached: bool) -> RunResult:
+    converter = MarkdownToAstConverter()
+    # Warm up imports and, for the cached mode, the parser itself.
+    converter.parse(_SNIPPETS[0])
+    start = time.perf_counter()
+    for index in range(iterations):
+        if not cached:
+            _clear_parser_cache()
+        converter.parse(_SNIPPETS[index % len(_SNIPPETS)])
+    seconds = time.perf_counter() - start
+    return RunResult(
+        mode="cached" if cached else "rebuilt",
+        documents=iterations,
+        seconds=seconds,
+        docs_per_s=iterations / seconds,
+        mean_us=seconds / iterations * 1_000_000,
+    )
+
+
+def run_markdown_benchmark(iterations: int) -> list[RunResult]:
+    """Parse ``iterations`` small documents with and without parser reuse."""
+    return [_run(iterations, cached=True), _run(iterations, cached=False)]
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'mode':<10}{'docs':>8}{'time (s)':>10}{'docs/s':>10}{'mean (us)':>11}"]
+    for result in results:
+        lines.append(
+            f"{result.mode:<10}{result.documents:>8}{result.seconds:>10.2f}"
+            f"{result.docs_per_s:>10.0f}{result.mean_us:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Documents to parse per mode (default: 5000)")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_markdown_benchmark(iterations=args.iterations)
+
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""Wall-time benchmark for ``optimize_options`` on a PDF.
+
+``all2md optimize`` re-parses the document once per candidate. This benchmark
+runs the same search three ways and checks that all three return the same
+report:
+
+* ``uncached``: every candidate parses from scratch (the old behaviour,
+  reproduced by disabling the page-stage cache),
+* ``sequential``: one process, with page stages shared between candidates,
+* ``workers=N``: candidates converted in N worker processes, each with its own
+  page-stage cache.
+
+Usage
+-----
+Default run on the shipped complex fixture::
+
+    python -m benchmarks.optimize_search
+
+Your own document, four workers, with JSON output::
+
+    python -m benchmarks.optimize_search report.pdf --workers 4 --out benchmarks/optimize_results/run.json
+
+Requires ``pymupdf`` (``pip install all2md[pdf]``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from unittest import mock
+
+from all2md import optimize_options
+from all2md.parsers import pdf as pdf_parser
+
+_DEFAULT_PDF = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "documents" / "complex.pdf"
+
+
+@dataclass
+class RunResult:
+    """Wall time of one search mode."""
+
+    mode: str
+    evaluated: int
+    seconds: float
+    per_candidate_ms: float
+
+
+def _run(path: Path, mode: str, workers: int, sample_pages: int | None) -> tuple[RunResult, dict]:
+    # The uncached mode hides the active cache from the parser, which is exactly the
+    # code path of a release without it.
+    patch = (
+        mock.patch.object(pdf_parser, "get_active_page_cache", lambda: None) if mode == "uncached" else nullcontext()
+    )
+    with patch:
+        start = time.perf_counter()
+        report = optimize_options(path, workers=workers, sample_pages=sample_pages)
+        seconds = time.perf_counter() - start
+    result = RunResult(
+        mode=mode,
+        evaluated=report.evaluated,
+        seconds=seconds,
+        per_candidate_ms=seconds / max(1, report.evaluated) * 1000,
+    )
+    return result, report.to_dict()
+
+
+def run_optimize_benchmark(path: Path, workers: int, sample_pages: int | None = None) -> list[RunResult]:
+    """Run the search uncached, sequentially cached and in ``workers`` processes.
+
+    Raises
+    ------
+    RuntimeError
+        If the modes do not report the same search.
+
+    """
+    results: list[RunResult] = []
+    reports: list[dict] = []
+    for mode, mode_workers in (("uncached", 1), ("sequential", 1), (f"workers={workers}", workers)):
+        result, report = _run(path, mode, mode_workers, sample_pages)
+        print(f"{mode}: {result.seconds:.1f}s", flush=True)
+        results.append(result)
+        reports.append(report)
+    if any(report != reports[0] for report in reports[1:]):
+        raise RuntimeError("search modes reported different results")
+    return results
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'mode':<14}{'candidates':>11}{'time (s)':>10}{'per cand. (ms)':>16}"]
+    for result in results:
+        lines.append(f"{result.mode:<14}{result.evaluated:>11}{result.seconds:>10.2f}{result.per_candidate_ms:>16.0f}")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", type=Path, default=_DEFAULT_PDF, help="PDF to tune (default: complex.pdf)")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes for the parallel mode (default: 2)")
+    parser.add_argument("--sample-pages", type=int, default=None, help="Tune on only the first N pages")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_optimize_benchmark(args.pdf, workers=args.workers, sample_pages=args.sample_pages)
+
+    print()
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,193 @@
+"""Time and peak-memory benchmark for streamed XLSX/ODS reading.
+
+Generates one large XLSX workbook (with openpyxl's write-only mode) and one ODS
+spreadsheet of the same shape (written directly as ``content.xml`` inside a
+zip, so odfpy is not needed to build it), then converts each with
+``streaming=True`` and ``streaming=False``. For every run it reports wall time
+and the ``tracemalloc`` peak, and checks that both modes render identical
+Markdown.
+
+The peak covers the whole conversion, including the AST, which still holds
+every kept row; pass ``--max-rows`` to see the effect of the early stop when
+only the head of a sheet is wanted.
+
+Usage
+-----
+Default run (50k rows x 12 columns)::
+
+    python -m benchmarks.spreadsheet_streaming
+
+A smaller smoke run, or a head-only conversion with JSON output::
+
+    python -m benchmarks.spreadsheet_streaming --rows 5000
+    python -m benchmarks.spreadsheet_streaming --max-rows 100 --out benchmarks/spreadsheet_results/run.json
+
+Requires ``openpyxl`` and ``odfpy`` (``pip install all2md[spreadsheet]``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import zipfile
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from all2md.options.ods import OdsSpreadsheetOptions
+from all2md.options.xlsx import XlsxOptions
+from all2md.parsers.ods_spreadsheet import OdsSpreadsheetToAstConverter
+from all2md.parsers.xlsx import XlsxToAstConverter
+from all2md.renderers.markdown import MarkdownRenderer
+
+_ODS_MIMETYPE = "application/vnd.oasis.opendocument.spreadsheet"
+
+
+@dataclass
+class RunResult:
+    """Time and memory of one conversion."""
+
+    format: str
+    streaming: bool
+    seconds: float
+    peak_mib: float
+
+
+def _cell_value(row: int, col: int) -> str | int:
+    return row * 31 + col if col % 3 == 0 else f"r{row}c{col}"
+
+
+def _build_xlsx(rows: int, cols: int) -> bytes:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    sheet.append([f"Column {col}" for col in range(cols)])
+    for row in range(rows):
+        sheet.append([_cell_value(row, col) for col in range(cols)])
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def _ods_cell(value: str | int) -> str:
+    if isinstance(value, int):
+        return (
+            f'<table:table-cell office:value-type="float" office:value="{value}"><text:p>{value}</text:p>'
+            "</table:table-cell>"
+        )
+    return f'<table:table-cell office:value-type="string"><text:p>{escape(value)}</text:p></table:table-cell>'
+
+
+def _build_ods(rows: int, cols: int) -> bytes:
+    header = "".join(_ods_cell(f"Column {col}") for col in range(cols))
+    body = "".join(
+        "<table:table-row>" + "".join(_ods_cell(_cell_value(row, col)) for col in range(cols)) + "</table:table-row>"
+        for row in range(rows)
+    )
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" office:version="1.2">'
+        '<office:body><office:spreadsheet><table:table table:name="Data">'
+        f"<table:table-row>{header}</table:table-row>{body}"
+        "</table:table></office:spreadsheet></office:body></office:document-content>"
+    )
+    manifest = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" manifest:version="1.2">'
+        f'<manifest:file-entry manifest:full-path="/" manifest:media-type="{_ODS_MIMETYPE}"/>'
+        '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+        "</manifest:manifest>"
+    )
+    output = BytesIO()
+    with zipfile.ZipFile(output, "w") as archive:
+        archive.writestr("mimetype", _ODS_MIMETYPE, compress_type=zipfile.ZIP_STORED)
+        archive.writestr("content.xml", content, compress_type=zipfile.ZIP_DEFLATED)
+        archive.writestr("META-INF/manifest.xml", manifest, compress_type=zipfile.ZIP_DEFLATED)
+    return output.getvalue()
+
+
+def _convert(fmt: str, data: bytes, streaming: bool, max_rows: int | None) -> tuple[str, float, float]:
+    if fmt == "xlsx":
+        converter: XlsxToAstConverter | OdsSpreadsheetToAstConverter = XlsxToAstConverter(
+            XlsxOptions(streaming=streaming, max_rows=max_rows)
+        )
+    else:
+        converter = OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(streaming=streaming, max_rows=max_rows))
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    document = converter.parse(BytesIO(data))
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return MarkdownRenderer().render_to_string(document), seconds, peak / (1024 * 1024)
+
+
+def run_spreadsheet_benchmark(rows: int, cols: int, max_rows: int | None = None) -> list[RunResult]:
+    """Convert generated XLSX and ODS files in both modes and return the measurements.
+
+    Raises
+    ------
+    RuntimeError
+        If the streaming and full-load conversions render different Markdown.
+
+    """
+    results: list[RunResult] = []
+    for fmt, build in (("xlsx", _build_xlsx), ("ods", _build_ods)):
+        data = build(rows, cols)
+        print(f"{fmt}: {rows} rows x {cols} columns, {len(data) / 1024:.0f} KiB", flush=True)
+        rendered: dict[bool, str] = {}
+        for streaming in (True, False):
+            markdown, seconds, peak_mib = _convert(fmt, data, streaming, max_rows)
+            rendered[streaming] = markdown
+            results.append(RunResult(fmt, streaming, seconds, peak_mib))
+        if rendered[True] != rendered[False]:
+            raise RuntimeError(f"{fmt}: streaming and full-load output differ")
+    return results
+
+
+def _format_table(results: list[RunResult]) -> str:
+    lines = [f"{'format':<8}{'mode':<12}{'time (s)':>10}{'peak (MiB)':>12}"]
+    for result in results:
+        mode = "streaming" if result.streaming else "full"
+        lines.append(f"{result.format:<8}{mode:<12}{result.seconds:>10.2f}{result.peak_mib:>12.1f}")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="Data rows per sheet (default: 50000)")
+    parser.add_argument("--cols", type=int, default=12, help="Columns per row (default: 12)")
+    parser.add_argument("--max-rows", type=int, default=None, help="Convert only this many data rows per sheet")
+    parser.add_argument("--out", type=Path, default=None, help="Optional path for a JSON dump of the results")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_spreadsheet_benchmark(rows=args.rows, cols=args.cols, max_rows=args.max_rows)
+
+    print()
+    print(_format_table(results))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
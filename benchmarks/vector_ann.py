@@ -0,0 +1,192 @@
+"""Recall-vs-latency benchmark for the vector search index types.
+
+Builds every FAISS index type ``VectorIndex`` supports (``flat``, ``ivf_flat``,
+``hnsw``, ``ivf_pq``) over the same synthetic embedding matrix and reports, for
+each query-time setting (``nprobe`` for IVF, ``efSearch`` for HNSW), the
+recall@k against the exact ``flat`` baseline together with single-query latency
+percentiles. It exercises the same ``_build_faiss_index`` helper the index
+uses, so the numbers reflect the shipped build parameters; no embedding model is
+loaded.
+
+The vectors are drawn around random cluster centres in a 32-dimensional latent
+space, projected to the embedding dimension and L2-normalized. That is closer
+to sentence-transformer output than isotropic noise, which has no low-dimensional
+neighbourhood structure and makes every ANN index look bad.
+
+Usage
+-----
+Default run (100k x 384-dim vectors, 200 queries)::
+
+    python -m benchmarks.vector_ann
+
+A smaller smoke run, or a bigger one with JSON output::
+
+    python -m benchmarks.vector_ann --vectors 20000 --queries 100
+    python -m benchmarks.vector_ann --vectors 500000 --out benchmarks/vector_ann_results/run.json
+
+Requires ``numpy`` and ``faiss-cpu`` (``pip install all2md[search]``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from all2md.search.vector import VectorIndexConfig, _apply_search_params, _build_faiss_index
+
+_NPROBE_SWEEP = (1, 4, 16, 64)
+_EF_SEARCH_SWEEP = (16, 32, 64, 128)
+_LATENT_DIMENSION = 32
+
+
+@dataclass
+class SweepResult:
+    """Accuracy and latency of one index type at one query-time setting."""
+
+    index_type: str
+    setting: str
+    build_s: float
+    recall: float
+    p50_ms: float
+    p99_ms: float
+
+
+def _clustered_vectors(np: Any, count: int, dimension: int, clusters: int, seed: int) -> Any:
+    # Centres and projection come from ``seed`` alone so corpus and queries share them.
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, _LATENT_DIMENSION))
+    projection = rng.standard_normal((_LATENT_DIMENSION, dimension))
+    sample_rng = np.random.default_rng((seed, count))
+    labels = sample_rng.integers(0, clusters, size=count)
+    latent = centres[labels] + 0.5 * sample_rng.standard_normal((count, _LATENT_DIMENSION))
+    vectors = (latent @ projection).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def _time_queries(index: Any, queries: Any, k: int) -> tuple[Any, list[float]]:
+    latencies: list[float] = []
+    rows = []
+    for row in range(queries.shape[0]):
+        start = time.perf_counter()
+        _, ids = index.search(queries[row : row + 1], k)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        rows.append(ids[0])
+    return rows, latencies
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run_vector_ann_benchmark(
+    *,
+    vectors: int,
+    dimension: int,
+    queries: int,
+    k: int,
+    nlist: int,
+    pq_m: int,
+    seed: int = 0,
+) -> list[SweepResult]:
+    """Build each index type over the same corpus and sweep its query-time knob."""
+    import faiss
+    import numpy as np
+
+    corpus = _clustered_vectors(np, vectors, dimension, clusters=max(16, vectors // 500), seed=seed)
+    probes = _clustered_vectors(np, queries, dimension, clusters=max(16, vectors // 500), seed=seed)
+
+    results: list[SweepResult] = []
+    truth: list[set[int]] = []
+    for index_type in ("flat", "ivf_flat", "hnsw", "ivf_pq"):
+        config = VectorIndexConfig(index_type=index_type, nlist=nlist, pq_m=pq_m)
+        start = time.perf_counter()
+        index, built_type, _ = _build_faiss_index(faiss, corpus, config)
+        build_s = time.perf_counter() - start
+        if built_type != index_type:
+            print(f"{index_type}: too few vectors to train, skipped", flush=True)
+            continue
+
+        if index_type == "flat":
+            settings: list[tuple[str, VectorIndexConfig]] = [("exact", config)]
+        elif index_type == "hnsw":
+            settings = [
+                (f"efSearch={ef}", VectorIndexConfig(**{**asdict(config), "hnsw_ef_search": ef}))
+                for ef in _EF_SEARCH_SWEEP
+            ]
+        else:
+            settings = [(f"nprobe={n}", VectorIndexConfig(**{**asdict(config), "nprobe": n})) for n in _NPROBE_SWEEP]
+
+        for label, tuned in settings:
+            _apply_search_params(index, built_type, tuned)
+            rows, latencies = _time_queries(index, probes, k)
+            if index_type == "flat":
+                truth = [set(row.tolist()) for row in rows]
+            recall = statistics.fmean(len(truth[i] & set(row.tolist())) / k for i, row in enumerate(rows))
+            result = SweepResult(
+                index_type=index_type,
+                setting=label,
+                build_s=build_s,
+                recall=recall,
+                p50_ms=_percentile(latencies, 50),
+                p99_ms=_percentile(latencies, 99),
+            )
+            print(f"{index_type:<9} {label:<13} recall@{k}={recall:.3f}  p50={result.p50_ms:.3f} ms", flush=True)
+            results.append(result)
+    return results
+
+
+def _format_table(results: list[SweepResult], k: int) -> str:
+    header = f"{'index':<9} {'setting':<13} {'build (s)':>10} {f'recall@{k}':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        timings = f"{r.build_s:>10.2f} {r.recall:>10.3f} {r.p50_ms:>10.3f} {r.p99_ms:>10.3f}"
+        lines.append(f"{r.index_type:<9} {r.setting:<13} {timings}")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vectors", type=int, default=100_000, help="Corpus size (default: 100000)")
+    parser.add_argument("--dimension", type=int, default=384, help="Embedding dimension (default: 384, MiniLM)")
+    parser.add_argument("--queries", type=int, default=200, help="Number of timed queries (default: 200)")
+    parser.add_argument("-k", type=int, default=10, help="Neighbours per query for recall@k (default: 10)")
+    parser.add_argument("--nlist", type=int, default=1024, help="IVF list cap (default: 1024)")
+    parser.add_argument("--pq-m", type=int, default=16, help="PQ sub-vectors; must divide --dimension (default: 16)")
+    parser.add_argument("--out", type=Path, default=None, help="Write raw results as JSON to this path")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run_vector_ann_benchmark(
+        vectors=args.vectors,
+        dimension=args.dimension,
+        queries=args.queries,
+        k=args.k,
+        nlist=args.nlist,
+        pq_m=args.pq_m,
+    )
+
+    print()
+    print(_format_table(results, args.k))
+
+    if args.out is not None:
+        payload = {
+            "args": {key: str(value) for key, value in vars(args).items()},
+            "results": [asdict(r) for r in results],
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.out}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
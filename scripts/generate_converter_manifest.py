@@ -123,6 +123,8 @@ def _record_to_kwargs(metadata) -> dict:
         "mime_types": list(metadata.mime_types),
         "magic_bytes": list(metadata.magic_bytes),
         "content_detector_path": content_detector_path,
+        "zip_members": list(metadata.zip_members),
+        "zip_mimetypes": list(metadata.zip_mimetypes),
         "parser_class": parser_class,
         "renderer_class": renderer_class,
         "parser_required_packages": list(metadata.parser_required_packages),
@@ -144,6 +146,8 @@ _FIELD_ORDER = [
     "mime_types",
     "magic_bytes",
     "content_detector_path",
+    "zip_members",
+    "zip_mimetypes",
     "parser_class",
     "renderer_class",
     "parser_required_packages",
@@ -163,6 +167,8 @@ _OMIT_IF = {
     "mime_types": [],
     "magic_bytes": [],
     "content_detector_path": None,
+    "zip_members": [],
+    "zip_mimetypes": [],
     "parser_class": None,
     "renderer_class": None,
     "parser_required_packages": [],
@@ -139,6 +139,7 @@ if TYPE_CHECKING:
 
 from all2md.api import (
     chunk,
+    chunk_many,
     confidence_report,
     convert,
     from_ast,
@@ -256,6 +257,7 @@ __all__ = [
     "from_markdown",
     "convert",
     "chunk",
+    "chunk_many",
     # Conversion confidence ("quality card")
     "confidence_report",
     "ConfidenceReport",
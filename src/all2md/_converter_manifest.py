@@ -108,6 +108,7 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".docx"],
         mime_types=["application/vnd.openxmlformats-officedocument.wordprocessingml.document"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_members=["word/document.xml"],
         parser_class="all2md.parsers.docx.DocxToAstConverter",
         renderer_class="all2md.renderers.docx.DocxRenderer",
         parser_required_packages=[("python-docx", "docx", "")],
@@ -175,6 +176,8 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".epub"],
         mime_types=["application/epub+zip"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_members=["META-INF/container.xml"],
+        zip_mimetypes=["application/epub+zip"],
         parser_class="all2md.parsers.epub.EpubToAstConverter",
         renderer_class="all2md.renderers.epub.EpubRenderer",
         parser_required_packages=[("ebooklib", "ebooklib", "")],
@@ -340,6 +343,7 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".odp"],
         mime_types=["application/vnd.oasis.opendocument.presentation"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_mimetypes=["application/vnd.oasis.opendocument.presentation"],
         parser_class="all2md.parsers.odp.OdpToAstConverter",
         renderer_class="all2md.renderers.odp.OdpRenderer",
         parser_required_packages=[("odfpy", "odf", "")],
@@ -355,9 +359,10 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".ods"],
         mime_types=["application/vnd.oasis.opendocument.spreadsheet"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_mimetypes=["application/vnd.oasis.opendocument.spreadsheet"],
         parser_class="all2md.parsers.ods_spreadsheet.OdsSpreadsheetToAstConverter",
-        parser_required_packages=[("odfpy", "odf", "")],
-        import_error_message="ODS conversion requires 'odfpy'. Install with: pip install odfpy",
+        parser_required_packages=[("odfpy", "odf", ""), ("defusedxml", "defusedxml", "")],
+        import_error_message="ODS conversion requires 'odfpy' and 'defusedxml'. Install with: pip install all2md[odf]",
         parser_options_class="all2md.options.ods.OdsSpreadsheetOptions",
         description="Convert OpenDocument Spreadsheet files to Markdown tables",
         priority=6,
@@ -367,6 +372,7 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".odt"],
         mime_types=["application/vnd.oasis.opendocument.text"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_mimetypes=["application/vnd.oasis.opendocument.text"],
         parser_class="all2md.parsers.odt.OdtToAstConverter",
         renderer_class="all2md.renderers.odt.OdtRenderer",
         parser_required_packages=[("odfpy", "odf", "")],
@@ -447,6 +453,7 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".pptx"],
         mime_types=["application/vnd.openxmlformats-officedocument.presentationml.presentation"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_members=["ppt/presentation.xml"],
         parser_class="all2md.parsers.pptx.PptxToAstConverter",
         renderer_class="all2md.renderers.pptx.PptxRenderer",
         parser_required_packages=[("python-pptx", "pptx", "")],
@@ -693,6 +700,7 @@ _MANIFEST_RECORDS: list[ConverterMetadata] = [
         extensions=[".xlsx"],
         mime_types=["application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"],
         magic_bytes=[(b"PK\x03\x04", 0)],
+        zip_members=["xl/workbook.xml"],
         parser_class="all2md.parsers.xlsx.XlsxToAstConverter",
         parser_required_packages=[("openpyxl", "openpyxl", "")],
         import_error_message="XLSX conversion requires 'openpyxl'. Install with: pip install openpyxl",
@@ -4,16 +4,17 @@
 # src/all2md/api.py
 import logging
 import warnings
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import fields, is_dataclass, replace
+from functools import partial
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Optional, TypeVar, Union, cast, get_type_hints
 
 from all2md.ast.nodes import Document
 from all2md.constants import DocumentFormat
-from all2md.conversion_cache import get_active_cache, make_cache_key
+from all2md.conversion_cache import get_active_cache, install_worker_cache, make_cache_key, worker_cache_settings
 from all2md.converter_registry import registry
 from all2md.exceptions import All2MdError, FormatError, ParsingError, ValidationError
 from all2md.options.base import BaseParserOptions, BaseRendererOptions
@@ -26,12 +27,11 @@ from all2md.utils.input_sources import (
     RemoteInputOptions,
     default_loader,
 )
-from all2md.utils.io_utils import write_content
 
 if TYPE_CHECKING:
     from all2md.chunking import ProvenanceChunk
     from all2md.confidence import ConfidenceReport
-    from all2md.optimize import OptimizationReport
+    from all2md.optimize import DocumentMetrics, OptimizationReport
     from all2md.roundtrip import RoundTripReport
 
 logger = logging.getLogger(__name__)
@@ -1030,19 +1030,6 @@ def to_ast(
         raise ParsingError(f"AST conversion failed: {e!r}", parsing_stage="ast_conversion", original_error=e) from e
 
 
-def _derive_chunk_identity(source: Any, ast_doc: "Document", document_id: Optional[str]) -> tuple[str, Optional[str]]:
-    """Derive ``(document_id, document_path)`` for chunking from the source.
-
-    Reuses the ``source_path`` ``to_ast`` stashes for file inputs; falls back to a
-    generic id (or the caller-supplied ``document_id``) for streams/bytes.
-    """
-    source_path = ast_doc.metadata.get("source_path") if ast_doc.metadata else None
-    if source_path:
-        path = Path(source_path)
-        return document_id or path.stem, path.as_posix()
-    return document_id or "document", None
-
-
 def chunk(
     source: Union[str, Path, IO[bytes], bytes],
     *,
@@ -1113,19 +1100,112 @@ def chunk(
     >>> chunks[0].section_heading, chunks[0].page, chunks[0].token_count  # doctest: +SKIP
 
     """
-    from all2md.chunking import chunk_ast
+    from all2md.chunking.batch import ChunkSettings, chunk_job
 
-    doc = to_ast(source, source_format=source_format, **converter_options)
+    settings = ChunkSettings(
+        strategy=strategy,
+        max_tokens=max_tokens,
+        overlap=overlap,
+        min_tokens=min_tokens,
+        include_preamble=include_preamble,
+        heading_merge=heading_merge,
+        max_heading_level=max_heading_level,
+        avoid_table_split=avoid_table_split,
+        avoid_code_split=avoid_code_split,
+        elide_data_uris=elide_data_uris,
+        token_counter=token_counter,
+        drop_elements=tuple(drop_elements or ()),
+    )
+    job = (source, document_id, {"source_format": source_format, **converter_options})
+    return chunk_job(settings, None, job)
 
-    if drop_elements:
-        from all2md.transforms.builtin import RemoveNodesTransform
 
-        doc = cast("Document", RemoveNodesTransform(node_types=list(drop_elements)).transform(doc))
+def chunk_many(
+    sources: Iterable[Union[str, Path, bytes]],
+    *,
+    workers: int = 1,
+    skip_errors: bool = False,
+    strategy: str = "semantic",
+    max_tokens: int = 512,
+    overlap: int = 0,
+    min_tokens: int = 0,
+    include_preamble: bool = True,
+    heading_merge: bool = True,
+    max_heading_level: Optional[int] = None,
+    avoid_table_split: bool = False,
+    avoid_code_split: bool = False,
+    elide_data_uris: bool = True,
+    drop_elements: Optional[list[str]] = None,
+    token_counter: str = "auto",
+    source_format: DocumentFormat = "auto",
+    **converter_options: Any,
+) -> "Iterator[ProvenanceChunk]":
+    """Convert and chunk many documents, optionally across worker processes.
+
+    The batch form of :func:`chunk`: each source is converted and chunked exactly
+    as ``chunk`` would, and the chunks are yielded document by document in the
+    order of ``sources``. Nothing is collected -- ``sources`` is consumed lazily
+    and only a few documents per worker are in flight at once, so a corpus of any
+    size runs in bounded memory. Write ``chunk.to_dict()`` out as each chunk
+    arrives to stream JSONL.
+
+    With ``workers`` other than 1, documents are parsed and chunked in a process
+    pool; each worker resolves the token counter once and reuses it for every
+    document it handles. When a conversion cache is active
+    (:func:`all2md.conversion_cache.use_conversion_cache`), workers share it, so
+    a re-run over an unchanged corpus skips parsing.
 
-    doc_id, doc_path = _derive_chunk_identity(source, doc, document_id)
+    Parameters
+    ----------
+    sources : iterable of str, Path, or bytes
+        Documents to chunk. File sources take their ``document_id`` from the file
+        stem; a bytes source gets ``"document-<n>"``, its 1-based position.
+    workers : int, default 1
+        Worker processes; ``0`` uses one per CPU. ``1`` runs in this process.
+    skip_errors : bool, default False
+        Log and skip a document that fails to convert or chunk instead of raising.
+    strategy : str
+        Chunking strategy, as for :func:`chunk`.
+    max_tokens, overlap, min_tokens : int
+        Size controls, as for :func:`chunk`.
+    include_preamble, heading_merge : bool
+        Structure toggles, as for :func:`chunk`.
+    max_heading_level : int, optional
+        For fine strategies, only descend into sections at or above this level.
+    avoid_table_split, avoid_code_split, elide_data_uris : bool
+        As for :func:`chunk`.
+    drop_elements : list of str, optional
+        AST node types to strip from every document before chunking.
+    token_counter : {"auto", "tiktoken", "whitespace"}
+        Token-counting backend.
+    source_format : DocumentFormat, default "auto"
+        Explicit source format for every source, or auto-detect.
+    converter_options : Any
+        Extra options forwarded to :func:`to_ast` for every source.
+
+    Yields
+    ------
+    ProvenanceChunk
+        Each document's chunks in reading order (``prev``/``next`` linked within
+        the document), documents in input order.
+
+    Raises
+    ------
+    ValidationError
+        If ``workers`` is negative.
+
+    Examples
+    --------
+    >>> import json
+    >>> import all2md
+    >>> with open("chunks.jsonl", "w") as out:  # doctest: +SKIP
+    ...     for c in all2md.chunk_many(paths, workers=8, token_counter="whitespace"):
+    ...         print(json.dumps(c.to_dict()), file=out)
+
+    """
+    from all2md.chunking.batch import ChunkSettings, iter_chunk_jobs
 
-    return chunk_ast(
-        doc,
+    settings = ChunkSettings(
         strategy=strategy,
         max_tokens=max_tokens,
         overlap=overlap,
@@ -1137,9 +1217,15 @@ def chunk(
         avoid_code_split=avoid_code_split,
         elide_data_uris=elide_data_uris,
         token_counter=token_counter,
-        document_id=doc_id,
-        document_path=doc_path,
+        drop_elements=tuple(drop_elements or ()),
     )
+    kwargs = {"source_format": source_format, **converter_options}
+    jobs = (
+        (source, None if isinstance(source, (str, Path)) else f"document-{position}", kwargs)
+        for position, source in enumerate(sources, start=1)
+    )
+    for chunks in iter_chunk_jobs(settings, jobs, workers=workers, skip_errors=skip_errors):
+        yield from chunks
 
 
 def _attach_confidence_report(ast_doc: "Document", parser: Any) -> None:
@@ -1379,6 +1465,7 @@ def optimize_options(
     include_presets: bool = True,
     sample_pages: Optional[int] = None,
     remote_input_options: Optional[RemoteInputOptions] = None,
+    workers: int = 1,
 ) -> "OptimizationReport":
     """Search converter options for the settings that convert ``source`` best.
 
@@ -1389,9 +1476,11 @@ def optimize_options(
     into an ``.all2md.toml``.
 
     This is *not* cheap — it is tens of conversions. Use ``sample_pages`` to tune on
-    a slice of a long document, and enable the conversion cache
-    (:func:`all2md.conversion_cache.use_conversion_cache`) to skip re-converting
-    option sets already tried.
+    a slice of a long document, ``workers`` to convert candidates in parallel, and
+    enable the conversion cache (:func:`all2md.conversion_cache.use_conversion_cache`)
+    to skip re-converting option sets already tried. PDF pages additionally keep the
+    stages no searched option affects (text extraction, table finding, layout
+    prediction) between candidates, so only the first conversion pays for them.
 
     Parameters
     ----------
@@ -1415,6 +1504,9 @@ def optimize_options(
         that they *repeat*, so a single-page sample cannot see them at all.
     remote_input_options : RemoteInputOptions, optional
         Controls retrieval when ``source`` is a URL.
+    workers : int, default 1
+        Convert candidates in this many worker processes; ``0`` uses one per CPU.
+        The report is identical to a sequential run.
 
     Returns
     -------
@@ -1435,8 +1527,14 @@ def optimize_options(
         {'table_detection_mode': 'ruling', 'detect_columns': True}
 
     """
+    from concurrent.futures import ProcessPoolExecutor
+
     from all2md.cli.presets import PRESETS
-    from all2md.optimize import DocumentMetrics, extract_metrics, search, tunable_knobs
+    from all2md.optimize import search, tunable_knobs
+    from all2md.parsers._pdf_page_cache import use_page_cache
+
+    if workers < 0:
+        raise ValidationError("workers must be >= 0", parameter_name="workers", parameter_value=workers)
 
     resolved = _resolve_document_source(source, remote_input_options, None).payload
 
@@ -1481,15 +1579,6 @@ def optimize_options(
         # double-converted to 0-based and come back off by one (see #75).
         base = base.create_updated(pages=list(range(1, sample_pages + 1)))
 
-    def evaluate(overrides: dict[str, Any]) -> DocumentMetrics:
-        candidate_options = base.create_updated(**overrides) if overrides else base
-        document = to_ast(
-            cast(Union[str, Path, IO[bytes], bytes], resolved),
-            parser_options=candidate_options,
-            source_format=cast(DocumentFormat, actual_format),
-        )
-        return extract_metrics(document)
-
     presets: dict[str, dict[str, Any]] = {}
     if include_presets:
         for name, preset in PRESETS.items():
@@ -1498,7 +1587,18 @@ def optimize_options(
             if section:
                 presets[name] = section
 
-    report = search(knobs, evaluate, presets=presets, rounds=rounds)
+    if workers == 1:
+        evaluate = partial(_evaluate_optimize_candidate, resolved, actual_format, base)
+        with use_page_cache():
+            report = search(knobs, evaluate, presets=presets, rounds=rounds)
+    else:
+        # Workers keep their page-stage cache and the parent's conversion cache for
+        # the whole search, so whichever candidates land on a worker share its pages.
+        evaluate = partial(_evaluate_optimize_candidate, resolved, actual_format, base)
+        with ProcessPoolExecutor(
+            max_workers=workers or None, initializer=_init_optimize_worker, initargs=(worker_cache_settings(),)
+        ) as executor:
+            report = search(knobs, evaluate, presets=presets, rounds=rounds, executor=executor)
     report.source_format = actual_format
 
     # Coordinate descent accumulates whatever it walked through, so the winner can
@@ -1510,6 +1610,36 @@ def optimize_options(
     return report
 
 
+def _evaluate_optimize_candidate(
+    source: Union[str, Path, bytes],
+    source_format: str,
+    base: BaseParserOptions,
+    overrides: dict[str, Any],
+) -> "DocumentMetrics":
+    """Convert ``source`` with ``overrides`` applied and measure it for :func:`optimize_options`.
+
+    Module-level so a process pool can run it; a worker's caches are set up once
+    by :func:`_init_optimize_worker`.
+    """
+    from all2md.optimize import extract_metrics
+
+    candidate_options = base.create_updated(**overrides) if overrides else base
+    document = to_ast(
+        source,
+        parser_options=candidate_options,
+        source_format=cast(DocumentFormat, source_format),
+    )
+    return extract_metrics(document)
+
+
+def _init_optimize_worker(cache_settings: Optional[dict[str, Any]]) -> None:
+    """Process-pool initializer for :func:`optimize_options`: install the worker's caches once."""
+    from all2md.parsers._pdf_page_cache import install_page_cache
+
+    install_page_cache()
+    install_worker_cache(cache_settings)
+
+
 def _record_source_path(ast_doc: "Document", source: Any) -> None:
     """Stash the absolute path of a file-based source onto the AST.
 
@@ -1667,14 +1797,9 @@ def from_ast(
         renderer=target_format,
         options=final_renderer_options,
         progress_callback=progress_callback,
+        output=output,
     )
-
-    result = write_content(content, output)
-
-    # Auto-unwrap file-like objects for better UX
-    if result is not None:
-        return result.getvalue()  # Extract str/bytes from StringIO/BytesIO
-    return None
+    return content
 
 
 def from_markdown(
@@ -1991,12 +2116,6 @@ def convert(
         renderer=renderer_spec,
         options=final_renderer_options,
         progress_callback=progress_callback,
+        output=output,
     )
-
-    # Handle output using centralized I/O utility
-    result = write_content(rendered, output)
-
-    # Auto-unwrap file-like objects for better UX
-    if result is not None:
-        return result.getvalue()  # Extract str/bytes from StringIO/BytesIO
-    return None
+    return rendered
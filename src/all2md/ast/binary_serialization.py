@@ -0,0 +1,509 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/ast/binary_serialization.py
+"""Compact binary serialization for AST nodes.
+
+AST-JSON (:mod:`all2md.ast.serialization`) is the interchange format: readable,
+schema-validated and stable across releases. This module is the *storage*
+format, built for the conversion cache, where a hit has to cost less than the
+parse it replaces. Decoding a large AST-JSON entry tokenizes the whole file into
+dicts and then validates every one of them on the way back to nodes; for a
+40 MB PDF extraction that is about as slow as re-parsing the PDF.
+
+Layout
+------
+::
+
+    header        magic b"A2MB", format version (u16), flags (u16),
+                  schema digest (8 bytes), string count (u32), float count (u32)
+    string table  per string: varint byte length + UTF-8 bytes
+    float table   little-endian float64 values
+    body          one tagged value (the root node)
+
+Every repeated string -- text runs, URLs, metadata keys, node field values --
+is stored once in the string table and referenced by index, and floats (PDF
+bounding boxes, mostly) likewise live in their own table. A node is a type tag
+(its index in :data:`_NODE_TYPES`) followed by its dataclass fields in
+declaration order; child lists are length-prefixed. The reader walks the body
+in a single pass straight out of the buffer it is given, so a memory-mapped
+file decodes without being copied or tokenized (see :func:`read_ast_file`).
+
+The schema digest is derived from the node classes' names and field layouts.
+A blob written by a build whose nodes had different fields is rejected with a
+``ValueError`` instead of being decoded into the wrong attributes; the
+conversion cache treats that as a miss. Bump :data:`BINARY_FORMAT_VERSION`
+when the encoding itself changes.
+
+Examples
+--------
+Round-trip a document:
+
+    >>> from all2md.ast import Document, Paragraph, Text
+    >>> from all2md.ast.binary_serialization import ast_to_bytes, bytes_to_ast
+    >>> doc = Document(children=[Paragraph(content=[Text(content="Hello")])])
+    >>> bytes_to_ast(ast_to_bytes(doc)) == doc
+    True
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Union
+
+from all2md.ast.nodes import (
+    BlockQuote,
+    Code,
+    CodeBlock,
+    Comment,
+    CommentInline,
+    DefinitionDescription,
+    DefinitionList,
+    DefinitionTerm,
+    Document,
+    Emphasis,
+    Figure,
+    FootnoteDefinition,
+    FootnoteReference,
+    Heading,
+    HTMLBlock,
+    HTMLInline,
+    Image,
+    LineBreak,
+    Link,
+    List,
+    ListItem,
+    Mark,
+    MathBlock,
+    MathInline,
+    Node,
+    Paragraph,
+    SourceLocation,
+    Strikethrough,
+    Strong,
+    Subscript,
+    Superscript,
+    Table,
+    TableCell,
+    TableRow,
+    Text,
+    ThematicBreak,
+    Underline,
+)
+
+#: Version of the binary encoding (tags, header layout). Independent of the
+#: AST-JSON ``schema_version``; node-layout changes are caught by the digest.
+BINARY_FORMAT_VERSION = 1
+
+_MAGIC = b"A2MB"
+_HEADER = struct.Struct("<4sHH8sII")
+
+# Node types in tag order. Append only: a tag's meaning must not change for a
+# given format version (reordering also changes the digest, so stale blobs are
+# rejected rather than misread).
+_NODE_TYPES: tuple[type, ...] = (
+    SourceLocation,
+    Document,
+    Heading,
+    Paragraph,
+    CodeBlock,
+    BlockQuote,
+    List,
+    ListItem,
+    Table,
+    TableRow,
+    TableCell,
+    Figure,
+    ThematicBreak,
+    HTMLBlock,
+    Text,
+    Emphasis,
+    Strong,
+    Code,
+    Link,
+    Image,
+    LineBreak,
+    Strikethrough,
+    Mark,
+    Underline,
+    Superscript,
+    Subscript,
+    HTMLInline,
+    FootnoteReference,
+    MathInline,
+    CommentInline,
+    FootnoteDefinition,
+    DefinitionList,
+    DefinitionTerm,
+    DefinitionDescription,
+    MathBlock,
+    Comment,
+)
+_NODE_TAGS: dict[type, int] = {cls: index for index, cls in enumerate(_NODE_TYPES)}
+_NODE_FIELDS: tuple[tuple[str, ...], ...] = tuple(tuple(f.name for f in dataclasses.fields(cls)) for cls in _NODE_TYPES)
+
+
+def _schema_digest() -> bytes:
+    """Fingerprint the node classes' names and field layouts."""
+    layout = ";".join(
+        f"{cls.__name__}({','.join(names)})" for cls, names in zip(_NODE_TYPES, _NODE_FIELDS, strict=True)
+    )
+    return hashlib.blake2b(layout.encode("utf-8"), digest_size=8).digest()
+
+
+_SCHEMA_DIGEST = _schema_digest()
+
+# Value tags
+_T_NONE = 0
+_T_FALSE = 1
+_T_TRUE = 2
+_T_INT = 3
+_T_FLOAT = 4
+_T_STR = 5
+_T_LIST = 6
+_T_TUPLE = 7
+_T_DICT = 8
+_T_NODE = 9
+_T_EMPTY_LIST = 10
+_T_EMPTY_DICT = 11
+
+BinaryInput = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class _BinaryWriter:
+    """Encode one AST into a body buffer while interning its strings and floats."""
+
+    def __init__(self) -> None:
+        self.body = bytearray()
+        self.strings: list[str] = []
+        self.floats: list[float] = []
+        self._string_index: dict[str, int] = {}
+        self._float_index: dict[bytes, int] = {}
+
+    def varint(self, value: int) -> None:
+        out = self.body
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def string(self, value: str) -> None:
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self._string_index[value] = index
+            self.strings.append(value)
+        self.body.append(_T_STR)
+        self.varint(index)
+
+    def number(self, value: float) -> None:
+        # Keyed on the bit pattern so 0.0/-0.0 and NaN payloads survive interning.
+        key = struct.pack("<d", value)
+        index = self._float_index.get(key)
+        if index is None:
+            index = len(self.floats)
+            self._float_index[key] = index
+            self.floats.append(value)
+        self.body.append(_T_FLOAT)
+        self.varint(index)
+
+    def value(self, value: Any) -> None:
+        # Ordered by frequency in real documents; bool before int (bool is an int).
+        if isinstance(value, str):
+            self.string(value)
+        elif value is None:
+            self.body.append(_T_NONE)
+        elif type(value) in _NODE_TAGS:
+            self.node(value)
+        elif isinstance(value, list):
+            if not value:
+                self.body.append(_T_EMPTY_LIST)
+                return
+            self.body.append(_T_LIST)
+            self.varint(len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            if not value:
+                self.body.append(_T_EMPTY_DICT)
+                return
+            self.body.append(_T_DICT)
+            self.varint(len(value))
+            for key, item in value.items():
+                self.value(key)
+                self.value(item)
+        elif isinstance(value, bool):
+            self.body.append(_T_TRUE if value else _T_FALSE)
+        elif isinstance(value, int):
+            self.body.append(_T_INT)
+            # Zigzag so small negatives stay small.
+            self.varint(value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif isinstance(value, float):
+            self.number(value)
+        elif isinstance(value, tuple):
+            self.body.append(_T_TUPLE)
+            self.varint(len(value))
+            for item in value:
+                self.value(item)
+        else:
+            raise TypeError(f"Cannot serialize value of type {type(value).__name__} to binary AST")
+
+    def node(self, node: Any) -> None:
+        tag = _NODE_TAGS[type(node)]
+        self.body.append(_T_NODE)
+        self.varint(tag)
+        attrs = node.__dict__
+        for name in _NODE_FIELDS[tag]:
+            self.value(attrs[name])
+
+
+def _decode_body(body: memoryview, strings: list[str], floats: list[float]) -> Any:
+    """Decode the single tagged value held in ``body``.
+
+    Iterating a memoryview yields its bytes as ints at C speed, so the decoder
+    pulls bytes with ``next`` instead of tracking an offset by hand. Truncation
+    surfaces as ``StopIteration`` and trailing bytes as a non-empty iterator;
+    the caller turns both into ``ValueError``.
+    """
+    stream = iter(body)
+    nxt = stream.__next__
+    node_types = _NODE_TYPES
+    node_fields = _NODE_FIELDS
+    new = object.__new__
+
+    def varint() -> int:
+        byte = nxt()
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = nxt()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value() -> Any:
+        tag = nxt()
+        if tag == _T_STR:
+            return strings[varint()]
+        if tag == _T_NODE:
+            type_tag = varint()
+            if type_tag >= len(node_types):
+                raise ValueError(f"Unknown node type tag {type_tag} in binary AST")
+            node: Node = new(node_types[type_tag])
+            # Fields were validated when the node was built; going through
+            # __init__/__post_init__ again would only repeat that work.
+            node.__dict__ = {name: value() for name in node_fields[type_tag]}
+            return node
+        if tag == _T_EMPTY_DICT:
+            return {}
+        if tag == _T_NONE:
+            return None
+        if tag == _T_LIST:
+            return [value() for _ in range(varint())]
+        if tag == _T_EMPTY_LIST:
+            return []
+        if tag == _T_DICT:
+            result = {}
+            for _ in range(varint()):
+                key = value()
+                result[key] = value()
+            return result
+        if tag == _T_FLOAT:
+            return floats[varint()]
+        if tag == _T_INT:
+            raw = varint()
+            return raw >> 1 if not raw & 1 else -((raw + 1) >> 1)
+        if tag == _T_TRUE:
+            return True
+        if tag == _T_FALSE:
+            return False
+        if tag == _T_TUPLE:
+            return tuple([value() for _ in range(varint())])
+        raise ValueError(f"Unknown value tag {tag} in binary AST")
+
+    root = value()
+    if next(stream, None) is not None:
+        raise ValueError("Binary AST has trailing bytes after the root node")
+    return root
+
+
+def ast_to_bytes(node: Node) -> bytes:
+    """Serialize an AST node to the compact binary format.
+
+    Parameters
+    ----------
+    node : Node
+        The AST node to serialize (usually a ``Document``)
+
+    Returns
+    -------
+    bytes
+        Header, string and float tables, and node body
+
+    Raises
+    ------
+    TypeError
+        If a node or a metadata value is of a type the format cannot represent
+        (anything that is not a plain str/int/float/bool/None/list/tuple/dict)
+
+    """
+    if type(node) not in _NODE_TAGS:
+        raise TypeError(f"Cannot serialize {type(node).__name__} to binary AST")
+    writer = _BinaryWriter()
+    writer.value(node)
+
+    table = _BinaryWriter()
+    for string in writer.strings:
+        encoded = string.encode("utf-8", "surrogatepass")
+        table.varint(len(encoded))
+        table.body += encoded
+
+    floats = array("d", writer.floats)
+    if struct.pack("=d", 1.0) != struct.pack("<d", 1.0):
+        floats.byteswap()
+
+    header = _HEADER.pack(_MAGIC, BINARY_FORMAT_VERSION, 0, _SCHEMA_DIGEST, len(writer.strings), len(writer.floats))
+    return b"".join((header, table.body, floats.tobytes(), writer.body))
+
+
+def bytes_to_ast(data: BinaryInput) -> Node:
+    """Deserialize an AST node from the binary format.
+
+    Parameters
+    ----------
+    data : bytes, bytearray, memoryview or mmap.mmap
+        The encoded blob. Any object exposing the buffer protocol works, so a
+        memory-mapped file can be decoded in place.
+
+    Returns
+    -------
+    Node
+        Reconstructed AST node
+
+    Raises
+    ------
+    ValueError
+        If the blob is truncated, is not a binary AST, was written by an
+        incompatible format version, or was written against a different node
+        schema
+
+    """
+    with memoryview(data) as view:
+        if view.nbytes < _HEADER.size:
+            raise ValueError("Binary AST is truncated (missing header)")
+        magic, version, _flags, digest, string_count, float_count = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a binary AST (bad magic bytes)")
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported binary AST format version: {version}. "
+                f"This version of all2md supports version {BINARY_FORMAT_VERSION} only."
+            )
+        if digest != _SCHEMA_DIGEST:
+            raise ValueError("Binary AST was written against a different node schema")
+
+        strings: list[str] = []
+        pos = _HEADER.size
+        size = view.nbytes
+        try:
+            for _ in range(string_count):
+                byte = view[pos]
+                pos += 1
+                length = byte & 0x7F
+                shift = 7
+                while byte & 0x80:
+                    byte = view[pos]
+                    pos += 1
+                    length |= (byte & 0x7F) << shift
+                    shift += 7
+                end = pos + length
+                if end > size:
+                    raise ValueError("Binary AST is truncated (string table)")
+                strings.append(str(view[pos:end], "utf-8", "surrogatepass"))
+                pos = end
+        except IndexError as exc:
+            raise ValueError("Binary AST is truncated (string table)") from exc
+
+        float_end = pos + 8 * float_count
+        if float_end > size:
+            raise ValueError("Binary AST is truncated (float table)")
+        float_table = array("d")
+        float_table.frombytes(view[pos:float_end])
+        if struct.pack("=d", 1.0) != struct.pack("<d", 1.0):
+            float_table.byteswap()
+
+        with view[float_end:] as body:
+            try:
+                node = _decode_body(body, strings, float_table.tolist())
+            except StopIteration as exc:
+                raise ValueError("Binary AST is truncated (body)") from exc
+            except (IndexError, RecursionError) as exc:
+                raise ValueError(f"Binary AST is corrupt: {exc}") from exc
+
+    if not isinstance(node, Node):
+        raise ValueError(f"Binary AST root is {type(node).__name__}, not an AST node")
+    return node
+
+
+def write_ast_file(node: Node, path: str | Path) -> None:
+    """Write ``node`` to ``path`` in the binary format.
+
+    Parameters
+    ----------
+    node : Node
+        The AST node to serialize
+    path : str or Path
+        Destination file
+
+    """
+    Path(path).write_bytes(ast_to_bytes(node))
+
+
+def read_ast_file(path: str | Path) -> Node:
+    """Read a binary AST file by memory-mapping it.
+
+    The file is decoded straight out of the mapping -- one read of the pages
+    the decoder touches, no intermediate copy and no tokenizing -- and the
+    mapping is closed before returning.
+
+    Parameters
+    ----------
+    path : str or Path
+        File written by :func:`write_ast_file` (or :func:`ast_to_bytes`)
+
+    Returns
+    -------
+    Node
+        Reconstructed AST node
+
+    Raises
+    ------
+    ValueError
+        If the file is empty or is not a compatible binary AST
+    OSError
+        If the file cannot be opened
+
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError("Binary AST file is empty")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return bytes_to_ast(mapped)
+
+
+__all__ = [
+    "BINARY_FORMAT_VERSION",
+    "ast_to_bytes",
+    "bytes_to_ast",
+    "read_ast_file",
+    "write_ast_file",
+]
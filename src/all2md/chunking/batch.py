@@ -0,0 +1,172 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/chunking/batch.py
+"""Convert-and-chunk jobs shared by :func:`all2md.chunk`, :func:`all2md.chunk_many` and ``all2md chunk``.
+
+A :data:`ChunkJob` is one source plus the ``to_ast`` keyword arguments to convert
+it with; :class:`ChunkSettings` holds the chunking knobs applied to every job.
+:func:`iter_chunk_jobs` runs jobs in this process or across a process pool and
+yields each document's chunks in job order.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Optional, Union, cast
+
+from all2md.ast.nodes import Document
+from all2md.chunking.provenance import chunk_ast
+from all2md.chunking.records import ProvenanceChunk
+from all2md.chunking.tokenization import TokenCounter, get_counter
+from all2md.conversion_cache import install_worker_cache, worker_cache_settings
+from all2md.exceptions import ValidationError
+from all2md.utils.parallel import in_flight_limit, submit_in_order
+
+__all__ = ["ChunkJob", "ChunkSettings", "chunk_job", "iter_chunk_jobs"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChunkSettings:
+    """Chunking knobs shared by every document of one :func:`all2md.chunk` / :func:`all2md.chunk_many` call."""
+
+    strategy: str
+    max_tokens: int
+    overlap: int
+    min_tokens: int
+    include_preamble: bool
+    heading_merge: bool
+    max_heading_level: Optional[int]
+    avoid_table_split: bool
+    avoid_code_split: bool
+    elide_data_uris: bool
+    token_counter: str
+    drop_elements: tuple[str, ...]
+
+
+# (source, document_id or None to derive it, to_ast keyword arguments).
+ChunkJob = tuple[Union[str, Path, IO[bytes], bytes], Optional[str], dict[str, Any]]
+
+# Set by _init_chunk_worker: the token counter a chunk_many worker reuses for every document.
+_worker_counter: Optional[TokenCounter] = None
+
+
+def iter_chunk_jobs(
+    settings: ChunkSettings,
+    jobs: Iterable[ChunkJob],
+    *,
+    workers: int = 1,
+    skip_errors: bool = False,
+) -> Iterator[list[ProvenanceChunk]]:
+    """Convert and chunk each job, yielding one list of chunks per document in job order.
+
+    The token counter is resolved once up front, so a misconfigured counter fails
+    before any document is parsed. With ``workers`` other than 1, jobs fan out to a
+    process pool whose workers each resolve their own counter once; ``jobs`` is
+    pulled only as results are consumed, keeping a bounded window in flight.
+    """
+    if workers < 0:
+        raise ValidationError("workers must be >= 0", parameter_name="workers", parameter_value=workers)
+    counter = get_counter(settings.token_counter, strategy=settings.strategy)
+
+    if workers == 1:
+        for job in jobs:
+            try:
+                chunks = chunk_job(settings, counter, job)
+            except Exception as exc:
+                if not skip_errors:
+                    raise
+                _log_skipped_chunk_job(job, exc)
+                continue
+            yield chunks
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers or None,
+        initializer=_init_chunk_worker,
+        initargs=(settings.token_counter, settings.strategy, worker_cache_settings()),
+    )
+    try:
+        for job, future in submit_in_order(executor, jobs, _chunk_job_worker, settings, limit=in_flight_limit(workers)):
+            assert future is not None  # no job bypasses the pool
+            try:
+                chunks = future.result()
+            except Exception as exc:
+                if not skip_errors:
+                    raise
+                _log_skipped_chunk_job(job, exc)
+                continue
+            yield chunks
+    finally:
+        # Abandon queued documents on error (or an early-closed generator).
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def chunk_job(settings: ChunkSettings, counter: Optional[TokenCounter], job: ChunkJob) -> list[ProvenanceChunk]:
+    """Convert one source and chunk it with ``settings``."""
+    from all2md.api import to_ast
+
+    source, document_id, kwargs = job
+    doc = to_ast(source, **kwargs)
+
+    if settings.drop_elements:
+        from all2md.transforms.builtin import RemoveNodesTransform
+
+        doc = cast(Document, RemoveNodesTransform(node_types=list(settings.drop_elements)).transform(doc))
+
+    doc_id, doc_path = _derive_chunk_identity(source, doc, document_id)
+
+    return chunk_ast(
+        doc,
+        strategy=settings.strategy,
+        max_tokens=settings.max_tokens,
+        overlap=settings.overlap,
+        min_tokens=settings.min_tokens,
+        include_preamble=settings.include_preamble,
+        heading_merge=settings.heading_merge,
+        max_heading_level=settings.max_heading_level,
+        avoid_table_split=settings.avoid_table_split,
+        avoid_code_split=settings.avoid_code_split,
+        elide_data_uris=settings.elide_data_uris,
+        token_counter=settings.token_counter,
+        counter=counter,
+        document_id=doc_id,
+        document_path=doc_path,
+    )
+
+
+def _init_chunk_worker(token_counter: str, strategy: str, cache_settings: Optional[dict[str, Any]]) -> None:
+    """Process-pool initializer: resolve the worker's token counter and open the parent's cache once."""
+    global _worker_counter
+    _worker_counter = get_counter(token_counter, strategy=strategy)
+    install_worker_cache(cache_settings)
+
+
+def _chunk_job_worker(job: ChunkJob, settings: ChunkSettings) -> list[ProvenanceChunk]:
+    """Process-pool entry point for :func:`chunk_job`, using the counter from :func:`_init_chunk_worker`."""
+    return chunk_job(settings, _worker_counter, job)
+
+
+def _log_skipped_chunk_job(job: ChunkJob, exc: Exception) -> None:
+    """Log a document ``skip_errors`` is passing over."""
+    source, document_id, _ = job
+    label = document_id or (str(source) if isinstance(source, (str, Path)) else "document")
+    logger.warning("Skipping document %s: %s", label, exc)
+
+
+def _derive_chunk_identity(source: Any, ast_doc: Document, document_id: Optional[str]) -> tuple[str, Optional[str]]:
+    """Derive ``(document_id, document_path)`` for chunking from the source.
+
+    Reuses the ``source_path`` ``to_ast`` stashes for file inputs; falls back to a
+    generic id (or the caller-supplied ``document_id``) for streams/bytes.
+    """
+    source_path = ast_doc.metadata.get("source_path") if ast_doc.metadata else None
+    if source_path:
+        path = Path(source_path)
+        return document_id or path.stem, path.as_posix()
+    return document_id or "document", None
@@ -14,8 +14,15 @@ inject an :class:`~all2md.chunking.tokenization.TokenCounter` rather than
 constructing a ``tiktoken`` encoder directly, so count-only strategies work
 without ``tiktoken`` installed.
 
+Positions are resolved through two indexes built once per text and shared by
+every chunker: a :class:`LineIndex` of line-start offsets (line/column by binary
+search) and, for token-boundary chunking, a :class:`TokenOffsets` map from token
+index to character offset. Both keep chunking linear in the length of the text.
+
 Classes
 -------
+LineIndex : Line-start offsets of a text, for line/column lookups
+TokenOffsets : A text's tokens and the character offset each one starts at
 PositionTrackingChunker : Abstract base with position + token-limit machinery
 SentenceChunker, TokenChunker, WordChunker, LineChunker, CharChunker,
 ParagraphChunker, SectionChunker, CodeBlockChunker : Concrete strategies
@@ -31,6 +38,7 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -65,6 +73,77 @@ class TextChunk:
     index: int
 
 
+class LineIndex:
+    """Line-start offsets of one text, for O(log n) line/column lookups.
+
+    Parameters
+    ----------
+    text : str
+        The text positions refer to. Kept by reference so a chunker can tell
+        whether a cached index still belongs to the text it is given.
+
+    """
+
+    __slots__ = ("text", "_starts")
+
+    _NEWLINE_RE = re.compile("\n")
+
+    def __init__(self, text: str) -> None:
+        """Record where every line of ``text`` starts."""
+        self.text = text
+        self._starts = [0] + [match.end() for match in self._NEWLINE_RE.finditer(text)]
+
+    def line_column(self, position: int) -> Tuple[int, int]:
+        """Return the 1-based ``(line, column)`` of a character offset, clamped to the text."""
+        position = min(position, len(self.text))
+        line = bisect_right(self._starts, position)
+        return line, position - self._starts[line - 1] + 1
+
+
+class TokenOffsets:
+    """A text's tokens and the character offset each one starts at.
+
+    Built once per text, so a token window's character span is two list
+    lookups instead of a decode of every token before it. Uses the encoding's
+    ``decode_with_offsets`` when it has one (``tiktoken`` does), and otherwise
+    sums the decoded length of each token.
+
+    Parameters
+    ----------
+    text : str
+        The text to tokenize. Kept by reference, like :attr:`LineIndex.text`.
+    encoding : Any
+        A ``tiktoken``-style encoding with ``encode`` and ``decode``.
+
+    """
+
+    __slots__ = ("text", "tokens", "_starts")
+
+    def __init__(self, text: str, encoding: Any) -> None:
+        """Encode ``text`` and map every token to its starting character."""
+        self.text = text
+        self.tokens: List[int] = encoding.encode(text)
+        decode_with_offsets = getattr(encoding, "decode_with_offsets", None)
+        if decode_with_offsets is not None:
+            _decoded, starts = decode_with_offsets(self.tokens)
+        else:
+            starts = []
+            length = 0
+            for token in self.tokens:
+                starts.append(length)
+                length += len(encoding.decode([token]))
+        # Sentinel: the window that runs to the last token ends at the end of the text.
+        self._starts: List[int] = [min(start, len(text)) for start in starts] + [len(text)]
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self.tokens)
+
+    def char_offset(self, token_index: int) -> int:
+        """Return the character offset where token ``token_index`` starts (``len(text)`` past the end)."""
+        return self._starts[min(token_index, len(self.tokens))]
+
+
 class PositionTrackingChunker(ABC):
     """Base class for chunkers that track exact positions.
 
@@ -85,6 +164,8 @@ class PositionTrackingChunker(ABC):
         self.max_tokens = max_tokens
         self.overlap = overlap
         self.counter = counter
+        self._line_index: Optional[LineIndex] = None
+        self._token_offsets: Optional[TokenOffsets] = None
 
     @abstractmethod
     def chunk(self, text: str) -> List[TextChunk]:
@@ -95,29 +176,54 @@ class PositionTrackingChunker(ABC):
         """Count tokens in ``text`` using the injected counter."""
         return self.counter.count(text)
 
+    def _line_index_for(self, text: str) -> LineIndex:
+        """Return the line index of ``text``, building it on first use."""
+        index = self._line_index
+        if index is None or index.text is not text:
+            index = self._line_index = LineIndex(text)
+        return index
+
+    def _token_offsets_for(self, text: str) -> TokenOffsets:
+        """Return the token offset map of ``text``, building it on first use.
+
+        Raises
+        ------
+        ValueError
+            If the counter has no ``encoding`` to tokenize with.
+
+        """
+        offsets = self._token_offsets
+        if offsets is None or offsets.text is not text:
+            encoding = getattr(self.counter, "encoding", None)
+            if encoding is None:
+                raise ValueError("Token offsets require a tiktoken-backed token counter.")
+            offsets = self._token_offsets = TokenOffsets(text, encoding)
+        return offsets
+
     def _calculate_line_column(self, text: str, position: int) -> Tuple[int, int]:
         """Calculate 1-based line and column for a character position."""
-        if position > len(text):
-            position = len(text)
+        return self._line_index_for(text).line_column(position)
 
-        before = text[:position]
-        lines = before.split("\n")
-        line = len(lines)
-
-        last_line = lines[-1]
-        column = len(last_line) + 1 if last_line else 1
-        return line, column
+    def _position(self, text: str, start: int, end: int) -> ChunkPosition:
+        """Build the position of ``text[start:end]``."""
+        index = self._line_index_for(text)
+        line, column = index.line_column(start)
+        end_line, end_column = index.line_column(end)
+        return ChunkPosition(start=start, end=end, line=line, column=column, end_line=end_line, end_column=end_column)
 
     def _create_chunk(self, text: str, start: int, end: int, index: int) -> TextChunk:
         """Create a chunk with position tracking."""
         content = text[start:end]
-        line, column = self._calculate_line_column(text, start)
-        end_line, end_column = self._calculate_line_column(text, end)
-
-        position = ChunkPosition(
-            start=start, end=end, line=line, column=column, end_line=end_line, end_column=end_column
+        return TextChunk(
+            content=content, position=self._position(text, start, end), tokens=self.count_tokens(content), index=index
         )
-        return TextChunk(content=content, position=position, tokens=self.count_tokens(content), index=index)
+
+    def _rebase_chunks(self, chunks: List[TextChunk], text: str, offset: int, base_index: int) -> List[TextChunk]:
+        """Move chunks of ``text[offset:]`` into ``text``'s coordinates, numbering them from ``base_index``."""
+        for i, chunk in enumerate(chunks):
+            chunk.position = self._position(text, offset + chunk.position.start, offset + chunk.position.end)
+            chunk.index = base_index + i
+        return chunks
 
     def _ensure_chunks_within_limit(self, chunks: List[TextChunk], text: str) -> List[TextChunk]:
         """Split any oversized chunk with :class:`CharChunker`, then renumber."""
@@ -135,19 +241,7 @@ class PositionTrackingChunker(ABC):
             )
             char_chunker = CharChunker(self.max_tokens, overlap=0, counter=self.counter)
             sub_chunks = char_chunker.chunk(chunk.content)
-
-            base_start = chunk.position.start
-            base_index = chunk.index
-            for i, sub_chunk in enumerate(sub_chunks):
-                new_start = base_start + sub_chunk.position.start
-                new_end = base_start + sub_chunk.position.end
-                line, column = self._calculate_line_column(text, new_start)
-                end_line, end_column = self._calculate_line_column(text, new_end)
-                sub_chunk.position = ChunkPosition(
-                    start=new_start, end=new_end, line=line, column=column, end_line=end_line, end_column=end_column
-                )
-                sub_chunk.index = base_index + i
-            result.extend(sub_chunks)
+            result.extend(self._rebase_chunks(sub_chunks, text, chunk.position.start, chunk.index))
 
         for i, chunk in enumerate(result):
             chunk.index = i
@@ -287,19 +381,17 @@ class TokenChunker(PositionTrackingChunker):
         if not text.strip():
             return []
 
-        tokens = self.encoding.encode(text)
-        if len(tokens) <= self.max_tokens:
+        offsets = self._token_offsets_for(text)
+        if len(offsets) <= self.max_tokens:
             return [self._create_chunk(text, 0, len(text), 0)]
 
         chunks: List[TextChunk] = []
         chunk_index = 0
         stride = max(1, self.max_tokens - self.overlap)
 
-        for i in range(0, len(tokens), stride):
-            chunk_tokens = tokens[i : i + self.max_tokens]
-            chunk_text = self.encoding.decode(chunk_tokens)
-            start_pos = self._estimate_position(text, tokens, i)
-            end_pos = min(start_pos + len(chunk_text), len(text))
+        for i in range(0, len(offsets), stride):
+            start_pos = offsets.char_offset(i)
+            end_pos = offsets.char_offset(i + self.max_tokens)
             chunks.append(self._create_chunk(text, start_pos, end_pos, chunk_index))
             chunk_index += 1
             if end_pos >= len(text):
@@ -307,13 +399,6 @@ class TokenChunker(PositionTrackingChunker):
 
         return self._ensure_chunks_within_limit(chunks, text)
 
-    def _estimate_position(self, text: str, all_tokens: List[int], token_index: int) -> int:
-        """Estimate a character position from a token index via decode length."""
-        if token_index == 0:
-            return 0
-        prefix_text = self.encoding.decode(all_tokens[:token_index])
-        return min(len(prefix_text), len(text))
-
 
 class WordChunker(PositionTrackingChunker):
     """Chunk by word boundaries while preserving whitespace."""
@@ -407,15 +492,8 @@ class LineChunker(PositionTrackingChunker):
 
     def _split_line_by_words(self, text: str, start: int, end: int, base_index: int) -> List[TextChunk]:
         """Split an over-long line by words, rebasing positions to ``text``."""
-        line_text = text[start:end]
         word_chunker = WordChunker(self.max_tokens, self.overlap, counter=self.counter)
-        word_chunks = word_chunker.chunk(line_text)
-        for chunk in word_chunks:
-            chunk.position.start += start
-            chunk.position.end += start
-            chunk.index = base_index
-            base_index += 1
-        return word_chunks
+        return self._rebase_chunks(word_chunker.chunk(text[start:end]), text, start, base_index)
 
 
 class CharChunker(PositionTrackingChunker):
@@ -517,15 +595,8 @@ class ParagraphChunker(PositionTrackingChunker):
 
     def _split_paragraph_by_sentences(self, text: str, start: int, end: int, base_index: int) -> List[TextChunk]:
         """Split an over-long paragraph by sentences, rebasing positions."""
-        para_text = text[start:end]
         sentence_chunker = SentenceChunker(self.max_tokens, self.overlap, counter=self.counter)
-        sentence_chunks = sentence_chunker.chunk(para_text)
-        for chunk in sentence_chunks:
-            chunk.position.start += start
-            chunk.position.end += start
-            chunk.index = base_index
-            base_index += 1
-        return sentence_chunks
+        return self._rebase_chunks(sentence_chunker.chunk(text[start:end]), text, start, base_index)
 
 
 class SectionChunker(PositionTrackingChunker):
@@ -545,7 +616,8 @@ class SectionChunker(PositionTrackingChunker):
             return []
 
         headers = list(self.header_pattern.finditer(text))
-        header_positions = {h.start() for h in headers}
+        header_starts = [h.start() for h in headers]
+        header_positions = set(header_starts)
 
         if not headers:
             if self.count_tokens(text) <= self.max_tokens:
@@ -583,7 +655,8 @@ class SectionChunker(PositionTrackingChunker):
                 chunk_end = next_break
 
                 if chunk_end in header_positions:
-                    next_header_pos = next((h.start() for h in headers if h.start() > chunk_end), len(text))
+                    following = bisect_right(header_starts, chunk_end)
+                    next_header_pos = header_starts[following] if following < len(header_starts) else len(text)
                     section_text = text[chunk_end:next_header_pos]
                     if chunk_tokens + self.count_tokens(section_text) <= self.max_tokens:
                         chunk_end = next_header_pos
@@ -881,8 +954,8 @@ class CodeBlockChunker(PositionTrackingChunker):
                 large_block_text = text[block_start_pos:block_end_pos]
                 line_chunker = LineChunker(self.max_tokens, self.overlap, counter=self.counter)
                 for line_chunk in line_chunker.chunk(large_block_text):
-                    chunk_start = block_start_pos + large_block_text.index(line_chunk.content)
-                    chunk_end = chunk_start + len(line_chunk.content)
+                    chunk_start = block_start_pos + line_chunk.position.start
+                    chunk_end = block_start_pos + line_chunk.position.end
                     chunks.append(self._create_chunk(text, chunk_start, chunk_end, chunk_index))
                     chunk_index += 1
                 continue
@@ -18,18 +18,21 @@ Two strategy families:
   ``char``/``code``) iterate sections (plus the preamble) and run a
   position-tracking chunker over each section's *rendered Markdown*.
 
-Rendering each unit to Markdown (rather than flattening with ``extract_text``)
-preserves the blank-line/structure boundaries the paragraph/line/section
-chunkers depend on, and yields clean, RAG-friendly chunk text. Character spans
-are therefore into that rendered section text (``char_basis="section_text"``),
-not the original binary -- including when ``avoid_table_split`` /
-``avoid_code_split`` chunk a section one segment at a time; see
-:func:`_build_pieces` for the one case that cannot hold the basis and says so.
+Rendering to Markdown (rather than flattening with ``extract_text``) preserves
+the blank-line/structure boundaries the paragraph/line/section chunkers depend
+on, and yields clean, RAG-friendly chunk text. The document is rendered once,
+with the span of every top-level node recorded
+(:meth:`~all2md.renderers.markdown.MarkdownRenderer.render_to_string_with_spans`);
+sections, atomic segments and each window's provenance nodes are all slices of
+that one string. Character spans are into the rendered section text
+(``char_basis="section_text"``), not the original binary -- including when
+``avoid_table_split`` / ``avoid_code_split`` chunk a section one segment at a time.
 """
 
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import Iterable, Optional, cast
 
@@ -39,7 +42,6 @@ from all2md.ast.splitting import DocumentSplitter
 from all2md.chunking.primitives import ChunkerFactory, PositionTrackingChunker
 from all2md.chunking.records import ProvenanceChunk
 from all2md.chunking.tokenization import TokenCounter, get_counter
-from all2md.constants import DocumentFormat
 
 #: Coarse strategies cut at semantic boundaries (one chunk per unit).
 _COARSE_STRATEGIES = frozenset({"heading", "section", "auto"})
@@ -176,12 +178,16 @@ def chunk_ast(
         cls for cls, on in ((Table, avoid_table_split), (CodeBlock, avoid_code_split)) if on
     )
 
+    # The whole document is rendered once; every unit, segment and span is a slice of it.
+    rendering = _render(list(doc.children), elide_data_uris)
+
     if strategy in _COARSE_STRATEGIES:
         # Coarse strategies emit one chunk per split, so no atomic segmentation is
         # needed; data-URI elision still applies.
         opts = _UnitOpts(atomic_types=(), elide_data_uris=elide_data_uris)
         chunks = _chunk_coarse(
             doc,
+            rendering,
             strategy=strategy,
             max_tokens=max_tokens,
             heading_merge=heading_merge,
@@ -194,6 +200,7 @@ def chunk_ast(
         opts = _UnitOpts(atomic_types=atomic_types, elide_data_uris=elide_data_uris)
         chunks = _chunk_fine(
             doc,
+            rendering,
             strategy=strategy,
             max_tokens=max_tokens,
             overlap=overlap,
@@ -219,6 +226,7 @@ def chunk_ast(
 
 def _chunk_fine(
     doc: Document,
+    rendering: _Rendering,
     *,
     strategy: str,
     max_tokens: int,
@@ -246,7 +254,7 @@ def _chunk_fine(
             chunks,
             chunker=chunker,
             unit_nodes=list(doc.children),
-            provenance_nodes=list(doc.children),
+            rendering=rendering,
             id_base=f"{document_id}::preamble",
             strategy=strategy,
             running_index=running_index,
@@ -266,7 +274,7 @@ def _chunk_fine(
                 chunks,
                 chunker=chunker,
                 unit_nodes=preamble_nodes,
-                provenance_nodes=preamble_nodes,
+                rendering=rendering,
                 id_base=f"{document_id}::preamble",
                 strategy=strategy,
                 running_index=running_index,
@@ -279,13 +287,12 @@ def _chunk_fine(
             )
 
     for section_index, section in enumerate(sections, start=1):
-        provenance_nodes = [section.heading] + list(section.content)
-        unit_nodes: list[Node] = provenance_nodes if heading_merge else list(section.content)
+        unit_nodes: list[Node] = [section.heading, *section.content] if heading_merge else list(section.content)
         running_index = _emit_unit(
             chunks,
             chunker=chunker,
             unit_nodes=unit_nodes,
-            provenance_nodes=provenance_nodes,
+            rendering=rendering,
             id_base=f"{document_id}::s{section_index}",
             strategy=strategy,
             running_index=running_index,
@@ -307,6 +314,7 @@ def _chunk_fine(
 
 def _chunk_coarse(
     doc: Document,
+    rendering: _Rendering,
     *,
     strategy: str,
     max_tokens: int,
@@ -331,20 +339,20 @@ def _chunk_coarse(
     chunks: list[ProvenanceChunk] = []
     running_index = 0
     for split in splits:
-        provenance_nodes = list(split.document.children)
-        unit_nodes = provenance_nodes if heading_merge else _drop_leading_heading(provenance_nodes)
+        split_nodes = list(split.document.children)
+        unit_nodes = split_nodes if heading_merge else _drop_leading_heading(split_nodes)
         running_index = _emit_unit(
             chunks,
             chunker=chunker,
             unit_nodes=unit_nodes,
-            provenance_nodes=provenance_nodes,
+            rendering=rendering,
             id_base=f"{document_id}::p{split.index}",
             strategy=strategy,
             running_index=running_index,
             document_id=document_id,
             document_path=document_path,
             section_heading=split.title,
-            section_level=_first_heading_level(provenance_nodes),
+            section_level=_first_heading_level(split_nodes),
             section_index=split.index,
             opts=opts,
         )
@@ -361,7 +369,7 @@ def _emit_unit(
     *,
     chunker: PositionTrackingChunker,
     unit_nodes: list[Node],
-    provenance_nodes: list[Node],
+    rendering: _Rendering,
     id_base: str,
     strategy: str,
     running_index: int,
@@ -372,7 +380,7 @@ def _emit_unit(
     section_index: int,
     opts: _UnitOpts,
 ) -> int:
-    """Render ``unit_nodes`` to Markdown, chunk it, and append provenance chunks.
+    """Slice ``unit_nodes`` out of ``rendering``, chunk it, and append provenance chunks.
 
     When ``opts.atomic_types`` is non-empty, the unit is segmented at those node
     boundaries: each atomic node (e.g. a table or code block) becomes one chunk
@@ -380,7 +388,7 @@ def _emit_unit(
     normally. Chunk numbering stays continuous across segments. Returns the new
     running index.
     """
-    pieces = _build_pieces(chunker, unit_nodes, provenance_nodes, opts)
+    pieces = _build_pieces(chunker, unit_nodes, rendering, opts)
     for chunk_in_unit, (text, tokens, char_start, char_end, prov_nodes, char_basis) in enumerate(pieces, start=1):
         page, page_end, line_start, line_end = _node_provenance(prov_nodes)
         chunks.append(
@@ -414,86 +422,113 @@ def _emit_unit(
 _Piece = tuple[str, int, int, int, list[Node], str]
 
 
+@dataclass(frozen=True)
+class _Rendering:
+    """Nodes rendered to Markdown once, with where each top-level node landed.
+
+    Attributes
+    ----------
+    text : str
+        The rendered Markdown (data URIs already elided when asked).
+    spans : dict
+        ``id(node) -> (start, end)`` into ``text`` for every rendered node.
+    nodes : tuple of Node
+        The rendered nodes, held so the ids in ``spans`` stay theirs.
+
+    """
+
+    text: str
+    spans: dict[int, tuple[int, int]]
+    nodes: tuple[Node, ...]
+
+    def span_of(self, nodes: list[Node]) -> Optional[tuple[int, int]]:
+        """Return the span covering the consecutive run ``nodes``, or None if any was not rendered here."""
+        if not nodes or any(id(node) not in self.spans for node in nodes):
+            return None
+        return self.spans[id(nodes[0])][0], self.spans[id(nodes[-1])][1]
+
+
+def _render(nodes: list[Node], elide_data_uris: bool = True) -> _Rendering:
+    """Render ``nodes`` to Markdown in one pass, recording each node's span in the result."""
+    from all2md.renderers.markdown import MarkdownRenderer
+
+    text, block_spans = MarkdownRenderer().render_to_string_with_spans(Document(children=list(nodes)))
+    if elide_data_uris:
+        text, block_spans = _elide_data_uris(text, block_spans)
+    return _Rendering(
+        text=text,
+        spans={id(node): span for node, span in zip(nodes, block_spans, strict=True)},
+        nodes=tuple(nodes),
+    )
+
+
 def _build_pieces(
     chunker: PositionTrackingChunker,
     unit_nodes: list[Node],
-    provenance_nodes: list[Node],
+    rendering: _Rendering,
     opts: _UnitOpts,
 ) -> list[_Piece]:
-    """Render and chunk a unit into pieces, keeping atomic nodes whole when asked.
-
-    Every piece carries a span *into the unit's own rendered Markdown* -- the string a
-    consumer gets by rendering the section, which is what ``char_basis="section_text"``
-    promises. The segmented path renders each segment separately, so its windows count
-    from 0 within that segment; each segment is located in the whole-unit rendering and
-    its windows are shifted by that offset. A segment that cannot be located (rendering
-    a fragment is not always a substring of rendering the whole -- footnote definitions,
-    for one, are collected at the end of whatever document they are rendered in) keeps
-    its segment-relative span and says so with ``char_basis="segment_text"``, rather
-    than reporting a section offset that is wrong.
+    """Slice a unit out of the rendered document and chunk it, keeping atomic nodes whole when asked.
+
+    The unit, each of its segments and each window's provenance all come from the one
+    rendering: the unit's text is the slice spanning its nodes, a segment is a sub-slice
+    at a known offset, and a window's provenance is the nodes its span overlaps. Every
+    piece carries a span *into the unit's own rendered Markdown* -- the string a consumer
+    gets by rendering the section, which is what ``char_basis="section_text"`` promises.
+    A unit whose nodes are not in ``rendering`` (not a run of the document's own
+    children) is rendered once on its own instead.
     """
-    pieces: list[_Piece] = []
+    unit_span = rendering.span_of(unit_nodes)
+    if unit_span is None:
+        rendering = _render(unit_nodes, opts.elide_data_uris)
+        unit_span = rendering.span_of(unit_nodes)
+        if unit_span is None:
+            return []
+    unit_start = unit_span[0]
 
     if opts.atomic_types and any(isinstance(n, opts.atomic_types) for n in unit_nodes):
-        # One extra render of the whole unit, only on this path, to have the string the
-        # spans are documented to index into.
-        section_text = _render_markdown(unit_nodes, opts.elide_data_uris)
-        cursor = 0
-        for seg_nodes, is_atomic in _segment_atomic(unit_nodes, opts.atomic_types):
-            text = _render_markdown(seg_nodes, opts.elide_data_uris)
-            if not text.strip():
-                continue
-            offset = _locate_segment(section_text, text, cursor)
-            basis = "section_text" if offset is not None else "segment_text"
-            base = offset if offset is not None else 0
-            if offset is not None:
-                cursor = offset + len(text)
-            if is_atomic:
-                # Whole atomic node is one chunk; allowed to exceed max_tokens.
-                pieces.append((text, chunker.counter.count(text), base, base + len(text), seg_nodes, basis))
-            else:
-                for window in chunker.chunk(text):
-                    pieces.append(
-                        (
-                            window.content,
-                            window.tokens,
-                            base + window.position.start,
-                            base + window.position.end,
-                            seg_nodes,
-                            basis,
-                        )
-                    )
-        return pieces
-
-    text = _render_markdown(unit_nodes, opts.elide_data_uris)
-    if text.strip():
+        segments = _segment_atomic(unit_nodes, opts.atomic_types)
+    else:
+        segments = [(unit_nodes, False)]
+
+    pieces: list[_Piece] = []
+    for seg_nodes, is_atomic in segments:
+        seg_start, seg_end = cast(tuple[int, int], rendering.span_of(seg_nodes))
+        text = rendering.text[seg_start:seg_end]
+        if not text.strip():
+            continue
+        base = seg_start - unit_start
+        if is_atomic:
+            # Whole atomic node is one chunk; allowed to exceed max_tokens.
+            pieces.append((text, chunker.counter.count(text), base, base + len(text), seg_nodes, "section_text"))
+            continue
+        locate = _NodeLocator(rendering, seg_nodes)
         for window in chunker.chunk(text):
             pieces.append(
                 (
                     window.content,
                     window.tokens,
-                    window.position.start,
-                    window.position.end,
-                    provenance_nodes,
+                    base + window.position.start,
+                    base + window.position.end,
+                    locate(seg_start + window.position.start, seg_start + window.position.end),
                     "section_text",
                 )
             )
     return pieces
 
 
-def _locate_segment(section_text: str, segment_text: str, cursor: int) -> Optional[int]:
-    """Return where ``segment_text`` starts in ``section_text``, or None if it does not.
+class _NodeLocator:
+    """Find which of a run of rendered nodes a span of the rendering overlaps."""
 
-    Searching forward from ``cursor`` (the end of the previous segment) keeps the
-    segments in document order when two of them render identically -- two tables with
-    the same cells, say -- which a plain search would collapse onto the first match.
-    Falls back to a search from the start so one unlocatable segment does not strand
-    every segment after it.
-    """
-    offset = section_text.find(segment_text, cursor)
-    if offset < 0:
-        offset = section_text.find(segment_text)
-    return offset if offset >= 0 else None
+    def __init__(self, rendering: _Rendering, nodes: list[Node]) -> None:
+        self._nodes = nodes
+        self._starts = [rendering.spans[id(node)][0] for node in nodes]
+        self._ends = [rendering.spans[id(node)][1] for node in nodes]
+
+    def __call__(self, start: int, end: int) -> list[Node]:
+        first = bisect_right(self._ends, start)
+        last = bisect_left(self._starts, end)
+        return self._nodes[first:last] or list(self._nodes)
 
 
 def _segment_atomic(nodes: list[Node], atomic_types: tuple[type, ...]) -> list[tuple[list[Node], bool]]:
@@ -513,34 +548,38 @@ def _segment_atomic(nodes: list[Node], atomic_types: tuple[type, ...]) -> list[t
     return segments
 
 
-def _render_markdown(nodes: list[Node], elide_data_uris: bool = True) -> str:
-    """Render a list of AST nodes to Markdown (the chunk source text)."""
-    if not nodes:
-        return ""
-    from all2md.api import from_ast
-
-    rendered = from_ast(Document(children=list(nodes)), cast(DocumentFormat, "markdown"))
-    if not isinstance(rendered, str):
-        return ""
-    return _elide_data_uris(rendered) if elide_data_uris else rendered
-
-
-def _elide_data_uris(text: str) -> str:
-    """Replace long ``data:…;base64,…`` payloads with a short placeholder.
+def _elide_data_uris(text: str, spans: list[tuple[int, int]]) -> tuple[str, list[tuple[int, int]]]:
+    """Replace long ``data:…;base64,…`` payloads with a short placeholder, moving ``spans`` to match.
 
     Keeps the surrounding Markdown (e.g. ``![alt](…)``) intact so a chunk records
     that an embedded asset was present without carrying the base64 blob — which
-    would otherwise inflate token counts and shred into noise chunks.
+    would otherwise inflate token counts and shred into noise chunks. A data URI
+    never crosses a block boundary, so each span endpoint only shifts left by what
+    was elided before it.
     """
-
-    def _repl(match: re.Match[str]) -> str:
+    parts: list[str] = []
+    match_ends: list[int] = []
+    shrinkage: list[int] = []
+    last = 0
+    for match in _DATA_URI_RE.finditer(text):
         data = match.group("data")
         if len(data) <= _DATA_URI_ELIDE_THRESHOLD:
-            return match.group(0)
+            continue
         mime = match.group("mime") or "application/octet-stream"
-        return f"data:{mime};base64,<elided:{len(data)}B>"
-
-    return _DATA_URI_RE.sub(_repl, text)
+        replacement = f"data:{mime};base64,<elided:{len(data)}B>"
+        parts.extend((text[last : match.start()], replacement))
+        last = match.end()
+        match_ends.append(last)
+        shrinkage.append((shrinkage[-1] if shrinkage else 0) + len(match.group(0)) - len(replacement))
+    if not match_ends:
+        return text, spans
+    parts.append(text[last:])
+
+    def _move(position: int) -> int:
+        index = bisect_right(match_ends, position)
+        return position - (shrinkage[index - 1] if index else 0)
+
+    return "".join(parts), [(_move(start), _move(end)) for start, end in spans]
 
 
 def _iter_nodes(nodes: Iterable[Node]) -> Iterable[Node]:
@@ -114,6 +114,18 @@ def dispatch_command(args: list[str] | None = None) -> int | None:  # noqa: C901
 
         return handle_chunk_command(args[1:])
 
+    # Check for mailbox command (incremental, resumable mailbox conversion)
+    if args[0] == "mailbox":
+        from all2md.cli.commands.mailbox import handle_mailbox_command
+
+        return handle_mailbox_command(args[1:])
+
+    # Check for cache command (conversion cache maintenance)
+    if args[0] == "cache":
+        from all2md.cli.commands.cache import handle_cache_command
+
+        return handle_cache_command(args[1:])
+
     # Check for report command (conversion confidence "quality card")
     if args[0] == "report":
         from all2md.cli.commands.report import handle_report_command
@@ -0,0 +1,146 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/cli/commands/cache.py
+"""Conversion cache maintenance command.
+
+``all2md cache`` inspects and trims the on-disk conversion cache that
+``--cache`` (or ``ALL2MD_CACHE=1``) enables on the converting commands.
+
+Examples
+--------
+    all2md cache stats
+    all2md cache stats --json
+    all2md cache prune --max-size 500MB
+    all2md cache clear --cache-dir /var/cache/all2md
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from all2md.cli.builder import EXIT_SUCCESS, EXIT_VALIDATION_ERROR
+from all2md.cli.commands.shared import parse_cache_size_arg
+
+
+def _format_size(size_bytes: int | float) -> str:
+    size = float(size_bytes)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} TB"
+
+
+def _create_cache_parser() -> argparse.ArgumentParser:
+    """Build the argparse parser for ``all2md cache``."""
+    parser = argparse.ArgumentParser(
+        prog="all2md cache",
+        description="Inspect and trim the on-disk conversion cache.",
+    )
+    subparsers = parser.add_subparsers(dest="action", metavar="{stats,prune,clear}")
+
+    def add_dir_argument(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument(
+            "--cache-dir",
+            metavar="DIR",
+            default=None,
+            help="Conversion cache directory (default: per-OS user cache dir, or $ALL2MD_CACHE_DIR).",
+        )
+
+    stats = subparsers.add_parser("stats", help="Show entry count, size, bounds and lifetime hit/miss counters.")
+    add_dir_argument(stats)
+    stats.add_argument("--json", action="store_true", help="Emit the statistics as JSON.")
+
+    prune = subparsers.add_parser("prune", help="Evict least recently used entries down to the size/entry bounds.")
+    add_dir_argument(prune)
+    prune.add_argument(
+        "--max-size",
+        metavar="SIZE",
+        type=parse_cache_size_arg,
+        default=None,
+        help="Prune to this total size, e.g. 500MB (default: $ALL2MD_CACHE_MAX_SIZE, else 2G).",
+    )
+    prune.add_argument(
+        "--max-entries",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Prune to at most N entries (default: $ALL2MD_CACHE_MAX_ENTRIES, else unbounded).",
+    )
+
+    clear = subparsers.add_parser("clear", help="Remove every cached entry.")
+    add_dir_argument(clear)
+    return parser
+
+
+def handle_cache_command(args: list[str] | None = None) -> int:
+    """Handle the ``cache`` command.
+
+    Parameters
+    ----------
+    args : list[str], optional
+        Command line arguments (beyond 'cache').
+
+    Returns
+    -------
+    int
+        Exit code.
+
+    """
+    from all2md.conversion_cache import ConversionCache, cache_limits_from_env, default_cache_dir
+
+    parser = _create_cache_parser()
+    try:
+        parsed = parser.parse_args(args or [])
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 0
+
+    if parsed.action is None:
+        parser.print_help(sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    max_bytes, max_entries = cache_limits_from_env()
+    if parsed.action == "prune":
+        if parsed.max_size is not None:
+            max_bytes = parsed.max_size or None
+        if parsed.max_entries is not None:
+            max_entries = parsed.max_entries or None
+    directory = Path(parsed.cache_dir).expanduser() if parsed.cache_dir else default_cache_dir()
+    cache = ConversionCache(directory, max_bytes=max_bytes, max_entries=max_entries)
+
+    if parsed.action == "stats":
+        entries, total = cache.usage()
+        lifetime = cache.lifetime_stats()
+        if parsed.json:
+            payload = {
+                "directory": str(directory),
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": max_bytes,
+                "max_entries": max_entries,
+                "lifetime": {**lifetime.to_dict(), "hit_rate": lifetime.hit_rate},
+            }
+            print(json.dumps(payload, indent=2))
+            return EXIT_SUCCESS
+        print(f"directory:    {directory}")
+        print(f"entries:      {entries:,}" + (f" / {max_entries:,}" if max_entries else ""))
+        print(f"size:         {_format_size(total)}" + (f" / {_format_size(max_bytes)}" if max_bytes else ""))
+        print(f"hits:         {lifetime.hits:,}  ({lifetime.hit_rate:.0%} of lookups)")
+        print(f"misses:       {lifetime.misses:,}")
+        print(f"writes:       {lifetime.writes:,}  ({_format_size(lifetime.bytes_written)})")
+        print(f"evictions:    {lifetime.evictions:,}  ({_format_size(lifetime.bytes_evicted)})")
+        return EXIT_SUCCESS
+
+    if parsed.action == "prune":
+        removed, freed = cache.prune()
+        cache.flush_stats()
+        print(f"Pruned {removed:,} entries ({_format_size(freed)}) from {directory}")
+        return EXIT_SUCCESS
+
+    removed, freed = cache.clear()
+    print(f"Cleared {removed:,} entries ({_format_size(freed)}) from {directory}")
+    return EXIT_SUCCESS
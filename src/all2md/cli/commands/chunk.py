@@ -13,6 +13,7 @@ Examples
     all2md chunk report.pdf --strategy semantic --max-tokens 512 --overlap 64
     all2md chunk notes.md --strategy paragraph --token-counter whitespace
     all2md chunk *.docx --format json --out chunks.json
+    all2md chunk corpus/*.pdf --parallel 8 --cache --out chunks.jsonl
     cat doc.html | all2md chunk - --strategy section
 
 """
@@ -22,11 +23,13 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
 from pathlib import Path
-from typing import cast
+from typing import IO
 
-from all2md.ast.nodes import Document
-from all2md.chunking import STRATEGIES, ProvenanceChunk, chunk_ast
+from all2md.chunking import STRATEGIES, ProvenanceChunk
+from all2md.chunking.batch import ChunkJob, ChunkSettings, iter_chunk_jobs
 from all2md.cli.builder import (
     EXIT_DEPENDENCY_ERROR,
     EXIT_ERROR,
@@ -34,31 +37,10 @@ from all2md.cli.builder import (
     EXIT_SUCCESS,
     EXIT_VALIDATION_ERROR,
 )
-from all2md.cli.commands.shared import add_cache_arguments, conversion_cache_from_args
+from all2md.cli.commands.shared import add_cache_arguments, conversion_cache_from_args, non_negative_int, positive_int
 from all2md.cli.config import apply_config_to_parser
 from all2md.exceptions import All2MdError, DependencyError
-
-
-def _positive_int(value: str) -> int:
-    """Validate a strictly positive integer argument."""
-    try:
-        ivalue = int(value)
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'") from e
-    if ivalue < 1:
-        raise argparse.ArgumentTypeError(f"must be >= 1, got {ivalue}")
-    return ivalue
-
-
-def _non_negative_int(value: str) -> int:
-    """Validate a non-negative integer argument."""
-    try:
-        ivalue = int(value)
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'") from e
-    if ivalue < 0:
-        raise argparse.ArgumentTypeError(f"must be >= 0, got {ivalue}")
-    return ivalue
+from all2md.utils.io_utils import replace_on_success
 
 
 def _heading_level(value: str) -> int:
@@ -95,19 +77,19 @@ def _create_chunk_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--max-tokens",
-        type=_positive_int,
+        type=positive_int,
         default=512,
         help="Maximum tokens per chunk (default: 512).",
     )
     parser.add_argument(
         "--overlap",
-        type=_non_negative_int,
+        type=non_negative_int,
         default=0,
         help="Overlap between consecutive windows (coerced to 0 for coarse strategies; default: 0).",
     )
     parser.add_argument(
         "--min-tokens",
-        type=_non_negative_int,
+        type=non_negative_int,
         default=0,
         help="Drop trailing chunks smaller than this many tokens (default: 0, keep all).",
     )
@@ -181,6 +163,20 @@ def _create_chunk_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--out", "-o", help="Write output to a file (default: stdout).")
 
+    parser.add_argument(
+        "--parallel",
+        type=non_negative_int,
+        default=1,
+        metavar="N",
+        help="Parse and chunk documents in N worker processes (0 = one per CPU; default: 1, in-process). "
+        "Output keeps input order and is written as each document finishes.",
+    )
+    parser.add_argument(
+        "--skip-errors",
+        action="store_true",
+        help="Skip documents that fail to convert or chunk (logged as a warning) instead of stopping.",
+    )
+
     parser.add_argument(
         "--config",
         help="Path to a configuration file. Values in its [chunk] section provide defaults "
@@ -224,27 +220,25 @@ def _parse_drop_elements(spec: str | None) -> list[str]:
     return types
 
 
-def _load_ast(source: str, converter_options: dict) -> tuple[Document, str, str | None]:
-    """Load an input to an AST, returning ``(doc, document_id, document_path)``.
+def _chunk_job(source: str, converter_options: dict) -> ChunkJob:
+    """Turn an input into a ``(source, document_id, to_ast kwargs)`` chunking job.
 
     ``converter_options`` is a dot-notation options dict (from config + CLI
-    overrides); it is projected onto the detected format before conversion.
+    overrides); it is projected onto the detected format here, in the parent
+    process, so workers receive ready-to-use ``to_ast`` keyword arguments.
     """
-    from all2md import to_ast
     from all2md.cli.processors import prepare_options_for_execution
 
     if source == "-":
         data = sys.stdin.buffer.read()
         if not data:
             raise All2MdError("No data received from stdin")
-        kwargs = prepare_options_for_execution(converter_options, None, "auto")
-        return cast(Document, to_ast(data, **kwargs)), "stdin", None
+        return data, "stdin", prepare_options_for_execution(converter_options, None, "auto")
 
     path = Path(source)
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {source}")
-    kwargs = prepare_options_for_execution(converter_options, path, "auto")
-    return cast(Document, to_ast(source, **kwargs)), path.stem, path.as_posix()
+    return source, path.stem, prepare_options_for_execution(converter_options, path, "auto")
 
 
 def _render_pretty(chunks: list[ProvenanceChunk]) -> str:
@@ -265,13 +259,27 @@ def _render_pretty(chunks: list[ProvenanceChunk]) -> str:
     return "\n".join(lines)
 
 
-def _format_output(chunks: list[ProvenanceChunk], output_format: str) -> str:
-    """Serialize chunks to the requested output format."""
-    if output_format == "jsonl":
-        return "\n".join(json.dumps(c.to_dict(), ensure_ascii=False) for c in chunks)
+def _write_chunks(documents: Iterable[list[ProvenanceChunk]], output_format: str, out: IO[str]) -> int:
+    """Write each document's chunks to ``out`` as it arrives, returning the chunk count.
+
+    ``jsonl`` and ``pretty`` are written a document at a time, so memory stays flat
+    however many documents there are; ``json`` is one array and is written at the end.
+    """
+    count = 0
+    collected: list[dict] = []
+    for chunks in documents:
+        count += len(chunks)
+        if output_format == "json":
+            collected.extend(c.to_dict() for c in chunks)
+        elif chunks:
+            if output_format == "jsonl":
+                out.writelines(json.dumps(c.to_dict(), ensure_ascii=False) + "\n" for c in chunks)
+            else:
+                out.write(_render_pretty(chunks) + "\n")
+            out.flush()
     if output_format == "json":
-        return json.dumps([c.to_dict() for c in chunks], ensure_ascii=False, indent=2)
-    return _render_pretty(chunks)
+        out.write(json.dumps(collected, ensure_ascii=False, indent=2) + "\n")
+    return count
 
 
 def handle_chunk_command(args: list[str] | None = None) -> int:
@@ -310,47 +318,52 @@ def handle_chunk_command(args: list[str] | None = None) -> int:
         converter_options["attachment_mode"] = parsed.attachment_mode
 
     drop_types = _parse_drop_elements(parsed.drop_elements)
-    drop_transform = None
     if drop_types:
         from all2md.transforms.builtin import RemoveNodesTransform
 
         try:
-            drop_transform = RemoveNodesTransform(node_types=drop_types)
+            RemoveNodesTransform(node_types=drop_types)
         except ValueError as e:
             print(f"Error: invalid --drop-elements: {e}", file=sys.stderr)
             return EXIT_VALIDATION_ERROR
 
-    all_chunks: list[ProvenanceChunk] = []
+    settings = ChunkSettings(
+        strategy=parsed.strategy,
+        max_tokens=parsed.max_tokens,
+        overlap=parsed.overlap,
+        min_tokens=parsed.min_tokens,
+        include_preamble=parsed.include_preamble,
+        heading_merge=parsed.heading_merge,
+        max_heading_level=parsed.max_heading_level,
+        avoid_table_split=parsed.avoid_table_split,
+        avoid_code_split=parsed.avoid_code_split,
+        elide_data_uris=parsed.elide_data_uris,
+        token_counter=parsed.token_counter,
+        drop_elements=tuple(drop_types),
+    )
+
+    def jobs() -> Iterator[ChunkJob]:
+        for source in parsed.inputs:
+            try:
+                job = _chunk_job(source, converter_options)
+            except FileNotFoundError as e:
+                if not parsed.skip_errors:
+                    raise
+                print(f"Warning: skipping {source}: {e}", file=sys.stderr)
+                continue
+            label = Path(source).as_posix() if source != "-" else "stdin"
+            print(f"Chunking {label} (strategy={parsed.strategy}, max_tokens={parsed.max_tokens})...", file=sys.stderr)
+            yield job
+
+    out_path = Path(parsed.out) if parsed.out else None
     try:
-        # Conversion happens in _load_ast (to_ast); an opt-in cache lets repeated
-        # chunk runs over the same files skip re-parsing.
-        with conversion_cache_from_args(parsed):
-            for source in parsed.inputs:
-                doc, document_id, document_path = _load_ast(source, converter_options)
-                if drop_transform is not None:
-                    doc = cast(Document, drop_transform.transform(doc))
-                label = document_path or document_id
-                print(
-                    f"Chunking {label} (strategy={parsed.strategy}, max_tokens={parsed.max_tokens})...",
-                    file=sys.stderr,
-                )
-                chunks = chunk_ast(
-                    doc,
-                    strategy=parsed.strategy,
-                    max_tokens=parsed.max_tokens,
-                    overlap=parsed.overlap,
-                    document_id=document_id,
-                    document_path=document_path,
-                    include_preamble=parsed.include_preamble,
-                    heading_merge=parsed.heading_merge,
-                    max_heading_level=parsed.max_heading_level,
-                    avoid_table_split=parsed.avoid_table_split,
-                    avoid_code_split=parsed.avoid_code_split,
-                    elide_data_uris=parsed.elide_data_uris,
-                    min_tokens=parsed.min_tokens,
-                    token_counter=parsed.token_counter,
-                )
-                all_chunks.extend(chunks)
+        # Conversion happens in the jobs (to_ast); an opt-in cache lets repeated
+        # chunk runs over the same files skip re-parsing, and pool workers share it.
+        with conversion_cache_from_args(parsed), ExitStack() as stack:
+            # --out only replaces an existing file once every document has been written.
+            out: IO[str] = stack.enter_context(replace_on_success(out_path)) if out_path else sys.stdout
+            documents = iter_chunk_jobs(settings, jobs(), workers=parsed.parallel, skip_errors=parsed.skip_errors)
+            total = _write_chunks(documents, parsed.output_format, out)
     except DependencyError as e:
         print(f"Error: {e}", file=sys.stderr)
         return EXIT_DEPENDENCY_ERROR
@@ -364,14 +377,7 @@ def handle_chunk_command(args: list[str] | None = None) -> int:
         print(f"Error chunking document: {e}", file=sys.stderr)
         return EXIT_ERROR
 
-    output = _format_output(all_chunks, parsed.output_format)
-
-    if parsed.out:
-        out_path = Path(parsed.out)
-        out_path.write_text(output + ("\n" if output and not output.endswith("\n") else ""), encoding="utf-8")
-        print(f"Wrote {len(all_chunks)} chunk(s) to {out_path}", file=sys.stderr)
-    else:
-        if output:
-            print(output)
-    print(f"Done: {len(all_chunks)} chunk(s) from {len(parsed.inputs)} input(s).", file=sys.stderr)
+    if out_path:
+        print(f"Wrote {total} chunk(s) to {out_path}", file=sys.stderr)
+    print(f"Done: {total} chunk(s) from {len(parsed.inputs)} input(s).", file=sys.stderr)
     return EXIT_SUCCESS
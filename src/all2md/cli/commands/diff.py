@@ -18,6 +18,7 @@ from all2md.cli.config import apply_config_to_parser
 from all2md.diff.renderers.html import HtmlDiffRenderer
 from all2md.diff.renderers.json import JsonDiffRenderer
 from all2md.diff.renderers.unified import UnifiedDiffRenderer
+from all2md.diff.sequence import DEFAULT_DIFF_TIMEOUT
 
 
 def _validate_context_lines(value: str) -> int:
@@ -50,6 +51,36 @@ def _validate_context_lines(value: str) -> int:
     return ivalue
 
 
+def _validate_timeout(value: str) -> float:
+    """Validate the diff timeout is a non-negative number of seconds.
+
+    Parameters
+    ----------
+    value : str
+        Timeout value as string
+
+    Returns
+    -------
+    float
+        Validated timeout in seconds (0 disables the timeout)
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If value is not a non-negative number
+
+    """
+    try:
+        fvalue = float(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"timeout must be a number of seconds, got '{value}'") from e
+
+    if fvalue < 0:
+        raise argparse.ArgumentTypeError(f"timeout must be non-negative, got {value}")
+
+    return fvalue
+
+
 def _create_diff_parser() -> argparse.ArgumentParser:
     """Create argparse parser for diff command.
 
@@ -106,6 +137,13 @@ def _create_diff_parser() -> argparse.ArgumentParser:
         default="block",
         help="Diff granularity: block (default), sentence, or word",
     )
+    parser.add_argument(
+        "--timeout",
+        type=_validate_timeout,
+        default=DEFAULT_DIFF_TIMEOUT,
+        help=f"Seconds to search for a minimal diff before showing the remaining changed regions as "
+        f"whole replacements (default: {DEFAULT_DIFF_TIMEOUT:g}, 0 = no limit)",
+    )
 
     # HTML-specific options
     parser.add_argument(
@@ -215,10 +253,18 @@ def handle_diff_command(args: list[str] | None = None) -> int:
             context_lines=parsed.context,
             ignore_whitespace=parsed.ignore_whitespace,
             granularity=parsed.granularity,
+            timeout=parsed.timeout or None,
         )
 
         has_changes = any(op.tag != "equal" for op in diff_result.iter_operations())
 
+        if diff_result.timed_out:
+            print(
+                f"Warning: diff timed out after {parsed.timeout:g}s; some changed regions are shown "
+                "as whole replacements (raise --timeout for a finer diff)",
+                file=sys.stderr,
+            )
+
         if not has_changes:
             print("No differences found.", file=sys.stderr)
             # Still output empty diff in requested format
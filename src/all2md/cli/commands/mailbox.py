@@ -0,0 +1,229 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/cli/commands/mailbox.py
+"""Incremental mailbox conversion command.
+
+``all2md mailbox`` converts an mbox file or a maildir/MH/Babyl/MMDF mailbox
+one message at a time and writes each message (or batch of messages) as soon
+as it is converted, instead of building the whole mailbox in memory first. A
+run that stops part-way can be resumed: the command reports the position of
+the last message it wrote, which ``--start-offset`` (mbox) or ``--after-key``
+(any format) picks up from.
+
+Examples
+--------
+    all2md mailbox archive.mbox --out archive.md
+    all2md mailbox archive.mbox --format jsonl --workers 4 > messages.jsonl
+    all2md mailbox archive.mbox --start-offset 1048576 --batch-size 50
+    all2md mailbox ~/Maildir --after-key 1700000000.M1P2.host --max-messages 500
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Any
+
+from all2md.cli.builder import (
+    EXIT_DEPENDENCY_ERROR,
+    EXIT_ERROR,
+    EXIT_FILE_ERROR,
+    EXIT_SUCCESS,
+    EXIT_VALIDATION_ERROR,
+)
+from all2md.cli.commands.shared import non_negative_int, positive_int
+from all2md.exceptions import All2MdError, DependencyError, ValidationError
+
+
+def _create_mailbox_parser() -> argparse.ArgumentParser:
+    """Build the argparse parser for ``all2md mailbox``."""
+    parser = argparse.ArgumentParser(
+        prog="all2md mailbox",
+        description="Convert a mailbox to Markdown one message at a time, with resumable output.",
+        add_help=True,
+    )
+    parser.add_argument("input", help="mbox file or maildir/MH/Babyl/MMDF mailbox.")
+
+    parser.add_argument(
+        "--format",
+        "-f",
+        dest="output_format",
+        choices=["markdown", "jsonl"],
+        default="markdown",
+        help="Output format: markdown (default, messages in mailbox order) or jsonl "
+        "(one object per message, with its resume key and rendered Markdown).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1,
+        help="Write and flush output after this many messages (default: 1).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=non_negative_int,
+        default=1,
+        help="Parse messages in this many worker processes; 0 uses one per CPU (default: 1). "
+        "Output order is unchanged.",
+    )
+
+    resume = parser.add_mutually_exclusive_group()
+    resume.add_argument(
+        "--start-offset",
+        type=non_negative_int,
+        default=None,
+        help="mbox only: start reading at this byte offset (the end offset reported by a previous run).",
+    )
+    resume.add_argument(
+        "--after-key",
+        default=None,
+        help="Resume after the message with this key (the last key reported by a previous run).",
+    )
+
+    parser.add_argument(
+        "--mailbox-format",
+        choices=["auto", "mbox", "maildir", "mh", "babyl", "mmdf"],
+        default="auto",
+        help="Mailbox format (default: auto-detect).",
+    )
+    parser.add_argument(
+        "--output-structure",
+        choices=["flat", "hierarchical"],
+        default="flat",
+        help="'flat' (default) gives each message an H1; 'hierarchical' adds folder headings.",
+    )
+    parser.add_argument(
+        "--max-messages",
+        type=positive_int,
+        default=None,
+        help="Stop after this many messages from the resume point.",
+    )
+    parser.add_argument(
+        "--attachment-mode",
+        choices=["skip", "alt_text", "save", "base64"],
+        default=None,
+        help="How attachments are handled (default: the converter default).",
+    )
+    parser.add_argument("--out", "-o", help="Write output to a file (default: stdout). Resumed runs append.")
+    return parser
+
+
+def _write_batch(batch: list[Any], stream: IO[str], output_format: str, first: bool) -> None:
+    """Write one batch of :class:`~all2md.parsers.mbox.MailboxMessage` objects and flush."""
+    from all2md.renderers.markdown import MarkdownRenderer
+
+    renderer = MarkdownRenderer()
+    for message in batch:
+        if output_format == "jsonl":
+            metadata = message.document.metadata
+            record = {
+                "key": message.key,
+                "end_offset": message.end_offset,
+                "folder": message.folder,
+                "subject": metadata.get("title"),
+                "from": metadata.get("author"),
+                "date": metadata.get("creation_date"),
+                "markdown": renderer.render_to_string(message.document),
+            }
+            stream.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        else:
+            if not first:
+                stream.write("\n")
+            renderer.render_to_stream(message.document, stream)
+            stream.write("\n")
+            first = False
+    stream.flush()
+
+
+def _write_messages(messages: Iterable[Any], stream: IO[str], output_format: str, batch_size: int) -> Any:
+    """Write messages in batches; return ``(count, last_message)``."""
+    count = 0
+    last = None
+    batch: list[Any] = []
+    for message in messages:
+        batch.append(message)
+        if len(batch) >= batch_size:
+            _write_batch(batch, stream, output_format, first=count == 0)
+            count += len(batch)
+            last = batch[-1]
+            batch = []
+    if batch:
+        _write_batch(batch, stream, output_format, first=count == 0)
+        count += len(batch)
+        last = batch[-1]
+    return count, last
+
+
+def handle_mailbox_command(args: list[str] | None = None) -> int:
+    """Handle the ``mailbox`` command.
+
+    Parameters
+    ----------
+    args : list[str], optional
+        Command line arguments (beyond 'mailbox').
+
+    Returns
+    -------
+    int
+        Exit code (0 for success).
+
+    """
+    parser = _create_mailbox_parser()
+    try:
+        parsed = parser.parse_args(args or [])
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 0
+
+    from all2md.options.mbox import MboxOptions
+    from all2md.parsers.mbox import MboxToAstConverter
+
+    path = Path(parsed.input)
+    if not path.exists():
+        print(f"Error: Input file not found: {parsed.input}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+
+    option_values: dict[str, Any] = {
+        "mailbox_format": parsed.mailbox_format,
+        "output_structure": parsed.output_structure,
+        "max_messages": parsed.max_messages,
+    }
+    if parsed.attachment_mode:
+        option_values["attachment_mode"] = parsed.attachment_mode
+
+    resuming = parsed.start_offset is not None or parsed.after_key is not None
+    try:
+        converter = MboxToAstConverter(MboxOptions(**option_values))
+        messages = converter.iter_messages_as_ast(
+            path, start_offset=parsed.start_offset, after_key=parsed.after_key, workers=parsed.workers
+        )
+        print(f"Converting {path} one message at a time...", file=sys.stderr)
+        if parsed.out:
+            out_path = Path(parsed.out)
+            with out_path.open("a" if resuming else "w", encoding="utf-8") as handle:
+                if resuming and parsed.output_format == "markdown" and out_path.stat().st_size:
+                    handle.write("\n")
+                count, last = _write_messages(messages, handle, parsed.output_format, parsed.batch_size)
+        else:
+            count, last = _write_messages(messages, sys.stdout, parsed.output_format, parsed.batch_size)
+    except DependencyError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_DEPENDENCY_ERROR
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+    except (ValidationError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+    except All2MdError as e:
+        print(f"Error converting mailbox: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    print(f"Done: {count} message(s).", file=sys.stderr)
+    if last is not None:
+        hint = f"--start-offset {last.end_offset}" if last.end_offset is not None else f"--after-key {last.key}"
+        print(f"To resume after the last message written, pass {hint}", file=sys.stderr)
+    return EXIT_SUCCESS
@@ -14,7 +14,8 @@ output to compare against. The objective is therefore reference-free (see
 visibly broken and so has no gradient to search.
 
 This costs tens of conversions. ``--sample-pages`` tunes on a slice of a long
-document and ``--cache`` makes repeat runs nearly free.
+document, ``--workers`` converts candidates in parallel, and ``--cache`` makes
+repeat runs nearly free.
 
 Examples
 --------
@@ -22,6 +23,7 @@ Examples
     all2md optimize report.pdf --sample-pages 5 --cache
     all2md optimize page.html --json
     all2md optimize paper.pdf --rounds 2 --out .all2md.toml
+    all2md optimize long-report.pdf --workers 4
 
 """
 
@@ -87,6 +89,13 @@ def _create_optimize_parser() -> argparse.ArgumentParser:
             "running headers/footers are found by their repetition, so one page cannot reveal them."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert candidates in N worker processes; 0 uses one per CPU (default: 1). The result is unchanged.",
+    )
     parser.add_argument(
         "--no-presets",
         action="store_true",
@@ -199,6 +208,7 @@ def _optimize_one(
     rounds: int,
     sample_pages: int | None,
     include_presets: bool,
+    workers: int = 1,
 ) -> tuple[str, OptimizationReport]:
     """Tune one input, returning ``(label, report)``."""
     from all2md import optimize_options
@@ -215,6 +225,7 @@ def _optimize_one(
             rounds=rounds,
             sample_pages=sample_pages,
             include_presets=include_presets,
+            workers=workers,
         )
 
     path = Path(source)
@@ -226,6 +237,7 @@ def _optimize_one(
         rounds=rounds,
         sample_pages=sample_pages,
         include_presets=include_presets,
+        workers=workers,
     )
 
 
@@ -302,6 +314,10 @@ def handle_optimize_command(args: list[str] | None = None) -> int:
         print("Error: --rounds must be at least 1.", file=sys.stderr)
         return EXIT_VALIDATION_ERROR
 
+    if parsed.workers < 0:
+        print("Error: --workers must be at least 0.", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
     if parsed.sample_pages is not None and parsed.sample_pages < 1:
         print("Error: --sample-pages must be at least 1.", file=sys.stderr)
         return EXIT_VALIDATION_ERROR
@@ -335,6 +351,7 @@ def handle_optimize_command(args: list[str] | None = None) -> int:
                         parsed.rounds,
                         parsed.sample_pages,
                         not parsed.no_presets,
+                        parsed.workers,
                     )
                 )
     except DependencyError as e:
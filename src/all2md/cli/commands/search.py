@@ -22,9 +22,11 @@ from all2md.cli.builder import EXIT_DEPENDENCY_ERROR, EXIT_ERROR, EXIT_FILE_ERRO
 from all2md.cli.commands.shared import add_cache_arguments, collect_input_files, conversion_cache_from_args
 from all2md.cli.config import load_config_with_priority
 from all2md.cli.input_items import CLIInputItem
+from all2md.constants import VECTOR_INDEX_TYPES
 from all2md.exceptions import DependencyError
 from all2md.options.search import SearchOptions
 from all2md.progress import ProgressCallback, ProgressEvent
+from all2md.search.embedding_cache import default_embedding_cache_dir
 from all2md.search.service import SearchDocumentInput, SearchMode, SearchResult, SearchService
 
 
@@ -552,6 +554,12 @@ def _build_search_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument("--index-dir", help="Directory containing or storing persisted index data")
     parser.add_argument("--persist", action="store_true", help="Persist index state to --index-dir")
     parser.add_argument("--rebuild", action="store_true", help="Force rebuild even if cached index exists")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Sync the index in --index-dir with the inputs: reindex only new or changed documents, "
+        "drop deleted ones, and save the result",
+    )
     parser.add_argument("--top-k", type=int, default=10, help="Maximum number of results to return")
     parser.add_argument("--json", action="store_true", help="Emit search results as JSON")
     parser.add_argument("--progress", action="store_true", help="Print progress updates during indexing/search")
@@ -643,6 +651,70 @@ def _build_search_argument_parser() -> argparse.ArgumentParser:
         default=None,
         help="Normalize embeddings before FAISS indexing",
     )
+    parser.add_argument(
+        "--vector-index",
+        dest="vector_index_type",
+        choices=list(VECTOR_INDEX_TYPES),
+        help="FAISS index structure (flat is exact; the others are approximate)",
+    )
+    parser.add_argument(
+        "--vector-nlist", dest="vector_nlist", type=int, help="Maximum number of IVF lists (ivf_flat, ivf_pq)"
+    )
+    parser.add_argument(
+        "--vector-nprobe", dest="vector_nprobe", type=int, help="IVF lists scanned per query (ivf_flat, ivf_pq)"
+    )
+    parser.add_argument("--vector-hnsw-m", dest="vector_hnsw_m", type=int, help="Neighbours per HNSW graph node")
+    parser.add_argument(
+        "--vector-ef-construction",
+        dest="vector_hnsw_ef_construction",
+        type=int,
+        help="HNSW candidate queue size while building",
+    )
+    parser.add_argument(
+        "--vector-ef-search", dest="vector_hnsw_ef_search", type=int, help="HNSW candidate queue size per query"
+    )
+    parser.add_argument("--vector-pq-m", dest="vector_pq_m", type=int, help="Product-quantizer sub-vectors (ivf_pq)")
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        metavar="N",
+        help="Parse and chunk documents in N worker processes while indexing (0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--streaming",
+        dest="streaming_build",
+        action="store_true",
+        default=None,
+        help=(
+            "Memory-bounded build: drop each parsed document once chunked, feed the indexes in batches and "
+            "spill chunks to the index directory as they arrive (grep re-parses on demand; pair with --cache)"
+        ),
+    )
+    parser.add_argument(
+        "--skip-errors",
+        dest="skip_failed_documents",
+        action="store_true",
+        default=None,
+        help="Skip documents that fail to convert instead of aborting the index build",
+    )
+    parser.add_argument(
+        "--embedding-cache",
+        action="store_true",
+        help=(
+            "Reuse chunk embeddings from a persistent cache so rebuilds only encode new text "
+            "(default dir: per-OS user cache dir, or $ALL2MD_EMBEDDING_CACHE_DIR)"
+        ),
+    )
+    parser.add_argument(
+        "--embedding-cache-dir",
+        dest="vector_embedding_cache_dir",
+        metavar="DIR",
+        help="Directory for the embedding cache (implies --embedding-cache)",
+    )
+    parser.add_argument(
+        "--vector-pq-nbits", dest="vector_pq_nbits", type=int, help="Bits per product-quantizer code (ivf_pq)"
+    )
     parser.add_argument(
         "--hybrid-keyword-weight",
         dest="hybrid_keyword_weight",
@@ -684,6 +756,13 @@ def _validate_search_args(parsed: argparse.Namespace, parser: argparse.ArgumentP
     """
     if parsed.persist and not parsed.index_dir:
         parser.error("--persist requires --index-dir")
+    if parsed.update:
+        if not parsed.index_dir:
+            parser.error("--update requires --index-dir")
+        if not parsed.inputs:
+            parser.error("--update requires the input documents to sync the index with")
+        if parsed.rebuild:
+            parser.error("--update and --rebuild are mutually exclusive")
 
     if getattr(parsed, "grep_context", None) is not None:
         if parsed.grep_context_before is None:
@@ -727,6 +806,8 @@ def _load_search_options_from_config(parsed: argparse.Namespace) -> tuple[Search
 
     options = _apply_search_config(SearchOptions(), search_section)
     overrides = _collect_search_overrides(parsed)
+    if getattr(parsed, "embedding_cache", False) and options.vector_embedding_cache_dir is None:
+        overrides.setdefault("vector_embedding_cache_dir", str(default_embedding_cache_dir()))
     if overrides:
         try:
             options = options.create_updated(**overrides)
@@ -778,6 +859,9 @@ def _build_or_load_index(
         except FileNotFoundError:
             using_existing = False
 
+    if parsed.update and resolved_mode is not SearchMode.GREP:
+        return _update_index(parsed, options, resolved_mode, items, service, index_path, progress_callback)
+
     if using_existing and parsed.inputs:
         print(
             "Error: Cannot specify inputs when reusing an existing index. Use --rebuild to regenerate it.",
@@ -792,12 +876,23 @@ def _build_or_load_index(
         if not documents:
             print("Error: No input documents available for indexing", file=sys.stderr)
             return None, EXIT_FILE_ERROR
+        # A streaming build writes chunks into the index directory as it goes;
+        # save() then moves the spill file into place as chunks.jsonl.
+        spill_path = None
+        if index_path and parsed.persist and options.streaming_build and resolved_mode is not SearchMode.GREP:
+            spill_path = index_path / "chunks.jsonl.partial"
         try:
-            service.build_indexes(documents, modes={resolved_mode}, progress_callback=progress_callback)
+            service.build_indexes(
+                documents, modes={resolved_mode}, progress_callback=progress_callback, spill_path=spill_path
+            )
         except DependencyError as exc:
+            if spill_path is not None:
+                spill_path.unlink(missing_ok=True)
             print(f"Error: {exc}", file=sys.stderr)
             return None, EXIT_DEPENDENCY_ERROR
         except Exception as exc:
+            if spill_path is not None:
+                spill_path.unlink(missing_ok=True)
             print(f"Error building index: {exc}", file=sys.stderr)
             return None, EXIT_ERROR
 
@@ -812,6 +907,73 @@ def _build_or_load_index(
     return service, None
 
 
+def _update_index(
+    parsed: argparse.Namespace,
+    options: SearchOptions,
+    resolved_mode: SearchMode,
+    items: List[CLIInputItem],
+    service: SearchService | None,
+    index_path: Path | None,
+    progress_callback: ProgressCallback | None,
+) -> tuple[SearchService | None, int | None]:
+    """Apply ``--update``: sync a persisted index with the inputs and save it.
+
+    Parameters
+    ----------
+    parsed : argparse.Namespace
+        Parsed arguments
+    options : SearchOptions
+        Search options
+    resolved_mode : SearchMode
+        Resolved search mode
+    items : List[CLIInputItem]
+        Current corpus
+    service : SearchService | None
+        Service loaded from ``index_path``, or None to build it from scratch
+    index_path : Path | None
+        Index directory (required by ``--update``)
+    progress_callback : ProgressCallback | None
+        Progress callback
+
+    Returns
+    -------
+    tuple[SearchService | None, int | None]
+        Tuple of (service, error_code) where error_code is None on success
+
+    """
+    assert index_path is not None  # enforced by _validate_search_args
+    documents = _create_search_documents(items)
+    if not documents:
+        print("Error: No input documents available for indexing", file=sys.stderr)
+        return None, EXIT_FILE_ERROR
+
+    service = service or SearchService(options=options)
+    try:
+        summary = service.update_indexes(documents, modes={resolved_mode}, progress_callback=progress_callback)
+    except DependencyError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return None, EXIT_DEPENDENCY_ERROR
+    except Exception as exc:
+        print(f"Error updating index: {exc}", file=sys.stderr)
+        return None, EXIT_ERROR
+
+    try:
+        service.save(index_path)
+    except Exception as exc:
+        print(f"Error saving index: {exc}", file=sys.stderr)
+        return None, EXIT_ERROR
+
+    if summary.rebuilt:
+        message = f"Rebuilt index from {summary.added} documents"
+    else:
+        message = (
+            f"Updated index: {summary.added} added, {summary.changed} changed, "
+            f"{summary.removed} removed, {summary.unchanged} unchanged"
+        )
+    print(message, file=sys.stderr)
+    return service, None
+
+
 def handle_search_command(args: list[str] | None = None) -> int:
     """Handle ``all2md search`` for keyword/vector/hybrid queries."""
     parser = _build_search_argument_parser()
@@ -1051,6 +1213,18 @@ def _collect_search_overrides(parsed: argparse.Namespace) -> Dict[str, object]:
         "vector_batch_size",
         "vector_device",
         "vector_normalize_embeddings",
+        "vector_index_type",
+        "vector_nlist",
+        "vector_nprobe",
+        "vector_hnsw_m",
+        "vector_hnsw_ef_construction",
+        "vector_hnsw_ef_search",
+        "vector_pq_m",
+        "vector_pq_nbits",
+        "vector_embedding_cache_dir",
+        "workers",
+        "streaming_build",
+        "skip_failed_documents",
         "hybrid_keyword_weight",
         "hybrid_vector_weight",
         "default_mode",
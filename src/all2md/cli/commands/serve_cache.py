@@ -0,0 +1,313 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+
+"""Rendered-page cache and HTTP revalidation helpers for the ``serve`` command.
+
+``serve`` converts documents on demand. This module keeps the results cheap to
+hand out again:
+
+* :class:`RenderedPage` -- one rendered page as UTF-8 bytes, with a content
+  ``ETag``, the source's ``Last-Modified`` time, and gzip (and, when the
+  ``brotli`` package is installed, brotli) bodies compressed once at store time.
+* :class:`RenderedPageCache` -- a byte-bounded LRU of rendered pages keyed by
+  URL path and the source file's signature (size and mtime), so an edited file
+  misses without anyone having to invalidate it. Concurrent requests for a page
+  being rendered, including by the prewarm pool, wait for that one render.
+  Prewarming only fills unused budget; it never evicts a page.
+* :func:`prewarm_order` -- the order the prewarm pool converts a directory in.
+* :func:`is_not_modified` / :func:`choose_encoding` -- conditional-GET and
+  ``Accept-Encoding`` negotiation for a request's headers.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Optional, Tuple
+
+try:  # optional: brotli bodies are only offered when the package is installed
+    import brotli as _brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    _brotli = None
+
+#: Default byte budget for rendered pages, counting every stored encoding (256 MiB).
+DEFAULT_PAGE_CACHE_BYTES = 256 * 1024**2
+
+# Below this size a compressed body saves less than its header costs.
+_MIN_COMPRESS_BYTES = 1024
+
+FileSignature = Tuple[int, int]
+
+
+def file_signature(path: Path) -> Optional[FileSignature]:
+    """Return ``(size, mtime_ns)`` for ``path``, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """A rendered HTML page ready to send, with its validators and encodings.
+
+    Attributes
+    ----------
+    body : bytes
+        The page as UTF-8.
+    etag : str
+        Strong entity tag (quoted) derived from ``body``.
+    last_modified : float or None
+        Modification time of the source document, if the page has one.
+    encodings : dict
+        Precompressed bodies by content coding (``"br"``, ``"gzip"``); only
+        codings that came out smaller than ``body`` are kept.
+
+    """
+
+    body: bytes
+    etag: str
+    last_modified: Optional[float]
+    encodings: Mapping[str, bytes]
+
+    @classmethod
+    def build(cls, html: str, last_modified: Optional[float] = None, *, compress: bool = True) -> "RenderedPage":
+        """Encode ``html`` and, unless ``compress`` is False, precompress it."""
+        body = html.encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        encodings: dict[str, bytes] = {}
+        if compress and len(body) >= _MIN_COMPRESS_BYTES:
+            candidates = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+            if _brotli is not None:
+                candidates["br"] = _brotli.compress(body)
+            encodings = {name: data for name, data in candidates.items() if len(data) < len(body)}
+        return cls(body=body, etag=etag, last_modified=last_modified, encodings=encodings)
+
+    @property
+    def size(self) -> int:
+        """Bytes held by this page across all stored encodings."""
+        return len(self.body) + sum(len(data) for data in self.encodings.values())
+
+    @property
+    def last_modified_header(self) -> Optional[str]:
+        """``Last-Modified`` value in HTTP date format, if the page has a source time."""
+        if self.last_modified is None:
+            return None
+        return formatdate(self.last_modified, usegmt=True)
+
+
+def choose_encoding(page: RenderedPage, accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best stored encoding the client accepts, or None for identity.
+
+    Brotli is preferred over gzip. A coding listed with ``q=0`` is refused.
+    """
+    if not accept_encoding or not page.encodings:
+        return None
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for name in ("br", "gzip"):
+        quality = accepted.get(name, accepted.get("*", 0.0))
+        if name in page.encodings and quality > 0:
+            return name
+    return None
+
+
+def is_not_modified(page: RenderedPage, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """Return True when the request's validators show the client already has ``page``.
+
+    ``If-None-Match`` wins when present (RFC 9110 section 13.2.2); weak tags
+    compare equal to their strong form. ``If-Modified-Since`` is only consulted
+    without it, and only for pages that carry a source time.
+    """
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == page.etag for tag in tags)
+    if if_modified_since is None or page.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution.
+    return int(page.last_modified) <= since
+
+
+class RenderedPageCache:
+    """Byte-bounded LRU of rendered pages, keyed by URL path and file signature.
+
+    Parameters
+    ----------
+    max_bytes : int, default DEFAULT_PAGE_CACHE_BYTES
+        Evict least recently used pages once the stored bytes (every encoding
+        counted) exceed this. A page larger than the whole budget is served but
+        not kept.
+
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PAGE_CACHE_BYTES) -> None:
+        """Create an empty cache with a ``max_bytes`` budget."""
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[Optional[FileSignature], RenderedPage]] = OrderedDict()
+        self._bytes = 0
+        self._pending: dict[tuple[str, Optional[FileSignature]], Future[RenderedPage]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached pages."""
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently held."""
+        with self._lock:
+            return self._bytes
+
+    def get(self, key: str, signature: Optional[FileSignature]) -> Optional[RenderedPage]:
+        """Return the page stored for ``key`` if it was rendered from ``signature``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_or_render(
+        self, key: str, signature: Optional[FileSignature], render: Callable[[], RenderedPage]
+    ) -> RenderedPage:
+        """Return the cached page, rendering it once however many threads ask at the same time.
+
+        Raises
+        ------
+        Exception
+            Whatever ``render`` raised; nothing is stored and the next caller retries.
+
+        """
+        page = self.get(key, signature)
+        if page is not None:
+            return page
+        return self._render_once(key, signature, render, evict=True)[0]
+
+    def prewarm(self, key: str, signature: Optional[FileSignature], render: Callable[[], RenderedPage]) -> bool:
+        """Render ``key`` ahead of any request, into budget nobody is using yet.
+
+        Never evicts: a page that does not fit in the unused budget is dropped,
+        and nothing is rendered once the cache is full. Hit and miss counters are
+        left to real requests.
+
+        Returns
+        -------
+        bool
+            False when the budget is spent, i.e. warming more pages could only
+            push out ones already cached.
+
+        Raises
+        ------
+        Exception
+            Whatever ``render`` raised; nothing is stored.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                return True
+            if self._bytes >= self.max_bytes:
+                return False
+        return self._render_once(key, signature, render, evict=False)[1]
+
+    def _render_once(
+        self, key: str, signature: Optional[FileSignature], render: Callable[[], RenderedPage], *, evict: bool
+    ) -> tuple[RenderedPage, bool]:
+        """Render ``(key, signature)`` unless another thread already is; return the page and whether it is stored."""
+        slot = (key, signature)
+        with self._lock:
+            pending = self._pending.get(slot)
+            if pending is None:
+                future: Future[RenderedPage] = Future()
+                self._pending[slot] = future
+        if pending is not None:
+            # The thread rendering it stores it.
+            return pending.result(), True
+        try:
+            page = render()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            stored = self.put(key, signature, page, evict=evict)
+            future.set_result(page)
+            return page, stored
+        finally:
+            with self._lock:
+                self._pending.pop(slot, None)
+
+    def put(self, key: str, signature: Optional[FileSignature], page: RenderedPage, *, evict: bool = True) -> bool:
+        """Store ``page`` for ``key``, replacing any older rendering, then enforce the budget.
+
+        With ``evict`` False the page is only stored if it fits in the unused
+        budget. Returns whether it was stored.
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1].size
+            if page.size > (self.max_bytes if evict else self.max_bytes - self._bytes):
+                return False
+            self._entries[key] = (signature, page)
+            self._bytes += page.size
+            while self._bytes > self.max_bytes:
+                _key, (_signature, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+            return True
+
+    def discard(self, key: str) -> None:
+        """Drop the page stored for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1].size
+
+
+def prewarm_order(files: Mapping[str, Path], base_dir: Path, index_names: Iterable[str] = ()) -> list[str]:
+    """Order URL paths for the prewarm pool: index pages, then shallow, then recent files.
+
+    A served directory is read from the top down, so top-level documents and the
+    files standing in for directory indexes are the first pages viewers open;
+    within a level, the most recently modified documents are the likeliest to be
+    opened next.
+    """
+    index_names = {name.lower() for name in index_names}
+
+    def rank(item: tuple[str, Path]) -> tuple[int, int, float]:
+        _url, path = item
+        try:
+            depth = len(path.relative_to(base_dir).parts)
+        except ValueError:
+            depth = 0
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = 0.0
+        return (0 if path.name.lower() in index_names else 1, depth, -mtime)
+
+    return [url for url, _path in sorted(files.items(), key=rank)]
@@ -20,6 +20,7 @@ import socketserver
 import sys
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -27,7 +28,22 @@ from urllib.parse import quote, unquote
 
 from all2md.api import from_ast, to_ast
 from all2md.cli.builder import EXIT_ERROR, EXIT_FILE_ERROR, EXIT_SUCCESS
-from all2md.cli.commands.shared import has_hidden_component, split_glob_pattern
+from all2md.cli.commands.serve_cache import (
+    DEFAULT_PAGE_CACHE_BYTES,
+    RenderedPage,
+    RenderedPageCache,
+    choose_encoding,
+    file_signature,
+    is_not_modified,
+    prewarm_order,
+)
+from all2md.cli.commands.shared import (
+    add_cache_arguments,
+    conversion_cache_from_args,
+    has_hidden_component,
+    parse_cache_size_arg,
+    split_glob_pattern,
+)
 from all2md.cli.commands.web_assets import ThemeError, inject_web_assets, resolve_theme
 from all2md.cli.config import apply_config_to_parser, load_config_with_priority
 from all2md.converter_registry import registry
@@ -768,6 +784,22 @@ def _create_serve_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable caching - always render fresh content (useful for live editing)",
     )
+    parser.add_argument(
+        "--html-cache-size",
+        type=parse_cache_size_arg,
+        default=DEFAULT_PAGE_CACHE_BYTES,
+        metavar="SIZE",
+        help="Memory budget for rendered pages, e.g. 64MB or 1G; least recently used pages are dropped "
+        "first (default: 256MB)",
+    )
+    parser.add_argument(
+        "--prewarm-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Threads converting the served directory in the background at startup, top-level and "
+        "recently modified files first (directory mode only; 0 disables; default: 1)",
+    )
     parser.add_argument(
         "--poll-interval",
         type=float,
@@ -796,6 +828,7 @@ def _create_serve_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable configuration file loading for this command.",
     )
+    add_cache_arguments(parser)
     return parser
 
 
@@ -824,6 +857,14 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
     except SystemExit as e:
         return e.code if isinstance(e.code, int) else EXIT_ERROR
 
+    # The opt-in conversion cache (--cache / ALL2MD_CACHE) stays active for the
+    # server's lifetime; request threads reach it through the module global.
+    with conversion_cache_from_args(parsed):
+        return _serve(parsed)
+
+
+def _serve(parsed: argparse.Namespace) -> int:  # noqa: C901
+    """Run the HTTP server for already-parsed ``serve`` arguments."""
     # A combined --address host:port overrides --host/--port. Only the supplied
     # half is applied, so 'host:' keeps the default port and ':port' the host.
     if parsed.address:
@@ -882,8 +923,10 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
     # Shared state guarded by state_lock so the polling thread and request
     # handler threads can coexist safely.
     state_lock = threading.Lock()
-    file_cache: Dict[str, str] = {}
-    index_cache: Dict[str, str] = {}
+    # Rendered documents, keyed by URL path and checked against the source's
+    # signature on every hit, so an edited file is reconverted on its next request.
+    page_cache = RenderedPageCache(parsed.html_cache_size)
+    index_cache: Dict[str, RenderedPage] = {}
     file_mapping: Dict[str, Path] = {}
     supported_files: List[Path] = []
     known_subdirs: set = set()
@@ -920,6 +963,60 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
             html_content = html_content.replace("<body>", "<body>\n" + breadcrumbs, 1)
         return html_content
 
+    def _render_document(url_path: str, file_path: Path, signature: Optional[Tuple[int, int]]) -> RenderedPage:
+        """Convert the document served at ``url_path`` into a ready-to-send page."""
+        print(f"Converting {file_path.name}...")
+        breadcrumb_path = unquote(url_path) if is_directory else None
+        html_content = _convert_to_html(file_path, breadcrumb_path=breadcrumb_path)
+        last_modified = signature[1] / 1e9 if signature is not None else None
+        # With --no-cache the page is thrown away after one response; skip compressing it.
+        return RenderedPage.build(html_content, last_modified, compress=not parsed.no_cache)
+
+    def _serve_document(url_path: str, file_path: Path) -> RenderedPage:
+        """Return the page for ``url_path``, from the cache unless caching is off."""
+        signature = file_signature(file_path)
+        if parsed.no_cache:
+            return _render_document(url_path, file_path, signature)
+        return page_cache.get_or_render(url_path, signature, lambda: _render_document(url_path, file_path, signature))
+
+    # Background conversion of the served directory, so the first viewer of a large
+    # document finds it rendered. Off in single-file and --no-cache modes.
+    prewarm_pool: Optional[ThreadPoolExecutor] = None
+    if is_directory and not parsed.no_cache and parsed.prewarm_workers > 0:
+        prewarm_pool = ThreadPoolExecutor(max_workers=parsed.prewarm_workers, thread_name_prefix="all2md-prewarm")
+
+    # Set once a prewarmed page no longer fits in --html-cache-size: the queued rest
+    # would only be converted to push out pages warmed (or requested) before them.
+    prewarm_budget_spent = threading.Event()
+
+    def _prewarm_one(url_path: str) -> None:
+        if prewarm_budget_spent.is_set():
+            return
+        with state_lock:
+            file_path = file_mapping.get(url_path)
+        if file_path is None:  # removed since it was queued
+            return
+        signature = file_signature(file_path)
+        try:
+            warmed = page_cache.prewarm(url_path, signature, lambda: _render_document(url_path, file_path, signature))
+        except Exception as exc:
+            # The request that wants this page will retry and report the error.
+            print(f"Prewarm: could not convert {file_path.name}: {exc}", file=sys.stderr)
+            return
+        if not warmed:
+            prewarm_budget_spent.set()
+
+    def _schedule_prewarm(url_paths: List[str]) -> None:
+        if prewarm_pool is None:
+            return
+        # Rescans drop and replace pages, so a new batch gets another try at the budget.
+        prewarm_budget_spent.clear()
+        for url_path in url_paths:
+            try:
+                prewarm_pool.submit(_prewarm_one, url_path)
+            except RuntimeError:  # a rescan racing shutdown
+                return
+
     def _rescan_directory(initial: bool = False) -> bool:
         """Rescan the served directory; update state and drop stale caches.
 
@@ -935,6 +1032,7 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
             if not initial and new_signature == scan_signature:
                 return False
             old_url_paths = set(file_mapping.keys())
+            changed_files = {entry[0] for entry in new_signature - scan_signature}
             scan_signature.clear()
             scan_signature.update(new_signature)
             supported_files[:] = new_files
@@ -944,9 +1042,12 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
             file_mapping.update(new_mapping)
             # Any cached directory listing might now be stale.
             index_cache.clear()
-            # Drop file-cache entries for files that vanished from disk.
-            for removed in old_url_paths - set(new_mapping.keys()):
-                file_cache.pop(removed, None)
+        # Drop pages of files that vanished from disk; rerender added and edited ones.
+        for removed in old_url_paths - set(new_mapping.keys()):
+            page_cache.discard(removed)
+        if not initial:
+            changed = {url: path for url, path in new_mapping.items() if str(path) in changed_files}
+            _schedule_prewarm(prewarm_order(changed, input_path, INDEX_FILE_NAMES))
         return True
 
     # Setup based on input type
@@ -961,14 +1062,13 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
             return EXIT_ERROR
 
         mode_str = "recursively" if parsed.recursive else "in directory"
-        print(f"Found {len(supported_files)} document(s) {mode_str} - will convert on demand")
+        when = "in the background" if prewarm_pool is not None else "on demand"
+        print(f"Found {len(supported_files)} document(s) {mode_str} - will convert {when}")
     else:
-        print(f"Converting {input_path.name}...")
         try:
-            html_content = _convert_to_html(input_path)
             with state_lock:
-                file_cache["/"] = html_content
                 file_mapping["/"] = input_path
+            _serve_document("/", input_path)
         except Exception as e:
             print(f"Error: Could not convert {input_path.name}: {e}", file=sys.stderr)
             return EXIT_ERROR
@@ -1032,12 +1132,12 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
 
             # Directory index requests (root or known subdirectory)
             if _is_directory_index_path(path):
-                cached: Optional[str] = None
+                cached: Optional[RenderedPage] = None
                 if not parsed.no_cache:
                     with state_lock:
                         cached = index_cache.get(path)
                 if cached is not None:
-                    self._send_html(cached)
+                    self._send_page(cached)
                     return
                 # In --no-cache mode the polling thread is off, so force a
                 # rescan on root requests to keep the listing fresh.
@@ -1047,38 +1147,54 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
                 if html_content is None:
                     self._send_500("Failed to render directory index")
                     return
+                index_page = RenderedPage.build(html_content, compress=not parsed.no_cache)
                 if not parsed.no_cache:
                     with state_lock:
-                        index_cache[path] = html_content
-                self._send_html(html_content)
+                        index_cache[path] = index_page
+                self._send_page(index_page)
                 return
 
             # File request
             with state_lock:
                 file_path = file_mapping.get(path)
-                cached_file: Optional[str] = file_cache.get(path) if file_path else None
 
             if file_path is None:
                 self._send_404()
                 return
 
-            if cached_file is not None and not parsed.no_cache:
-                self._send_html(cached_file)
-                return
-
-            print(f"Converting {file_path.name}...")
             try:
-                breadcrumb_path = unquote(path) if is_directory else None
-                html_content = _convert_to_html(file_path, breadcrumb_path=breadcrumb_path)
+                page = _serve_document(path, file_path)
             except Exception as e:
                 print(f"Error converting {file_path.name}: {e}", file=sys.stderr)
                 self._send_500(f"Error converting document: {e}")
                 return
+            self._send_page(page)
+
+        def _send_page(self, page: RenderedPage) -> None:
+            """Send ``page``, or 304 if the client's copy is current, in the best accepted encoding."""
+            if is_not_modified(page, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")):
+                self.send_response(304)
+                self._send_validators(page)
+                self.end_headers()
+                return
+            encoding = choose_encoding(page, self.headers.get("Accept-Encoding"))
+            body = page.encodings[encoding] if encoding else page.body
+            self.send_response(200)
+            self.send_header("Content-type", "text/html; charset=utf-8")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self._send_validators(page)
+            self.end_headers()
+            self.wfile.write(body)
 
-            if not parsed.no_cache:
-                with state_lock:
-                    file_cache[path] = html_content
-            self._send_html(html_content)
+        def _send_validators(self, page: RenderedPage) -> None:
+            self.send_header("ETag", page.etag)
+            if page.last_modified_header is not None:
+                self.send_header("Last-Modified", page.last_modified_header)
+            # Revalidate on every view: the file can change while the server runs.
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
 
         def _send_html(self, html: str) -> None:
             self.send_response(200)
@@ -1325,6 +1441,11 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
     url = f"http://{parsed.host}:{bound_port}/"
     print(f"\nServing at {url}")
 
+    if prewarm_pool is not None:
+        with state_lock:
+            mapping_snapshot = dict(file_mapping)
+        _schedule_prewarm(prewarm_order(mapping_snapshot, input_path, INDEX_FILE_NAMES))
+
     # Print development warning if upload or API is enabled
     if parsed.enable_upload or parsed.enable_api:
         print("\n" + "=" * 70)
@@ -1394,6 +1515,8 @@ def handle_serve_command(args: list[str] | None = None) -> int:  # noqa: C901
         print("\n\nShutting down server...")
     finally:
         stop_event.set()
+        if prewarm_pool is not None:
+            prewarm_pool.shutdown(wait=False, cancel_futures=True)
         httpd.shutdown()
         httpd.server_close()
         if poll_thread is not None:
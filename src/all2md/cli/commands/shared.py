@@ -76,6 +76,68 @@ def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Directory for the conversion cache (default: per-OS user cache dir, or $ALL2MD_CACHE_DIR).",
     )
+    group.add_argument(
+        "--cache-max-size",
+        metavar="SIZE",
+        type=parse_cache_size_arg,
+        default=None,
+        help=(
+            "Evict least recently used cache entries beyond this total size, e.g. 500MB or 2G; 0 disables "
+            "the bound (default: $ALL2MD_CACHE_MAX_SIZE, else 2G)."
+        ),
+    )
+    group.add_argument(
+        "--cache-max-entries",
+        metavar="N",
+        type=int,
+        default=None,
+        help=(
+            "Evict least recently used cache entries beyond N entries "
+            "(default: $ALL2MD_CACHE_MAX_ENTRIES, else unbounded)."
+        ),
+    )
+    group.add_argument(
+        "--cache-memory",
+        metavar="SIZE",
+        type=parse_cache_size_arg,
+        default=None,
+        help=(
+            "Also keep up to SIZE of recently used documents in memory, in front of the disk cache; "
+            "0 disables (default: $ALL2MD_CACHE_MEMORY_SIZE, else 256M)."
+        ),
+    )
+
+
+def parse_cache_size_arg(value: str) -> int:
+    """Argparse ``type`` for byte sizes such as ``500MB``."""
+    from all2md.conversion_cache import parse_size
+
+    try:
+        return parse_size(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def positive_int(value: str) -> int:
+    """Argparse ``type`` for a strictly positive integer."""
+    try:
+        ivalue = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'") from e
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {ivalue}")
+    return ivalue
+
+
+def non_negative_int(value: str) -> int:
+    """Argparse ``type`` for a non-negative integer."""
+    try:
+        ivalue = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'") from e
+    if ivalue < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {ivalue}")
+    return ivalue
 
 
 def conversion_cache_from_args(parsed: "argparse.Namespace") -> Any:
@@ -88,7 +150,13 @@ def conversion_cache_from_args(parsed: "argparse.Namespace") -> Any:
     from all2md.conversion_cache import use_conversion_cache
 
     enabled = True if getattr(parsed, "cache", False) else None
-    return use_conversion_cache(enabled=enabled, cache_dir=getattr(parsed, "cache_dir", None))
+    return use_conversion_cache(
+        enabled=enabled,
+        cache_dir=getattr(parsed, "cache_dir", None),
+        max_bytes=getattr(parsed, "cache_max_size", None),
+        max_entries=getattr(parsed, "cache_max_entries", None),
+        memory_max_bytes=getattr(parsed, "cache_memory", None),
+    )
 
 
 def split_glob_pattern(raw: str) -> tuple[Path, str, bool]:
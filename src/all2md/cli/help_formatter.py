@@ -166,6 +166,8 @@ _SUBCOMMAND_SUMMARIES: Sequence[tuple[str, str]] = (
     ("search", "Search documents using keyword, vector, or hybrid retrieval"),
     ("grep", "Search for text patterns in documents (like grep for any format)"),
     ("chunk", "Split documents into provenance-carrying chunks (JSONL) for RAG/LLM pipelines"),
+    ("mailbox", "Convert a mailbox one message at a time, with resumable output (mbox/maildir)"),
+    ("cache", "Inspect and trim the on-disk conversion cache (stats/prune/clear)"),
     ("report", "Print a conversion confidence report ('quality card') scoring how much to trust a conversion"),
     ("roundtrip", "Convert a document through another format and back, scoring the structure that survived"),
     ("optimize", "Search converter options for the settings that convert a document best"),
@@ -16,7 +16,7 @@ Constants are organized by category:
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, get_args
 
 # =============================================================================
 # Type Definitions - All Literal Types and Type Aliases
@@ -112,6 +112,9 @@ BBCodeUnknownTagMode = Literal["preserve", "strip", "escape"]
 # Email types
 EmailSortOrder = Literal["asc", "desc"]
 
+# Search types: the FAISS structure a vector index is built as
+VectorIndexType = Literal["flat", "ivf_flat", "hnsw", "ivf_pq"]
+
 # AsciiDoc types
 AttributeMissingPolicy = Literal["keep", "blank", "warn"]
 TableHeaderDetection = Literal["first-row", "attribute-based", "auto"]
@@ -231,7 +234,8 @@ DEPS_HTML_READABILITY = [("readability-lxml", "readability", ">=0.8.1")]
 DEPS_MARKDOWN = [("mistune", "mistune", ">=3.0.0")]
 DEPS_MEDIAWIKI = [("mwparserfromhell", "mwparserfromhell", "")]
 DEPS_MHTML = [("beautifulsoup4", "bs4", "")]
-DEPS_ODF = [("odfpy", "odf", "")]  # Used by ODP, ODS, ODT
+DEPS_ODF = [("odfpy", "odf", "")]  # Used by ODP, ODT
+DEPS_ODS = [("odfpy", "odf", ""), ("defusedxml", "defusedxml", "")]
 DEPS_OPENAPI = [("PyYAML", "yaml", ">=5.1")]
 DEPS_ORG = [("orgparse", "orgparse", "")]
 DEPS_OUTLOOK = [("extract-msg", "extract_msg", "")]
@@ -268,14 +272,13 @@ DEPS_NETWORK = [("httpx", "httpx", ">=0.28.1")]
 # Chunking (token-boundary strategies need a real BPE tokenizer)
 DEPS_CHUNK = [("tiktoken", "tiktoken", ">=0.7.0")]
 
-# Search backends
-DEPS_SEARCH_BM25 = [("rank-bm25", "rank_bm25", ">=0.2.2")]
-
+# Search backends (BM25 keyword search is built in)
 DEPS_SEARCH_VECTOR = [
     ("faiss-cpu", "faiss", ""),
     ("sentence-transformers", "sentence_transformers", ">=2.2.0"),
     ("numpy", "numpy", ">=1.24.0"),
 ]
+VECTOR_INDEX_TYPES: tuple[str, ...] = get_args(VectorIndexType)
 
 # =============================================================================
 # General Markdown Formatting Constants
@@ -872,6 +875,11 @@ DEFAULT_AUTO_TRIM_HEADERS_FOOTERS = False
 DEFAULT_HEADER_HEIGHT = 0  # Height in points to trim from top
 DEFAULT_FOOTER_HEIGHT = 0  # Height in points to trim from bottom
 
+# Page-parallel parsing. Each worker process opens its own PyMuPDF handle and pays
+# the import and document-open cost once, so short documents are faster serially;
+# the threshold keeps an opted-in batch of two-page memos on the serial path.
+DEFAULT_PDF_PARALLEL_THRESHOLD = 8
+
 # Layout analysis defaults (requires pymupdf-layout)
 DEFAULT_LAYOUT_ANALYSIS_MODE: LayoutAnalysisMode = "auto"
 DEFAULT_LAYOUT_IOU_THRESHOLD = 0.3  # Min IoU to match a prediction to a text block
@@ -919,6 +927,7 @@ DEFAULT_OCR_DOC_TEXT_THRESHOLD = 16  # Whole-doc meaningful-char floor below whi
 DEFAULT_OCR_IMAGE_AREA_THRESHOLD = 0.8
 DEFAULT_OCR_PRESERVE_EXISTING_TEXT = False
 DEFAULT_OCR_TESSERACT_CONFIG = ""
+DEFAULT_OCR_WORKERS = 0  # PDF only: threads recognizing pages ahead of the page loop; 0 = inline
 
 # =============================================================================
 # Format-Specific Constants - HTML
@@ -1248,6 +1257,7 @@ DEFAULT_HTML_FIGURES_PARSING: FiguresParsing = "figure"
 DEFAULT_HTML_DETAILS_PARSING: DetailsParsing = "blockquote"
 DEFAULT_HTML_EXTRACT_MICRODATA = True
 DEFAULT_HTML_PARSER: HtmlParser = "html.parser"
+DEFAULT_HTML_DIRECT_LXML_TREE = True
 
 # HTML renderer options
 DEFAULT_HTML_STANDALONE = True
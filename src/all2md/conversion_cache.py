@@ -10,6 +10,33 @@ fingerprint over the source file (path + size + mtime), the resolved format and
 parser options, and the all2md version + AST schema — so a changed file, changed
 options, or a version bump all miss cleanly rather than serving a stale AST.
 
+Entries are stored in the compact binary AST format
+(:mod:`all2md.ast.binary_serialization`) and read back by memory-mapping the
+file, so a hit on a large document costs a fraction of re-parsing it. An entry
+written against a different binary format version or node schema fails its
+header check and is treated as a miss.
+
+The directory is bounded: once it holds more than ``max_bytes`` (default
+:data:`DEFAULT_CACHE_MAX_BYTES`) or ``max_entries`` entries, the least recently
+used entries are evicted. Recency is the entry file's mtime, which a hit bumps,
+so there is no sidecar index to keep consistent between processes sharing one
+cache directory. ``ALL2MD_CACHE_MAX_SIZE`` / ``ALL2MD_CACHE_MAX_ENTRIES`` set
+the bounds from the environment, and ``all2md cache stats|prune|clear`` inspects
+and trims the directory by hand.
+
+In front of the directory sits an in-process tier (``memory_max_bytes``, default
+:data:`DEFAULT_MEMORY_CACHE_BYTES`, ``ALL2MD_CACHE_MEMORY_SIZE``) for long-lived
+processes that convert the same files over and over (``all2md serve``, the MCP
+server, ``optimize``). Callers are free to mutate what they get back -- the
+server stamps a title into ``doc.metadata`` -- so the tier never holds a live
+``Document``: it holds a pickled snapshot and every hit unpickles an
+independent copy. Unpickling runs in C and is about three times faster than
+decoding the disk entry or copying the tree node by node (tens of microseconds
+for a typical page); the snapshot's length is also an exact measure of what the
+tier holds, so the budget is real bytes rather than an estimate. Pickle is safe
+here because the bytes never leave the process; the disk format stays the
+schema-checked binary AST.
+
 Activation is process-scoped via a context manager, so the many call sites that
 funnel through :func:`all2md.to_ast` need no per-call plumbing::
 
@@ -18,18 +45,26 @@ funnel through :func:`all2md.to_ast` need no per-call plumbing::
 
 A module-global (not a ``ContextVar``) holds the active cache so it is visible
 from ``all2md serve``'s per-request worker threads, which a context variable set
-on the main thread would not reach.
+on the main thread would not reach. Those threads share one
+:class:`ConversionCache`, so its counters and eviction run under a lock.
 """
 
 #  Copyright (c) 2025 Tom Villani, Ph.D.
 
 from __future__ import annotations
 
+import dataclasses
+import json
 import logging
 import os
+import pickle  # nosec B403 - in-process snapshots only, never read from disk
+import re
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Iterator, cast
 
 from all2md.utils.fingerprint import corpus_fingerprint
 
@@ -40,19 +75,55 @@ logger = logging.getLogger(__name__)
 
 _ENV_ENABLE = "ALL2MD_CACHE"
 _ENV_DIR = "ALL2MD_CACHE_DIR"
+_ENV_MAX_SIZE = "ALL2MD_CACHE_MAX_SIZE"
+_ENV_MAX_ENTRIES = "ALL2MD_CACHE_MAX_ENTRIES"
+_ENV_MEMORY_SIZE = "ALL2MD_CACHE_MEMORY_SIZE"
 _APP_NAME = "all2md"
 
 # AST serialization schema the cache stores; bump-invalidation is handled by
 # folding the all2md version into every key, but this is an extra guard.
-_AST_SCHEMA = 1
+# 2: entries moved from AST-JSON to the binary AST format.
+_AST_SCHEMA = 2
+
+# File suffix of a cache entry (binary AST, see all2md.ast.binary_serialization).
+_ENTRY_SUFFIX = ".a2mb"
+# File suffix of an opaque artifact stored with put_artifact (OCR results and the like).
+_ARTIFACT_SUFFIX = ".a2ma"
+# Entries written by releases that stored AST-JSON. Never read again, so they
+# are the first thing eviction removes.
+_LEGACY_SUFFIX = ".json"
+
+#: Default upper bound on the total size of the cache directory (2 GiB).
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024**3
+
+#: Default budget for the in-process tier, in bytes of pickled snapshots (256 MiB).
+DEFAULT_MEMORY_CACHE_BYTES = 256 * 1024**2
+
+# When a bound is exceeded, evict down to this fraction of it, so a run of puts
+# at the limit does not rescan the directory on every write.
+_EVICT_LOW_WATER = 0.9
+
+# Lifetime counters, merged in by every process that used the cache.
+_STATS_FILE = "stats.json"
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(i?b?)\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
 
 __all__ = [
+    "CacheStats",
     "ConversionCache",
+    "DEFAULT_CACHE_MAX_BYTES",
+    "DEFAULT_MEMORY_CACHE_BYTES",
+    "cache_limits_from_env",
+    "memory_limit_from_env",
     "default_cache_dir",
     "use_conversion_cache",
     "get_active_cache",
+    "install_worker_cache",
     "cache_enabled_by_env",
     "make_cache_key",
+    "parse_size",
+    "worker_cache_settings",
 ]
 
 
@@ -77,6 +148,63 @@ def cache_enabled_by_env() -> bool:
     return os.environ.get(_ENV_ENABLE, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+def parse_size(text: str) -> int:
+    """Parse a human-readable byte size such as ``"500MB"``, ``"2G"`` or ``"1.5GiB"``.
+
+    Units are binary (``1K`` is 1024 bytes); a bare number is bytes.
+
+    Raises
+    ------
+    ValueError
+        If ``text`` is not a size.
+
+    """
+    match = _SIZE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r} (expected e.g. 500MB, 2G, 1048576)")
+    number, unit, _ = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
+def cache_limits_from_env() -> tuple[int | None, int | None]:
+    """Return the ``(max_bytes, max_entries)`` bounds requested by the environment.
+
+    ``ALL2MD_CACHE_MAX_SIZE`` defaults to :data:`DEFAULT_CACHE_MAX_BYTES`;
+    ``ALL2MD_CACHE_MAX_ENTRIES`` defaults to unbounded. ``0`` disables a bound.
+    Unparseable values are logged and ignored.
+    """
+    max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES
+    max_entries: int | None = None
+    raw_size = os.environ.get(_ENV_MAX_SIZE, "").strip()
+    if raw_size:
+        try:
+            max_bytes = parse_size(raw_size) or None
+        except ValueError as exc:
+            logger.warning("Ignoring %s: %s", _ENV_MAX_SIZE, exc)
+    raw_entries = os.environ.get(_ENV_MAX_ENTRIES, "").strip()
+    if raw_entries:
+        try:
+            max_entries = int(raw_entries) or None
+        except ValueError:
+            logger.warning("Ignoring %s: not an integer: %r", _ENV_MAX_ENTRIES, raw_entries)
+    return max_bytes, max_entries
+
+
+def memory_limit_from_env() -> int | None:
+    """Return the in-process tier's byte budget requested by ``ALL2MD_CACHE_MEMORY_SIZE``.
+
+    Defaults to :data:`DEFAULT_MEMORY_CACHE_BYTES`; ``0`` disables the tier.
+    """
+    raw = os.environ.get(_ENV_MEMORY_SIZE, "").strip()
+    if not raw:
+        return DEFAULT_MEMORY_CACHE_BYTES
+    try:
+        return parse_size(raw) or None
+    except ValueError as exc:
+        logger.warning("Ignoring %s: %s", _ENV_MEMORY_SIZE, exc)
+        return DEFAULT_MEMORY_CACHE_BYTES
+
+
 def make_cache_key(source_path: str, *, source_format: str, options_repr: str) -> str:
     """Build the cache key for a parsed AST.
 
@@ -97,52 +225,412 @@ def make_cache_key(source_path: str, *, source_format: str, options_repr: str) -
     )
 
 
+@dataclasses.dataclass
+class CacheStats:
+    """Hit/miss and byte counters for a :class:`ConversionCache`.
+
+    Attributes
+    ----------
+    hits, misses : int
+        Lookups that returned a document / found nothing usable.
+    writes : int
+        Entries stored.
+    evictions : int
+        Entries removed to keep the directory within its bounds.
+    bytes_read, bytes_written, bytes_evicted : int
+        Entry bytes served by hits, stored by writes, and freed by eviction.
+    memory_hits : int
+        The subset of ``hits`` served by the in-process tier without touching disk
+        (``bytes_read`` counts only disk hits).
+
+    """
+
+    hits: int = 0
+    memory_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    bytes_evicted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 when there were none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dict."""
+        return dataclasses.asdict(self)
+
+    def merge(self, other: "CacheStats") -> "CacheStats":
+        """Return the field-wise sum of ``self`` and ``other``."""
+        return CacheStats(**{f.name: getattr(self, f.name) + getattr(other, f.name) for f in dataclasses.fields(self)})
+
+
 class ConversionCache:
-    """Directory-backed store of parsed ASTs, serialized as AST-JSON.
+    """Directory-backed, size-bounded store of parsed ASTs, serialized as binary AST.
+
+    All I/O is best-effort: a corrupt, unreadable or schema-incompatible entry is
+    treated as a miss, and a failed write or eviction is swallowed — caching must
+    never break a conversion.
+
+    Parameters
+    ----------
+    directory : Path
+        Cache root (created lazily on first write).
+    max_bytes : int or None, default None
+        Evict least recently used entries once the entries total more than this
+        many bytes. None means unbounded.
+    max_entries : int or None, default None
+        Evict least recently used entries once there are more than this many.
+        None means unbounded.
+    memory_max_bytes : int or None, default None
+        Budget, in bytes of pickled snapshots, for the in-process tier in front
+        of the directory. None disables the tier.
 
-    All I/O is best-effort: a corrupt or unreadable entry is treated as a miss,
-    and a failed write is swallowed — caching must never break a conversion.
     """
 
-    def __init__(self, directory: Path) -> None:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        memory_max_bytes: int | None = None,
+    ) -> None:
         """Create a cache rooted at ``directory`` (created lazily on first write)."""
         self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.memory_max_bytes = memory_max_bytes
+        # key -> pickled Document snapshot, least recently used first.
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._flushed = CacheStats()
+        # (entry count, total bytes) as of the last directory scan plus this
+        # process's writes and evictions since; None until the first bounded put.
+        self._usage: tuple[int, int] | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of this process's counters for the cache."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    @property
+    def memory_usage(self) -> tuple[int, int]:
+        """Return ``(documents, bytes)`` held by the in-process tier."""
+        with self._lock:
+            return len(self._memory), self._memory_bytes
+
+    def _remember(self, key: str, document: "Document") -> None:
+        """Snapshot ``document`` into the in-process tier (best-effort)."""
+        budget = self.memory_max_bytes
+        if not budget:
+            return
+        try:
+            # nosemgrep: python.lang.security.deserialization.pickle.avoid-pickle
+            snapshot = pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:  # unpicklable metadata: serve this one from disk only
+            logger.debug("Conversion cache: not holding %s in memory: %s", key, exc)
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            if len(snapshot) > budget:
+                return
+            self._memory[key] = snapshot
+            self._memory_bytes += len(snapshot)
+            while self._memory_bytes > budget:
+                _evicted_key, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
 
     def _entry_path(self, key: str) -> Path:
         # Shard by the first two hex chars to avoid one enormous flat directory.
-        return self.directory / key[:2] / f"{key}.json"
+        return self.directory / key[:2] / f"{key}{_ENTRY_SUFFIX}"
 
     def get(self, key: str) -> "Document | None":
         """Return the cached ``Document`` for ``key``, or None on any miss/error."""
+        from all2md.ast.binary_serialization import read_ast_file
+        from all2md.ast.nodes import Document
+
+        if self.memory_max_bytes:
+            with self._lock:
+                held = self._memory.get(key)
+                if held is not None:
+                    self._memory.move_to_end(key)
+                    self._stats.hits += 1
+                    self._stats.memory_hits += 1
+            if held is not None:
+                # Snapshot taken by this process (see _remember); never read from disk.
+                # nosemgrep: python.lang.security.deserialization.pickle.avoid-pickle
+                return cast("Document", pickle.loads(held))  # nosec B301
+
         path = self._entry_path(key)
-        if not path.exists():
-            return None
+        node = None
+        size = 0
         try:
-            from all2md.ast.nodes import Document
-            from all2md.ast.serialization import json_to_ast
-
-            node = json_to_ast(path.read_text(encoding="utf-8"))
+            size = path.stat().st_size
+            node = read_ast_file(path)
+        except FileNotFoundError:
+            pass
         except Exception as exc:  # corrupt / schema-incompatible entry → treat as miss
             logger.debug("Conversion cache: ignoring unreadable entry %s: %s", path, exc)
-            return None
         if not isinstance(node, Document):
+            with self._lock:
+                self._stats.misses += 1
             return None
+        try:
+            # Bump the mtime: it is the recency eviction orders by.
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._stats.hits += 1
+            self._stats.bytes_read += size
+        # The snapshot is independent of ``node``, so the caller may keep it.
+        self._remember(key, node)
         return node
 
     def put(self, key: str, document: "Document") -> None:
         """Store ``document`` under ``key`` (best-effort; never raises)."""
-        from all2md.ast.serialization import ast_to_json
+        from all2md.ast.binary_serialization import ast_to_bytes
 
         path = self._entry_path(key)
+        try:
+            blob = ast_to_bytes(document)
+        except Exception as exc:
+            logger.debug("Conversion cache: failed to store entry %s: %s", path, exc)
+            return
+        if self._write_entry(path, blob):
+            self._remember(key, document)
+
+    def _artifact_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{_ARTIFACT_SUFFIX}"
+
+    def get_artifact(self, key: str) -> bytes | None:
+        """Return the raw bytes stored under ``key`` by :meth:`put_artifact`, or None.
+
+        Artifacts are intermediate results other than ASTs (OCR output, for one)
+        that share the directory, its bounds and its eviction with the documents.
+        They are counted in the same hit/miss statistics.
+        """
+        path = self._artifact_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._stats.hits += 1
+            self._stats.bytes_read += len(data)
+        return data
+
+    def put_artifact(self, key: str, data: bytes) -> None:
+        """Store raw ``data`` under ``key`` (best-effort; never raises)."""
+        self._write_entry(self._artifact_path(key), data)
+
+    def _write_entry(self, path: Path, blob: bytes) -> bool:
+        """Atomically write ``blob`` to ``path`` and enforce the bounds; False on failure."""
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = None
             # Write to a temp sibling then atomically replace, so a crash mid-write
-            # can't leave a truncated entry that later reads as corrupt.
-            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
-            tmp.write_text(ast_to_json(document), encoding="utf-8")
+            # can't leave a truncated entry that later reads as corrupt. The name
+            # is unique per thread as well as per process (serve's workers).
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(blob)
             os.replace(tmp, path)
         except Exception as exc:  # a cache write must never break the conversion
             logger.debug("Conversion cache: failed to store entry %s: %s", path, exc)
+            return False
+
+        with self._lock:
+            self._stats.writes += 1
+            self._stats.bytes_written += len(blob)
+            if self.max_bytes is None and self.max_entries is None:
+                return True
+            if self._usage is None:
+                self._usage = self._scan_usage()
+            else:
+                count, total = self._usage
+                if replaced is None:
+                    self._usage = (count + 1, total + len(blob))
+                else:
+                    self._usage = (count, total - replaced + len(blob))
+            if self._over_bounds(*self._usage, self.max_bytes, self.max_entries):
+                self._evict_locked(self.max_bytes, self.max_entries, low_water=_EVICT_LOW_WATER)
+        return True
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def _iter_entries(self) -> Iterator[tuple[Path, int, float]]:
+        """Yield ``(path, size, mtime)`` for every entry, legacy entries with mtime 0."""
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            try:
+                files = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for entry in files:
+                name = entry.name
+                if name.endswith((_ENTRY_SUFFIX, _ARTIFACT_SUFFIX)):
+                    legacy = False
+                elif name.endswith(_LEGACY_SUFFIX):
+                    legacy = True
+                else:  # in-flight .tmp writes and anything foreign
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                yield Path(entry.path), st.st_size, 0.0 if legacy else st.st_mtime
+
+    def _scan_usage(self) -> tuple[int, int]:
+        count = total = 0
+        for _path, size, _mtime in self._iter_entries():
+            count += 1
+            total += size
+        return count, total
+
+    @staticmethod
+    def _over_bounds(count: int, total: int, max_bytes: int | None, max_entries: int | None) -> bool:
+        return (max_bytes is not None and total > max_bytes) or (max_entries is not None and count > max_entries)
+
+    def _evict_locked(
+        self, max_bytes: int | None, max_entries: int | None, *, low_water: float = 1.0
+    ) -> tuple[int, int]:
+        """Remove least recently used entries until within bounds; caller holds the lock.
+
+        The directory is rescanned rather than trusting ``_usage``, because other
+        processes may share it. An entry that vanishes or cannot be removed (a
+        concurrent eviction, or an open mapping on Windows) is skipped.
+        """
+        entries = sorted(self._iter_entries(), key=lambda item: item[2])
+        count = len(entries)
+        total = sum(size for _path, size, _mtime in entries)
+        target_bytes = int(max_bytes * low_water) if max_bytes is not None else None
+        target_entries = int(max_entries * low_water) if max_entries is not None else None
+        removed = freed = 0
+        for path, size, _mtime in entries:
+            if not self._over_bounds(count, total, target_bytes, target_entries):
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.debug("Conversion cache: could not evict %s: %s", path, exc)
+                continue
+            else:
+                removed += 1
+                freed += size
+            count -= 1
+            total -= size
+        self._usage = (count, total)
+        self._stats.evictions += removed
+        self._stats.bytes_evicted += freed
+        return removed, freed
+
+    def usage(self) -> tuple[int, int]:
+        """Return ``(entry_count, total_bytes)`` for the cache directory."""
+        with self._lock:
+            self._usage = self._scan_usage()
+            return self._usage
+
+    def prune(self, *, max_bytes: int | None = None, max_entries: int | None = None) -> tuple[int, int]:
+        """Evict least recently used entries down to the given bounds.
+
+        Parameters
+        ----------
+        max_bytes, max_entries : int or None
+            Bounds to prune to; each defaults to the cache's own bound.
+
+        Returns
+        -------
+        tuple[int, int]
+            ``(entries_removed, bytes_freed)``
+
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_entries = self.max_entries if max_entries is None else max_entries
+        with self._lock:
+            return self._evict_locked(max_bytes, max_entries)
+
+    def clear(self) -> tuple[int, int]:
+        """Remove every entry; returns ``(entries_removed, bytes_freed)``."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            removed, freed = self._evict_locked(0, 0)
+            # Evicting everything is not eviction pressure; keep the counters honest.
+            self._stats.evictions -= removed
+            self._stats.bytes_evicted -= freed
+        try:
+            (self.directory / _STATS_FILE).unlink()
+        except OSError:
+            pass
+        return removed, freed
+
+    def lifetime_stats(self) -> CacheStats:
+        """Return counters accumulated by every process that used this directory.
+
+        Includes this process's counters not yet written by :meth:`flush_stats`.
+        """
+        stored = CacheStats()
+        try:
+            raw: dict[str, Any] = json.loads((self.directory / _STATS_FILE).read_text(encoding="utf-8"))
+            stored = CacheStats(**{f.name: int(raw.get(f.name, 0)) for f in dataclasses.fields(CacheStats)})
+        except (OSError, ValueError, TypeError):
+            pass
+        with self._lock:
+            pending = CacheStats(
+                **{
+                    f.name: getattr(self._stats, f.name) - getattr(self._flushed, f.name)
+                    for f in dataclasses.fields(CacheStats)
+                }
+            )
+        return stored.merge(pending)
+
+    def flush_stats(self) -> None:
+        """Add this process's unflushed counters to the directory's lifetime stats.
+
+        Best-effort read-modify-write: processes flushing at the same instant can
+        lose each other's increments, which is acceptable for reporting.
+        """
+        if not self.directory.is_dir():
+            return
+        totals = self.lifetime_stats()
+        path = self.directory / _STATS_FILE
+        try:
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps({**totals.to_dict(), "updated": time.time()}), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Conversion cache: failed to write stats %s: %s", path, exc)
+            return
+        with self._lock:
+            self._flushed = dataclasses.replace(self._stats)
 
 
 # Process-global active cache (see module docstring for why not a ContextVar).
@@ -150,13 +638,22 @@ _active_cache: "ConversionCache | None" = None
 
 
 def get_active_cache() -> "ConversionCache | None":
-    """Return the currently active conversion cache, or None if disabled."""
+    """Return the currently active conversion cache, or None if disabled.
+
+    Its :attr:`ConversionCache.stats` are the hit/miss/byte counters for the
+    ``with use_conversion_cache(...)`` block so far.
+    """
     return _active_cache
 
 
 @contextmanager
 def use_conversion_cache(
-    *, enabled: bool | None = None, cache_dir: str | Path | None = None
+    *,
+    enabled: bool | None = None,
+    cache_dir: str | Path | None = None,
+    max_bytes: int | None = None,
+    max_entries: int | None = None,
+    memory_max_bytes: int | None = None,
 ) -> Iterator["ConversionCache | None"]:
     """Activate the conversion cache for the duration of the ``with`` block.
 
@@ -169,6 +666,12 @@ def use_conversion_cache(
     cache_dir : str | Path | None
         Override the cache directory; otherwise ``ALL2MD_CACHE_DIR`` or the
         per-OS default (:func:`default_cache_dir`) is used.
+    max_bytes, max_entries : int | None
+        Bounds for LRU eviction; each falls back to :func:`cache_limits_from_env`
+        when None. Pass ``0`` to disable a bound.
+    memory_max_bytes : int | None
+        Budget for the in-process tier; falls back to :func:`memory_limit_from_env`
+        when None. Pass ``0`` to disable the tier.
 
     Yields
     ------
@@ -183,11 +686,67 @@ def use_conversion_cache(
         yield None
         return
 
-    directory = Path(cache_dir).expanduser() if cache_dir else default_cache_dir()
-    cache = ConversionCache(directory)
+    cache = _build_cache(cache_dir, max_bytes, max_entries, memory_max_bytes)
     previous = _active_cache
     _active_cache = cache
     try:
         yield cache
     finally:
         _active_cache = previous
+        cache.flush_stats()
+
+
+def _build_cache(
+    cache_dir: str | Path | None, max_bytes: int | None, max_entries: int | None, memory_max_bytes: int | None
+) -> ConversionCache:
+    """Create a cache, resolving each unset bound from the environment (``0`` disables it)."""
+    env_bytes, env_entries = cache_limits_from_env()
+    directory = Path(cache_dir).expanduser() if cache_dir else default_cache_dir()
+    return ConversionCache(
+        directory,
+        max_bytes=(max_bytes or None) if max_bytes is not None else env_bytes,
+        max_entries=(max_entries or None) if max_entries is not None else env_entries,
+        memory_max_bytes=(memory_max_bytes or None) if memory_max_bytes is not None else memory_limit_from_env(),
+    )
+
+
+def install_worker_cache(settings: dict[str, Any] | None) -> None:
+    """Activate the parent's cache for the rest of a process-pool worker's life.
+
+    Meant to be called from a pool ``initializer`` with the parent's
+    :func:`worker_cache_settings`. The worker then keeps one
+    :class:`ConversionCache` for every task it runs -- so a bounded cache scans
+    its directory once per worker, not once per document -- and merges its
+    counters into the lifetime stats once, when the worker process exits.
+    Does nothing when ``settings`` is None.
+    """
+    global _active_cache
+    if settings is None:
+        return
+    from multiprocessing.util import Finalize
+
+    cache = _build_cache(**settings)
+    _active_cache = cache
+    # Pool workers leave through os._exit, which skips atexit; multiprocessing
+    # finalizers with an exit priority still run on the way out.
+    Finalize(cache, cache.flush_stats, exitpriority=10)
+
+
+def worker_cache_settings() -> dict[str, Any] | None:
+    """Describe the active cache so process-pool workers can share its directory.
+
+    The active cache is process-global, so a worker re-activates it with
+    :func:`install_worker_cache` from its pool initializer (or
+    ``use_conversion_cache(enabled=True, **settings)``). Returns None when no
+    cache is active.
+    """
+    cache = get_active_cache()
+    if cache is None:
+        return None
+    return {
+        "cache_dir": cache.directory,
+        "max_bytes": cache.max_bytes or 0,
+        "max_entries": cache.max_entries or 0,
+        # Workers rarely see the same source twice, so an in-process tier per worker is wasted memory.
+        "memory_max_bytes": 0,
+    }
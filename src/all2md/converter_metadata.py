@@ -42,6 +42,14 @@ class ConverterMetadata:
         importing the parser module; the function is imported lazily the first
         time detection actually needs it. Prefer ``content_detector`` when you
         already hold the callable (e.g. plugins).
+    zip_members : list[str]
+        For ZIP-based formats: member paths whose presence in the archive's
+        central directory identifies this format (e.g. ``"word/document.xml"``).
+        Formats sharing the ZIP signature are told apart with one read of the
+        central directory, shared by all of them
+    zip_mimetypes : list[str]
+        For ZIP-based formats that store a ``mimetype`` member (OpenDocument,
+        EPUB): the values of that member that identify this format
     parser_class : Union[str, type, None], optional
         Parser class specification. Can be:
         - Simple class name (e.g., "DocxParser") - looks in all2md.parsers.{format}
@@ -96,6 +104,8 @@ class ConverterMetadata:
     magic_bytes: list[tuple[bytes, int]] = field(default_factory=list)
     content_detector: Optional[Callable[[bytes], bool]] = None
     content_detector_path: Optional[str] = None
+    zip_members: list[str] = field(default_factory=list)
+    zip_mimetypes: list[str] = field(default_factory=list)
     parser_class: Optional[Union[str, type]] = None
     renderer_class: Optional[Union[str, type]] = None
     parser_required_packages: list[tuple[str, str, str]] = field(default_factory=list)
@@ -14,7 +14,9 @@ import importlib.metadata
 import io
 import logging
 import mimetypes
+import zipfile
 from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Dict, List, NoReturn, Optional, Tuple, Union
 
@@ -23,6 +25,15 @@ from all2md.exceptions import DependencyError, FormatError
 
 logger = logging.getLogger(__name__)
 
+# Leading bytes read for content detection, and the prefix of them that magic
+# patterns must fit in (see ConverterMetadata.matches_magic_bytes).
+_SAMPLE_BYTES = 1024
+_MAGIC_CHECK_BYTES = 512
+
+# A ZIP ``mimetype`` member (OpenDocument, EPUB) is a short ASCII string; larger
+# ones are not read.
+_MAX_ZIP_MIMETYPE_BYTES = 256
+
 
 def _sanitize_for_log(value: str) -> str:
     """Sanitize a string for safe logging to prevent log injection.
@@ -261,6 +272,121 @@ def match_extension(name: Union[str, Path], known_extensions: Iterable[str]) ->
     return None
 
 
+@dataclass(frozen=True)
+class _MagicTable:
+    """Magic-byte patterns of all registered converters, indexed for one-pass matching.
+
+    Patterns are bucketed by offset and then by their first byte, so matching
+    a sample costs one dictionary lookup per distinct offset (almost always
+    just offset 0) plus a ``startswith`` per candidate sharing that byte,
+    instead of a scan over every converter's pattern list.
+
+    Parameters
+    ----------
+    offsets : tuple[int, ...]
+        Distinct pattern offsets, ascending
+    buckets : dict[int, dict[int, list[tuple[int, bytes]]]]
+        ``offset -> first byte -> [(rank, pattern), ...]``, where ``rank`` is
+        the converter's position in the priority-sorted converter list. Empty
+        patterns, which match any sample long enough, use the key ``-1``.
+
+    """
+
+    offsets: tuple[int, ...]
+    buckets: dict[int, dict[int, list[tuple[int, bytes]]]]
+
+    @classmethod
+    def compile(cls, sorted_converters: List[Tuple[str, ConverterMetadata]]) -> _MagicTable:
+        """Build the table from the priority-sorted converter list."""
+        buckets: dict[int, dict[int, list[tuple[int, bytes]]]] = {}
+        for rank, (_format_name, metadata) in enumerate(sorted_converters):
+            for pattern, offset in metadata.magic_bytes:
+                if offset + len(pattern) > _MAGIC_CHECK_BYTES:
+                    continue  # can never match; see ConverterMetadata.matches_magic_bytes
+                key = pattern[0] if pattern else -1
+                buckets.setdefault(offset, {}).setdefault(key, []).append((rank, pattern))
+        return cls(offsets=tuple(sorted(buckets)), buckets=buckets)
+
+    def match(self, content: bytes) -> List[int]:
+        """Return the ranks of all converters with a pattern matching ``content``, best first."""
+        sample = content[:_MAGIC_CHECK_BYTES]
+        ranks: set[int] = set()
+        for offset in self.offsets:
+            if offset > len(sample):
+                break
+            by_byte = self.buckets[offset]
+            candidates = list(by_byte.get(-1, ()))
+            if offset < len(sample):
+                candidates.extend(by_byte.get(sample[offset], ()))
+            for rank, pattern in candidates:
+                if rank not in ranks and sample.startswith(pattern, offset):
+                    ranks.add(rank)
+        return sorted(ranks)
+
+
+@dataclass(frozen=True)
+class _ZipListing:
+    """What format detection needs from a ZIP container, read once for all detectors.
+
+    Parameters
+    ----------
+    names : frozenset[str]
+        Member paths from the central directory
+    mimetype : str or None
+        Content of the ``mimetype`` member, if there is a small one
+
+    """
+
+    names: frozenset[str]
+    mimetype: Optional[str]
+
+    def identifies(self, metadata: ConverterMetadata) -> bool:
+        """Return whether this listing carries one of ``metadata``'s ZIP markers."""
+        if self.mimetype is not None and self.mimetype in metadata.zip_mimetypes:
+            return True
+        return any(name in self.names for name in metadata.zip_members)
+
+
+def _read_zip_listing(source: Union[bytes, str, Path, IO[bytes]]) -> Optional[_ZipListing]:
+    """Read the central directory (and ``mimetype`` member) of a ZIP container.
+
+    Only the end-of-archive records and the central directory are read, not
+    member data. Streams are restored to their original position. Returns
+    None when ``source`` is not a readable ZIP archive (including when it is
+    only a truncated sample of one).
+    """
+    position: Optional[int] = None
+    stream: Union[str, Path, IO[bytes]]
+    if isinstance(source, (bytes, bytearray)):
+        stream = io.BytesIO(source)
+    elif isinstance(source, (str, Path)):
+        stream = source
+    else:
+        stream = source
+        try:
+            position = stream.tell()
+        except (OSError, ValueError):
+            return None
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            names = frozenset(archive.namelist())
+            mimetype = None
+            if "mimetype" in names:
+                info = archive.getinfo("mimetype")
+                if info.file_size <= _MAX_ZIP_MIMETYPE_BYTES:
+                    mimetype = archive.read(info).decode("ascii", errors="replace").strip()
+        return _ZipListing(names=names, mimetype=mimetype)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError, OSError, ValueError) as e:
+        logger.debug(f"Could not read ZIP central directory for format detection: {e!r}")
+        return None
+    finally:
+        if position is not None:
+            try:
+                stream.seek(position)  # type: ignore[union-attr]
+            except (OSError, ValueError):
+                pass
+
+
 class ConverterRegistry:
     """Registry for managing document parsers and renderers.
 
@@ -291,6 +417,7 @@ class ConverterRegistry:
     _converters: Dict[str, List[ConverterMetadata]] = {}
     _initialized: bool = False
     _sorted_converters_cache: Optional[List[Tuple[str, ConverterMetadata]]] = None
+    _magic_table_cache: Optional[_MagicTable] = None
 
     def __new__(cls) -> ConverterRegistry:
         """Create or return singleton instance."""
@@ -299,6 +426,7 @@ class ConverterRegistry:
             cls._instance._converters = {}
             cls._instance._initialized = False
             cls._instance._sorted_converters_cache = None
+            cls._instance._magic_table_cache = None
         return cls._instance
 
     def _sorted_converter_list(self) -> List[Tuple[str, ConverterMetadata]]:
@@ -318,6 +446,12 @@ class ConverterRegistry:
             self._sorted_converters_cache = sorted(all_converters, key=lambda x: x[1].priority, reverse=True)
         return self._sorted_converters_cache
 
+    def _magic_table(self) -> _MagicTable:
+        """Return the compiled magic-byte table, memoized like ``_sorted_converter_list``."""
+        if self._magic_table_cache is None:
+            self._magic_table_cache = _MagicTable.compile(self._sorted_converter_list())
+        return self._magic_table_cache
+
     def register(self, metadata: ConverterMetadata) -> None:
         """Register a converter with its metadata.
 
@@ -346,6 +480,7 @@ class ConverterRegistry:
         self._converters[metadata.format_name].append(metadata)
         self._converters[metadata.format_name].sort(key=lambda m: m.priority, reverse=True)
         self._sorted_converters_cache = None
+        self._magic_table_cache = None
 
     def unregister(self, format_name: str) -> bool:
         """Unregister a converter.
@@ -364,6 +499,7 @@ class ConverterRegistry:
         if format_name in self._converters:
             del self._converters[format_name]
             self._sorted_converters_cache = None
+            self._magic_table_cache = None
             logger.debug(f"Unregistered converter: {format_name}")
             return True
         return False
@@ -612,15 +748,19 @@ class ConverterRegistry:
 
         # Get content for validation
         content: bytes | str | None = None
+        # Where a ZIP central directory can be read from, if content turns out to be one
+        container: Union[bytes, str, Path, IO[bytes], None] = None
         opened_as_file = False
         if isinstance(input_data, bytes):
             content = input_data
+            container = input_data
         elif isinstance(input_data, (str, Path)):
             # Read first 1KB for detection
             try:
                 with open(input_data, "rb") as f:
-                    content = f.read(1024)
+                    content = f.read(_SAMPLE_BYTES)
                 opened_as_file = True
+                container = input_data
             except Exception:
                 pass
         elif isinstance(input_data, io.IOBase) or (
@@ -633,8 +773,9 @@ class ConverterRegistry:
             try:
                 pos = input_data.tell()
                 input_data.seek(0)
-                content = input_data.read(1024)
+                content = input_data.read(_SAMPLE_BYTES)
                 input_data.seek(pos)
+                container = input_data
             except Exception as e:
                 logger.debug(f"Error reading input as file: {e!r}")
 
@@ -661,7 +802,65 @@ class ConverterRegistry:
         # Normalize content to bytes if it's a string (from text streams)
         if isinstance(content, str):
             content = content.encode("utf-8", errors="ignore")
+            container = None
+
+        return self._detect_from_sample(filename, content, container)
+
+    def detect_formats(self, paths: Iterable[Union[str, Path]]) -> List[str]:
+        """Detect the formats of many files.
+
+        Equivalent to calling :meth:`detect_format` on each path, but each file
+        is opened once for both its leading sample and, for ZIP containers,
+        its central directory, and the compiled magic-byte table is shared by
+        the whole batch. Intended for sniffing large numbers of files.
 
+        Parameters
+        ----------
+        paths : Iterable[str or Path]
+            Files to detect
+
+        Returns
+        -------
+        list[str]
+            Detected format names, in the order of ``paths``
+
+        """
+        results: List[str] = []
+        for path in paths:
+            try:
+                handle = open(path, "rb")
+            except OSError:
+                # Unreadable: extension/MIME matching only, as detect_format does
+                results.append(self.detect_format(path))
+                continue
+            with handle:
+                content = handle.read(_SAMPLE_BYTES)
+                results.append(self._detect_from_sample(str(path), content, handle))
+        return results
+
+    def _detect_from_sample(
+        self,
+        filename: Optional[str],
+        content: Optional[bytes],
+        container: Union[bytes, str, Path, IO[bytes], None],
+    ) -> str:
+        """Run filename and content detection on an already-read sample.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name to match extensions and MIME types against
+        content : bytes or None
+            Leading bytes of the input
+        container : bytes, str, Path, IO[bytes] or None
+            Full input to read a ZIP central directory from, when needed
+
+        Returns
+        -------
+        str
+            Detected format name, ``"plaintext"`` when nothing matches
+
+        """
         # Try filename-based detection with content validation
         if filename:
             format_name = self._detect_by_filename(filename, content)
@@ -671,7 +870,7 @@ class ConverterRegistry:
 
         # Try content-based detection
         if content:
-            format_name = self._detect_by_content(content)
+            format_name = self._detect_by_content(content, container)
             if format_name:
                 logger.debug(f"Format detected from content: {format_name}")
                 return format_name
@@ -733,13 +932,20 @@ class ConverterRegistry:
 
         return None
 
-    def _detect_by_content(self, content: bytes) -> Optional[str]:
+    def _detect_by_content(
+        self, content: bytes, container: Union[bytes, str, Path, IO[bytes], None] = None
+    ) -> Optional[str]:
         """Detect format from file content.
 
         Parameters
         ----------
         content : bytes
             File content to analyze
+        container : bytes, str, Path, IO[bytes], optional
+            Full input, used to read the central directory when ``content``
+            starts with a signature shared by several ZIP-based formats.
+            Defaults to ``content`` itself, which suffices when it holds the
+            whole file.
 
         Returns
         -------
@@ -751,9 +957,14 @@ class ConverterRegistry:
         sorted_converters = self._sorted_converter_list()
 
         # Check magic bytes first
-        for format_name, metadata in sorted_converters:
-            if metadata.matches_magic_bytes(content):
-                return format_name
+        ranks = self._magic_table().match(content)
+        if ranks:
+            candidates = [sorted_converters[rank] for rank in ranks]
+            if len(candidates) > 1:
+                format_name = self._detect_zip_container(candidates, content if container is None else container)
+                if format_name:
+                    return format_name
+            return candidates[0][0]
 
         # Check custom content detectors. resolve_content_detector() imports each
         # detector lazily; only the (few) formats that declare one are imported,
@@ -766,6 +977,34 @@ class ConverterRegistry:
 
         return None
 
+    def _detect_zip_container(
+        self,
+        candidates: List[Tuple[str, ConverterMetadata]],
+        container: Union[bytes, str, Path, IO[bytes]],
+    ) -> Optional[str]:
+        """Pick among formats sharing a magic signature using ZIP member markers.
+
+        The central directory is read once and checked against every
+        candidate's ``zip_members``/``zip_mimetypes``, in priority order. A ZIP
+        that none of them claims goes to the best candidate without markers
+        (the generic ``zip`` format). Returns None when no candidate declares
+        markers or the container cannot be read, leaving the choice to
+        priority alone.
+        """
+        if not any(metadata.zip_members or metadata.zip_mimetypes for _, metadata in candidates):
+            return None
+        listing = _read_zip_listing(container)
+        if listing is None:
+            return None
+        for format_name, metadata in candidates:
+            if listing.identifies(metadata):
+                logger.debug(f"Format '{format_name}' identified from ZIP members")
+                return format_name
+        for format_name, metadata in candidates:
+            if not (metadata.zip_members or metadata.zip_mimetypes):
+                return format_name
+        return None
+
     def list_formats(self) -> List[str]:
         """List all registered format names.
 
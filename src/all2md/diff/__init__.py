@@ -10,7 +10,7 @@ any document format (PDF, DOCX, HTML, etc.).
 Key Features
 ------------
 - Cross-format document comparison (PDF vs DOCX, etc.)
-- Text-based comparison using Python's difflib (guaranteed symmetric)
+- Text-based comparison that scales to very large documents (patience and Myers diff)
 - Multiple output formats (unified diff, HTML visual, JSON)
 - Optional whitespace normalization
 - Works exactly like Unix diff but for any document format
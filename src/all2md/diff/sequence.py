@@ -0,0 +1,408 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/diff/sequence.py
+"""Line-sequence diff engine that scales to very large documents.
+
+:class:`difflib.SequenceMatcher` looks for the longest matching block at every
+level of its recursion, which is quadratic in the worst case. Two revisions of
+a long document diffed at ``granularity="word"`` have millions of tokens, and
+the comparison effectively never finishes. This module replaces it with:
+
+* Interning. Every distinct line becomes a small integer, so all comparisons
+  below are integer comparisons and each line is hashed exactly once.
+* A section pre-pass. When the caller knows where sections start (the text
+  extractor records top-level headings), each section is reduced to one
+  token for its heading and content together. Sections that are unchanged
+  match as a whole, and only the runs of changed sections are diffed line
+  by line.
+* Patience diff. Lines that occur exactly once on both sides of a region are
+  matched up in order (longest increasing subsequence), which splits the
+  region into small gaps that are diffed the same way.
+* Myers' O(ND) algorithm with linear space, for the gaps where no line is
+  unique (repeated words, blank table rows). The cost grows with the size of
+  the edit, not the product of the lengths.
+* A deadline. Once it passes, every region not yet resolved is reported as a
+  single replacement. The result is still a correct edit script, only a
+  coarser one; :attr:`SequenceDiff.timed_out` says when that happened.
+
+Opcodes have the same shape as ``SequenceMatcher.get_opcodes()``, and
+:func:`unified_diff` formats them the way :func:`difflib.unified_diff` does.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Hashable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+__all__ = [
+    "DEFAULT_DIFF_TIMEOUT",
+    "Opcode",
+    "OpcodeTag",
+    "SequenceDiff",
+    "diff_sequences",
+    "group_opcodes",
+    "intern_lines",
+    "unified_diff",
+]
+
+#: Seconds a diff may spend searching for a minimal edit before it settles for a coarser one.
+DEFAULT_DIFF_TIMEOUT = 10.0
+
+OpcodeTag = Literal["replace", "delete", "insert", "equal"]
+Opcode = tuple[OpcodeTag, int, int, int, int]
+
+# A region of the two interned sequences still to be diffed: a[alo:ahi] against b[blo:bhi].
+_Region = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceDiff:
+    """Result of :func:`diff_sequences`.
+
+    Attributes
+    ----------
+    opcodes : list of tuple
+        ``(tag, i1, i2, j1, j2)`` tuples as returned by
+        ``difflib.SequenceMatcher.get_opcodes()``.
+    timed_out : bool
+        True when the deadline passed and some regions were reported as whole
+        replacements instead of being diffed.
+
+    """
+
+    opcodes: list[Opcode]
+    timed_out: bool
+
+
+def intern_lines(*sequences: Sequence[Hashable]) -> list[list[int]]:
+    """Map every distinct item across ``sequences`` to a small integer.
+
+    Equal items get the same integer in every sequence, so the diff can compare
+    integers instead of strings.
+    """
+    table: dict[Hashable, int] = {}
+    return [[table.setdefault(item, len(table)) for item in sequence] for sequence in sequences]
+
+
+def diff_sequences(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+    *,
+    a_sections: Sequence[int] = (),
+    b_sections: Sequence[int] = (),
+    timeout: float | None = DEFAULT_DIFF_TIMEOUT,
+) -> SequenceDiff:
+    """Diff two sequences of lines.
+
+    Parameters
+    ----------
+    a, b : sequence of hashable
+        The old and new lines.
+    a_sections, b_sections : sequence of int, optional
+        Indices where a section starts in ``a`` and ``b``, in increasing order.
+        When both are given, whole sections are matched first and only the
+        changed ones are diffed line by line.
+    timeout : float or None, default DEFAULT_DIFF_TIMEOUT
+        Seconds to spend before settling for a coarser diff. None or a value
+        of zero or less never gives up.
+
+    Returns
+    -------
+    SequenceDiff
+        The opcodes, and whether the deadline cut the search short.
+
+    """
+    deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+    a_ids, b_ids = intern_lines(a, b)
+    engine = _Engine(a_ids, b_ids, deadline)
+
+    if a_sections and b_sections:
+        engine.diff_sections(_section_bounds(a_sections, len(a_ids)), _section_bounds(b_sections, len(b_ids)))
+    else:
+        engine.run((0, len(a_ids), 0, len(b_ids)))
+
+    return SequenceDiff(_opcodes(engine.matches, len(a_ids), len(b_ids)), engine.timed_out)
+
+
+def _section_bounds(starts: Sequence[int], length: int) -> list[tuple[int, int]]:
+    """Turn section start indices into ``(start, end)`` ranges that cover ``0..length``."""
+    cuts = sorted({0, length, *(start for start in starts if 0 < start < length)})
+    return list(zip(cuts, cuts[1:], strict=False))
+
+
+class _Engine:
+    """Collects matching lines for one diff; see the module docstring for the strategy."""
+
+    def __init__(self, a: list[int], b: list[int], deadline: float | None) -> None:
+        self.a = a
+        self.b = b
+        self.deadline = deadline
+        self.timed_out = False
+        # (i, j) pairs of matched lines, unordered until _opcodes sorts them.
+        self.matches: list[tuple[int, int]] = []
+
+    def expired(self) -> bool:
+        if self.deadline is not None and not self.timed_out and time.monotonic() > self.deadline:
+            self.timed_out = True
+        return self.timed_out
+
+    def diff_sections(self, a_bounds: list[tuple[int, int]], b_bounds: list[tuple[int, int]]) -> None:
+        """Match unchanged sections whole, then diff the lines of each changed run."""
+        a_keys = [tuple(self.a[start:end]) for start, end in a_bounds]
+        b_keys = [tuple(self.b[start:end]) for start, end in b_bounds]
+        a_tokens, b_tokens = intern_lines(a_keys, b_keys)
+
+        outer = _Engine(a_tokens, b_tokens, self.deadline)
+        outer.run((0, len(a_tokens), 0, len(b_tokens)))
+        self.timed_out = outer.timed_out
+
+        for tag, i1, i2, j1, j2 in _opcodes(outer.matches, len(a_tokens), len(b_tokens)):
+            if tag == "equal":
+                # Equal tokens mean identical sections, so their lines pair up one to one.
+                for offset in range(i2 - i1):
+                    (a_start, a_end), (b_start, b_end) = a_bounds[i1 + offset], b_bounds[j1 + offset]
+                    self.matches.extend(zip(range(a_start, a_end), range(b_start, b_end), strict=True))
+                continue
+            if tag == "replace":
+                self.run((a_bounds[i1][0], a_bounds[i2 - 1][1], b_bounds[j1][0], b_bounds[j2 - 1][1]))
+
+    def run(self, region: _Region) -> None:
+        """Resolve ``region`` and every sub-region it splits into."""
+        stack = [region]
+        while stack:
+            alo, ahi, blo, bhi = stack.pop()
+            a, b = self.a, self.b
+
+            # Common prefix and suffix cost nothing to match.
+            while alo < ahi and blo < bhi and a[alo] == b[blo]:
+                self.matches.append((alo, blo))
+                alo += 1
+                blo += 1
+            while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+                ahi -= 1
+                bhi -= 1
+                self.matches.append((ahi, bhi))
+            if alo == ahi or blo == bhi or self.expired():
+                continue
+
+            anchors = _patience_anchors(a, b, alo, ahi, blo, bhi)
+            if anchors:
+                self.matches.extend(anchors)
+                prev_i, prev_j = alo, blo
+                for i, j in anchors:
+                    stack.append((prev_i, i, prev_j, j))
+                    prev_i, prev_j = i + 1, j + 1
+                stack.append((prev_i, ahi, prev_j, bhi))
+                continue
+
+            split = self._middle_snake(alo, ahi, blo, bhi)
+            if split is not None and split not in {(alo, blo), (ahi, bhi)}:
+                x, y = split
+                stack.append((alo, x, blo, y))
+                stack.append((x, ahi, y, bhi))
+
+    def _middle_snake(self, alo: int, ahi: int, blo: int, bhi: int) -> tuple[int, int] | None:
+        """Find a point on a shortest edit path through the region (Myers, linear space).
+
+        Returns None when the deadline passes first, in which case the region is
+        left unmatched. Expects the region's first and last lines to differ.
+        """
+        a, b = self.a, self.b
+        n, m = ahi - alo, bhi - blo
+        max_d = (n + m + 1) // 2
+        offset = max_d + 1
+        size = 2 * max_d + 3
+        forward = [-1] * size
+        backward = [-1] * size
+        forward[offset + 1] = 0
+        backward[offset + 1] = 0
+        delta = n - m
+        front = delta % 2 != 0
+        k1start = k1end = k2start = k2end = 0
+
+        for d in range(max_d + 1):
+            if self.expired():
+                return None
+
+            for k1 in range(-d + k1start, d + 1 - k1end, 2):
+                k1_offset = offset + k1
+                if k1 == -d or (k1 != d and forward[k1_offset - 1] < forward[k1_offset + 1]):
+                    x1 = forward[k1_offset + 1]
+                else:
+                    x1 = forward[k1_offset - 1] + 1
+                y1 = x1 - k1
+                while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                    x1 += 1
+                    y1 += 1
+                forward[k1_offset] = x1
+                if x1 > n:
+                    k1end += 2
+                elif y1 > m:
+                    k1start += 2
+                elif front:
+                    k2_offset = offset + delta - k1
+                    if 0 <= k2_offset < size and backward[k2_offset] != -1 and x1 >= n - backward[k2_offset]:
+                        return alo + x1, blo + y1
+
+            for k2 in range(-d + k2start, d + 1 - k2end, 2):
+                k2_offset = offset + k2
+                if k2 == -d or (k2 != d and backward[k2_offset - 1] < backward[k2_offset + 1]):
+                    x2 = backward[k2_offset + 1]
+                else:
+                    x2 = backward[k2_offset - 1] + 1
+                y2 = x2 - k2
+                while x2 < n and y2 < m and a[ahi - x2 - 1] == b[bhi - y2 - 1]:
+                    x2 += 1
+                    y2 += 1
+                backward[k2_offset] = x2
+                if x2 > n:
+                    k2end += 2
+                elif y2 > m:
+                    k2start += 2
+                elif not front:
+                    k1_offset = offset + delta - k2
+                    if 0 <= k1_offset < size and forward[k1_offset] != -1:
+                        x1 = forward[k1_offset]
+                        y1 = offset + x1 - k1_offset
+                        if x1 >= n - x2:
+                            return alo + x1, blo + y1
+
+        # Nothing in common at all; the whole region is a replacement.
+        return None
+
+
+def _patience_anchors(a: list[int], b: list[int], alo: int, ahi: int, blo: int, bhi: int) -> list[tuple[int, int]]:
+    """Return the longest in-order run of lines that occur exactly once on each side."""
+    counts: dict[int, int] = {}
+    for i in range(alo, ahi):
+        counts[a[i]] = counts.get(a[i], 0) + 1
+    # Position in b of each line unique in a; -1 once it turns up twice in b.
+    in_b: dict[int, int] = {}
+    for j in range(blo, bhi):
+        line = b[j]
+        if counts.get(line) == 1:
+            in_b[line] = -1 if line in in_b else j
+    pairs = [(i, in_b[a[i]]) for i in range(alo, ahi) if in_b.get(a[i], -1) >= 0]
+    if not pairs:
+        return []
+
+    # Longest increasing subsequence of the b positions (patience sorting).
+    tails: list[int] = []
+    tail_index: list[int] = []
+    previous = [-1] * len(pairs)
+    for index, (_i, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[pile] = j
+            tail_index[pile] = index
+        previous[index] = tail_index[pile - 1] if pile else -1
+
+    chain: list[tuple[int, int]] = []
+    index = tail_index[-1]
+    while index >= 0:
+        chain.append(pairs[index])
+        index = previous[index]
+    chain.reverse()
+    return chain
+
+
+def _opcodes(matches: list[tuple[int, int]], len_a: int, len_b: int) -> list[Opcode]:
+    """Turn matched line pairs into ``SequenceMatcher``-style opcodes."""
+    opcodes: list[Opcode] = []
+    tag: OpcodeTag
+    i = j = 0
+    for mi, mj in sorted(matches):
+        if mi > i or mj > j:
+            tag = "replace" if mi > i and mj > j else ("delete" if mi > i else "insert")
+            opcodes.append((tag, i, mi, j, mj))
+        if opcodes and opcodes[-1][0] == "equal" and opcodes[-1][2] == mi:
+            _tag, i1, _i2, j1, _j2 = opcodes[-1]
+            opcodes[-1] = ("equal", i1, mi + 1, j1, mj + 1)
+        else:
+            opcodes.append(("equal", mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    if i < len_a or j < len_b:
+        tag = "replace" if i < len_a and j < len_b else ("delete" if i < len_a else "insert")
+        opcodes.append((tag, i, len_a, j, len_b))
+    return opcodes
+
+
+def group_opcodes(opcodes: list[Opcode], n: int = 3) -> Iterator[list[Opcode]]:
+    """Group opcodes into hunks with ``n`` lines of context.
+
+    Same grouping as ``difflib.SequenceMatcher.get_grouped_opcodes()``.
+    """
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    window = n + n
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > window:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range the way ``difflib.unified_diff`` does."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def unified_diff(
+    a: Sequence[str],
+    b: Sequence[str],
+    opcodes: list[Opcode],
+    *,
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = 3,
+    lineterm: str = "\n",
+) -> Iterator[str]:
+    """Format precomputed opcodes as a unified diff.
+
+    Output matches :func:`difflib.unified_diff` for the same opcodes, without
+    running ``SequenceMatcher`` again.
+    """
+    started = False
+    for group in group_opcodes(opcodes, n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@{lineterm}"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in {"replace", "delete"}:
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in {"replace", "insert"}:
+                for line in b[j1:j2]:
+                    yield "+" + line
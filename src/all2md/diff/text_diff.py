@@ -1,16 +1,16 @@
 #  Copyright (c) 2025 Tom Villani, Ph.D.
 #
 # src/all2md/diff/text_diff.py
-"""Simple text-based document comparison using difflib.
+"""Simple text-based document comparison.
 
 This module provides a simplified diff implementation that works like Unix diff
-but supports any document format. It extracts plain text from documents and uses
-Python's built-in difflib.unified_diff() for symmetric, predictable comparison.
+but supports any document format. It extracts plain text from documents and
+diffs the lines with :mod:`all2md.diff.sequence`, which stays fast on documents
+far too large for :mod:`difflib`, and prints the same unified diff format.
 """
 
 from __future__ import annotations
 
-import difflib
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -31,6 +31,7 @@ from all2md.ast.nodes import (
     ThematicBreak,
     get_node_children,
 )
+from all2md.diff.sequence import DEFAULT_DIFF_TIMEOUT, Opcode, OpcodeTag, diff_sequences, unified_diff
 
 Granularity = Literal["block", "sentence", "word"]
 
@@ -39,7 +40,7 @@ Granularity = Literal["block", "sentence", "word"]
 class DiffOp:
     """Structured diff operation between two sequences."""
 
-    tag: Literal["replace", "delete", "insert", "equal"]
+    tag: OpcodeTag
     old_slice: Sequence[str]
     new_slice: Sequence[str]
     old_range: tuple[int, int]
@@ -63,6 +64,9 @@ class DiffResult:
         new_label: str,
         context_lines: int,
         granularity: Granularity,
+        old_sections: Sequence[int] = (),
+        new_sections: Sequence[int] = (),
+        timeout: float | None = DEFAULT_DIFF_TIMEOUT,
     ) -> None:
         """Store the precomputed diff sequences and metadata.
 
@@ -80,6 +84,13 @@ class DiffResult:
             Number of context lines to include when rendering unified diffs.
         granularity : Granularity
             Tokenisation level used to build ``old_lines`` and ``new_lines``.
+        old_sections : sequence of int, optional
+            Indices in ``old_lines`` where a top-level section starts.
+        new_sections : sequence of int, optional
+            Indices in ``new_lines`` where a top-level section starts.
+        timeout : float or None, default DEFAULT_DIFF_TIMEOUT
+            Seconds the diff may search for a minimal edit before settling for a
+            coarser one; None never gives up.
 
         """
         self.old_lines = old_lines
@@ -88,18 +99,47 @@ class DiffResult:
         self.new_label = new_label
         self.context_lines = context_lines
         self.granularity = granularity
+        self.old_sections = old_sections
+        self.new_sections = new_sections
+        self.timeout = timeout
         self._ops: list[DiffOp] | None = None
+        self._opcodes: list[Opcode] | None = None
+        self._timed_out = False
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over the unified diff output."""
         yield from self.iter_unified_diff()
 
+    @property
+    def timed_out(self) -> bool:
+        """Whether the diff hit its timeout and reported some changes coarsely.
+
+        A timed-out diff is still correct, but a changed region it did not finish
+        is shown as one replacement rather than line by line.
+        """
+        self._get_opcodes()
+        return self._timed_out
+
+    def _get_opcodes(self) -> list[Opcode]:
+        if self._opcodes is None:
+            result = diff_sequences(
+                self.old_lines,
+                self.new_lines,
+                a_sections=self.old_sections,
+                b_sections=self.new_sections,
+                timeout=self.timeout,
+            )
+            self._opcodes = result.opcodes
+            self._timed_out = result.timed_out
+        return self._opcodes
+
     def iter_unified_diff(self, context_lines: int | None = None) -> Iterator[str]:
         """Yield unified diff lines using the cached sequences."""
         n = self.context_lines if context_lines is None else context_lines
-        yield from difflib.unified_diff(
+        yield from unified_diff(
             self.old_lines,
             self.new_lines,
+            self._get_opcodes(),
             fromfile=self.old_label,
             tofile=self.new_label,
             n=n,
@@ -107,14 +147,8 @@ class DiffResult:
         )
 
     def iter_operations(self) -> Iterator[DiffOp]:
-        """Yield SequenceMatcher operations for structured renderers."""
+        """Yield diff operations for structured renderers."""
         if self._ops is None:
-            matcher = difflib.SequenceMatcher(
-                None,
-                self.old_lines,
-                self.new_lines,
-                autojunk=False,
-            )
             self._ops = [
                 DiffOp(
                     tag,
@@ -123,7 +157,7 @@ class DiffResult:
                     (i1, i2),
                     (j1, j2),
                 )
-                for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+                for tag, i1, i2, j1, j2 in self._get_opcodes()
             ]
         yield from self._ops
 
@@ -220,10 +254,13 @@ class _DocumentLineExtractor:
         self.ignore_whitespace = ignore_whitespace
         self.granularity = granularity
         self.lines: list[str] = []
+        # Line indices where a top-level heading starts a section.
+        self.section_starts: list[int] = []
 
     def extract(self, doc: Document) -> list[str]:
         """Convert a document AST into a flat list of text lines."""
         self.lines.clear()
+        self.section_starts.clear()
         for node in doc.children:
             self._process_node(node, prefix="")
         return self.lines
@@ -256,6 +293,8 @@ class _DocumentLineExtractor:
         )
         tokens = self._tokenize(text)
         if tokens:
+            if not prefix:
+                self.section_starts.append(len(self.lines))
             marker = "#" * node.level
             self._emit_tokens(tokens, prefix=prefix, leading_marker=marker)
 
@@ -448,13 +487,14 @@ def compare_documents(
     context_lines: int = 3,
     ignore_whitespace: bool = False,
     granularity: Granularity = "block",
+    timeout: float | None = DEFAULT_DIFF_TIMEOUT,
 ) -> DiffResult:
     """Compare two document ASTs and generate unified diff.
 
-    This function extracts plain text lines from both documents and uses
-    Python's difflib.unified_diff() to generate a standard unified diff.
-    The result is guaranteed to be symmetric: comparing A to B produces
-    the exact opposite of comparing B to A (with +/- swapped).
+    This function extracts plain text lines from both documents and diffs
+    them into a standard unified diff. Top-level sections that are unchanged
+    are matched whole, so only the sections that changed are compared line
+    by line; this keeps word-level diffs of very long documents fast.
 
     Parameters
     ----------
@@ -470,10 +510,12 @@ def compare_documents(
         Number of context lines to show around changes
     ignore_whitespace : bool, default = False
         If True, normalize whitespace before comparison
-    granularity : {'block', 'sentence', 'word'}, default = 'block'
-        Tokenisation level used when extracting text from each document.
     granularity : {'block', 'sentence', 'word'}, default = 'block'
         Tokenisation level used when extracting lines from the documents.
+    timeout : float or None, default = DEFAULT_DIFF_TIMEOUT
+        Seconds to search for a minimal diff before reporting the remaining
+        changed regions as whole replacements (see ``DiffResult.timed_out``).
+        None never gives up.
 
     Returns
     -------
@@ -481,16 +523,10 @@ def compare_documents(
         Diff result encapsulating sequences and render helpers
 
     """
-    old_lines = extract_document_lines(
-        old_doc,
-        ignore_whitespace=ignore_whitespace,
-        granularity=granularity,
-    )
-    new_lines = extract_document_lines(
-        new_doc,
-        ignore_whitespace=ignore_whitespace,
-        granularity=granularity,
-    )
+    old_extractor = _DocumentLineExtractor(ignore_whitespace, granularity)
+    old_lines = old_extractor.extract(old_doc)
+    new_extractor = _DocumentLineExtractor(ignore_whitespace, granularity)
+    new_lines = new_extractor.extract(new_doc)
 
     return DiffResult(
         old_lines,
@@ -499,6 +535,9 @@ def compare_documents(
         new_label=new_label,
         context_lines=context_lines,
         granularity=granularity,
+        old_sections=old_extractor.section_starts,
+        new_sections=new_extractor.section_starts,
+        timeout=timeout,
     )
 
 
@@ -510,6 +549,7 @@ def compare_files(
     context_lines: int = 3,
     ignore_whitespace: bool = False,
     granularity: Granularity = "block",
+    timeout: float | None = DEFAULT_DIFF_TIMEOUT,
 ) -> DiffResult:
     """Compare two document files and generate unified diff.
 
@@ -532,6 +572,8 @@ def compare_files(
         If True, normalize whitespace before comparison
     granularity : Granularity, default = 'block'
         The level of granularity of details.
+    timeout : float or None, default = DEFAULT_DIFF_TIMEOUT
+        Seconds to search for a minimal diff; see ``compare_documents``.
 
     Returns
     -------
@@ -562,4 +604,5 @@ def compare_files(
         context_lines=context_lines,
         ignore_whitespace=ignore_whitespace,
         granularity=granularity,
+        timeout=timeout,
     )
@@ -184,16 +184,23 @@ def search_documents_impl(input_data: SearchDocumentsInput, config: MCPConfig) -
             service = SearchService.load(persist_dir, options=options)
         else:
             if persist_dir is not None and (persist_dir / "keyword").exists():
-                logger.info(f"Persisted index at {persist_dir} is stale (corpus/options changed); rebuilding")
-            service = SearchService(options=options)
-            service.build_indexes(documents, modes={service_mode})
+                # Reparse only the documents that changed since the index was saved.
+                service = SearchService.load(persist_dir, options=options)
+                summary = service.update_indexes(documents, modes={service_mode})
+                logger.info(
+                    f"Persisted index at {persist_dir} was stale; "
+                    + ("rebuilt" if summary.rebuilt else f"updated {summary.added + summary.changed} documents")
+                )
+            else:
+                service = SearchService(options=options)
+                service.build_indexes(documents, modes={service_mode})
             if persist_dir is not None:
                 logger.info(f"Persisting keyword index to: {persist_dir}")
                 service.save(persist_dir)
 
         results = service.search(input_data.query, mode=service_mode, top_k=input_data.top_k)
     except DependencyError as e:
-        # Surface the optional-dependency requirement (e.g. rank-bm25) cleanly.
+        # Surface an optional-dependency requirement cleanly.
         raise All2MdError(
             f"Search mode '{mode}' is unavailable: {e}. Install with: pip install 'all2md[search]'."
         ) from e
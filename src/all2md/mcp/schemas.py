@@ -282,8 +282,8 @@ class SearchDocumentsInput:
     Searches a corpus of documents and returns ranked snippets rather than whole
     files. Two modes are supported in this slice:
 
-    - "keyword": BM25 relevance ranking (requires the optional ``rank-bm25``
-      dependency). Best for "find the most relevant passages" queries.
+    - "keyword": BM25 relevance ranking. Best for "find the most relevant
+      passages" queries. No extra dependencies.
     - "grep": literal/regex line matching with highlighted spans. Best for
       "find every occurrence of X" queries. Stateless, no extra dependencies.
 
@@ -331,8 +331,8 @@ def create_server(
             locate information across many documents cheaply.
 
             Modes:
-            - keyword: BM25 relevance ranking (requires the optional rank-bm25
-              dependency). Best for "find the most relevant passages" queries.
+            - keyword: BM25 relevance ranking. Best for "find the most relevant
+              passages" queries. No extra dependencies.
             - grep: literal/regex line matching. Best for "find every occurrence
               of X". Stateless, no extra dependencies.
 
@@ -581,7 +581,12 @@ def main() -> int:
         )
 
         logger.info("Server ready, listening on stdio")
-        mcp.run()  # Run with default stdio transport
+        # Honor ALL2MD_CACHE: repeated reads of an unchanged file then come from
+        # the conversion cache (and its in-process tier) instead of a re-parse.
+        from all2md.conversion_cache import use_conversion_cache
+
+        with use_conversion_cache():
+            mcp.run()  # Run with default stdio transport
 
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
@@ -105,7 +105,8 @@ from __future__ import annotations
 import logging
 import re
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from typing import Any, NamedTuple
 
@@ -795,6 +796,7 @@ def search(
     *,
     presets: dict[str, dict[str, Any]] | None = None,
     rounds: int = 1,
+    executor: Executor | None = None,
 ) -> OptimizationReport:
     """Search ``knobs`` for the option set with the best fitness.
 
@@ -817,31 +819,55 @@ def search(
     new best point, which recovers some interactions.
 
     Every distinct option set is evaluated at most once.
+
+    With an ``executor`` (which must be able to run ``evaluate``; a process pool
+    needs it picklable), the candidates of each step are submitted together: the
+    defaults and presets as one batch, each knob's values as one batch, and every
+    removal the minimization pass might try next. The walk itself is unchanged and
+    still takes results in the sequential order, so the report is identical to a
+    sequential run; a speculative removal the walk never reaches is simply not
+    counted as evaluated.
     """
     seen: dict[tuple[tuple[str, Any], ...], Candidate] = {}
+    pending: dict[tuple[tuple[str, Any], ...], Future[DocumentMetrics]] = {}
 
     def signature(options: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
         return tuple(sorted(options.items()))
 
+    def prefetch(trials: Iterable[dict[str, Any]]) -> None:
+        """Start evaluating ``trials`` on the executor ahead of :func:`consider`."""
+        if executor is None:
+            return
+        for options in trials:
+            key = signature(options)
+            if key not in seen and key not in pending:
+                pending[key] = executor.submit(evaluate, dict(options))
+
     def consider(options: dict[str, Any], origin: str) -> Candidate:
         key = signature(options)
         if key not in seen:
-            seen[key] = Candidate(options=dict(options), origin=origin, metrics=evaluate(options))
+            future = pending.pop(key, None)
+            metrics = future.result() if future is not None else evaluate(options)
+            seen[key] = Candidate(options=dict(options), origin=origin, metrics=metrics)
         return seen[key]
 
     def rank() -> None:
         """Fitness is pool-relative, so it must be recomputed as the pool grows."""
         score_candidates(list(seen.values()))
 
+    # A preset that sets nothing for this format is the default under another
+    # name; evaluating it would just be a duplicate.
+    preset_trials = {
+        name: overrides
+        for name, config in (presets or {}).items()
+        if (overrides := {k: v for k, v in config.items() if k in knobs})
+    }
+    prefetch([{}, *preset_trials.values()])
+
     baseline = consider({}, "default")
     rank()
 
-    for name, config in (presets or {}).items():
-        # A preset that sets nothing for this format is the default under another
-        # name; evaluating it would just be a duplicate.
-        overrides = {k: v for k, v in config.items() if k in knobs}
-        if not overrides:
-            continue
+    for name, overrides in preset_trials.items():
         consider(overrides, f"preset:{name}")
     rank()
     best = max(seen.values(), key=lambda c: c.fitness)
@@ -849,11 +875,9 @@ def search(
     for _ in range(max(1, rounds)):
         improved = False
         for knob, values in knobs.items():
-            for value in values:
-                if best.options.get(knob) == value:
-                    continue
-                trial = dict(best.options)
-                trial[knob] = value
+            trials = [{**best.options, knob: value} for value in values if best.options.get(knob) != value]
+            prefetch(trials)
+            for trial in trials:
                 consider(trial, f"refine:{knob}")
             rank()
             leader = max(seen.values(), key=lambda c: c.fitness)
@@ -878,8 +902,11 @@ def search(
     shrinking = True
     while shrinking:
         shrinking = False
-        for knob in list(best.options):
-            trial = {name: value for name, value in best.options.items() if name != knob}
+        removals = {
+            knob: {name: value for name, value in best.options.items() if name != knob} for knob in best.options
+        }
+        prefetch(removals.values())
+        for knob, trial in removals.items():
             candidate = consider(trial, f"minimize:{knob}")
             rank()
             if candidate.fitness >= best.fitness - MINIMIZE_TOLERANCE:
@@ -887,6 +914,9 @@ def search(
                 shrinking = True
                 break
 
+    for future in pending.values():
+        future.cancel()
+
     rank()
     ranked = sorted(seen.values(), key=lambda c: -c.fitness)
     best = seen[signature(best.options)]
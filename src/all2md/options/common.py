@@ -40,6 +40,7 @@ from all2md.constants import (
     DEFAULT_OCR_PRESERVE_EXISTING_TEXT,
     DEFAULT_OCR_TESSERACT_CONFIG,
     DEFAULT_OCR_TEXT_THRESHOLD,
+    DEFAULT_OCR_WORKERS,
     DEFAULT_PAGE_SEPARATOR,
     DEFAULT_REQUIRE_HEAD_SUCCESS,
     DEFAULT_REQUIRE_HTTPS,
@@ -601,6 +602,12 @@ class OCROptions(CloneFrozenMixin):
     tesseract_config : str, default ""
         Custom Tesseract configuration flags (advanced users).
         Example: "--psm 6 --oem 3" for custom page segmentation mode.
+    workers : int, default 0
+        PDF only: number of threads that recognize pages ahead of the page loop,
+        so OCR of later pages overlaps with layout work on the current one. Pages
+        are still rendered on the calling thread. 0 runs OCR inline, one page at
+        a time. Tesseract runs as a separate process per page and scales well;
+        EasyOCR shares one model and gains less.
 
     Notes
     -----
@@ -731,6 +738,14 @@ class OCROptions(CloneFrozenMixin):
             "importance": "advanced",
         },
     )
+    workers: int = field(
+        default=DEFAULT_OCR_WORKERS,
+        metadata={
+            "help": "PDF only: threads that OCR pages ahead of the page loop (0 = inline)",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
 
     def __post_init__(self) -> None:
         """Validate OCR option values.
@@ -749,6 +764,9 @@ class OCROptions(CloneFrozenMixin):
         if self.text_threshold < 0:
             raise ValueError(f"text_threshold must be non-negative, got {self.text_threshold}")
 
+        if self.workers < 0:
+            raise ValueError(f"workers must be non-negative, got {self.workers}")
+
         if not 0.0 <= self.image_area_threshold <= 1.0:
             raise ValueError(f"image_area_threshold must be in range [0.0, 1.0], got {self.image_area_threshold}")
 
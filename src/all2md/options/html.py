@@ -21,6 +21,7 @@ from all2md.constants import (
     DEFAULT_HTML_CONTENT_PLACEHOLDER,
     DEFAULT_HTML_CSS_STYLE,
     DEFAULT_HTML_DETAILS_PARSING,
+    DEFAULT_HTML_DIRECT_LXML_TREE,
     DEFAULT_HTML_ESCAPE_HTML,
     DEFAULT_HTML_EXTRACT_MICRODATA,
     DEFAULT_HTML_EXTRACT_READABLE,
@@ -562,3 +563,15 @@ class HtmlOptions(BaseParserOptions, AttachmentOptionsMixin):
             "importance": "advanced",
         },
     )
+    direct_lxml_tree: bool = field(
+        default=DEFAULT_HTML_DIRECT_LXML_TREE,
+        metadata={
+            "help": (
+                "With html_parser='lxml', walk lxml's tree directly instead of building a BeautifulSoup tree "
+                "(same output, faster on large pages). Falls back to BeautifulSoup when sanitization or "
+                "'html' figure/details output needs one, or for markup the direct path does not cover."
+            ),
+            "cli_name": "no-direct-lxml-tree",
+            "importance": "advanced",
+        },
+    )
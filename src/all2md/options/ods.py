@@ -24,6 +24,10 @@ class OdsSpreadsheetOptions(SpreadsheetParserOptions):
     ----------
     has_header : bool, default True
         Whether the first row contains column headers.
+    streaming : bool, default True
+        Read ``content.xml`` row by row instead of loading the whole document
+        tree with odfpy. Spreadsheets with a selected sheet that has images or
+        charts to render still load the full tree.
 
     See SpreadsheetParserOptions for complete documentation of inherited options.
 
@@ -37,6 +41,14 @@ class OdsSpreadsheetOptions(SpreadsheetParserOptions):
             "importance": "core",
         },
     )
+    streaming: bool = field(
+        default=True,
+        metadata={
+            "help": "Stream rows from content.xml (sheets with images or charts still load the full document)",
+            "cli_name": "no-streaming",
+            "importance": "advanced",
+        },
+    )
 
     def __post_init__(self) -> None:
         """Validate options by calling parent validation."""
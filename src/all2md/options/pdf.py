@@ -46,6 +46,7 @@ from all2md.constants import (
     DEFAULT_PDF_LINE_SPACING,
     DEFAULT_PDF_MARGIN,
     DEFAULT_PDF_PAGE_SIZE,
+    DEFAULT_PDF_PARALLEL_THRESHOLD,
     DEFAULT_TABLE_DETECTION_MODE,
     DEFAULT_TABLE_FALLBACK_DETECTION,
     DEFAULT_TABLE_FALLBACK_EXTRACTION_MODE,
@@ -184,6 +185,21 @@ class PdfOptions(PaginatedParserOptions):
         Height in points to trim from bottom of page (requires trim_headers_footers).
     skip_image_extraction : bool, default False
         Skip all image extraction for text-only conversion (improves performance for large PDFs).
+    enable_parallel_processing : bool, default False
+        Split the page loop across a process pool (opt-in). Each worker opens its
+        own PyMuPDF handle and processes whole pages; the results are stitched
+        back in page order and the cross-page passes (header/footer zone
+        detection, running-heading demotion) run once on the joined document, so
+        the output matches serial mode exactly. When the document-level OCR
+        safety net fires, its forced-OCR retry re-renders every page through a
+        second pool the same way. Falls back to serial
+        parsing when layout analysis is active, because the layout heading path
+        carries heading levels from one page into the next.
+    max_workers : int or None, default None
+        Maximum number of worker processes for page-parallel parsing.
+        If None, uses CPU count.
+    parallel_threshold : int, default 8
+        Minimum number of pages required to enable page-parallel parsing.
     ocr : OCROptions, default OCROptions()
         OCR settings for extracting text from scanned/image-based PDF pages.
         Requires optional dependencies: pip install all2md[ocr]
@@ -568,6 +584,32 @@ class PdfOptions(PaginatedParserOptions):
         },
     )
 
+    enable_parallel_processing: bool = field(
+        default=False,
+        metadata={
+            "help": "Split the page loop across a process pool for large PDFs (opt-in)",
+            "cli_name": "parallel",
+            "importance": "advanced",
+        },
+    )
+    max_workers: int | None = field(
+        default=None,
+        metadata={
+            "help": "Maximum worker processes for page-parallel parsing (None=auto-detect CPU cores)",
+            "cli_name": "max-workers",
+            "importance": "advanced",
+        },
+    )
+    parallel_threshold: int = field(
+        default=DEFAULT_PDF_PARALLEL_THRESHOLD,
+        metadata={
+            "help": "Minimum number of pages to enable page-parallel parsing",
+            "cli_name": "parallel-threshold",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+
     # OCR options
     ocr: OCROptions = field(
         default_factory=OCROptions,
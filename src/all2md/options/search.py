@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from all2md.constants import VECTOR_INDEX_TYPES, VectorIndexType
 from all2md.options.base import CloneFrozenMixin
 
 
@@ -102,6 +103,80 @@ class SearchOptions(CloneFrozenMixin):
             "importance": "advanced",
         },
     )
+    vector_index_type: VectorIndexType = field(
+        default="flat",
+        metadata={
+            "help": "FAISS index structure: flat (exact), ivf_flat, hnsw or ivf_pq (approximate)",
+            "choices": list(VECTOR_INDEX_TYPES),
+            "importance": "advanced",
+        },
+    )
+    vector_nlist: int = field(
+        default=1024,
+        metadata={
+            "help": "Maximum number of IVF lists (capped by corpus size at build time)",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_nprobe: int = field(
+        default=16,
+        metadata={
+            "help": "IVF lists scanned per query; higher is more accurate and slower",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_hnsw_m: int = field(
+        default=32,
+        metadata={
+            "help": "Neighbours per node in the HNSW graph",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_hnsw_ef_construction: int = field(
+        default=200,
+        metadata={
+            "help": "HNSW candidate queue size while building the graph",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_hnsw_ef_search: int = field(
+        default=64,
+        metadata={
+            "help": "HNSW candidate queue size per query; higher is more accurate and slower",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_pq_m: int = field(
+        default=16,
+        metadata={
+            "help": "Product-quantizer sub-vectors for ivf_pq (must divide the embedding dimension)",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_pq_nbits: int = field(
+        default=8,
+        metadata={
+            "help": "Bits per product-quantizer code for ivf_pq",
+            "type": int,
+            "importance": "advanced",
+        },
+    )
+    vector_embedding_cache_dir: str | None = field(
+        default=None,
+        metadata={
+            "help": (
+                "Directory of a persistent embedding cache keyed by model and chunk-text hash; "
+                "rebuilds only encode unseen chunks. Disabled when None"
+            ),
+            "importance": "advanced",
+        },
+    )
     hybrid_keyword_weight: float = field(
         default=0.5,
         metadata={
@@ -118,6 +193,31 @@ class SearchOptions(CloneFrozenMixin):
             "importance": "core",
         },
     )
+    workers: int = field(
+        default=1,
+        metadata={
+            "help": "Processes used to parse and chunk documents while indexing (1 = in-process, 0 = one per CPU core)",
+            "type": int,
+            "importance": "core",
+        },
+    )
+    streaming_build: bool = field(
+        default=False,
+        metadata={
+            "help": (
+                "Drop each parsed document once chunked and feed chunks to the indexes in batches, "
+                "bounding memory on large corpora; grep re-parses documents on demand"
+            ),
+            "importance": "advanced",
+        },
+    )
+    skip_failed_documents: bool = field(
+        default=False,
+        metadata={
+            "help": "Skip documents that fail to parse or chunk instead of aborting the index build",
+            "importance": "core",
+        },
+    )
     default_mode: str = field(
         default="keyword",
         metadata={
@@ -186,6 +286,22 @@ class SearchOptions(CloneFrozenMixin):
             raise ValueError("bm25_b must be between 0 and 1")
         if self.vector_batch_size <= 0:
             raise ValueError("vector_batch_size must be positive")
+        if self.workers < 0:
+            raise ValueError("workers must be non-negative (0 = one per CPU core)")
+        if self.vector_index_type not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"vector_index_type must be one of {', '.join(VECTOR_INDEX_TYPES)}")
+        for name in (
+            "vector_nlist",
+            "vector_nprobe",
+            "vector_hnsw_m",
+            "vector_hnsw_ef_construction",
+            "vector_hnsw_ef_search",
+            "vector_pq_m",
+        ):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if not (1 <= self.vector_pq_nbits <= 16):
+            raise ValueError("vector_pq_nbits must be between 1 and 16")
         if self.max_heading_level is not None and not (1 <= self.max_heading_level <= 6):
             raise ValueError("max_heading_level must be between 1 and 6 when provided")
         total_weight = self.hybrid_keyword_weight + self.hybrid_vector_weight
@@ -8,7 +8,7 @@ This module defines options for parsing Excel spreadsheet files.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from all2md.options.common import SpreadsheetParserOptions
 
@@ -17,13 +17,31 @@ from all2md.options.common import SpreadsheetParserOptions
 class XlsxOptions(SpreadsheetParserOptions):
     """Configuration options for XLSX spreadsheet conversion.
 
-    This dataclass inherits all spreadsheet options from SpreadsheetParserOptions.
-    Currently, XLSX has no format-specific options beyond the base spreadsheet options.
+    This dataclass inherits all spreadsheet options from SpreadsheetParserOptions
+    and adds XLSX-specific options.
 
-    See SpreadsheetParserOptions for complete documentation of available options.
+    Parameters
+    ----------
+    streaming : bool, default True
+        Read cells with openpyxl's read-only mode, one row at a time, instead of
+        building every cell object of the workbook up front. Merged ranges and
+        hyperlinks are read separately, so the output is the same. Workbooks
+        with a selected sheet that has images or charts to render still load in
+        full mode, since read-only mode does not expose drawings.
+
+    See SpreadsheetParserOptions for complete documentation of inherited options.
 
     """
 
+    streaming: bool = field(
+        default=True,
+        metadata={
+            "help": "Stream rows in read-only mode (sheets with images or charts still load in full)",
+            "cli_name": "no-streaming",
+            "importance": "advanced",
+        },
+    )
+
     def __post_init__(self) -> None:
         """Validate options by calling parent validation."""
         super().__post_init__()
@@ -0,0 +1,116 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/parsers/_archive_members.py
+"""Bounded-memory hand-off of archive members to worker processes.
+
+This private module is shared by the ZIP and TAR/7Z/RAR parsers' parallel
+paths. Instead of reading every member into a ``{path: bytes}`` map and
+pickling each payload into the process pool up front, members are read
+lazily, one at a time, and only a fixed number of them are ever in flight.
+Small members travel to the worker as bytes; members larger than
+``SPILL_THRESHOLD_BYTES`` are streamed to a temporary file and the worker
+receives only its path, so neither the parent nor the pickle channel ever
+holds a large member in full. The payloads are submitted through
+:func:`all2md.utils.parallel.submit_in_order`, so callers assemble results in
+the order members appear in the archive while later members are still being
+converted.
+
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+__all__ = ["SPILL_THRESHOLD_BYTES", "MemberPayload", "spool_member"]
+
+# Members up to this size are passed to workers as bytes; larger ones go
+# through a temporary file.
+SPILL_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+_UNSAFE_SUFFIX_CHARS = re.compile(r"[^\w.]")
+
+
+@dataclass(frozen=True)
+class MemberPayload:
+    """One archive member, either held in memory or spilled to a temporary file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the member inside the archive
+    size : int
+        Member size in bytes
+    data : bytes or None
+        Member content, when it is small enough to be passed by value
+    spill_path : str or None
+        Temporary file holding the content otherwise
+
+    """
+
+    file_path: str
+    size: int
+    data: bytes | None = None
+    spill_path: str | None = None
+
+    def open(self) -> IO[bytes]:
+        """Open the member content for reading.
+
+        In-memory payloads are named after the member path so that format
+        detection sees its extension; spill files keep the member's suffix for
+        the same reason.
+        """
+        if self.spill_path is not None:
+            return open(self.spill_path, "rb")
+        stream = io.BytesIO(self.data or b"")
+        stream.name = self.file_path
+        return stream
+
+    def read_bytes(self) -> bytes:
+        """Return the member content."""
+        if self.spill_path is not None:
+            return Path(self.spill_path).read_bytes()
+        return self.data or b""
+
+    def discard(self) -> None:
+        """Delete the spill file, if any. Safe to call more than once."""
+        if self.spill_path is not None:
+            Path(self.spill_path).unlink(missing_ok=True)
+
+
+def spool_member(file_path: str, stream: IO[bytes], spill_dir: Path, sequence: int) -> MemberPayload:
+    """Read a member from ``stream``, spilling it to ``spill_dir`` when it is large.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the member inside the archive
+    stream : IO[bytes]
+        Open, readable member stream (e.g. from ``ZipFile.open``)
+    spill_dir : Path
+        Directory for spill files
+    sequence : int
+        Position of the member in the archive, used to name its spill file
+
+    Returns
+    -------
+    MemberPayload
+        The member, holding at most ``SPILL_THRESHOLD_BYTES`` in memory
+
+    """
+    head = stream.read(SPILL_THRESHOLD_BYTES + 1)
+    if len(head) <= SPILL_THRESHOLD_BYTES:
+        return MemberPayload(file_path=file_path, size=len(head), data=head)
+
+    suffix = _UNSAFE_SUFFIX_CHARS.sub("", Path(file_path).suffix)[:16]
+    target = spill_dir / f"{sequence:08d}{suffix}"
+    with target.open("wb") as handle:
+        handle.write(head)
+        del head
+        shutil.copyfileobj(stream, handle)
+        size = handle.tell()
+    return MemberPayload(file_path=file_path, size=size, spill_path=str(target))
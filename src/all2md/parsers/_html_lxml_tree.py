@@ -0,0 +1,390 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/parsers/_html_lxml_tree.py
+"""Read-only BeautifulSoup view over a tree parsed directly by lxml.
+
+``BeautifulSoup(html, "lxml")`` lets libxml2 tokenize the page and then builds
+its own Python tree from lxml's parser-target callbacks -- one Python call per
+start tag, end tag and text run, plus a ``Tag`` and ``NavigableString`` object
+for every node whether or not anything reads it. On multi-megabyte pages that
+tree building, not the parse, is most of the time ``HtmlToAstConverter`` spends
+before it visits its first node.
+
+This private module parses with lxml alone and wraps the resulting C-level
+tree lazily: :class:`LxmlTag` exposes the part of the ``Tag`` API the HTML
+parser uses (``name``, ``attrs``, ``get``, ``children``, ``contents``,
+``parent``, ``string``, ``get_text`` and ``find``/``find_all``) and only builds
+a node's children the first time they are asked for. Text nodes are real
+``NavigableString``/``Comment`` instances, so the parser's type checks and
+string handling see exactly what bs4 would have handed them.
+
+The view reproduces what bs4's lxml builder would build from the same markup:
+whitespace-only strings outside ``<pre>``/``<textarea>`` collapse to a single
+space or newline, multi-valued attributes such as ``class`` and ``rel`` become
+lists, and strings inside ``<script>``, ``<style>``, ``<template>`` and ruby
+annotations get bs4's dedicated string classes (which ``get_text()`` skips).
+:func:`parse_lxml_tree` returns ``None`` for anything it does not cover -- lxml
+missing, markup lxml rejects, or a document without a ``<body>`` -- and the
+caller falls back to BeautifulSoup. The view is read-only; sanitization, which
+edits the tree, always runs on a BeautifulSoup tree.
+
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import Any, Optional, Union
+
+from bs4.builder import HTMLTreeBuilder
+from bs4.element import CData, Comment, NavigableString, ProcessingInstruction
+
+__all__ = ["LxmlDocument", "LxmlTag", "parse_lxml_tree"]
+
+_Child = Union["LxmlTag", NavigableString]
+_AttributeRule = Union[bool, str, "re.Pattern[str]"]
+
+# Mirror the settings bs4's HTML tree builders use, so the two trees agree
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+_NONWHITESPACE = re.compile(r"\S+")
+_MULTI_VALUED_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+_PRESERVE_WHITESPACE_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+_STRING_CONTAINERS = HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS
+_MAIN_CONTENT_STRING_TYPES = frozenset({NavigableString, CData})
+
+
+def _make_string(text: str, string_class: type[NavigableString], preserve_whitespace: bool) -> NavigableString:
+    """Build a string node the way ``BeautifulSoup.endData`` does."""
+    if not preserve_whitespace and not text.strip(_ASCII_SPACES):
+        text = "\n" if "\n" in text else " "
+    return string_class(text)
+
+
+def _value_matches(value: Optional[str], rule: _AttributeRule) -> bool:
+    if value is None:
+        return False
+    if isinstance(rule, str):
+        return value == rule
+    return rule.search(value) is not None  # type: ignore[union-attr]
+
+
+def _attribute_matches(value: Any, rule: _AttributeRule) -> bool:
+    """Match one attribute value against a ``find_all`` rule, as bs4's ``SoupStrainer`` does."""
+    if rule is True:
+        return value is not None
+    values = value if isinstance(value, list) else [value]
+    if any(_value_matches(item, rule) for item in values):
+        return True
+    # A multi-valued attribute also matches as its space-joined string
+    return len(values) != 1 and _value_matches(" ".join(values), rule)
+
+
+class LxmlTag:
+    """A lazily built, read-only ``Tag`` look-alike over one lxml element.
+
+    Parameters
+    ----------
+    element : lxml.etree._Element
+        The wrapped element.
+    parent : LxmlTag or None
+        The wrapper of the element's parent.
+    string_class : type[NavigableString]
+        Class of the strings directly inside the element -- a bs4 string
+        container class inside ``<script>``, ``<style>`` and friends.
+    preserve_whitespace : bool
+        Whether the element is, or sits inside, a ``<pre>`` or ``<textarea>``.
+    registry : dict
+        The document-wide map from lxml element to wrapper. ``find_all`` searches
+        with lxml's C-level ``iter()`` and maps the hits back through it, so a
+        search returns the very objects a walk over ``children`` would.
+
+    """
+
+    __slots__ = (
+        "_element",
+        "_contents",
+        "_registry",
+        "name",
+        "attrs",
+        "parent",
+        "_string_class",
+        "_preserve_whitespace",
+    )
+
+    def __init__(
+        self,
+        element: Any,
+        parent: Optional[LxmlTag],
+        string_class: type[NavigableString],
+        preserve_whitespace: bool,
+        registry: dict[Any, LxmlTag],
+    ) -> None:
+        self._element = element
+        self._contents: Optional[list[_Child]] = None
+        self._registry = registry
+        registry[element] = self
+        self.parent = parent
+        self.name: str = element.tag
+        self.attrs: dict[str, Any] = dict(element.attrib)
+        if self.attrs:
+            multi_valued = _MULTI_VALUED_ATTRIBUTES["*"] | _MULTI_VALUED_ATTRIBUTES.get(self.name, set())
+            for key in multi_valued.intersection(self.attrs):
+                self.attrs[key] = _NONWHITESPACE.findall(self.attrs[key])
+        self._string_class = _STRING_CONTAINERS.get(self.name, string_class)
+        self._preserve_whitespace = preserve_whitespace or self.name in _PRESERVE_WHITESPACE_TAGS
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def __iter__(self) -> Iterator[_Child]:
+        return iter(self.contents)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.attrs[key]
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+    def __str__(self) -> str:
+        from lxml import etree
+
+        return etree.tostring(self._element, method="html", encoding="unicode", with_tail=False)
+
+    @property
+    def contents(self) -> list[_Child]:
+        """The element's children, built on first access."""
+        return self._ensure_contents()
+
+    @property
+    def children(self) -> Iterator[_Child]:
+        """Iterate over the element's children."""
+        return iter(self.contents)
+
+    @property
+    def string(self) -> Optional[NavigableString]:
+        """The element's only string, following single-child tags down, else ``None``."""
+        contents = self.contents
+        if len(contents) != 1:
+            return None
+        child = contents[0]
+        if isinstance(child, NavigableString):
+            return child
+        return child.string
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return an attribute value, or ``default`` if the attribute is absent."""
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        """Check whether the element carries an attribute."""
+        return key in self.attrs
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        """Concatenate the element's text, skipping comments and script/style-like strings."""
+        types = {self._string_class} if self.name in _STRING_CONTAINERS else _MAIN_CONTENT_STRING_TYPES
+        strings: list[str] = []
+        for descendant in self._descendants():
+            if not isinstance(descendant, NavigableString) or type(descendant) not in types:
+                continue
+            if strip:
+                stripped = descendant.strip()
+                if stripped:
+                    strings.append(stripped)
+            else:
+                strings.append(descendant)
+        return separator.join(strings)
+
+    def find(
+        self,
+        name: Union[str, list[str], None] = None,
+        attrs: Optional[dict[str, _AttributeRule]] = None,
+        recursive: bool = True,
+        **kwargs: _AttributeRule,
+    ) -> Optional[LxmlTag]:
+        """Return the first matching descendant (or child), like ``Tag.find``."""
+        return next(self._find(name, attrs, recursive, kwargs), None)
+
+    def find_all(
+        self,
+        name: Union[str, list[str], None] = None,
+        attrs: Optional[dict[str, _AttributeRule]] = None,
+        recursive: bool = True,
+        **kwargs: _AttributeRule,
+    ) -> list[LxmlTag]:
+        """Return every matching descendant (or child), like ``Tag.find_all``."""
+        return list(self._find(name, attrs, recursive, kwargs))
+
+    def _find(
+        self,
+        name: Union[str, list[str], None],
+        attrs: Optional[dict[str, _AttributeRule]],
+        recursive: bool,
+        kwargs: dict[str, _AttributeRule],
+    ) -> Iterator[LxmlTag]:
+        names = {name} if isinstance(name, str) else None if name is None else set(name)
+        rules = {**(attrs or {}), **kwargs}
+        if not recursive:
+            for node in self.contents:
+                if not isinstance(node, LxmlTag) or (names is not None and node.name not in names):
+                    continue
+                if all(_attribute_matches(node.attrs.get(key), rule) for key, rule in rules.items()):
+                    yield node
+            return
+
+        for element in self._iter_descendant_elements(names):
+            # Every rule needs its attribute present; check that on the raw element before wrapping
+            if rules and not all(key in element.attrib for key in rules):
+                continue
+            node = self._wrapper_for(element)
+            if all(_attribute_matches(node.attrs.get(key), rule) for key, rule in rules.items()):
+                yield node
+
+    def _iter_descendant_elements(self, names: Optional[set[str]]) -> Iterator[Any]:
+        """Yield the lxml elements beneath this one, in document order, optionally filtered by name."""
+        from lxml import etree
+
+        element = self._element
+        for descendant in element.iter(*names) if names is not None else element.iter(etree.Element):
+            if descendant is not element:
+                yield descendant
+
+    def _wrapper_for(self, element: Any) -> LxmlTag:
+        """Return the wrapper of a descendant element, building the wrappers on the way down to it."""
+        registry = self._registry
+        missing = []
+        while element not in registry:
+            missing.append(element)
+            element = element.getparent()
+        for ancestor in reversed(missing):
+            # Building the nearest wrapped ancestor's contents registers the next element down
+            registry[element]._ensure_contents()
+            element = ancestor
+        return registry[element]
+
+    def _descendants(self) -> Iterator[_Child]:
+        """Yield every node beneath the element in document order."""
+        stack = list(reversed(self.contents))
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, LxmlTag):
+                stack.extend(reversed(node.contents))
+
+    def _ensure_contents(self) -> list[_Child]:
+        if self._contents is None:
+            self._contents = self._build_contents()
+        return self._contents
+
+    def _build_contents(self) -> list[_Child]:
+        from lxml import etree
+
+        element = self._element
+        string_class = self._string_class
+        preserve = self._preserve_whitespace
+        contents: list[_Child] = []
+        if element.text:
+            contents.append(_make_string(element.text, string_class, preserve))
+        for child in element:
+            if isinstance(child.tag, str):
+                contents.append(LxmlTag(child, self, string_class, preserve, self._registry))
+            elif isinstance(child, etree._Comment):
+                contents.append(_make_string(child.text or "", Comment, preserve))
+            elif isinstance(child, etree._ProcessingInstruction):
+                text = f"{child.target} {child.text or ''}"
+                contents.append(_make_string(text, ProcessingInstruction, preserve))
+            if child.tail:
+                contents.append(_make_string(child.tail, string_class, preserve))
+        return contents
+
+
+class LxmlDocument(LxmlTag):
+    """The ``BeautifulSoup`` object's counterpart: the nodes around the root element.
+
+    Parameters
+    ----------
+    root : lxml.etree._Element
+        The document's root (``<html>``) element.
+
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, root: Any) -> None:
+        self._root = root
+        self._element = root
+        self._contents = None
+        self._registry = {}
+        self.parent = None
+        self.name = "[document]"
+        self.attrs = {}
+        self._string_class = NavigableString
+        self._preserve_whitespace = False
+
+    def __str__(self) -> str:
+        from lxml import etree
+
+        return etree.tostring(self._root.getroottree(), method="html", encoding="unicode")
+
+    def _iter_descendant_elements(self, names: Optional[set[str]]) -> Iterator[Any]:
+        from lxml import etree
+
+        # The root element is itself a descendant of the document; wrapping it
+        # here gives _wrapper_for a registered ancestor to build down from
+        self._ensure_contents()
+        root = self._root
+        return root.iter(*names) if names is not None else root.iter(etree.Element)
+
+    def _build_contents(self) -> list[_Child]:
+        from lxml import etree
+
+        siblings = [*reversed(list(self._root.itersiblings(preceding=True))), self._root, *self._root.itersiblings()]
+        contents: list[_Child] = []
+        for node in siblings:
+            if node is self._root:
+                contents.append(LxmlTag(node, self, NavigableString, False, self._registry))
+            elif isinstance(node, etree._Comment):
+                contents.append(_make_string(node.text or "", Comment, False))
+            elif isinstance(node, etree._ProcessingInstruction):
+                contents.append(_make_string(f"{node.target} {node.text or ''}", ProcessingInstruction, False))
+        return contents
+
+
+def parse_lxml_tree(html_content: str) -> Optional[LxmlDocument]:
+    """Parse HTML with lxml and wrap it, or return ``None`` to fall back to BeautifulSoup.
+
+    Parameters
+    ----------
+    html_content : str
+        HTML to parse.
+
+    Returns
+    -------
+    LxmlDocument or None
+        The wrapped document; ``None`` if lxml is not installed, rejects the
+        markup (an empty document, or a ``str`` carrying an XML encoding
+        declaration) or produces no ``<body>``. bs4 retries the first two
+        differently and keeps a ``Doctype`` string at the top level of a
+        bodiless document, neither of which this view reproduces.
+
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+
+    # bs4 drops a leading byte order mark before handing str markup to lxml
+    if html_content.startswith("\ufeff"):
+        html_content = html_content[1:]
+
+    parser = etree.HTMLParser(recover=True)
+    try:
+        parser.feed(html_content)
+        root = parser.close()
+    except (etree.LxmlError, ValueError):
+        return None
+    if root is None or next(root.iter("body"), None) is None:
+        return None
+    return LxmlDocument(root)
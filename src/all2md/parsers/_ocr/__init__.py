@@ -8,6 +8,12 @@ Dispatches a rendered PDF page pixmap to the OCR backend selected by
 declares its own optional dependencies, so importing this package never pulls
 in pytesseract, EasyOCR, or PyTorch until an engine is actually used.
 
+Every adapter splits into a pixmap entry point (``ocr_pixmap``) and a
+page-free core (``recognize_text``, and for Tesseract ``recognize_layout``)
+that takes an :class:`OcrPage`. The core needs no PyMuPDF object, so it can
+run on a worker thread (see :mod:`all2md.parsers._ocr.prefetch`) and its
+results can be kept on disk (see :mod:`all2md.parsers._ocr.cache`).
+
 """
 
 from __future__ import annotations
@@ -20,7 +26,16 @@ if TYPE_CHECKING:
 
     from all2md.options.pdf import PdfOptions
 
-__all__ = ["OcrLine", "OcrParagraph", "ocr_pixmap", "ocr_pixmap_layout"]
+__all__ = [
+    "OcrLine",
+    "OcrPage",
+    "OcrParagraph",
+    "ocr_language",
+    "ocr_pixmap",
+    "ocr_pixmap_layout",
+    "recognize_layout",
+    "recognize_text",
+]
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,6 +59,79 @@ class OcrParagraph:
     bbox: tuple[float, float, float, float]
 
 
+@dataclass(frozen=True, slots=True)
+class OcrPage:
+    """A page rendered for OCR, detached from its document.
+
+    PyMuPDF objects belong to the thread that opened the document; recognition only
+    needs the pixels, the language and the rectangle results are mapped back into.
+
+    Attributes
+    ----------
+    samples : bytes
+        RGB pixel data, ``width * height * 3`` bytes.
+    width, height : int
+        Size of the rendering in pixels.
+    rect : tuple of float
+        ``(x0, y0, width, height)`` of the source page in PDF points.
+    language : str
+        Tesseract-style language spec, ``"+"``-joined (see :func:`ocr_language`).
+
+    """
+
+    samples: bytes
+    width: int
+    height: int
+    rect: tuple[float, float, float, float]
+    language: str
+
+    @classmethod
+    def from_pixmap(cls, pix: "pymupdf.Pixmap", page: "pymupdf.Page", options: "PdfOptions") -> "OcrPage":
+        """Copy what recognition needs out of a pixmap and its page."""
+        rect = page.rect
+        return cls(
+            samples=pix.samples,
+            width=pix.width,
+            height=pix.height,
+            rect=(rect.x0, rect.y0, rect.width, rect.height),
+            language=ocr_language(page, options),
+        )
+
+
+def ocr_language(page: "pymupdf.Page", options: "PdfOptions") -> str:
+    """Resolve the configured OCR language(s) to one Tesseract-style spec.
+
+    Auto-detection reads the page's text layer, so this must run where the page
+    lives; the result travels with the :class:`OcrPage`.
+    """
+    ocr_opts = options.ocr
+    if ocr_opts.auto_detect_language:
+        from all2md.parsers._pdf_ocr import detect_page_language
+
+        return detect_page_language(page, options)
+    if isinstance(ocr_opts.languages, list):
+        return "+".join(ocr_opts.languages)
+    return str(ocr_opts.languages)
+
+
+def recognize_layout(page: OcrPage, options: "PdfOptions") -> list[OcrParagraph] | None:
+    """Page-free counterpart of :func:`ocr_pixmap_layout`."""
+    if options.ocr.engine == "easyocr":
+        return None
+    from all2md.parsers._ocr.tesseract import recognize_layout as _run
+
+    return _run(page, options)
+
+
+def recognize_text(page: OcrPage, options: "PdfOptions") -> str:
+    """Page-free counterpart of :func:`ocr_pixmap`."""
+    if options.ocr.engine == "easyocr":
+        from all2md.parsers._ocr.easyocr import recognize_text as _run
+    else:
+        from all2md.parsers._ocr.tesseract import recognize_text as _run
+    return _run(page, options)
+
+
 def ocr_pixmap_layout(
     pix: "pymupdf.Pixmap",
     page: "pymupdf.Page",
@@ -0,0 +1,172 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/parsers/_ocr/cache.py
+"""Persistent OCR results, shared by every engine.
+
+OCR is by far the slowest thing a PDF conversion can do, and a scanned page
+renders to the same pixels every time. While a conversion cache is active (see
+:mod:`all2md.conversion_cache`), the page-free recognizers of each adapter are
+wrapped by :func:`cached_ocr`, which stores their results in that cache's
+directory as artifacts, under the same size bounds and eviction.
+
+The key is a hash of everything that decides the output: the pixels and their
+size, the engine and its installed version, the language, the DPI and the
+Tesseract config (plus the page rectangle for layout results, which are in
+PDF points). A conversion whose options miss the AST cache, say a different
+``table_detection_mode``, still reuses the OCR of every page.
+
+Empty results are not stored: the adapters also return them for a failed
+page, and a transient failure must not outlive the run.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from all2md.conversion_cache import get_active_cache
+
+if TYPE_CHECKING:
+    from all2md.options.pdf import PdfOptions
+    from all2md.parsers._ocr import OcrPage, OcrParagraph
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["cached_ocr", "engine_version", "ocr_cache_key"]
+
+R = TypeVar("R")
+
+# Bump when the stored payload format changes.
+_PAYLOAD_SCHEMA = 1
+
+
+@functools.cache
+def engine_version(engine: str) -> str | None:
+    """Return the installed version of an OCR engine, or None if it cannot be told.
+
+    For Tesseract this is the binary's version, which is what decides the output;
+    pytesseract is only a wrapper. Results are never cached for an engine whose
+    version is unknown.
+    """
+    try:
+        if engine == "easyocr":
+            from importlib.metadata import version
+
+            return f"easyocr {version('easyocr')}"
+        import pytesseract
+
+        return f"tesseract {pytesseract.get_tesseract_version()}"
+    except Exception as exc:  # noqa: BLE001 - an unknown version only disables caching
+        logger.debug("OCR cache: cannot determine the %s version: %s", engine, exc)
+        return None
+
+
+def ocr_cache_key(kind: str, page: "OcrPage", options: "PdfOptions", version: str) -> str:
+    """Build the cache key for one recognition of ``page``.
+
+    Parameters
+    ----------
+    kind : {"text", "layout"}
+        Which recognizer the result came from.
+    page : OcrPage
+        The rendered page.
+    options : PdfOptions
+        Conversion options; only the OCR settings that change the output count.
+    version : str
+        The engine version, from :func:`engine_version`.
+
+    Returns
+    -------
+    str
+        A hex digest, usable as a conversion cache artifact key.
+
+    """
+    ocr_opts = options.ocr
+    header = {
+        "schema": _PAYLOAD_SCHEMA,
+        "kind": kind,
+        "engine": ocr_opts.engine,
+        "version": version,
+        "language": page.language,
+        "dpi": ocr_opts.dpi,
+        "config": ocr_opts.tesseract_config or "",
+        "size": [page.width, page.height],
+        # Layout boxes are mapped into the page rectangle; flat text is not.
+        "rect": list(page.rect) if kind == "layout" else None,
+    }
+    digest = hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8"))
+    digest.update(hashlib.sha256(page.samples).digest())
+    return digest.hexdigest()
+
+
+def _encode_layout(paragraphs: "list[OcrParagraph]") -> Any:
+    return [
+        {"bbox": list(paragraph.bbox), "lines": [[line.text, list(line.bbox)] for line in paragraph.lines]}
+        for paragraph in paragraphs
+    ]
+
+
+def _decode_layout(data: Any) -> "list[OcrParagraph]":
+    from all2md.parsers._ocr import OcrLine, OcrParagraph
+
+    return [
+        OcrParagraph(
+            lines=tuple(OcrLine(text=text, bbox=tuple(bbox)) for text, bbox in paragraph["lines"]),
+            bbox=tuple(paragraph["bbox"]),
+        )
+        for paragraph in data
+    ]
+
+
+_CODECS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "text": (lambda text: text, lambda data: data),
+    "layout": (_encode_layout, _decode_layout),
+}
+
+
+def cached_ocr(kind: str) -> Callable[[Callable[["OcrPage", "PdfOptions"], R]], Callable[["OcrPage", "PdfOptions"], R]]:
+    """Decorate a page-free recognizer so its results persist in the conversion cache.
+
+    Parameters
+    ----------
+    kind : {"text", "layout"}
+        What the recognizer returns: a string, or a list of ``OcrParagraph``.
+
+    Returns
+    -------
+    callable
+        A decorator. The wrapped recognizer behaves exactly like the original
+        when no conversion cache is active or the engine version is unknown.
+
+    """
+    encode, decode = _CODECS[kind]
+
+    def decorator(recognize: Callable[["OcrPage", "PdfOptions"], R]) -> Callable[["OcrPage", "PdfOptions"], R]:
+        @functools.wraps(recognize)
+        def wrapper(page: "OcrPage", options: "PdfOptions") -> R:
+            cache = get_active_cache()
+            version = engine_version(options.ocr.engine) if cache is not None else None
+            if cache is None or version is None:
+                return recognize(page, options)
+
+            key = ocr_cache_key(kind, page, options, version)
+            stored = cache.get_artifact(key)
+            if stored is not None:
+                try:
+                    return decode(json.loads(stored))
+                except (ValueError, KeyError, TypeError) as exc:
+                    logger.debug("OCR cache: ignoring unreadable entry %s: %s", key, exc)
+
+            result = recognize(page, options)
+            if result:
+                cache.put_artifact(key, json.dumps(encode(result)).encode("utf-8"))
+            return result
+
+        return wrapper
+
+    return decorator
@@ -16,9 +16,11 @@ position and sorting left-to-right within each line.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
 from all2md.constants import DEPS_PDF_OCR_EASYOCR
+from all2md.parsers._ocr.cache import cached_ocr
 from all2md.parsers._pdf_ocr import detect_page_language
 from all2md.utils.decorators import requires_dependencies
 
@@ -26,6 +28,7 @@ if TYPE_CHECKING:
     import pymupdf
 
     from all2md.options.pdf import PdfOptions
+    from all2md.parsers._ocr import OcrPage
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,8 @@ logger = logging.getLogger(__name__)
 # models from disk (slow), so reuse one per (languages, gpu) key across pages
 # and documents.
 _READER_CACHE: dict[tuple[tuple[str, ...], bool], Any] = {}
+# OCR can run on worker threads (see _ocr.prefetch); two pages must not both load the models.
+_READER_LOCK = threading.Lock()
 
 # Map language codes to EasyOCR's codes. Accepts both ISO 639-1 (e.g. "en") and
 # Tesseract codes (e.g. "eng") so a config written for Tesseract keeps working
@@ -137,6 +142,11 @@ def _resolve_languages(page: "pymupdf.Page", options: "PdfOptions") -> list[str]
     else:
         raw_tokens = [ocr_opts.languages]
 
+    return _map_languages(raw_tokens)
+
+
+def _map_languages(raw_tokens: list[str]) -> list[str]:
+    """Map language codes, possibly ``"+"``-joined, to EasyOCR language codes."""
     # Flatten any "+"-joined specs (e.g. "eng+fra") into individual tokens.
     tokens: list[str] = []
     for tok in raw_tokens:
@@ -159,11 +169,12 @@ def _get_reader(languages: list[str], gpu: bool) -> Any:
     import easyocr
 
     key = (tuple(languages), gpu)
-    reader = _READER_CACHE.get(key)
-    if reader is None:
-        logger.debug("Initializing EasyOCR reader for languages=%s gpu=%s", languages, gpu)
-        reader = easyocr.Reader(languages, gpu=gpu)
-        _READER_CACHE[key] = reader
+    with _READER_LOCK:
+        reader = _READER_CACHE.get(key)
+        if reader is None:
+            logger.debug("Initializing EasyOCR reader for languages=%s gpu=%s", languages, gpu)
+            reader = easyocr.Reader(languages, gpu=gpu)
+            _READER_CACHE[key] = reader
     return reader
 
 
@@ -237,10 +248,19 @@ def ocr_pixmap(pix: "pymupdf.Pixmap", page: "pymupdf.Page", options: "PdfOptions
         unsupported script combination or a failed model download).
 
     """
+    from all2md.parsers._ocr import OcrPage
+
+    return recognize_text(OcrPage.from_pixmap(pix, page, options), options)
+
+
+@requires_dependencies("pdf", DEPS_PDF_OCR_EASYOCR)
+@cached_ocr("text")
+def recognize_text(page: "OcrPage", options: "PdfOptions") -> str:
+    """Page-free core of :func:`ocr_pixmap`; safe to call from any thread."""
     import numpy as np
     from PIL import Image
 
-    languages = _resolve_languages(page, options)
+    languages = _map_languages([page.language])
     try:
         reader = _get_reader(languages, options.ocr.gpu)
     except Exception as e:  # noqa: BLE001 - surface init failures with guidance
@@ -250,7 +270,7 @@ def ocr_pixmap(pix: "pymupdf.Pixmap", page: "pymupdf.Page", options: "PdfOptions
             "Japanese, and Korean) in one reader, and downloads models on first use."
         ) from e
 
-    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    img = Image.frombytes("RGB", (page.width, page.height), page.samples)
     array = np.asarray(img)
 
     try:
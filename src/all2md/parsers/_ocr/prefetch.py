@@ -0,0 +1,158 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/parsers/_ocr/prefetch.py
+"""Recognize pages on worker threads while the PDF page loop runs.
+
+OCR dominates the time of a scanned PDF, and the serial page loop used to
+wait for each page's OCR before starting on the next page's layout. With
+``OCROptions.workers`` set, :class:`OcrPrefetcher` looks a few pages ahead,
+decides which of them will need OCR, renders them and hands the pixels to a
+thread pool. When the loop reaches the page, its result is usually ready.
+
+Rendering stays on the calling thread: PyMuPDF documents must not be touched
+from two threads at once. Only the page-free recognizers run on the pool;
+Tesseract is a subprocess per call and EasyOCR spends its time in PyTorch,
+so both release the GIL while they work.
+
+The prediction uses the page's plain text, which is close to but not exactly
+what the parser later measures. A page predicted wrongly costs either wasted
+recognition or one inline OCR call; the output never changes.
+
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from all2md.parsers._ocr import OcrPage, OcrParagraph, recognize_layout, recognize_text
+
+if TYPE_CHECKING:
+    import pymupdf
+
+    from all2md.options.pdf import PdfOptions
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["OcrPrefetcher", "OcrResult", "recognize_page"]
+
+# Pages queued ahead of the loop, per worker thread. Two keeps every worker busy
+# while the loop catches up, and bounds the rendered pixmaps held in memory.
+_LOOKAHEAD_PER_WORKER = 2
+
+
+@dataclass(frozen=True, slots=True)
+class OcrResult:
+    """What the page loop would have got from OCR-ing one page itself.
+
+    ``paragraphs`` is the engine's layout when it reported one; otherwise
+    ``text`` holds the flat recognition.
+    """
+
+    paragraphs: list[OcrParagraph] | None
+    text: str | None
+
+
+def recognize_page(page: OcrPage, options: "PdfOptions") -> OcrResult:
+    """Recognize ``page`` the way the page loop does: layout first, then flat text.
+
+    Raises
+    ------
+    RuntimeError
+        If the engine is missing, exactly as the flat-text path raises it inline.
+
+    """
+    try:
+        paragraphs = recognize_layout(page, options)
+    except Exception as exc:  # noqa: BLE001 - layout is an enhancement; fall back to flat text
+        logger.debug(f"OCR layout recovery unavailable, falling back to flat text: {exc}")
+        paragraphs = None
+    if paragraphs:
+        return OcrResult(paragraphs=paragraphs, text=None)
+    return OcrResult(paragraphs=None, text=recognize_text(page, options))
+
+
+class OcrPrefetcher:
+    """Queue OCR for upcoming pages on a thread pool.
+
+    Parameters
+    ----------
+    doc : pymupdf.Document
+        The open document. Only touched from the thread calling :meth:`advance`.
+    pages : list of int
+        Page numbers in the order the loop visits them.
+    options : PdfOptions
+        Conversion options; ``options.ocr.workers`` sizes the pool.
+
+    """
+
+    def __init__(self, doc: "pymupdf.Document", pages: list[int], options: "PdfOptions") -> None:
+        """Create the pool; nothing is queued until :meth:`advance`."""
+        self._doc = doc
+        self._pages = pages
+        self._options = options
+        self._lookahead = options.ocr.workers * _LOOKAHEAD_PER_WORKER
+        self._executor = ThreadPoolExecutor(max_workers=options.ocr.workers, thread_name_prefix="all2md-ocr")
+        self._futures: dict[int, Future[OcrResult]] = {}
+        self._queued = 0
+
+    def advance(self, index: int) -> None:
+        """Queue every page up to ``index`` plus the lookahead that looks like it needs OCR."""
+        end = min(len(self._pages), index + self._lookahead + 1)
+        while self._queued < end:
+            pno = self._pages[self._queued]
+            self._queued += 1
+            try:
+                page = self._prepare(pno)
+            except Exception as exc:  # noqa: BLE001 - the loop will OCR this page inline
+                logger.debug(f"OCR prefetch skipped page {pno + 1}: {exc}")
+                continue
+            if page is not None:
+                self._futures[pno] = self._executor.submit(recognize_page, page, self._options)
+
+    def _prepare(self, pno: int) -> OcrPage | None:
+        import pymupdf
+
+        from all2md.parsers._pdf_ocr import should_use_ocr
+
+        page = self._doc[pno]
+        if not should_use_ocr(page, page.get_text(), self._options):
+            return None
+        zoom = self._options.ocr.dpi / 72.0
+        pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom))
+        return OcrPage.from_pixmap(pix, page, self._options)
+
+    def take(self, pno: int) -> OcrResult | None:
+        """Return the result for page ``pno``, waiting for it; None if it was not queued.
+
+        Raises
+        ------
+        Exception
+            Whatever the recognition raised.
+
+        """
+        future = self._futures.pop(pno, None)
+        return future.result() if future is not None else None
+
+    def close(self) -> None:
+        """Cancel queued work and wait for running recognitions to finish."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "OcrPrefetcher":
+        """Return the prefetcher."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut the pool down."""
+        self.close()
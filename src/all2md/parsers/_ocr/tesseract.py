@@ -15,7 +15,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from all2md.constants import DEPS_PDF_OCR
-from all2md.parsers._pdf_ocr import detect_page_language
+from all2md.parsers._ocr.cache import cached_ocr
 from all2md.utils.decorators import requires_dependencies
 
 if TYPE_CHECKING:
@@ -24,11 +24,18 @@ if TYPE_CHECKING:
     import pymupdf
 
     from all2md.options.pdf import PdfOptions
-    from all2md.parsers._ocr import OcrParagraph
+    from all2md.parsers._ocr import OcrPage, OcrParagraph
 
 logger = logging.getLogger(__name__)
 
 
+_NOT_INSTALLED = (
+    "Tesseract OCR is not installed or not in PATH. "
+    "Please install Tesseract: "
+    "https://github.com/tesseract-ocr/tesseract/wiki"
+)
+
+
 @requires_dependencies("pdf", DEPS_PDF_OCR)
 def ocr_pixmap(pix: "pymupdf.Pixmap", page: "pymupdf.Page", options: "PdfOptions") -> str:
     """Extract text from a rendered page pixmap using Tesseract.
@@ -53,47 +60,34 @@ def ocr_pixmap(pix: "pymupdf.Pixmap", page: "pymupdf.Page", options: "PdfOptions
         If the Tesseract binary is not installed or not on PATH.
 
     """
+    from all2md.parsers._ocr import OcrPage
+
+    return recognize_text(OcrPage.from_pixmap(pix, page, options), options)
+
+
+@requires_dependencies("pdf", DEPS_PDF_OCR)
+@cached_ocr("text")
+def recognize_text(page: "OcrPage", options: "PdfOptions") -> str:
+    """Page-free core of :func:`ocr_pixmap`; safe to call from any thread."""
     import pytesseract
     from PIL import Image
 
     ocr_opts = options.ocr
-
-    # Determine the Tesseract language code(s) to use.
-    if ocr_opts.auto_detect_language:
-        lang = detect_page_language(page, options)
-    elif isinstance(ocr_opts.languages, list):
-        lang = "+".join(ocr_opts.languages)
-    else:
-        lang = ocr_opts.languages
-
-    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    img = Image.frombytes("RGB", (page.width, page.height), page.samples)
     config = ocr_opts.tesseract_config if ocr_opts.tesseract_config else ""
 
     try:
-        ocr_text = pytesseract.image_to_string(img, lang=lang, config=config)
+        ocr_text = pytesseract.image_to_string(img, lang=page.language, config=config)
     except pytesseract.TesseractNotFoundError as e:
-        raise RuntimeError(
-            "Tesseract OCR is not installed or not in PATH. "
-            "Please install Tesseract: "
-            "https://github.com/tesseract-ocr/tesseract/wiki"
-        ) from e
+        raise RuntimeError(_NOT_INSTALLED) from e
     except Exception as e:  # noqa: BLE001 - keep extraction resilient per-page
         logger.warning(f"OCR failed for page: {e}")
         return ""
 
-    logger.debug(f"OCR extracted {len(ocr_text)} characters using language '{lang}' at {ocr_opts.dpi} DPI")
+    logger.debug(f"OCR extracted {len(ocr_text)} characters using language '{page.language}' at {ocr_opts.dpi} DPI")
     return ocr_text
 
 
-def _resolve_language(page: "pymupdf.Page", options: "PdfOptions") -> str:
-    ocr_opts = options.ocr
-    if ocr_opts.auto_detect_language:
-        return detect_page_language(page, options)
-    if isinstance(ocr_opts.languages, list):
-        return "+".join(ocr_opts.languages)
-    return str(ocr_opts.languages)
-
-
 @requires_dependencies("pdf", DEPS_PDF_OCR)
 def ocr_pixmap_layout(
     pix: "pymupdf.Pixmap",
@@ -127,34 +121,40 @@ def ocr_pixmap_layout(
         If the Tesseract binary is not installed or not on PATH.
 
     """
+    from all2md.parsers._ocr import OcrPage
+
+    return recognize_layout(OcrPage.from_pixmap(pix, page, options), options)
+
+
+@requires_dependencies("pdf", DEPS_PDF_OCR)
+@cached_ocr("layout")
+def recognize_layout(page: "OcrPage", options: "PdfOptions") -> "list[OcrParagraph] | None":
+    """Page-free core of :func:`ocr_pixmap_layout`; safe to call from any thread."""
     import pytesseract
     from PIL import Image
 
     from all2md.parsers._ocr import OcrLine, OcrParagraph
 
     ocr_opts = options.ocr
-    lang = _resolve_language(page, options)
-    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    lang = page.language
+    img = Image.frombytes("RGB", (page.width, page.height), page.samples)
     config = ocr_opts.tesseract_config if ocr_opts.tesseract_config else ""
 
     try:
         data = pytesseract.image_to_data(img, lang=lang, config=config, output_type=pytesseract.Output.DICT)
     except pytesseract.TesseractNotFoundError as e:
-        raise RuntimeError(
-            "Tesseract OCR is not installed or not in PATH. "
-            "Please install Tesseract: "
-            "https://github.com/tesseract-ocr/tesseract/wiki"
-        ) from e
+        raise RuntimeError(_NOT_INSTALLED) from e
     except Exception as e:  # noqa: BLE001 - keep extraction resilient per-page
         logger.warning(f"OCR layout extraction failed for page: {e}")
         return None
 
     # Map pixel space back to PDF points from the rendered size rather than from the DPI
     # setting, so a pixmap clamped or rounded by PyMuPDF still lands in the right place.
-    if not pix.width or not pix.height:
+    if not page.width or not page.height:
         return None
-    scale_x = page.rect.width / pix.width
-    scale_y = page.rect.height / pix.height
+    origin_x, origin_y, page_width, page_height = page.rect
+    scale_x = page_width / page.width
+    scale_y = page_height / page.height
 
     # (block_num, par_num) is Tesseract's paragraph; line_num splits it into lines.
     words: dict[tuple[int, int], dict[int, list[tuple[str, tuple[float, float, float, float]]]]] = {}
@@ -169,8 +169,8 @@ def ocr_pixmap_layout(
         # Tesseract marks non-text rows with -1; they carry boxes but no readable content.
         if confidence < 0:
             continue
-        left = page.rect.x0 + data["left"][index] * scale_x
-        top = page.rect.y0 + data["top"][index] * scale_y
+        left = origin_x + data["left"][index] * scale_x
+        top = origin_y + data["top"][index] * scale_y
         box = (
             left,
             top,
@@ -0,0 +1,173 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/parsers/_pdf_page_cache.py
+"""Per-process cache of the option-independent stages of PDF page parsing.
+
+``all2md optimize`` parses one document dozens of times, changing a couple of
+options between parses. Most of a page's cost sits in stages those options
+never reach: the raw ``get_text("dict")`` extraction, ``find_tables()``, the
+ruling-line scan and the layout model. This private module keeps the output
+of those stages while a ``with use_page_cache():`` block is active, keyed by
+document, page number, stage and the stage's own parameters, so a candidate
+that only changes, say, ``trim_headers_footers`` reuses all of them.
+
+Nothing is cached outside such a block, so ordinary conversions behave exactly
+as before. Like the conversion cache, the active cache is a module global
+rather than a ``ContextVar`` so threads see it too, and it is per process:
+pool workers install their own with :func:`install_page_cache`.
+
+Stages whose output the parser mutates (the text blocks are dehyphenated and
+annotated in place) are handed out as copies; see
+:meth:`PageStageCache.get_or_compute`.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from all2md.utils.fingerprint import source_signature
+
+__all__ = [
+    "DEFAULT_PAGE_CACHE_ENTRIES",
+    "PageStageCache",
+    "document_key",
+    "get_active_page_cache",
+    "install_page_cache",
+    "use_page_cache",
+]
+
+T = TypeVar("T")
+
+#: Default bound on cached stage results. A page contributes one entry per stage
+#: (and per parameter value searched), so this covers a few hundred pages.
+DEFAULT_PAGE_CACHE_ENTRIES = 4096
+
+
+class PageStageCache:
+    """Bounded LRU of page-stage results.
+
+    Parameters
+    ----------
+    max_entries : int, default DEFAULT_PAGE_CACHE_ENTRIES
+        Evict the least recently used result once more than this many are held.
+
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PAGE_CACHE_ENTRIES) -> None:
+        """Create an empty cache holding at most ``max_entries`` results."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Hashable, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_compute(
+        self,
+        key: tuple[Hashable, ...],
+        compute: Callable[[], T],
+        *,
+        copy: Callable[[T], T] | None = None,
+    ) -> T:
+        """Return the result stored under ``key``, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : tuple
+            ``(document, page, stage, *params)``
+        compute : callable
+            Produces the result on a miss. An exception propagates and nothing
+            is stored.
+        copy : callable, optional
+            Applied to everything handed out, on a hit and on a miss alike, so a
+            caller that mutates the result never touches the stored value.
+
+        Returns
+        -------
+        Any
+            The stage result, or a copy of it
+
+        """
+        with self._lock:
+            found = key in self._entries
+            if found:
+                self._entries.move_to_end(key)
+                value = self._entries[key]
+                self.hits += 1
+        if not found:
+            # Computed outside the lock: a stage can take a second, and two threads
+            # computing the same page at once is merely wasted work.
+            value = compute()
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return copy(value) if copy is not None else value
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+
+def document_key(source: str | bytes) -> tuple[tuple[str, object], ...]:
+    """Identify a PDF source for cache keys: path, size and mtime, or a content hash."""
+    return tuple(sorted(source_signature(source).items()))
+
+
+# Process-global active cache (module global for the same reason as the
+# conversion cache: worker threads must see it).
+_active_cache: PageStageCache | None = None
+
+
+def get_active_page_cache() -> PageStageCache | None:
+    """Return the active page-stage cache, or None outside :func:`use_page_cache`."""
+    return _active_cache
+
+
+@contextmanager
+def use_page_cache(cache: PageStageCache | None = None) -> Iterator[PageStageCache]:
+    """Activate a page-stage cache for the duration of the ``with`` block.
+
+    Parameters
+    ----------
+    cache : PageStageCache, optional
+        The cache to activate. When omitted, an already active cache is reused,
+        so nested blocks share results, and otherwise a new one is created.
+
+    Yields
+    ------
+    PageStageCache
+        The active cache
+
+    """
+    global _active_cache
+    previous = _active_cache
+    if cache is None:
+        cache = previous if previous is not None else PageStageCache()
+    _active_cache = cache
+    try:
+        yield cache
+    finally:
+        _active_cache = previous
+
+
+def install_page_cache(max_entries: int = DEFAULT_PAGE_CACHE_ENTRIES) -> None:
+    """Activate a page-stage cache for the rest of the process.
+
+    Meant as a process-pool ``initializer``: every task the worker runs then
+    shares the one cache, which is where the reuse across candidates comes from.
+    """
+    global _active_cache
+    _active_cache = PageStageCache(max_entries)
@@ -16,8 +16,8 @@ import logging
 import os
 import tarfile
 import tempfile
-from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import IO, Any, cast
 
@@ -37,9 +37,11 @@ from all2md.exceptions import (
 )
 from all2md.options.archive import ArchiveOptions
 from all2md.options.base import BaseParserOptions
+from all2md.parsers._archive_members import MemberPayload, spool_member
 from all2md.parsers.base import BaseParser
 from all2md.progress import ProgressCallback
 from all2md.utils.metadata import DocumentMetadata
+from all2md.utils.parallel import in_flight_limit, submit_in_order
 from all2md.utils.security import (
     validate_7z_archive,
     validate_rar_archive,
@@ -51,7 +53,7 @@ logger = logging.getLogger(__name__)
 
 
 def _process_archive_file_worker(
-    file_path: str, file_data: bytes, options_dict: dict[str, Any]
+    payload: MemberPayload, options_dict: dict[str, Any]
 ) -> tuple[str, Document | None, dict[str, Any] | None]:
     """Worker function for parallel file processing.
 
@@ -59,10 +61,8 @@ def _process_archive_file_worker(
 
     Parameters
     ----------
-    file_path : str
-        Path of file in archive
-    file_data : bytes
-        File content bytes
+    payload : MemberPayload
+        Archive member, passed by value or as a spill-file path
     options_dict : dict[str, Any]
         Serialized options dictionary including attachment options
 
@@ -73,6 +73,7 @@ def _process_archive_file_worker(
         Document is None on failure, error_dict contains error details if failed
 
     """
+    file_path = payload.file_path
     try:
         # Check if this file should be treated as a resource
         resource_extensions = options_dict.get("resource_file_extensions")
@@ -86,47 +87,46 @@ def _process_archive_file_worker(
             # This is a resource file, don't parse it
             return (file_path, None, None)
 
-        # Create a BytesIO object with a name attribute for better format detection
-        file_obj = io.BytesIO(file_data)
-        file_obj.name = file_path
-
-        # Detect format using registry
-        detected_format = registry.detect_format(file_obj)
-
-        # Check if we have a parser for this format
-        try:
-            _parser_class = registry.get_parser(detected_format)
-        except FormatError:
-            # No parser available
-            return (file_path, None, None)
-
-        # Reset the file object position for parsing
-        file_obj.seek(0)
+        # Open the member (bytes, or its spill file) under a name with its extension
+        # for better format detection
+        with payload.open() as file_obj:
+            # Detect format using registry
+            detected_format = registry.detect_format(file_obj)
 
-        # Create parser options with attachment settings if available
-        parser_options = None
-        attachment_opts = options_dict.get("attachment_options")
-        if attachment_opts:
+            # Check if we have a parser for this format
             try:
-                from all2md.options.common import AttachmentOptionsMixin
-
-                options_class = registry.get_parser_options_class(detected_format)
-                if options_class and issubclass(options_class, AttachmentOptionsMixin):
-                    default_options = options_class()
-                    parser_options = default_options.create_updated(**attachment_opts)
-                elif options_class:
-                    parser_options = options_class()
-            except Exception:
-                # If options creation fails, fall back to None (use defaults)
-                parser_options = None
+                _parser_class = registry.get_parser(detected_format)
+            except FormatError:
+                # No parser available
+                return (file_path, None, None)
 
-        # Convert using the detected format (no progress callback in parallel mode)
-        doc = to_ast(
-            file_obj,
-            source_format=cast(DocumentFormat, detected_format),
-            parser_options=cast(BaseParserOptions | None, parser_options),
-            progress_callback=None,
-        )
+            # Reset the file object position for parsing
+            file_obj.seek(0)
+
+            # Create parser options with attachment settings if available
+            parser_options = None
+            attachment_opts = options_dict.get("attachment_options")
+            if attachment_opts:
+                try:
+                    from all2md.options.common import AttachmentOptionsMixin
+
+                    options_class = registry.get_parser_options_class(detected_format)
+                    if options_class and issubclass(options_class, AttachmentOptionsMixin):
+                        default_options = options_class()
+                        parser_options = default_options.create_updated(**attachment_opts)
+                    elif options_class:
+                        parser_options = options_class()
+                except Exception:
+                    # If options creation fails, fall back to None (use defaults)
+                    parser_options = None
+
+            # Convert using the detected format (no progress callback in parallel mode)
+            doc = to_ast(
+                file_obj,
+                source_format=cast(DocumentFormat, detected_format),
+                parser_options=cast(BaseParserOptions | None, parser_options),
+                progress_callback=None,
+            )
 
         return (file_path, doc, None)
 
@@ -757,10 +757,20 @@ class ArchiveToAstConverter(BaseParser):
         """
         return self.options.enable_parallel_processing and file_count >= self.options.parallel_threshold
 
-    def _prepare_file_data_cache(
-        self, archive: Any, archive_type: str, file_list: list[str]
-    ) -> dict[str, bytes] | None:
-        """Prepare file data cache for parallel processing.
+    def _iter_member_payloads(
+        self,
+        archive: Any,
+        archive_type: str,
+        file_list: list[str],
+        spill_dir: Path,
+        file_data_cache: dict[str, bytes],
+    ) -> Iterator[MemberPayload]:
+        """Read members one at a time for the parallel path, in archive order.
+
+        TAR and RAR members are streamed straight from the archive. py7zr can
+        only decompress a solid archive in one pass, so 7z members come from
+        ``file_data_cache`` (see :meth:`_read_7z_members`) and each entry is
+        released as soon as it has been handed on.
 
         Parameters
         ----------
@@ -770,39 +780,38 @@ class ArchiveToAstConverter(BaseParser):
             Type of archive
         file_list : list[str]
             List of files to process
+        spill_dir : Path
+            Directory for members too large to pass to workers by value
+        file_data_cache : dict[str, bytes]
+            Pre-extracted 7z members (empty for other archive types)
 
-        Returns
-        -------
-        dict[str, bytes] or None
-            Map of file paths to file data, or None if preparation failed
+        Yields
+        ------
+        MemberPayload
+            Each readable member; unreadable ones are recorded as failed and
+            empty ones are skipped when ``skip_empty_files`` is set
 
         """
-        # For 7z archives, extract all files at once since py7zr.read() consumes the archive
-        file_data_cache: dict[str, bytes] = {}
-        if archive_type == "7z":
-            try:
-                data_dict = archive.read(file_list)
-                for fname, bio in data_dict.items():
-                    if hasattr(bio, "read"):
-                        file_data_cache[fname] = bio.read()
-                    elif isinstance(bio, bytes):
-                        file_data_cache[fname] = bio
-                    else:
-                        file_data_cache[fname] = b""
-            except Exception as e:
-                logger.warning(f"Failed to extract 7z files: {e}")
-                return None
+        tar_members: dict[str, Any] = {}
+        if archive_type.startswith("tar"):
+            # One name -> member map instead of a linear getmember() scan per file
+            tar_members = {member.name: member for member in archive.getmembers() if member.isfile()}
 
-        # Read all files into memory for parallel processing
-        file_data_map: dict[str, bytes] = {}
-        for file_path in file_list:
+        for sequence, file_path in enumerate(file_list):
             try:
-                # For 7z, use cached data; for others, read directly
-                if archive_type == "7z" and file_path in file_data_cache:
-                    file_data_map[file_path] = file_data_cache[file_path]
+                if archive_type.startswith("tar"):
+                    stream = archive.extractfile(tar_members.get(file_path) or archive.getmember(file_path))
+                elif archive_type == "7z":
+                    stream = io.BytesIO(file_data_cache.pop(file_path, b""))
+                elif archive_type == "rar":
+                    stream = archive.open(file_path)
                 else:
-                    file_data = self._read_archive_file(archive, archive_type, file_path)
-                    file_data_map[file_path] = file_data
+                    stream = None
+                if stream is None:
+                    payload = MemberPayload(file_path=file_path, size=0, data=b"")
+                else:
+                    with stream:
+                        payload = spool_member(file_path, stream, spill_dir, sequence)
             except Exception as e:
                 logger.warning(f"Failed to read file {file_path}: {e}")
                 self._failed_files.append(
@@ -812,153 +821,102 @@ class ArchiveToAstConverter(BaseParser):
                         "error_message": str(e),
                     }
                 )
+                continue
+            if not payload.size and self.options.skip_empty_files:
+                logger.debug(f"Skipping empty file: {file_path}")
+                continue
+            yield payload
 
-        return file_data_map
-
-    def _execute_parallel_processing(
-        self, file_data_map: dict[str, bytes], options_dict: dict[str, Any]
-    ) -> dict[str, tuple[Document | None, dict[str, Any] | None]]:
-        """Execute parallel processing of archive files.
+    @staticmethod
+    def _read_7z_members(archive: Any, file_list: list[str]) -> dict[str, bytes]:
+        """Extract the listed 7z members in one pass.
 
         Parameters
         ----------
-        file_data_map : dict[str, bytes]
-            Map of file paths to file data
-        options_dict : dict[str, Any]
-            Options to pass to worker processes
+        archive : Any
+            Opened SevenZipFile
+        file_list : list[str]
+            Members to extract
 
         Returns
         -------
-        dict[str, tuple[Document | None, dict[str, Any] | None]]
-            Map of file paths to (document, error_dict) tuples
+        dict[str, bytes]
+            Map of member paths to content
 
         """
-        max_workers = self.options.max_workers
-        results_map: dict[str, tuple[Document | None, dict[str, Any] | None]] = {}
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {}
-            for file_path, file_data in file_data_map.items():
-                if not file_data and self.options.skip_empty_files:
-                    logger.debug(f"Skipping empty file: {file_path}")
-                    continue
-                future = executor.submit(_process_archive_file_worker, file_path, file_data, options_dict)
-                future_to_file[future] = file_path
-
-            # Track progress
-            total_files = len(future_to_file)
-            completed_count = 0
-
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result_file_path, doc, error_dict = future.result()
-                    results_map[result_file_path] = (doc, error_dict)
-
-                    # Emit progress event as each file completes
-                    completed_count += 1
-                    self._emit_progress(
-                        "file_processing",
-                        f"Completed {result_file_path}",
-                        current=completed_count,
-                        total=total_files,
-                        file_path=result_file_path,
-                    )
-
-                    # Track errors
-                    if error_dict:
-                        self._failed_files.append(error_dict)
-                except Exception as e:
-                    logger.warning(f"Worker exception for {file_path}: {e}")
-                    completed_count += 1
-                    self._emit_progress(
-                        "file_processing",
-                        f"Failed {file_path}",
-                        current=completed_count,
-                        total=total_files,
-                        file_path=file_path,
-                    )
-                    self._failed_files.append(
-                        {
-                            "file_path": file_path,
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                        }
-                    )
-
-        return results_map
+        # py7zr.read() consumes the archive, so every member is extracted at once
+        file_data_cache: dict[str, bytes] = {}
+        data_dict = archive.read(file_list)
+        for fname, bio in data_dict.items():
+            if hasattr(bio, "read"):
+                file_data_cache[fname] = bio.read()
+            elif isinstance(bio, bytes):
+                file_data_cache[fname] = bio
+            else:
+                file_data_cache[fname] = b""
+        return file_data_cache
 
-    def _build_document_from_results(
+    def _append_member_result(
         self,
-        file_list: list[str],
-        results_map: dict[str, tuple[Document | None, dict[str, Any] | None]],
-        file_data_map: dict[str, bytes],
-    ) -> list[Node]:
-        """Build document children from processing results.
+        children: list[Node],
+        payload: MemberPayload,
+        doc: Document | None,
+        error_dict: dict[str, Any] | None,
+    ) -> None:
+        """Append the nodes for one parallel-processed member to ``children``.
 
         Parameters
         ----------
-        file_list : list[str]
-            Original list of files (for ordering)
-        results_map : dict[str, tuple[Document | None, dict[str, Any] | None]]
-            Map of file paths to (document, error_dict) tuples
-        file_data_map : dict[str, bytes]
-            Map of file paths to file data
-
-        Returns
-        -------
-        list[Node]
-            List of document children nodes
+        children : list[Node]
+            Document children being assembled
+        payload : MemberPayload
+            The member the result belongs to
+        doc : Document or None
+            Converted member, or None for resources and failures
+        error_dict : dict[str, Any] or None
+            Conversion error details, if the worker failed
 
         """
-        children: list[Node] = []
-
-        # Reconstruct document in original order
-        for file_path in file_list:
-            if file_path not in results_map:
-                # File was skipped or failed to read
-                continue
-
-            doc, error_dict = results_map[file_path]
-
-            # Handle resource files (doc is None but no error)
-            if doc is None and error_dict is None:
-                # This is a resource file
-                if self.options.extract_resource_files and self.options.attachment_output_dir:
-                    file_data = file_data_map.get(file_path, b"")
-                    self._extract_resource_file(file_path, file_data)
-                continue
+        file_path = payload.file_path
 
-            # Handle conversion errors (error_dict is not None)
-            if error_dict:
-                if not self.options.skip_empty_files:
-                    display_path = self._get_display_path(file_path)
-                    if self.options.create_section_headings:
-                        children.append(Heading(level=2, content=[Text(content=display_path)]))
-                    error_msg = f"(Error processing file: {error_dict['error_message']})"
-                    children.append(Paragraph(content=[Text(content=error_msg)]))
-                continue
+        # Handle resource files (doc is None but no error)
+        if doc is None and error_dict is None:
+            # This is a resource file
+            if self.options.extract_resource_files and self.options.attachment_output_dir:
+                self._extract_resource_file(file_path, payload.read_bytes())
+            return
 
-            # Add successfully converted content
-            if doc and doc.children:
-                if self.options.create_section_headings:
-                    display_path = self._get_display_path(file_path)
-                    children.append(Heading(level=2, content=[Text(content=display_path)]))
-                children.extend(doc.children)
-            elif not self.options.skip_empty_files:
+        # Handle conversion errors (error_dict is not None)
+        if error_dict:
+            if not self.options.skip_empty_files:
                 display_path = self._get_display_path(file_path)
                 if self.options.create_section_headings:
                     children.append(Heading(level=2, content=[Text(content=display_path)]))
-                children.append(Paragraph(content=[Text(content="(Could not parse this file)")]))
-                self._record_degraded("unparsed_member", detail=display_path, severity="warn")
+                error_msg = f"(Error processing file: {error_dict['error_message']})"
+                children.append(Paragraph(content=[Text(content=error_msg)]))
+            return
 
-        return children
+        # Add successfully converted content
+        if doc and doc.children:
+            if self.options.create_section_headings:
+                display_path = self._get_display_path(file_path)
+                children.append(Heading(level=2, content=[Text(content=display_path)]))
+            children.extend(doc.children)
+        elif not self.options.skip_empty_files:
+            display_path = self._get_display_path(file_path)
+            if self.options.create_section_headings:
+                children.append(Heading(level=2, content=[Text(content=display_path)]))
+            children.append(Paragraph(content=[Text(content="(Could not parse this file)")]))
+            self._record_degraded("unparsed_member", detail=display_path, severity="warn")
 
     def _convert_to_ast_parallel(self, archive: Any, archive_type: str, file_list: list[str]) -> Document:
         """Convert archive to AST using parallel processing.
 
+        Members are read lazily and only a bounded number are in flight; large
+        ones reach the workers through spill files instead of pickled bytes.
+        Results are collected in archive order, so the document is built as
+        they arrive.
+
         Parameters
         ----------
         archive : Any
@@ -976,9 +934,10 @@ class ArchiveToAstConverter(BaseParser):
         """
         logger.info(f"Using parallel processing for {len(file_list)} files")
 
+        children: list[Node] = []
         if not file_list:
             logger.warning("No files to process in archive")
-            children: list[Node] = [Paragraph(content=[Text(content="(Empty archive or no matching files)")])]
+            children.append(Paragraph(content=[Text(content="(Empty archive or no matching files)")]))
             return Document(children=children)
 
         # Prepare options dict for workers
@@ -987,18 +946,74 @@ class ArchiveToAstConverter(BaseParser):
             "attachment_options": self._get_attachment_options_dict(),
         }
 
-        # Prepare file data cache
-        file_data_map = self._prepare_file_data_cache(archive, archive_type, file_list)
-        if file_data_map is None:
-            # Failed to prepare file data (7z extraction error)
-            children = [Paragraph(content=[Text(content="(Error extracting archive)")])]
-            return Document(children=children)
+        # py7zr extracts in one pass; every other archive type is read member by member
+        file_data_cache: dict[str, bytes] = {}
+        if archive_type == "7z":
+            try:
+                file_data_cache = self._read_7z_members(archive, file_list)
+            except Exception as e:
+                logger.warning(f"Failed to extract 7z files: {e}")
+                return Document(children=[Paragraph(content=[Text(content="(Error extracting archive)")])])
+
+        max_workers = self.options.max_workers
+        total_files = len(file_list)
+        completed_count = 0
+
+        with (
+            tempfile.TemporaryDirectory(prefix="all2md-archive-") as spill_dir,
+            ProcessPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            in_order = submit_in_order(
+                executor,
+                self._iter_member_payloads(archive, archive_type, file_list, Path(spill_dir), file_data_cache),
+                _process_archive_file_worker,
+                options_dict,
+                limit=in_flight_limit(max_workers),
+                bypass=lambda payload: self._is_resource_file(payload.file_path),
+            )
+            for payload, future in in_order:
+                file_path = payload.file_path
+                try:
+                    if future is None:
+                        doc, error_dict = None, None
+                    else:
+                        _, doc, error_dict = future.result()
+                except Exception as e:
+                    logger.warning(f"Worker exception for {file_path}: {e}")
+                    completed_count += 1
+                    self._emit_progress(
+                        "file_processing",
+                        f"Failed {file_path}",
+                        current=completed_count,
+                        total=total_files,
+                        file_path=file_path,
+                    )
+                    self._failed_files.append(
+                        {
+                            "file_path": file_path,
+                            "error_type": type(e).__name__,
+                            "error_message": str(e),
+                        }
+                    )
+                    payload.discard()
+                    continue
+
+                # Emit progress event as each file completes
+                completed_count += 1
+                self._emit_progress(
+                    "file_processing",
+                    f"Completed {file_path}",
+                    current=completed_count,
+                    total=total_files,
+                    file_path=file_path,
+                )
 
-        # Execute parallel processing
-        results_map = self._execute_parallel_processing(file_data_map, options_dict)
+                # Track errors
+                if error_dict:
+                    self._failed_files.append(error_dict)
 
-        # Build document from results
-        children = self._build_document_from_results(file_list, results_map, file_data_map)
+                self._append_member_result(children, payload, doc, error_dict)
+                payload.discard()
 
         # Add resource manifest if requested and resources were extracted
         if self.options.include_resource_manifest and self.options.extract_resource_files and self._extracted_resources:
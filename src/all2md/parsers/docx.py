@@ -2051,6 +2051,7 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),  # ZIP signature (docx is ZIP-based)
     ],
+    zip_members=["word/document.xml"],
     parser_class=DocxToAstConverter,
     renderer_class="all2md.renderers.docx.DocxRenderer",
     renders_as_string=False,
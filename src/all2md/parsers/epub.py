@@ -291,6 +291,8 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),  # ZIP signature
     ],
+    zip_members=["META-INF/container.xml"],
+    zip_mimetypes=["application/epub+zip"],
     parser_required_packages=[("ebooklib", "ebooklib", "")],
     renderer_required_packages=[("ebooklib", "ebooklib", ">=0.17")],
     optional_packages=[],
@@ -56,7 +56,6 @@ from all2md.ast import (
     get_node_children,
 )
 from all2md.constants import (
-    DANGEROUS_HTML_ELEMENTS,
     DEPS_HTML,
     DEPS_HTML_READABILITY,
     MAX_JSON_LD_SIZE_BYTES,
@@ -255,6 +254,37 @@ class HtmlToAstConverter(BaseParser):
                 missing_packages=missing_packages,
             ) from e
 
+    def _parse_document(self, html_content: str) -> Any:
+        """Parse HTML into the tree the element handlers walk, sanitized as configured.
+
+        With ``html_parser="lxml"`` and ``direct_lxml_tree`` set, the handlers walk a
+        read-only view of lxml's own tree (see :mod:`all2md.parsers._html_lxml_tree`)
+        instead of a BeautifulSoup tree built from it. That view cannot be edited or
+        serialized the way bs4 does it, so sanitization and the ``"html"`` figure and
+        details modes keep the BeautifulSoup tree, as does any document the view
+        declines.
+        """
+        if self._can_use_lxml_tree():
+            from all2md.parsers._html_lxml_tree import parse_lxml_tree
+
+            document = parse_lxml_tree(html_content)
+            if document is not None:
+                return document
+            logger.debug("Direct lxml tree declined this document; falling back to BeautifulSoup")
+        return self._sanitize_soup(self._parse_html_with_parser(html_content))
+
+    def _can_use_lxml_tree(self) -> bool:
+        """Check whether the options allow walking lxml's tree directly."""
+        options = self.options
+        return (
+            options.direct_lxml_tree
+            and options.html_parser == "lxml"
+            and not options.strip_dangerous_elements
+            and options.allowed_attributes is None
+            and options.figures_parsing != "html"
+            and options.details_parsing != "html"
+        )
+
     def _sanitize_soup(self, soup: Any) -> Any:
         """Apply sanitization to parsed HTML soup."""
         if self.options.strip_dangerous_elements and self.options.allowed_attributes is None:
@@ -269,11 +299,13 @@ class HtmlToAstConverter(BaseParser):
         """Extract title heading from soup or readability title."""
         from bs4.element import Tag
 
+        from all2md.parsers._html_lxml_tree import LxmlTag
+
         if not self.options.extract_title:
             return None
 
         title_tag = soup.find("title")
-        if isinstance(title_tag, Tag) and title_tag.string:
+        if isinstance(title_tag, (Tag, LxmlTag)) and title_tag.string:
             self._heading_level_offset = 1
             return Heading(level=1, content=[Text(content=title_tag.string.strip())])
 
@@ -298,8 +330,10 @@ class HtmlToAstConverter(BaseParser):
         """
         from bs4.element import Tag
 
+        from all2md.parsers._html_lxml_tree import LxmlTag
+
         body = soup.find("body")
-        root = body if isinstance(body, Tag) else soup
+        root = body if isinstance(body, (Tag, LxmlTag)) else soup
         return self._process_block_container(root)
 
     def convert_to_ast(self, html_content: str) -> Document:
@@ -331,8 +365,7 @@ class HtmlToAstConverter(BaseParser):
             html_content, readability_title = self._extract_readable_html(html_content)
 
         # Parse and sanitize
-        soup = self._parse_html_with_parser(html_content)
-        soup = self._sanitize_soup(soup)
+        soup = self._parse_document(html_content)
 
         # Build document children
         children: list[Node] = []
@@ -707,115 +740,22 @@ class HtmlToAstConverter(BaseParser):
         # Use centralized element safety check from html_sanitizer utility
         return is_element_safe(element, strip_framework_attributes=self.options.strip_framework_attributes)
 
-    def _strip_dangerous_elements(self, soup: Any) -> None:
-        """Strip dangerous HTML elements from soup.
-
-        Removes script/style tags completely, then removes other dangerous elements
-        and elements with dangerous attributes.
-
-        Parameters
-        ----------
-        soup : BeautifulSoup
-            BeautifulSoup object to sanitize in-place
-
-        """
-        # Remove script and style tags completely (including all content for security)
-        for tag in soup.find_all(["script", "style"]):
-            tag.decompose()
-
-        # Collect other dangerous elements and elements with dangerous attributes
-        elements_to_remove = []
-        for element in soup.find_all():
-            if not hasattr(element, "name"):
-                continue
-            # Check for other dangerous elements (not script/style, already removed)
-            if element.name in DANGEROUS_HTML_ELEMENTS and element.name not in ["script", "style"]:
-                elements_to_remove.append(element)
-            # Check for dangerous attributes
-            elif not self._sanitize_element(element):
-                elements_to_remove.append(element)
-
-        # Remove collected elements completely for security (defense-in-depth)
-        for element in elements_to_remove:
-            element.decompose()
-
-    def _apply_element_whitelist(self, soup: Any) -> None:
-        """Apply element whitelist filter.
-
-        Removes elements not in the allowed_elements list (preserves children).
-
-        Parameters
-        ----------
-        soup : BeautifulSoup
-            BeautifulSoup object to filter in-place
-
-        """
-        if self.options.allowed_elements is None:
-            return
-
-        elements_to_remove = []
-        for element in soup.find_all():
-            if hasattr(element, "name") and element.name not in self.options.allowed_elements:
-                elements_to_remove.append(element)
-
-        for element in elements_to_remove:
-            element.unwrap()
-
-    def _apply_attribute_whitelist(self, soup: Any) -> None:
-        """Apply attribute whitelist filter.
-
-        Removes attributes not in the allowed_attributes list.
-        Supports both global allowlist (tuple) and per-element allowlist (dict).
-
-        Parameters
-        ----------
-        soup : BeautifulSoup
-            BeautifulSoup object to filter in-place
-
-        """
-        if self.options.allowed_attributes is None:
-            return
-
-        is_per_element = isinstance(self.options.allowed_attributes, dict)
-
-        for element in soup.find_all():
-            if not (hasattr(element, "attrs") and hasattr(element, "name")):
-                continue
-
-            allowed_attrs: Union[tuple[str, ...], dict[str, tuple[str, ...]]]
-            if is_per_element:
-                assert isinstance(self.options.allowed_attributes, dict)
-                allowed_attrs = self.options.allowed_attributes.get(element.name, ())
-            else:
-                allowed_attrs = self.options.allowed_attributes
-
-            attrs_to_remove = [attr for attr in element.attrs if attr not in allowed_attrs]
-            for attr in attrs_to_remove:
-                del element.attrs[attr]
-
-    def _final_security_pass(self, soup: Any) -> None:
-        """Execute final security pass to catch any dangerous attributes after whitelisting.
-
-        Parameters
-        ----------
-        soup : BeautifulSoup
-            BeautifulSoup object to sanitize in-place
-
-        """
-        elements_to_remove = []
-        for element in soup.find_all():
-            if hasattr(element, "name") and not self._sanitize_element(element):
-                elements_to_remove.append(element)
-
-        for element in elements_to_remove:
-            element.decompose()
-
     def _apply_custom_sanitization(self, soup: Any) -> Any:
-        """Apply custom sanitization with user-specified attribute allowlists.
+        """Apply custom sanitization with user-specified element/attribute allowlists.
 
         This method handles sanitization when custom allowed_elements or allowed_attributes
-        are specified, using multi-pass BeautifulSoup processing. For standard sanitization
-        without custom allowlists, use the shared html_sanitizer utility instead.
+        are specified. For standard sanitization without custom allowlists, use the shared
+        html_sanitizer utility instead.
+
+        Everything happens in one depth-first walk over the tree. Each element is
+        first checked for safety (script/style and the other dangerous elements, event
+        handlers, dangerous URLs, framework attributes); an unsafe element is removed
+        together with its subtree, which is then never visited. A safe element has its
+        attributes cut down to the allowlist and, if it is not an allowed element, is
+        unwrapped so its children take its place. Because the allowlist only ever
+        removes attributes, an element that was safe before filtering is still safe
+        after it, so this single check also covers the final security pass
+        (defense-in-depth) the separate passes used to end with.
 
         Parameters
         ----------
@@ -828,15 +768,32 @@ class HtmlToAstConverter(BaseParser):
             Sanitized BeautifulSoup object
 
         """
-        if self.options.strip_dangerous_elements:
-            self._strip_dangerous_elements(soup)
+        from bs4.element import Tag
+
+        strip_dangerous = self.options.strip_dangerous_elements
+        allowed_elements = self.options.allowed_elements
+        allowed_attributes = self.options.allowed_attributes
 
-        self._apply_element_whitelist(soup)
-        self._apply_attribute_whitelist(soup)
+        stack = [child for child in reversed(soup.contents) if isinstance(child, Tag)]
+        while stack:
+            element = stack.pop()
+            if strip_dangerous and not self._sanitize_element(element):
+                element.decompose()
+                continue
+            # Taken before any unwrap; the children stay valid wherever they are moved.
+            stack.extend(child for child in reversed(element.contents) if isinstance(child, Tag))
+
+            if allowed_attributes is not None and element.attrs:
+                allowed_attrs: tuple[str, ...]
+                if isinstance(allowed_attributes, dict):
+                    allowed_attrs = allowed_attributes.get(element.name, ())
+                else:
+                    allowed_attrs = allowed_attributes
+                for attr in [attr for attr in element.attrs if attr not in allowed_attrs]:
+                    del element.attrs[attr]
 
-        # Final security pass (defense-in-depth)
-        if self.options.strip_dangerous_elements:
-            self._final_security_pass(soup)
+            if allowed_elements is not None and element.name not in allowed_elements:
+                element.unwrap()
 
         return soup
 
@@ -15,6 +15,7 @@ import json
 import logging
 import re
 import sys
+import threading
 from collections.abc import Callable
 from pathlib import Path
 
@@ -354,6 +355,85 @@ def _plugin_table(md: Any) -> None:
     md.block.register("nptable", NP_TABLE_PATTERN, _parse_nptable_lenient, before="paragraph")
 
 
+# Options that change which mistune plugins are registered, and so key the
+# per-thread parser cache. Every other option only affects token processing.
+_PLUGIN_OPTION_FIELDS = (
+    "parse_strikethrough",
+    "parse_tables",
+    "parse_footnotes",
+    "parse_task_lists",
+    "parse_math",
+    "parse_definition_lists",
+    "parse_marks",
+    "parse_admonitions",
+)
+
+# mistune's block and inline parsers compile and memoize their rule regexes
+# lazily, during parsing, so one instance is not safe to share between threads.
+# Each thread keeps its own instance per plugin configuration instead.
+_thread_parsers = threading.local()
+
+
+def _mistune_plugins(options: MarkdownParserOptions) -> list[Any]:
+    """Return the mistune plugins enabled by ``options``.
+
+    Entries are either builtin plugin names (resolved by mistune) or plugin
+    callables.
+    """
+    plugins: list[Any] = []
+    if options.parse_strikethrough:
+        plugins.append("strikethrough")
+    if options.parse_tables:
+        # _plugin_table replaces mistune's builtin "table" plugin with a
+        # GFM-compliant one that pads/truncates ragged body rows instead of
+        # discarding the whole table. table_in_list/table_in_quote then
+        # extend that rule into list items and blockquotes so GFM tables
+        # nested there (e.g. a table inside a numbered list item) are parsed
+        # as tables rather than falling back to literal paragraph text.
+        # These ship with mistune but are not registered under string names,
+        # so import the callables.
+        from mistune.plugins.table import table_in_list, table_in_quote
+
+        plugins.extend([_plugin_table, table_in_list, table_in_quote])
+    if options.parse_footnotes:
+        plugins.append("footnotes")
+    if options.parse_task_lists:
+        plugins.append("task_lists")
+    if options.parse_math:
+        plugins.append("math")
+    if options.parse_definition_lists:
+        plugins.append("def_list")
+    if options.parse_marks:
+        # Material for MkDocs / pymdownx inline marks. mistune ships these
+        # as builtin plugins: highlight (==), insert (^^), superscript (^),
+        # subscript (~).
+        plugins.extend(["mark", "insert", "superscript", "subscript"])
+    if options.parse_admonitions:
+        plugins.append(_plugin_admonition)
+    return plugins
+
+
+def _cached_mistune_parser(options: MarkdownParserOptions) -> Any:
+    """Return this thread's mistune instance for the plugin set of ``options``.
+
+    Building a mistune instance registers every plugin's rules and is several
+    times more expensive than parsing a short snippet, so instances are built
+    once per plugin configuration and reused. They carry no per-document state:
+    ``Markdown.parse`` starts from a fresh ``BlockState`` on every call.
+    """
+    parsers: dict[tuple[bool, ...], Any] | None = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    key = tuple(bool(getattr(options, name)) for name in _PLUGIN_OPTION_FIELDS)
+    markdown = parsers.get(key)
+    if markdown is None:
+        import mistune
+
+        # renderer=None: we process the tokens ourselves
+        markdown = parsers[key] = mistune.create_markdown(plugins=_mistune_plugins(options), renderer=None)
+    return markdown
+
+
 class MarkdownToAstConverter(BaseParser):
     r"""Convert Markdown to AST representation.
 
@@ -441,43 +521,7 @@ class MarkdownToAstConverter(BaseParser):
         # This also strips frontmatter from the content
         markdown_content, frontmatter_metadata = self._extract_frontmatter(markdown_content)
 
-        import mistune
-
-        # Configure mistune plugins based on options. Entries are either
-        # builtin plugin names (resolved by mistune) or plugin callables.
-        plugins: list[Any] = []
-        if self.options.parse_strikethrough:
-            plugins.append("strikethrough")
-        if self.options.parse_tables:
-            # _plugin_table replaces mistune's builtin "table" plugin with a
-            # GFM-compliant one that pads/truncates ragged body rows instead of
-            # discarding the whole table. table_in_list/table_in_quote then
-            # extend that rule into list items and blockquotes so GFM tables
-            # nested there (e.g. a table inside a numbered list item) are parsed
-            # as tables rather than falling back to literal paragraph text.
-            # These ship with mistune but are not registered under string names,
-            # so import the callables.
-            from mistune.plugins.table import table_in_list, table_in_quote
-
-            plugins.extend([_plugin_table, table_in_list, table_in_quote])
-        if self.options.parse_footnotes:
-            plugins.append("footnotes")
-        if self.options.parse_task_lists:
-            plugins.append("task_lists")
-        if self.options.parse_math:
-            plugins.append("math")
-        if self.options.parse_definition_lists:
-            plugins.append("def_list")
-        if self.options.parse_marks:
-            # Material for MkDocs / pymdownx inline marks. mistune ships these
-            # as builtin plugins: highlight (==), insert (^^), superscript (^),
-            # subscript (~).
-            plugins.extend(["mark", "insert", "superscript", "subscript"])
-        if self.options.parse_admonitions:
-            plugins.append(_plugin_admonition)
-
-        # Create markdown parser with plugins
-        markdown = mistune.create_markdown(plugins=plugins, renderer=None)  # We'll process tokens ourselves
+        markdown = _cached_mistune_parser(self.options)
 
         # Parse to tokens
         tokens, state = markdown.parse(markdown_content)
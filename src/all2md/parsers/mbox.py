@@ -14,9 +14,13 @@ from __future__ import annotations
 import datetime
 import logging
 import mailbox
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from email.message import Message
 from pathlib import Path
-from typing import IO, Any, Optional, Union
+from typing import IO, Any, Optional, Union, cast
 
 from all2md.ast import Document, Heading, Node, Paragraph, Text, ThematicBreak
 from all2md.converter_metadata import ConverterMetadata
@@ -32,6 +36,7 @@ from all2md.parsers.eml import (
 )
 from all2md.progress import ProgressCallback
 from all2md.utils.metadata import DocumentMetadata
+from all2md.utils.parallel import in_flight_limit, submit_in_order
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +141,82 @@ def _filter_message(msg_data: dict[str, Any], options: MboxOptions) -> bool:
     return True
 
 
+@dataclass
+class MailboxMessage:
+    """One message produced by :meth:`MboxToAstConverter.iter_messages_as_ast`.
+
+    Parameters
+    ----------
+    key : str
+        Position of the message in the mailbox. For mbox files this is the
+        byte offset of its ``From`` line; for directory mailboxes it is the
+        stdlib mailbox key (the file name for maildir, the number for MH).
+        Pass it as ``after_key`` to resume after this message.
+    document : Document
+        The message as a self-contained AST document
+    end_offset : int or None
+        For mbox files, the byte offset just past the message; pass it as
+        ``start_offset`` to resume after this message. None otherwise.
+    folder : str or None
+        Maildir folder the message came from, when folders are filtered
+
+    """
+
+    key: str
+    document: Document
+    end_offset: int | None = None
+    folder: str | None = None
+
+
+def _iter_mbox_file(path: Path, start_offset: int = 0) -> Iterator[tuple[int, int, bytes]]:
+    """Yield ``(start, end, raw_bytes)`` for each message of an mbox file, reading forward.
+
+    Unlike :class:`mailbox.mbox`, which scans the whole file to build its table
+    of contents before handing out the first message, this reads one message
+    at a time. Message boundaries follow the stdlib rules: every line starting
+    with ``From`` opens a message, and the blank line separating it from the
+    previous message (or ends the file) belongs to neither. Anything before the first ``From``
+    line at or after ``start_offset`` is skipped, so the offset does not have
+    to fall exactly on a message boundary.
+    """
+    with open(path, "rb") as handle:
+        handle.seek(start_offset)
+        position = start_offset
+        start: int | None = None
+        lines: list[bytes] = []
+        for line in handle:
+            if line.startswith(b"From "):
+                if start is not None:
+                    yield start, position, _strip_separator(lines)
+                start = position
+                lines = []
+            if start is not None:
+                lines.append(line)
+            position += len(line)
+        if start is not None:
+            yield start, position, _strip_separator(lines)
+
+
+def _strip_separator(lines: list[bytes]) -> bytes:
+    """Join a message's lines, dropping the blank line that separates it from the next one."""
+    if len(lines) > 1 and lines[-1] in (b"\n", b"\r\n"):
+        lines.pop()
+    return b"".join(lines)
+
+
+def _message_from_bytes(raw: bytes) -> Message:
+    """Build a mailbox message from its raw bytes (a leading ``From`` line is kept as the envelope)."""
+    return mailbox.mboxMessage(raw)
+
+
+def _message_document_worker(
+    message: tuple[str, int | None, str | None, bytes], heading_level: int, options: MboxOptions
+) -> Document | None:
+    """Convert one ``(key, end_offset, folder, raw)`` message in a worker process (module level so it pickles)."""
+    key, _, folder, raw = message
+    return MboxToAstConverter(options)._message_document(_message_from_bytes(raw), key, folder, heading_level)
+
+
 class MboxToAstConverter(BaseParser):
     """Convert Unix mailbox archives to AST representation.
 
@@ -189,44 +270,14 @@ class MboxToAstConverter(BaseParser):
         # Reset parser state to prevent leakage across parse calls
         self._attachment_footnotes = {}
 
-        # Validate input - mailbox module requires file/directory access
-        if isinstance(input_data, bytes) or hasattr(input_data, "read"):
-            raise ValidationError(
-                "MBOX parser requires file or directory path. IO streams and bytes are not supported.",
-                parameter_name="input_data",
-                parameter_value="<IO or bytes>",
-            )
-
-        path = Path(input_data) if isinstance(input_data, str) else input_data
-
-        if not path.exists():
-            raise ValidationError(
-                f"Mailbox path does not exist: {path}",
-                parameter_name="input_data",
-                parameter_value=str(path),
-            )
+        path = self._validate_mailbox_path(input_data)
 
         try:
-            # Detect format if auto
-            mailbox_format = self.options.mailbox_format
-            if mailbox_format == "auto":
-                detected_format = _detect_mailbox_format(path)
-                mailbox_format = detected_format  # type: ignore[assignment]
-            format_name = str(mailbox_format)  # Convert to str for use in error messages
-
-            # Get appropriate mailbox class
-            mbox_class = _get_mailbox_class(format_name)
+            format_name = self._resolve_format_name(path)
 
             # Open mailbox
             mbox = None  # Initialize for finally block
-            try:
-                mbox = mbox_class(str(path))
-            except Exception as e:
-                raise MalformedFileError(
-                    f"Failed to open mailbox as {format_name}: {e!r}",
-                    file_path=str(path),
-                    original_error=e,
-                ) from e
+            mbox = self._open_mailbox(path, format_name)
 
             try:
                 # Get total message count for progress reporting
@@ -273,6 +324,273 @@ class MboxToAstConverter(BaseParser):
                 original_error=e,
             ) from e
 
+    @staticmethod
+    def _validate_mailbox_path(input_data: Union[str, Path, IO[bytes], bytes]) -> Path:
+        """Return the mailbox path, rejecting streams, bytes and missing paths."""
+        # Validate input - mailbox module requires file/directory access
+        if isinstance(input_data, bytes) or hasattr(input_data, "read"):
+            raise ValidationError(
+                "MBOX parser requires file or directory path. IO streams and bytes are not supported.",
+                parameter_name="input_data",
+                parameter_value="<IO or bytes>",
+            )
+
+        path = Path(input_data) if isinstance(input_data, str) else cast(Path, input_data)
+
+        if not path.exists():
+            raise ValidationError(
+                f"Mailbox path does not exist: {path}",
+                parameter_name="input_data",
+                parameter_value=str(path),
+            )
+        return path
+
+    def _resolve_format_name(self, path: Path) -> str:
+        """Return the configured mailbox format, detecting it when set to ``auto``."""
+        mailbox_format = self.options.mailbox_format
+        if mailbox_format == "auto":
+            return _detect_mailbox_format(path)
+        return str(mailbox_format)
+
+    @staticmethod
+    def _open_mailbox(path: Path, format_name: str) -> mailbox.Mailbox:
+        """Open ``path`` with the stdlib mailbox class for ``format_name``."""
+        mbox_class = _get_mailbox_class(format_name)
+        try:
+            return mbox_class(str(path))
+        except Exception as e:
+            raise MalformedFileError(
+                f"Failed to open mailbox as {format_name}: {e!r}",
+                file_path=str(path),
+                original_error=e,
+            ) from e
+
+    def iter_messages_as_ast(
+        self,
+        input_data: Union[str, Path],
+        *,
+        start_offset: int | None = None,
+        after_key: str | None = None,
+        workers: int = 1,
+    ) -> Iterator[MailboxMessage]:
+        """Convert a mailbox one message at a time, in mailbox order.
+
+        Unlike :meth:`parse`, which collects every message before building a
+        single document, this yields each message as its own document as soon
+        as it is converted, so memory stays flat and output starts
+        immediately. mbox files are read forward message by message instead of
+        being indexed up front. Messages come out in mailbox order:
+        ``sort_order`` is not applied, since sorting needs every message first.
+        In ``hierarchical`` mode the folder heading is prepended to the first
+        message of each folder.
+
+        Parameters
+        ----------
+        input_data : str or Path
+            Mailbox file or directory
+        start_offset : int, optional
+            mbox files only: start reading at this byte offset. Use the
+            ``end_offset`` of the last message processed to resume after it.
+        after_key : str, optional
+            Resume after the message with this key (see
+            :attr:`MailboxMessage.key`)
+        workers : int, default 1
+            Parse messages in this many worker processes (0 means one per
+            CPU). Results are still yielded in mailbox order, with a bounded
+            number of messages in flight.
+
+        Yields
+        ------
+        MailboxMessage
+            Each message that passes the date filters, with its resume key
+
+        Raises
+        ------
+        ValidationError
+            If the input is not a mailbox path, ``start_offset`` is used with a
+            non-mbox mailbox, or ``after_key`` does not occur in the mailbox
+        MalformedFileError
+            If the mailbox cannot be opened
+
+        """
+        path = self._validate_mailbox_path(input_data)
+        format_name = self._resolve_format_name(path)
+        if start_offset is not None and format_name != "mbox":
+            raise ValidationError(
+                f"start_offset is only supported for mbox files, not {format_name} mailboxes",
+                parameter_name="start_offset",
+                parameter_value=start_offset,
+            )
+        if workers < 0:
+            raise ValidationError("workers must be >= 0", parameter_name="workers", parameter_value=workers)
+
+        hierarchical = self.options.output_structure == "hierarchical"
+        heading_level = 2 if hierarchical else 1
+        current_folder: str | None = None
+        yielded = 0
+
+        self._emit_progress("started", f"Streaming {format_name} mailbox")
+        raw_messages = self._iter_raw_messages(path, format_name, start_offset or 0, after_key)
+        for i, (key, end_offset, folder, document) in enumerate(
+            self._convert_raw_messages(raw_messages, heading_level, workers), start=1
+        ):
+            self._emit_progress("message_done", f"Message {key}", current=i)
+            if document is None:
+                continue
+            if hierarchical:
+                label = folder if folder and self.options.preserve_folder_metadata else "Inbox"
+                if label != current_folder:
+                    document.children.insert(0, Heading(level=1, content=[Text(content=label)]))
+                    current_folder = label
+            yielded += 1
+            yield MailboxMessage(key=key, document=document, end_offset=end_offset, folder=folder)
+
+        self._emit_progress("finished", f"Streamed {yielded} messages", current=yielded, total=yielded)
+
+    def _iter_raw_messages(
+        self, path: Path, format_name: str, start_offset: int, after_key: str | None
+    ) -> Iterator[tuple[str, int | None, str | None, bytes]]:
+        """Yield ``(key, end_offset, folder, raw_bytes)`` per message, honoring resume and ``max_messages``."""
+        if format_name == "mbox":
+            source: Iterator[tuple[str, int | None, str | None, bytes]] = (
+                (str(start), end, None, raw) for start, end, raw in _iter_mbox_file(path, start_offset)
+            )
+        else:
+            source = self._iter_mailbox_bytes(path, format_name)
+
+        if after_key is not None:
+            source = self._skip_through_key(source, after_key)
+
+        for count, item in enumerate(source, start=1):
+            if self.options.max_messages and count > self.options.max_messages:
+                break
+            yield item
+
+    def _iter_mailbox_bytes(self, path: Path, format_name: str) -> Iterator[tuple[str, int | None, str | None, bytes]]:
+        """Yield raw messages from a stdlib-indexed mailbox (maildir, MH, Babyl, MMDF)."""
+        mbox = self._open_mailbox(path, format_name)
+        try:
+            if format_name == "maildir" and self.options.folder_filter and isinstance(mbox, mailbox.Maildir):
+                for folder_name in self.options.folder_filter:
+                    try:
+                        folder = mbox.get_folder(folder_name)
+                    except (KeyError, mailbox.NoSuchMailboxError):
+                        # Folder doesn't exist, skip
+                        continue
+                    for key in folder.iterkeys():
+                        yield str(key), None, folder_name, folder.get_bytes(key)
+            else:
+                for key in mbox.iterkeys():
+                    yield str(key), None, None, mbox.get_bytes(key)
+        finally:
+            try:
+                mbox.close()
+            except Exception:
+                pass  # Ignore errors during cleanup
+
+    @staticmethod
+    def _skip_through_key(
+        source: Iterator[tuple[str, int | None, str | None, bytes]], after_key: str
+    ) -> Iterator[tuple[str, int | None, str | None, bytes]]:
+        """Drop messages up to and including ``after_key``."""
+        for item in source:
+            if item[0] == after_key:
+                break
+        else:
+            raise ValidationError(
+                f"Resume key not found in mailbox: {after_key}",
+                parameter_name="after_key",
+                parameter_value=after_key,
+            )
+        yield from source
+
+    def _convert_raw_messages(
+        self,
+        raw_messages: Iterator[tuple[str, int | None, str | None, bytes]],
+        heading_level: int,
+        workers: int,
+    ) -> Iterator[tuple[str, int | None, str | None, Document | None]]:
+        """Convert raw messages in order, in-process or across a bounded process pool."""
+        worker_count = workers or os.cpu_count() or 1
+        if worker_count == 1:
+            for key, end_offset, folder, raw in raw_messages:
+                document = self._message_document(_message_from_bytes(raw), key, folder, heading_level)
+                yield key, end_offset, folder, document
+            return
+
+        executor = ProcessPoolExecutor(max_workers=worker_count)
+        try:
+            in_order = submit_in_order(
+                executor,
+                raw_messages,
+                _message_document_worker,
+                heading_level,
+                self.options,
+                limit=in_flight_limit(worker_count),
+            )
+            for (key, end_offset, folder, _), future in in_order:
+                assert future is not None  # no message bypasses the pool
+                yield self._message_result(key, end_offset, folder, future)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _message_result(
+        key: str, end_offset: int | None, folder: str | None, future: Future[Document | None]
+    ) -> tuple[str, int | None, str | None, Document | None]:
+        """Wait for one parallel conversion; a failed message yields no document."""
+        try:
+            document = future.result()
+        except Exception as e:
+            logger.warning(f"Failed to process message {key}: {e}")
+            document = None
+        return key, end_offset, folder, document
+
+    def _message_document(self, msg: Message, key: str, folder: str | None, heading_level: int) -> Document | None:
+        """Convert one message into a self-contained document, or None if it is filtered out.
+
+        Parameters
+        ----------
+        msg : Message
+            Email message object
+        key : str
+            Mailbox key, recorded in the document metadata
+        folder : str or None
+            Folder name for metadata
+        heading_level : int
+            Heading level for the subject
+
+        Returns
+        -------
+        Document or None
+            The message's nodes followed by its attachment footnotes, or None
+            when parsing fails or the date filters exclude it
+
+        """
+        self._attachment_footnotes = {}
+        msg_data = self._process_single_message(msg, folder=folder)
+        if not msg_data or not _filter_message(msg_data, self.options):
+            return None
+
+        children: list[Node] = []
+        self._add_message_nodes(children, msg_data, heading_level=heading_level)
+        if self.options.attachments_footnotes_section:
+            self._append_attachment_footnotes(
+                children, self._attachment_footnotes, self.options.attachments_footnotes_section
+            )
+
+        metadata = DocumentMetadata(
+            title=msg_data.get("subject") or None,
+            author=msg_data.get("from") or None,
+            creation_date=msg_data.get("date"),
+        )
+        metadata.custom["mailbox_key"] = key
+        if msg_data.get("message_id"):
+            metadata.custom["message_id"] = msg_data["message_id"]
+        if msg_data.get("folder"):
+            metadata.custom["folder"] = msg_data["folder"]
+        return Document(children=children, metadata=metadata.to_dict())
+
     def _process_messages(self, mbox: mailbox.Mailbox, format_name: str) -> list[dict[str, Any]]:
         """Process messages from mailbox with streaming and filtering.
 
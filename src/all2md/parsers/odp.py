@@ -869,6 +869,7 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),
     ],
+    zip_mimetypes=["application/vnd.oasis.opendocument.presentation"],
     parser_class=OdpToAstConverter,
     renderer_class="OdpRenderer",
     parser_required_packages=[("odfpy", "odf", "")],
@@ -13,8 +13,13 @@ from __future__ import annotations
 
 import logging
 import re
+import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import IO, Any, Optional, Union, cast
+from typing import IO, Any, Callable, Optional, Union, cast
+from xml.etree.ElementTree import Element
+
+from defusedxml.ElementTree import fromstring, iterparse
 
 from all2md.ast import (
     Alignment,
@@ -25,7 +30,7 @@ from all2md.ast import (
     Paragraph,
     Text,
 )
-from all2md.constants import DEPS_ODF
+from all2md.constants import DEPS_ODS
 from all2md.converter_metadata import ConverterMetadata
 from all2md.exceptions import MalformedFileError
 from all2md.options.ods import OdsSpreadsheetOptions
@@ -216,6 +221,183 @@ def _extract_ods_charts(table: Any, base_filename: str, options: Any) -> list[No
     return chart_nodes
 
 
+_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_DRAW_NS = "urn:oasis:names:tc:opendocument:xmlns:drawing:1.0"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_META_NS = "urn:oasis:names:tc:opendocument:xmlns:meta:1.0"
+
+_TABLE_TAG = f"{{{_TABLE_NS}}}table"
+_ROW_TAG = f"{{{_TABLE_NS}}}table-row"
+_CELL_TAG = f"{{{_TABLE_NS}}}table-cell"
+_FRAME_TAG = f"{{{_DRAW_NS}}}frame"
+_NAME_ATTR = f"{{{_TABLE_NS}}}name"
+_COLUMNS_REPEATED_ATTR = f"{{{_TABLE_NS}}}number-columns-repeated"
+
+# meta.xml element -> DocumentMetadata attribute, as read by extract_metadata()
+_META_FIELDS = (
+    (f"{{{_DC_NS}}}title", "title"),
+    (f"{{{_DC_NS}}}creator", "author"),
+    (f"{{{_DC_NS}}}description", "subject"),
+    (f"{{{_META_NS}}}creation-date", "creation_date"),
+)
+
+
+def _ods_cell_text(cell: Element) -> str:
+    """Return a cell's text the way :meth:`OdsSpreadsheetToAstConverter._extract_rows_from_table` reads it.
+
+    That is, the cell's own text nodes plus the text nodes directly inside
+    each child element (e.g. ``text:p``), so nested spans contribute only
+    their tails.
+    """
+    parts = [cell.text or ""]
+    for child in cell:
+        parts.append(child.text or "")
+        parts.extend(grandchild.tail or "" for grandchild in child)
+        parts.append(child.tail or "")
+    text = "".join(parts)
+    return text.strip() if text else ""
+
+
+def _ods_row_cells(row: Element, max_cols: int | None) -> list[str]:
+    """Expand a row's cells (honoring column repetition), keeping at most ``max_cols + 1`` of them.
+
+    One cell past ``max_cols`` is enough to tell that the row was truncated;
+    expanding the rest (often thousands of repeated empty cells) would only
+    be sliced off again.
+    """
+    limit = max_cols + 1 if max_cols is not None else None
+    cells: list[str] = []
+    for cell in row:
+        if cell.tag != _CELL_TAG:
+            continue
+        repeat_count = 1
+        try:
+            repeat_attr = cell.get(_COLUMNS_REPEATED_ATTR)
+            if repeat_attr:
+                repeat_count = int(repeat_attr)
+        except (ValueError, TypeError):
+            pass
+        if limit is not None:
+            repeat_count = min(repeat_count, limit - len(cells))
+        cells.extend([_ods_cell_text(cell)] * repeat_count)
+        if limit is not None and len(cells) >= limit:
+            break
+    return cells
+
+
+@dataclass
+class _StreamedSheet:
+    """Rows of one sheet read from ``content.xml``, limited the way the odfpy path limits them.
+
+    The odfpy path extracts every row, drops trailing empty rows, then keeps
+    ``max_rows + 1`` of them. Here only those rows are kept as they stream
+    past; later rows are looked at just long enough to know whether the
+    sheet was truncated.
+    """
+
+    name: str
+    max_rows: int | None
+    max_cols: int | None
+    rows: list[list[str]] = field(default_factory=list)
+    truncated: bool = False
+    _position: int = 0
+    _more_rows: bool = False
+    _pending_wide: bool = False
+
+    def add_row(self, cells: list[str]) -> None:
+        """Record one row of expanded cells."""
+        keep_limit = self.max_rows + 1 if self.max_rows is not None else None
+        wide = self.max_cols is not None and len(cells) > self.max_cols
+        if any(cells):
+            # Empty rows only count once a non-empty row follows them.
+            if wide or self._pending_wide:
+                self.truncated = True
+            self._pending_wide = False
+            if keep_limit is not None and self._position >= keep_limit:
+                self._more_rows = self.truncated = True
+        else:
+            self._pending_wide = self._pending_wide or wide
+        if keep_limit is None or self._position < keep_limit:
+            self.rows.append(cells)
+        self._position += 1
+
+    @property
+    def complete(self) -> bool:
+        """Whether later rows can no longer change the kept rows or the truncation flag."""
+        return self._more_rows
+
+    def finish(self) -> "_StreamedSheet":
+        """Drop trailing empty rows, unless a non-empty row follows beyond the kept ones."""
+        if not self._more_rows:
+            while self.rows and all(not cell for cell in self.rows[-1]):
+                self.rows.pop()
+        return self
+
+
+def _stream_ods_sheets(
+    content: IO[bytes],
+    is_selected: Callable[[str], bool],
+    max_rows: int | None,
+    max_cols: int | None,
+    stop_at_frames: bool,
+) -> list[_StreamedSheet] | None:
+    """Read the selected sheets of ``content.xml`` row by row.
+
+    Each row is converted and removed from the tree as soon as it is parsed,
+    so memory is bounded by one row plus the kept rows.
+
+    Parameters
+    ----------
+    content : IO[bytes]
+        The ``content.xml`` stream
+    is_selected : callable
+        Predicate on sheet names
+    max_rows, max_cols : int or None
+        Row and column limits from the options
+    stop_at_frames : bool
+        Give up when a selected sheet contains a drawing frame (image or
+        chart), which only the odfpy path converts
+
+    Returns
+    -------
+    list[_StreamedSheet] or None
+        The selected sheets in document order, or None if a frame was found
+
+    """
+    sheets: list[_StreamedSheet] = []
+    current: _StreamedSheet | None = None
+    open_elements: list[Element] = []
+    table_depth = 0
+    table_count = 0
+    for event, element in iterparse(content, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            if element.tag == _TABLE_TAG:
+                table_depth += 1
+                if table_depth == 1:
+                    table_count += 1
+                    name = element.get(_NAME_ATTR) or f"Sheet{table_count}"
+                    current = _StreamedSheet(name, max_rows, max_cols) if is_selected(name) else None
+            elif element.tag == _FRAME_TAG and current is not None and stop_at_frames:
+                return None
+            continue
+
+        open_elements.pop()
+        if element.tag == _ROW_TAG and table_depth == 1:
+            if current is not None and not current.complete:
+                current.add_row(_ods_row_cells(element, max_cols))
+            # Drop the finished row (and earlier siblings) from the tree.
+            del open_elements[-1][:]
+        elif element.tag == _TABLE_TAG:
+            if table_depth == 1:
+                if current is not None:
+                    sheets.append(current.finish())
+                current = None
+                del open_elements[-1][:]
+            table_depth -= 1
+    return sheets
+
+
 class OdsSpreadsheetToAstConverter(BaseParser):
     """Convert ODS spreadsheet files to AST representation.
 
@@ -241,7 +423,7 @@ class OdsSpreadsheetToAstConverter(BaseParser):
         # Type hint for IDE
         self.options: OdsSpreadsheetOptions = options
 
-    @requires_dependencies("ods", DEPS_ODF)
+    @requires_dependencies("ods", DEPS_ODS)
     def parse(self, input_data: Union[str, Path, IO[bytes], bytes]) -> Document:
         """Parse ODS spreadsheet into an AST.
 
@@ -275,12 +457,71 @@ class OdsSpreadsheetToAstConverter(BaseParser):
             doc_input, input_type = validate_and_convert_input(
                 input_data, supported_types=["path-like", "file-like", "bytes"], require_binary=True
             )
+            if self.options.streaming:
+                streamed = self._read_streamed_sheets(doc_input)
+                if streamed is not None:
+                    return self._streamed_sheets_to_ast(*streamed)
+                if hasattr(doc_input, "seek"):
+                    doc_input.seek(0)
             doc = opendocument.load(doc_input)
         except Exception as e:
             raise MalformedFileError(f"Failed to parse ODS file: {e!r}", original_error=e) from e
 
         return self.ods_to_ast(doc)
 
+    def _read_streamed_sheets(self, doc_input: Any) -> tuple[list[_StreamedSheet], DocumentMetadata] | None:
+        """Read the selected sheets and the metadata straight from the package, without odfpy.
+
+        Parameters
+        ----------
+        doc_input : Any
+            Path or binary stream of the ODS package
+
+        Returns
+        -------
+        tuple[list[_StreamedSheet], DocumentMetadata] or None
+            The sheets and metadata, or None when a selected sheet has images
+            or charts to render, which needs the odfpy document
+
+        """
+        stop_at_frames = self.options.attachment_mode != "skip" or self.options.chart_mode != "skip"
+        with zipfile.ZipFile(doc_input) as archive:
+            with archive.open("content.xml") as content:
+                sheets = _stream_ods_sheets(
+                    content, self._is_sheet_selected, self.options.max_rows, self.options.max_cols, stop_at_frames
+                )
+            if sheets is None:
+                return None
+
+            metadata = DocumentMetadata()
+            try:
+                meta_root = fromstring(archive.read("meta.xml"))
+            except KeyError:
+                meta_root = None
+            if meta_root is not None:
+                for tag, attribute in _META_FIELDS:
+                    element = meta_root.find(f".//{tag}")
+                    if element is not None:
+                        setattr(metadata, attribute, "".join(element.itertext()).strip())
+        return sheets, metadata
+
+    def _streamed_sheets_to_ast(self, sheets: list[_StreamedSheet], metadata: DocumentMetadata) -> Document:
+        """Build the document from sheets read by :meth:`_read_streamed_sheets`."""
+        children: list[Node] = []
+        for sheet in sheets:
+            if self.options.include_sheet_titles:
+                children.append(Heading(level=2, content=[Text(content=sheet.name)]))
+            children.extend(self._sheet_table_nodes(sheet.rows, sheet.truncated))
+        return Document(children=children, metadata=metadata.to_dict())
+
+    def _is_sheet_selected(self, name: str) -> bool:
+        """Return whether the ``sheets`` option selects the sheet called ``name``."""
+        if isinstance(self.options.sheets, list):
+            return name in self.options.sheets
+        if isinstance(self.options.sheets, str):
+            return re.search(self.options.sheets, name) is not None
+        return True
+
     def _select_sheets(self, tables: list[Any], sheet_names: list[str]) -> tuple[list[Any], list[str]]:
         """Select sheets based on options.
 
@@ -297,25 +538,10 @@ class OdsSpreadsheetToAstConverter(BaseParser):
             Tuple of (selected tables, selected names)
 
         """
-        selected_tables = []
-        selected_names = []
-
-        if isinstance(self.options.sheets, list):
-            for i, name in enumerate(sheet_names):
-                if name in self.options.sheets:
-                    selected_tables.append(tables[i])
-                    selected_names.append(name)
-        elif isinstance(self.options.sheets, str):
-            pattern = re.compile(self.options.sheets)
-            for i, name in enumerate(sheet_names):
-                if pattern.search(name):
-                    selected_tables.append(tables[i])
-                    selected_names.append(name)
-        else:
-            selected_tables = tables
-            selected_names = sheet_names
-
-        return selected_tables, selected_names
+        selected = [
+            (table, name) for table, name in zip(tables, sheet_names, strict=False) if self._is_sheet_selected(name)
+        ]
+        return [table for table, _ in selected], [name for _, name in selected]
 
     def _extract_rows_from_table(self, table: Any) -> list[list[str]]:
         """Extract raw row data from ODF table.
@@ -437,6 +663,39 @@ class OdsSpreadsheetToAstConverter(BaseParser):
 
         return header, data_rows
 
+    def _sheet_table_nodes(self, raw_rows: list[list[str]], truncated: bool) -> list[Node]:
+        """Build a sheet's table and truncation note, or nothing when it has no rows.
+
+        Parameters
+        ----------
+        raw_rows : list[list[str]]
+            Raw row data from the sheet
+        truncated : bool
+            Whether rows or columns were cut by ``max_rows``/``max_cols``
+
+        Returns
+        -------
+        list[Node]
+            The table, followed by the truncation indicator if needed
+
+        """
+        if not raw_rows:
+            return []
+
+        # Process header and data
+        header, data_rows = self._process_sheet_data(raw_rows)
+        if not header:
+            return []
+
+        # Build table
+        alignments: list[Alignment] = cast(list[Alignment], ["center"] * len(header))
+        nodes: list[Node] = [build_table_ast(header, data_rows, alignments)]
+
+        # Add truncation indicator if needed
+        if truncated:
+            nodes.append(Paragraph(content=[HTMLInline(content=f"*{self.options.truncation_indicator}*")]))
+        return nodes
+
     def ods_to_ast(self, doc: Any) -> Document:
         """Convert ODS document to AST Document.
 
@@ -493,25 +752,13 @@ class OdsSpreadsheetToAstConverter(BaseParser):
 
             # Extract rows
             raw_rows = self._extract_rows_from_table(table)
-            if not raw_rows:
-                continue
-
-            # Process header and data
-            header, data_rows = self._process_sheet_data(raw_rows)
-            if not header:
-                continue
-
-            # Build table
-            alignments: list[Alignment] = cast(list[Alignment], ["center"] * len(header))
-            table_node = build_table_ast(header, data_rows, alignments)
-            children.append(table_node)
-
-            # Add truncation indicator if needed
             truncated = (self.options.max_rows is not None and len(raw_rows) - 1 > self.options.max_rows) or (
                 self.options.max_cols is not None and any(len(row) > self.options.max_cols for row in raw_rows)
             )
-            if truncated:
-                children.append(Paragraph(content=[HTMLInline(content=f"*{self.options.truncation_indicator}*")]))
+            table_nodes = self._sheet_table_nodes(raw_rows, truncated)
+            if not table_nodes:
+                continue
+            children.extend(table_nodes)
 
             # Extract images from table
             table_images, table_footnotes = _extract_ods_images(
@@ -589,11 +836,12 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),
     ],
+    zip_mimetypes=["application/vnd.oasis.opendocument.spreadsheet"],
     parser_class=OdsSpreadsheetToAstConverter,
     renderer_class=None,
-    parser_required_packages=[("odfpy", "odf", "")],
+    parser_required_packages=[("odfpy", "odf", ""), ("defusedxml", "defusedxml", "")],
     renderer_required_packages=[],
-    import_error_message="ODS conversion requires 'odfpy'. Install with: pip install odfpy",
+    import_error_message="ODS conversion requires 'odfpy' and 'defusedxml'. Install with: pip install all2md[odf]",
     parser_options_class=OdsSpreadsheetOptions,
     renderer_options_class=None,
     description="Convert OpenDocument Spreadsheet files to Markdown tables",
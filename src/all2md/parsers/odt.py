@@ -647,6 +647,7 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),
     ],
+    zip_mimetypes=["application/vnd.oasis.opendocument.text"],
     parser_class=OdtToAstConverter,
     renderer_class="OdtRenderer",
     parser_required_packages=[("odfpy", "odf", "")],
@@ -11,6 +11,7 @@ enabling multiple rendering strategies and improved testability.
 
 from __future__ import annotations
 
+import copy
 import logging
 import re
 import unicodedata
@@ -26,8 +27,10 @@ if TYPE_CHECKING:
     import pymupdf
 
     from all2md.parsers._ocr import OcrParagraph
+    from all2md.parsers._ocr.prefetch import OcrPrefetcher
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 
 from all2md.ast import (
@@ -93,6 +96,7 @@ from all2md.parsers._pdf_ocr import (
 from all2md.parsers._pdf_ocr import (
     should_use_ocr as _should_use_ocr,
 )
+from all2md.parsers._pdf_page_cache import document_key, get_active_page_cache
 from all2md.parsers._pdf_tables import (
     MAX_DOT_LEADER_CELL_RATIO,
     MAX_EXTRACT_LOSS_SHARE,
@@ -130,7 +134,7 @@ from all2md.parsers._pdf_text import (
     inline_has_text,
 )
 from all2md.parsers.base import BaseParser
-from all2md.progress import ProgressCallback
+from all2md.progress import ProgressCallback, ProgressEvent
 from all2md.utils.decorators import requires_dependencies
 from all2md.utils.encoding import normalize_stream_to_bytes
 from all2md.utils.inputs import validate_and_convert_input, validate_page_range
@@ -656,6 +660,22 @@ class _BlockProcessingState:
         self.pending_rotated_key = None
 
 
+@dataclass
+class _PageResult:
+    """One page processed by a page-parallel worker, with its side effects.
+
+    A serial run accumulates these on the parser instance as it goes; a worker
+    ships them back so the parent can merge them in page order.
+    """
+
+    nodes: list[Node]
+    attachment_footnotes: dict[str, str]
+    degraded_events: list[Any]
+    ocr_pages_applied: int
+    tables_rejected: int
+    progress_events: list[ProgressEvent]
+
+
 def _check_pymupdf_version() -> None:
     """Check that PyMuPDF version meets minimum requirements.
 
@@ -746,12 +766,18 @@ class PdfToAstConverter(BaseParser):
         self._hdr_identifier: Optional[IdentifyHeaders] = None
         self._attachment_footnotes: dict[str, str] = {}  # label -> content for footnote definitions
         self._ocr_pages_applied: int = 0  # pages OCR was applied to in the current parse
+        self._ocr_prefetcher: OcrPrefetcher | None = None  # set while the serial page loop runs
         self._use_layout: bool = False
         # Most recent heading level emitted (any path). Used by
         # `_handle_header_line_with_layout` to pick a sibling-or-deeper level
         # when the layout model says section-header but the font heuristic
         # has nothing to anchor against.
         self._last_heading_level: int = 0
+        # Path or bytes a page-parallel worker can reopen the document from; None when
+        # the caller handed in a live pymupdf.Document, which cannot cross a process.
+        self._page_source: str | bytes | None = None
+        # Identity of ``_page_source`` in page-stage cache keys, computed on first use.
+        self._page_cache_document: tuple | None = None
 
     @requires_dependencies("pdf", DEPS_PDF)
     def parse(self, input_data: Union[str, Path, IO[bytes], bytes]) -> Document:
@@ -796,13 +822,17 @@ class PdfToAstConverter(BaseParser):
         )
 
         # Open document based on input type
+        self._page_source = None
+        self._page_cache_document = None
         try:
             if input_type == "path":
                 doc = pymupdf.open(filename=str(doc_input))
+                self._page_source = str(doc_input)
             elif input_type in ("file", "bytes"):
                 # PyMuPDF expects bytes, not file-like objects
                 stream_bytes = normalize_stream_to_bytes(doc_input)
                 doc = pymupdf.open(stream=stream_bytes, filetype="pdf")
+                self._page_source = stream_bytes
             elif input_type == "object":
                 if isinstance(doc_input, pymupdf.Document) or (
                     hasattr(doc_input, "page_count") and hasattr(doc_input, "__getitem__")
@@ -1305,8 +1335,12 @@ class PdfToAstConverter(BaseParser):
         """Process each page to AST nodes, inserting page separators between pages.
 
         Extracted from ``parse`` so the document-level OCR safety net can re-run
-        the whole page loop with OCR forced.
+        the whole page loop with OCR forced. Dispatches to
+        :meth:`_render_pages_parallel` when page-parallel processing is enabled.
         """
+        if self._should_use_parallel_processing(len(pages_list)):
+            return self._render_pages_parallel(pages_list, base_filename, total_pages)
+
         children: list[Node] = []
         # Suppress pymupdf-layout's global find_tables() hook for the whole
         # page loop. We call predict_page_layout() explicitly inside
@@ -1314,22 +1348,19 @@ class PdfToAstConverter(BaseParser):
         # implicit hook would additionally reroute find_tables()/Table.extract()
         # through the layout model, overdetecting tables and garbling cell text.
         # See native_find_tables() for the full rationale.
-        with native_find_tables():
+        with native_find_tables(), self._prefetch_ocr(doc, pages_list) as prefetcher:
             for idx, pno in enumerate(pages_list):
                 try:
+                    if prefetcher is not None:
+                        prefetcher.advance(idx)
                     page = doc[pno]
                     page_nodes = self._process_page_to_ast(page, pno, base_filename, attachment_sequencer, total_pages)
                     if page_nodes:
                         children.extend(page_nodes)
 
                     # Add page separator between pages (but not after the last page)
-                    if idx < len(pages_list) - 1 and self.options.include_page_numbers:
-                        # Add page separator as Comment node - renderers decide whether to display it
-                        # Format using page_separator_template with placeholders
-                        separator_text = self.options.page_separator_template.format(
-                            page_num=pno + 1, total_pages=total_pages
-                        )
-                        children.append(Comment(content=separator_text, metadata={"comment_type": "page_separator"}))
+                    if idx < len(pages_list) - 1:
+                        self._append_page_separator(children, pno, total_pages)
 
                     # Emit page done event
                     self._emit_progress(
@@ -1355,6 +1386,125 @@ class PdfToAstConverter(BaseParser):
                     raise
         return children
 
+    @contextmanager
+    def _prefetch_ocr(self, doc: "pymupdf.Document", pages_list: list[int]) -> Iterator["OcrPrefetcher | None"]:
+        """Run OCR ahead of the page loop on ``options.ocr.workers`` threads, if any.
+
+        Yields None, and leaves OCR inline, when OCR is off or no workers are set.
+        """
+        ocr_opts = self.options.ocr
+        if not ocr_opts.workers or not ocr_opts.enabled or ocr_opts.mode == "off":
+            yield None
+            return
+
+        from all2md.parsers._ocr.prefetch import OcrPrefetcher
+
+        with OcrPrefetcher(doc, pages_list, self.options) as prefetcher:
+            self._ocr_prefetcher = prefetcher
+            try:
+                yield prefetcher
+            finally:
+                self._ocr_prefetcher = None
+
+    def _append_page_separator(self, children: list[Node], pno: int, total_pages: int) -> None:
+        """Append the separator that follows page ``pno`` when page numbers are enabled."""
+        if not self.options.include_page_numbers:
+            return
+        # Add page separator as Comment node - renderers decide whether to display it
+        # Format using page_separator_template with placeholders
+        separator_text = self.options.page_separator_template.format(page_num=pno + 1, total_pages=total_pages)
+        children.append(Comment(content=separator_text, metadata={"comment_type": "page_separator"}))
+
+    def _should_use_parallel_processing(self, page_count: int) -> bool:
+        """Check whether the page loop should be split across a process pool.
+
+        Page-parallel parsing needs a source a worker can reopen (a path or the
+        raw bytes) and pages that can be processed independently. The layout
+        heading path reads the previous page's last heading level, so layout
+        analysis keeps the serial loop rather than trade exactness for speed.
+        """
+        if not self.options.enable_parallel_processing or page_count < self.options.parallel_threshold:
+            return False
+        if self._page_source is None:
+            logger.debug("Page-parallel parsing needs a path or bytes input; processing pages serially")
+            return False
+        if self._use_layout:
+            logger.debug("Layout analysis carries heading state across pages; processing pages serially")
+            return False
+        return True
+
+    def _render_pages_parallel(self, pages_list: list[int], base_filename: str, total_pages: int) -> list[Node]:
+        """Process pages in a process pool and stitch the results back in page order.
+
+        Each worker opens its own PyMuPDF handle once (see :func:`_init_page_worker`)
+        and runs :meth:`_process_page_to_ast` on whole pages. The per-page side
+        effects a serial run accumulates on ``self`` -- attachment footnotes,
+        degraded events, OCR and rejected-table counts -- travel back with each
+        page and are merged in page order, so the confidence signals and the
+        document match serial mode exactly. Progress events are emitted as pages
+        complete; a worker's own events (table detection) are replayed first.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        logger.info("Using page-parallel processing for %d pages", len(pages_list))
+
+        results: dict[int, _PageResult] = {}
+        # _should_use_parallel_processing only returns True once a source the workers can reopen is known
+        source = self._page_source
+        assert source is not None
+        init_args = (source, self.options, self._hdr_identifier, base_filename, total_pages)
+        with ProcessPoolExecutor(
+            max_workers=self.options.max_workers, initializer=_init_page_worker, initargs=init_args
+        ) as executor:
+            future_to_index = {executor.submit(_process_page_worker, pno): idx for idx, pno in enumerate(pages_list)}
+            completed_count = 0
+            for future in as_completed(future_to_index):
+                idx = future_to_index[future]
+                pno = pages_list[idx]
+                completed_count += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    for pending in future_to_index:
+                        pending.cancel()
+                    self._emit_progress(
+                        "error",
+                        f"Error processing page {pno + 1}: {str(e)}",
+                        current=completed_count,
+                        total=total_pages,
+                        error=str(e),
+                        stage="page_processing",
+                        page=pno + 1,
+                    )
+                    raise
+                results[idx] = result
+
+                if self.progress_callback:
+                    for event in result.progress_events:
+                        self._emit_progress(
+                            event.event_type, event.message, event.current, event.total, **event.metadata
+                        )
+                self._emit_progress(
+                    "item_done",
+                    f"Page {pno + 1} of {total_pages} processed",
+                    current=completed_count,
+                    total=total_pages,
+                    item_type="page",
+                    page=pno + 1,
+                )
+
+        children: list[Node] = []
+        for idx, pno in enumerate(pages_list):
+            result = results[idx]
+            children.extend(result.nodes)
+            self._attachment_footnotes.update(result.attachment_footnotes)
+            self._degraded_events.extend(result.degraded_events)
+            self._ocr_pages_applied += result.ocr_pages_applied
+            self._tables_rejected += result.tables_rejected
+            if idx < len(pages_list) - 1:
+                self._append_page_separator(children, pno, total_pages)
+        return children
+
     @staticmethod
     def _count_meaningful_chars(children: list[Node]) -> int:
         """Count alphanumeric characters across content nodes (ignoring separators)."""
@@ -1535,6 +1685,45 @@ class PdfToAstConverter(BaseParser):
             blocks.append({"type": 0, "bbox": paragraph.bbox, "lines": lines, "_engine_segmented": True})
         return blocks
 
+    def _cached_page_stage(
+        self,
+        page_num: int,
+        stage: tuple[Any, ...],
+        compute: Callable[[], Any],
+        clone: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Run one option-independent page stage through the active page-stage cache.
+
+        ``stage`` names the stage plus every parameter its output depends on. Outside
+        a :func:`~all2md.parsers._pdf_page_cache.use_page_cache` block, or for a live
+        ``pymupdf.Document`` input that has no stable identity, this is just
+        ``compute()``.
+        """
+        cache = get_active_page_cache()
+        if cache is None or self._page_source is None:
+            return compute()
+        if self._page_cache_document is None:
+            self._page_cache_document = document_key(self._page_source)
+        return cache.get_or_compute((self._page_cache_document, page_num, *stage), compute, copy=clone)
+
+    def _find_tables(self, page: "pymupdf.Page", page_num: int) -> Any:
+        """Return ``page.find_tables()``, shared across parses while a page-stage cache is active.
+
+        Safe to share because nothing downstream mutates the finder or its tables, and
+        each table snapshots the characters it reads from when it is built.
+        """
+        return self._cached_page_stage(page_num, ("find_tables",), page.find_tables)
+
+    def _ruling_line_tables(self, page: "pymupdf.Page", page_num: int) -> tuple[list[Any], list[Any]]:
+        """Return :func:`detect_tables_by_ruling_lines` output for the configured threshold."""
+        threshold = self.options.table_ruling_line_threshold
+        return self._cached_page_stage(
+            page_num,
+            ("ruling_lines", threshold),
+            lambda: detect_tables_by_ruling_lines(page, threshold),
+            clone=copy.deepcopy,
+        )
+
     def _detect_page_tables(
         self, page: "pymupdf.Page", page_num: int, total_pages: int
     ) -> tuple[list[dict], list[Any], list[Any]]:
@@ -1572,11 +1761,9 @@ class PdfToAstConverter(BaseParser):
         if mode == "none":
             tabs = EmptyTables()
         elif mode == "pymupdf":
-            tabs = page.find_tables()
+            tabs = self._find_tables(page, page_num)
         elif mode == "ruling":
-            fallback_table_rects, fallback_table_lines = detect_tables_by_ruling_lines(
-                page, self.options.table_ruling_line_threshold
-            )
+            fallback_table_rects, fallback_table_lines = self._ruling_line_tables(page, page_num)
             tabs = EmptyTables()
         else:
             # Default ("both"): gate ``find_tables()`` behind a cheap drawings
@@ -1585,12 +1772,10 @@ class PdfToAstConverter(BaseParser):
             # decorative frames that our guards then have to reject. Skip it
             # when there's no ruling-line evidence; the ruling-line fallback
             # would also find nothing on those pages.
-            if page_has_table_signals(page):
-                tabs = page.find_tables()
+            if self._cached_page_stage(page_num, ("table_signals",), lambda: page_has_table_signals(page)):
+                tabs = self._find_tables(page, page_num)
                 if self.options.enable_table_fallback_detection and not tabs.tables:
-                    fallback_table_rects, fallback_table_lines = detect_tables_by_ruling_lines(
-                        page, self.options.table_ruling_line_threshold
-                    )
+                    fallback_table_rects, fallback_table_lines = self._ruling_line_tables(page, page_num)
             else:
                 tabs = EmptyTables()
 
@@ -1665,7 +1850,12 @@ class PdfToAstConverter(BaseParser):
             # table-region filtering, block segmentation -- to re-derive structure from
             # geometry that no longer exists, so an OCR'd page projected as a single
             # page-sized block no matter what was on it.
-            paragraphs = self._ocr_page_to_layout(page, self.options)
+            # A page recognized ahead of the loop (see _prefetch_ocr) skips both calls.
+            prefetched = self._ocr_prefetcher.take(page.number) if self._ocr_prefetcher is not None else None
+            if prefetched is not None:
+                paragraphs = prefetched.paragraphs
+            else:
+                paragraphs = self._ocr_page_to_layout(page, self.options)
             if paragraphs:
                 ocr_blocks = self._blocks_from_ocr_layout(paragraphs)
                 if self.options.merge_hyphenated_words:
@@ -1678,7 +1868,10 @@ class PdfToAstConverter(BaseParser):
                 logger.debug(f"Replacing PyMuPDF text with {len(ocr_blocks)} OCR block(s)")
                 return ocr_blocks, True
 
-            ocr_text = self._ocr_page_to_text(page, self.options)
+            if prefetched is not None and prefetched.text is not None:
+                ocr_text = prefetched.text
+            else:
+                ocr_text = self._ocr_page_to_text(page, self.options)
 
             if not ocr_text.strip():
                 logger.warning("OCR returned empty text, keeping original extraction")
@@ -2268,7 +2461,13 @@ class PdfToAstConverter(BaseParser):
         # success, and if every page tripped it the document-level OCR safety net saw an
         # empty document and could re-run a perfectly good text PDF through OCR.
         try:
-            all_blocks = page.get_text("dict", flags=pymupdf.TEXTFLAGS_TEXT, sort=False)["blocks"]
+            # Copied out of the cache: dehyphenation and layout annotation edit blocks in place.
+            all_blocks = self._cached_page_stage(
+                page_num,
+                ("text_dict",),
+                lambda: page.get_text("dict", flags=pymupdf.TEXTFLAGS_TEXT, sort=False)["blocks"],
+                clone=copy.deepcopy,
+            )
         except Exception as e:
             logger.warning(
                 "Text extraction failed on page %d (%s); the page is dropped from the output.", page_num + 1, e
@@ -2294,7 +2493,10 @@ class PdfToAstConverter(BaseParser):
         layout: PageLayoutPredictions | None = None
         if self._use_layout:
             try:
-                raw_predictions = predict_page_layout(page, self.options.layout_feature_set)
+                feature_set = self.options.layout_feature_set
+                raw_predictions = self._cached_page_stage(
+                    page_num, ("layout", feature_set), lambda: predict_page_layout(page, feature_set), clone=list
+                )
                 layout = match_predictions_to_blocks(raw_predictions, all_blocks, self.options.layout_iou_threshold)
                 annotate_blocks_with_layout(all_blocks, layout)
                 # Also label individual lines. A block-level label is only available when
@@ -4951,6 +5153,101 @@ class PdfToAstConverter(BaseParser):
         return result
 
 
+#: Per-process state for page-parallel workers, filled once by :func:`_init_page_worker`
+#: so each worker opens the document a single time rather than once per page.
+_PAGE_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_page_worker(
+    source: str | bytes,
+    options: PdfOptions,
+    hdr_identifier: IdentifyHeaders | None,
+    base_filename: str,
+    total_pages: int,
+) -> None:
+    """Open the document and build a page-processing parser in a pool worker.
+
+    This function is defined at module level to be picklable for multiprocessing.
+
+    Parameters
+    ----------
+    source : str or bytes
+        Path to the PDF, or its raw bytes
+    options : PdfOptions
+        The parent's effective options (after header/footer zone detection)
+    hdr_identifier : IdentifyHeaders or None
+        The parent's font-size analysis, shared so every page classifies
+        headings against the same document-wide distribution
+    base_filename : str
+        Base filename for attachments
+    total_pages : int
+        Total number of pages being processed
+
+    """
+    import pymupdf
+
+    if isinstance(source, bytes):
+        doc = pymupdf.open(stream=source, filetype="pdf")
+    else:
+        doc = pymupdf.open(filename=source)
+    if doc.is_encrypted and options.password:
+        doc.authenticate(options.password)
+
+    parser = PdfToAstConverter(options)
+    parser._hdr_identifier = hdr_identifier
+    _PAGE_WORKER_STATE.update(
+        doc=doc,
+        parser=parser,
+        base_filename=base_filename,
+        total_pages=total_pages,
+        attachment_sequencer=create_attachment_sequencer(),
+    )
+
+
+def _process_page_worker(page_num: int) -> _PageResult:
+    """Process one page in a pool worker initialized by :func:`_init_page_worker`.
+
+    This function is defined at module level to be picklable for multiprocessing.
+
+    Parameters
+    ----------
+    page_num : int
+        Page number (0-based)
+
+    Returns
+    -------
+    _PageResult
+        The page's AST nodes and the per-page side effects the parent merges
+
+    """
+    state = _PAGE_WORKER_STATE
+    parser: PdfToAstConverter = state["parser"]
+    progress_events: list[ProgressEvent] = []
+    parser.progress_callback = progress_events.append
+    parser._attachment_footnotes = {}
+    parser._degraded_events = []
+    parser._ocr_pages_applied = 0
+    parser._tables_rejected = 0
+
+    with native_find_tables():
+        nodes = parser._process_page_to_ast(
+            state["doc"][page_num],
+            page_num,
+            state["base_filename"],
+            state["attachment_sequencer"],
+            state["total_pages"],
+        )
+
+    return _PageResult(
+        nodes=nodes,
+        attachment_footnotes=parser._attachment_footnotes,
+        degraded_events=parser._degraded_events,
+        ocr_pages_applied=parser._ocr_pages_applied,
+        tables_rejected=parser._tables_rejected,
+        progress_events=progress_events,
+    )
+
+
 # Converter metadata for registration
 CONVERTER_METADATA = ConverterMetadata(
     format_name="pdf",
@@ -1456,6 +1456,7 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),  # ZIP signature
     ],
+    zip_members=["ppt/presentation.xml"],
     parser_class=PptxToAstConverter,
     renderer_class="all2md.renderers.pptx.PptxRenderer",
     parser_required_packages=[("python-pptx", "pptx", "")],
@@ -11,7 +11,10 @@ It replaces the combined spreadsheet parser with a focused Excel parser.
 from __future__ import annotations
 
 import logging
+import posixpath
 import re
+import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import IO, Any, Iterable, Optional, Union, cast
 
@@ -64,7 +67,11 @@ def _cell_hyperlink_url(cell: Any) -> Optional[str]:
         if the cell has no hyperlink.
 
     """
-    hyperlink = getattr(cell, "hyperlink", None)
+    return _hyperlink_url(getattr(cell, "hyperlink", None))
+
+
+def _hyperlink_url(hyperlink: Any) -> Optional[str]:
+    """Return the URL of an openpyxl ``Hyperlink`` (or :class:`_CellLink`), if any."""
     if not hyperlink:
         return None
     if getattr(hyperlink, "target", None):
@@ -232,24 +239,185 @@ def _map_merged_cells(sheet: Any) -> dict[str, str]:
         Mapping of cell coordinates to master cell coordinates
 
     """
-    merged_map: dict[str, str] = {}
     try:
         ranges = getattr(sheet, "merged_cells", None)
         if not ranges or not getattr(ranges, "ranges", None):
-            return merged_map
-
-        for mcr in ranges.ranges:
-            min_r, min_c, max_r, max_c = mcr.min_row, mcr.min_col, mcr.max_row, mcr.max_col
-            master = sheet.cell(row=min_r, column=min_c).coordinate
-            for rr in range(min_r, max_r + 1):
-                for cc in range(min_c, max_c + 1):
-                    coord = sheet.cell(row=rr, column=cc).coordinate
-                    merged_map[coord] = master
+            return {}
+        return _merged_map_from_bounds((mcr.min_col, mcr.min_row, mcr.max_col, mcr.max_row) for mcr in ranges.ranges)
     except Exception as e:
         logger.debug(f"Unable to compute merged cell map: {e!r}")
+        return {}
+
+
+def _merged_map_from_bounds(bounds: Iterable[tuple[int, int, int, int]]) -> dict[str, str]:
+    """Map every cell coordinate inside merged ranges to its range's master coordinate.
+
+    Parameters
+    ----------
+    bounds : Iterable[tuple[int, int, int, int]]
+        ``(min_col, min_row, max_col, max_row)`` of each merged range, as
+        returned by ``openpyxl.utils.cell.range_boundaries``
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of cell coordinates to master cell coordinates
+
+    """
+    merged_map: dict[str, str] = {}
+    for min_c, min_r, max_c, max_r in bounds:
+        master = f"{_column_letter(min_c)}{min_r}"
+        for cc in range(min_c, max_c + 1):
+            letter = _column_letter(cc)
+            for rr in range(min_r, max_r + 1):
+                merged_map[f"{letter}{rr}"] = master
     return merged_map
 
 
+# Merged ranges, hyperlinks and drawings all follow ``<sheetData>`` in a
+# worksheet part, so finding its end is enough to reach them.
+_SHEET_DATA_END = re.compile(rb"</(?:[\w.-]+:)?sheetData\s*>|<(?:[\w.-]+:)?sheetData\s*/>")
+_WORKSHEET_START = re.compile(rb"<(?:[\w.-]+:)?worksheet\b[^>]*>")
+_SCAN_CHUNK_BYTES = 1024 * 1024
+# Enough to hold a closing tag split across two chunks.
+_SCAN_OVERLAP_BYTES = 64
+
+
+@dataclass(frozen=True)
+class _CellLink:
+    """Hyperlink read from a worksheet part (the fields of openpyxl's ``Hyperlink`` that are used)."""
+
+    target: Optional[str] = None
+    location: Optional[str] = None
+
+
+@dataclass
+class _SheetTail:
+    """What openpyxl's read-only mode leaves out of a worksheet.
+
+    Parameters
+    ----------
+    merged_map : dict[str, str]
+        Cell coordinate -> master coordinate for every merged cell
+    links : dict[str, _CellLink]
+        Cell coordinate -> hyperlink, bound the way full mode binds them
+    has_drawing : bool
+        Whether the sheet has a drawing (images or charts)
+
+    """
+
+    merged_map: dict[str, str] = field(default_factory=dict)
+    links: dict[str, _CellLink] = field(default_factory=dict)
+    has_drawing: bool = False
+
+
+def _local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix from an ElementTree tag or attribute name."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _read_sheet_rels(archive: zipfile.ZipFile, worksheet_path: str) -> dict[str, str]:
+    """Return relationship id -> target for a worksheet part."""
+    from openpyxl.xml.functions import fromstring
+
+    rels_path = posixpath.join(posixpath.dirname(worksheet_path), "_rels", posixpath.basename(worksheet_path) + ".rels")
+    try:
+        root = fromstring(archive.read(rels_path))
+    except KeyError:
+        return {}
+    return {rel.get("Id", ""): rel.get("Target", "") for rel in root if _local_name(rel.tag) == "Relationship"}
+
+
+def _scan_sheet_tail(archive: zipfile.ZipFile, worksheet_path: str) -> _SheetTail | None:
+    """Read merged ranges, hyperlinks and the drawing flag of a worksheet without parsing its cells.
+
+    The part is decompressed in chunks and only searched for the end of
+    ``<sheetData>``; the short remainder is then parsed together with the
+    root start tag, which carries the namespace declarations. Memory stays at
+    one chunk however large the sheet is.
+
+    Parameters
+    ----------
+    archive : zipfile.ZipFile
+        The open workbook package
+    worksheet_path : str
+        Path of the worksheet part inside the package
+
+    Returns
+    -------
+    _SheetTail or None
+        The sheet's extras, or None if the part could not be scanned (the
+        caller then loads the workbook in full mode)
+
+    """
+    from openpyxl.utils.cell import range_boundaries
+    from openpyxl.xml.functions import fromstring
+
+    start_tag: bytes | None = None
+    tail: bytes | None = None
+    window = b""
+    with archive.open(worksheet_path) as source:
+        while chunk := source.read(_SCAN_CHUNK_BYTES):
+            window += chunk
+            if start_tag is None:
+                start = _WORKSHEET_START.search(window)
+                if start is None:
+                    return None
+                start_tag = start.group(0)
+            end = _SHEET_DATA_END.search(window)
+            if end is not None:
+                tail = window[end.end() :] + source.read()
+                break
+            window = window[-_SCAN_OVERLAP_BYTES:]
+    if start_tag is None or tail is None:
+        return None
+
+    try:
+        root = fromstring(start_tag + tail)
+    except Exception as e:
+        logger.debug(f"Unable to parse the end of worksheet {worksheet_path}: {e!r}")
+        return None
+
+    merged_bounds: list[tuple[int, int, int, int]] = []
+    raw_links: list[tuple[str, Optional[str], Optional[str]]] = []
+    sheet_tail = _SheetTail()
+    for element in root:
+        name = _local_name(element.tag)
+        if name == "mergeCells":
+            merged_bounds.extend(range_boundaries(m.get("ref")) for m in element if m.get("ref"))
+        elif name == "hyperlinks":
+            for link in element:
+                rel_id = next((v for k, v in link.attrib.items() if k.endswith("}id")), None)
+                if link.get("ref"):
+                    raw_links.append((link.get("ref", ""), rel_id, link.get("location")))
+        elif name == "drawing":
+            sheet_tail.has_drawing = True
+
+    sheet_tail.merged_map = _merged_map_from_bounds(merged_bounds)
+    rels = _read_sheet_rels(archive, worksheet_path) if any(rel_id for _, rel_id, _ in raw_links) else {}
+    for ref, rel_id, location in raw_links:
+        link = _CellLink(target=rels.get(rel_id) if rel_id else None, location=location)
+        if ":" in ref:
+            # Full mode copies a range link onto each cell of the range except merged followers.
+            min_c, min_r, max_c, max_r = range_boundaries(ref)
+            for rr in range(min_r, max_r + 1):
+                for cc in range(min_c, max_c + 1):
+                    coord = f"{_column_letter(cc)}{rr}"
+                    if sheet_tail.merged_map.get(coord, coord) == coord:
+                        sheet_tail.links[coord] = link
+        else:
+            # A link on a merged follower belongs to the range's master cell.
+            sheet_tail.links[sheet_tail.merged_map.get(ref, ref)] = link
+    return sheet_tail
+
+
+def _column_letter(column: int) -> str:
+    """Return the column letter for a 1-based column index."""
+    from openpyxl.utils import get_column_letter
+
+    return cast(str, get_column_letter(column))
+
+
 def _get_merged_cell_spans(sheet: Any) -> dict[str, tuple[int, int]]:
     """Return a map of master cell coordinates to (colspan, rowspan) tuples.
 
@@ -559,12 +727,58 @@ class XlsxToAstConverter(BaseParser):
             doc_input, input_type = validate_and_convert_input(
                 input_data, supported_types=["path-like", "file-like", "bytes"], require_binary=True
             )
+            if self.options.streaming:
+                wb = openpyxl.load_workbook(doc_input, read_only=True, data_only=self.options.render_formulas)
+        except Exception as e:
+            raise MalformedFileError(f"Failed to parse XLSX file: {e!r}", original_error=e) from e
+
+        if self.options.streaming:
+            # Read-only mode has no drawings; a sheet whose images or charts would be
+            # rendered (or that could not be scanned) sends the workbook to full mode.
+            try:
+                tails = self._scan_read_only_sheets(wb)
+                renders_drawings = self.options.attachment_mode != "skip" or self.options.chart_mode != "skip"
+                if all(tail is not None and not (tail.has_drawing and renders_drawings) for tail in tails.values()):
+                    return self._workbook_to_ast(wb, cast(dict[str, _SheetTail], tails))
+            finally:
+                wb.close()
+            if hasattr(doc_input, "seek"):
+                doc_input.seek(0)
+
+        try:
             wb = openpyxl.load_workbook(doc_input, data_only=self.options.render_formulas)
         except Exception as e:
             raise MalformedFileError(f"Failed to parse XLSX file: {e!r}", original_error=e) from e
 
         return self.xlsx_to_ast(wb)
 
+    def _scan_read_only_sheets(self, workbook: Any) -> dict[str, _SheetTail | None]:
+        """Read merged ranges, hyperlinks and drawing flags of the selected sheets of a read-only workbook.
+
+        Parameters
+        ----------
+        workbook : Any
+            Openpyxl workbook opened with ``read_only=True``
+
+        Returns
+        -------
+        dict[str, _SheetTail or None]
+            Sheet name -> its extras, or None for a sheet that could not be
+            scanned (e.g. a chartsheet)
+
+        """
+        tails: dict[str, _SheetTail | None] = {}
+        for name in self._select_sheet_names(workbook):
+            try:
+                # NOTE: Using private API (workbook._archive, sheet._worksheet_path) because
+                # read-only workbooks expose neither the package nor the part of a sheet.
+                # Compatible with openpyxl>=3.1.5.
+                tails[name] = _scan_sheet_tail(workbook._archive, workbook[name]._worksheet_path)
+            except Exception as e:
+                logger.debug(f"Unable to scan sheet {name!r} for merged cells and hyperlinks: {e!r}")
+                tails[name] = None
+        return tails
+
     def _select_sheet_names(self, workbook: Any) -> list[str]:
         """Select sheet names based on options.
 
@@ -651,11 +865,79 @@ class XlsxToAstConverter(BaseParser):
             alignments = cast(list[Alignment], ["center"] * num_cols)
         return alignments
 
+    def _stream_sheet_cells(self, sheet: Any, tail: _SheetTail) -> tuple[list[list[tuple[str, Optional[str]]]], bool]:
+        """Convert a read-only worksheet to (text, hyperlink_url) rows one row at a time.
+
+        Cell objects are dropped as soon as their row is converted, and
+        reading stops at ``max_rows``, so only the converted text is ever held.
+        Merged followers and hyperlinks come from ``tail`` and are applied the
+        way :meth:`_convert_rows_to_cells` applies them in full mode.
+
+        Parameters
+        ----------
+        sheet : Any
+            Openpyxl read-only worksheet
+        tail : _SheetTail
+            The sheet's merged ranges and hyperlinks
+
+        Returns
+        -------
+        tuple[list[list[tuple[str, str | None]]], bool]
+            Rows padded to a common width, and whether rows or columns were
+            truncated
+
+        """
+        max_rows, max_cols = self.options.max_rows, self.options.max_cols
+        merged_map = tail.merged_map if self.options.merged_cell_mode == "flatten" else {}
+        links = tail.links
+        needs_coordinates = bool(merged_map or links)
+        preserve_newlines = self.options.preserve_newlines_in_cells
+
+        cell_rows: list[list[tuple[str, Optional[str]]]] = []
+        more_rows = False
+        wider = False
+        width = 0
+        for r_idx, row in enumerate(sheet.iter_rows(values_only=False), start=1):
+            if max_rows is not None and r_idx > max_rows:
+                more_rows = True
+                break
+            if max_cols is not None and len(row) > max_cols:
+                wider = True
+                row = row[:max_cols]
+            out: list[tuple[str, Optional[str]]] = []
+            for c_idx, cell in enumerate(row, start=1):
+                link: _CellLink | None = None
+                if needs_coordinates:
+                    coord = f"{_column_letter(c_idx)}{r_idx}"
+                    if merged_map.get(coord, coord) != coord:
+                        out.append(("", None))
+                        continue
+                    link = links.get(coord)
+                value = cell.value
+                if value is None and link is not None:
+                    # Full mode shows the link target in an otherwise empty linked cell.
+                    value = link.target or link.location
+                out.append((sanitize_cell_text(value, preserve_newlines), _hyperlink_url(link)))
+            width = max(width, len(out))
+            cell_rows.append(out)
+
+        # Without a declared dimension, read-only rows end at their last cell.
+        for out in cell_rows:
+            out.extend([("", None)] * (width - len(out)))
+
+        # Prefer the declared dimension, as full mode does; fall back to what was read.
+        truncated_rows = max_rows is not None and (sheet.max_row > max_rows if sheet.max_row is not None else more_rows)
+        truncated_cols = max_cols is not None and (
+            sheet.max_column > max_cols if sheet.max_column is not None else wider
+        )
+        return cell_rows, truncated_rows or truncated_cols
+
     def _process_sheet(
         self,
         sheet: Any,
         base_filename: str,
         attachment_sequencer: Any,
+        tail: _SheetTail | None = None,
     ) -> list[Node]:
         """Process a single sheet into AST nodes.
 
@@ -667,6 +949,9 @@ class XlsxToAstConverter(BaseParser):
             Base filename for attachments
         attachment_sequencer : callable
             Sequencer for unique attachment filenames
+        tail : _SheetTail, optional
+            Merged ranges and hyperlinks of a read-only worksheet, which is
+            then streamed; None for a worksheet loaded in full mode
 
         Returns
         -------
@@ -676,17 +961,25 @@ class XlsxToAstConverter(BaseParser):
         """
         children: list[Node] = []
 
-        # Handle merged cells based on mode
-        merged_map: dict[str, str] = {}
-        if self.options.merged_cell_mode != "skip":
-            merged_map = _map_merged_cells(sheet)
-
-        raw_rows: list[list[Any]] = list(_xlsx_iter_rows(sheet, self.options.max_rows, self.options.max_cols))
-        if not raw_rows:
-            return children
-
-        # Convert to (text, hyperlink_url) pairs
-        cell_rows = self._convert_rows_to_cells(raw_rows, merged_map)
+        if tail is not None:
+            cell_rows, truncated = self._stream_sheet_cells(sheet, tail)
+            if not cell_rows:
+                return children
+        else:
+            # Handle merged cells based on mode
+            merged_map: dict[str, str] = {}
+            if self.options.merged_cell_mode != "skip":
+                merged_map = _map_merged_cells(sheet)
+
+            raw_rows: list[list[Any]] = list(_xlsx_iter_rows(sheet, self.options.max_rows, self.options.max_cols))
+            if not raw_rows:
+                return children
+
+            # Convert to (text, hyperlink_url) pairs
+            cell_rows = self._convert_rows_to_cells(raw_rows, merged_map)
+            truncated_rows = self.options.max_rows is not None and sheet.max_row > self.options.max_rows
+            truncated_cols = self.options.max_cols is not None and sheet.max_column > self.options.max_cols
+            truncated = truncated_rows or truncated_cols
 
         # Trim empty rows and columns (mirrors trim_rows/trim_columns, but keeps
         # each cell's hyperlink URL alongside its text through the trim)
@@ -706,6 +999,7 @@ class XlsxToAstConverter(BaseParser):
         header_text = transform_header_case([text for text, _ in header_pairs], self.options.header_case)
         header_urls = [url for _, url in header_pairs]
         alignments = self._compute_alignments(sheet, len(header_text))
+        alignments.extend(cast(list[Alignment], ["center"] * (len(header_text) - len(alignments))))
 
         header: list[CellValue] = [_paired_cell(text, url) for text, url in zip(header_text, header_urls, strict=True)]
         data: list[list[CellValue]] = [[_paired_cell(text, url) for text, url in row] for row in data_pairs]
@@ -714,11 +1008,13 @@ class XlsxToAstConverter(BaseParser):
         children.append(table)
 
         # Add truncation indicator if needed
-        truncated_rows = self.options.max_rows is not None and sheet.max_row > self.options.max_rows
-        truncated_cols = self.options.max_cols is not None and sheet.max_column > self.options.max_cols
-        if truncated_rows or truncated_cols:
+        if truncated:
             children.append(Paragraph(content=[HTMLInline(content=f"*{self.options.truncation_indicator}*")]))
 
+        # Read-only worksheets expose no drawings
+        if tail is not None:
+            return children
+
         # Extract images and charts
         sheet_images, sheet_footnotes = _extract_sheet_images(sheet, base_filename, attachment_sequencer, self.options)
         self._attachment_footnotes.update(sheet_footnotes)
@@ -732,6 +1028,10 @@ class XlsxToAstConverter(BaseParser):
     def xlsx_to_ast(self, workbook: Any) -> Document:
         """Convert an openpyxl workbook to AST Document.
 
+        A workbook opened with ``read_only=True`` is streamed row by row, with
+        merged ranges and hyperlinks read from the package separately; images
+        and charts are not available in that mode.
+
         Parameters
         ----------
         workbook : Any
@@ -743,6 +1043,13 @@ class XlsxToAstConverter(BaseParser):
             AST document with table nodes
 
         """
+        tails: dict[str, _SheetTail] | None = None
+        if getattr(workbook, "read_only", False):
+            tails = {name: tail or _SheetTail() for name, tail in self._scan_read_only_sheets(workbook).items()}
+        return self._workbook_to_ast(workbook, tails)
+
+    def _workbook_to_ast(self, workbook: Any, tails: dict[str, _SheetTail] | None) -> Document:
+        """Convert a workbook, streaming the sheets that have an entry in ``tails``."""
         children: list[Node] = []
 
         # Extract metadata
@@ -772,7 +1079,8 @@ class XlsxToAstConverter(BaseParser):
                 children.append(Heading(level=2, content=[Text(content=sname)]))
 
             # Process sheet data
-            sheet_nodes = self._process_sheet(sheet, base_filename, attachment_sequencer)
+            tail = tails.get(sname) if tails is not None else None
+            sheet_nodes = self._process_sheet(sheet, base_filename, attachment_sequencer, tail)
             children.extend(sheet_nodes)
 
         # Append attachment footnote definitions if any were collected
@@ -834,6 +1142,7 @@ CONVERTER_METADATA = ConverterMetadata(
     magic_bytes=[
         (b"PK\x03\x04", 0),
     ],
+    zip_members=["xl/workbook.xml"],
     parser_class=XlsxToAstConverter,
     renderer_class=None,
     parser_required_packages=[("openpyxl", "openpyxl", "")],
@@ -16,7 +16,8 @@ import logging
 import os
 import tempfile
 import zipfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import IO, Any, Optional, Union, cast
 
@@ -35,16 +36,18 @@ from all2md.exceptions import (
 )
 from all2md.options.base import BaseParserOptions
 from all2md.options.zip import ZipOptions
+from all2md.parsers._archive_members import MemberPayload, spool_member
 from all2md.parsers.base import BaseParser
 from all2md.progress import ProgressCallback
 from all2md.utils.metadata import DocumentMetadata
+from all2md.utils.parallel import in_flight_limit, submit_in_order
 from all2md.utils.security import validate_safe_extraction_path, validate_zip_archive
 
 logger = logging.getLogger(__name__)
 
 
 def _process_zip_file_worker(
-    file_path: str, file_data: bytes, options_dict: dict[str, Any]
+    payload: MemberPayload, options_dict: dict[str, Any]
 ) -> tuple[str, Document | None, dict[str, Any] | None]:
     """Worker function for parallel file processing.
 
@@ -52,10 +55,8 @@ def _process_zip_file_worker(
 
     Parameters
     ----------
-    file_path : str
-        Path of file in archive
-    file_data : bytes
-        File content bytes
+    payload : MemberPayload
+        Archive member, passed by value or as a spill-file path
     options_dict : dict[str, Any]
         Serialized options dictionary (includes resource_file_extensions and attachment options)
 
@@ -66,6 +67,7 @@ def _process_zip_file_worker(
         Document is None on failure, error_dict contains error details if failed
 
     """
+    file_path = payload.file_path
     try:
         # Check if this file should be treated as a resource
         resource_extensions = options_dict.get("resource_file_extensions")
@@ -79,58 +81,57 @@ def _process_zip_file_worker(
             # This is a resource file, don't parse it
             return (file_path, None, None)
 
-        # Create a BytesIO object with a name attribute for better format detection
-        file_obj = io.BytesIO(file_data)
-        file_obj.name = file_path
+        # Open the member (bytes, or its spill file) under a name with its extension
+        # for better format detection
+        with payload.open() as file_obj:
+            # Detect format using registry
+            detected_format = cast(DocumentFormat, registry.detect_format(file_obj))
 
-        # Detect format using registry
-        detected_format = cast(DocumentFormat, registry.detect_format(file_obj))
-
-        # Check if we have a parser for this format
-        try:
-            _parser_class = registry.get_parser(detected_format)
-        except FormatError:
-            # No parser available
-            return (file_path, None, None)
+            # Check if we have a parser for this format
+            try:
+                _parser_class = registry.get_parser(detected_format)
+            except FormatError:
+                # No parser available
+                return (file_path, None, None)
 
-        # Reset the file object position for parsing
-        file_obj.seek(0)
+            # Reset the file object position for parsing
+            file_obj.seek(0)
 
-        # Create parser options with attachment settings from the options dict
-        parser_options: Optional[BaseParserOptions] = None
-        try:
-            options_class = registry.get_parser_options_class(detected_format)
-            if options_class is not None:
-                from all2md.options.common import AttachmentOptionsMixin
-
-                # Extract attachment options from the options dict (if present)
-                attachment_opts = {
-                    k: v
-                    for k, v in options_dict.items()
-                    if k
-                    in (
-                        "attachment_mode",
-                        "alt_text_mode",
-                        "attachment_output_dir",
-                        "attachment_base_url",
-                        "max_asset_size_bytes",
-                        "attachment_filename_template",
-                        "attachment_overwrite",
-                        "attachment_deduplicate_by_hash",
-                        "attachments_footnotes_section",
-                    )
-                }
+            # Create parser options with attachment settings from the options dict
+            parser_options: Optional[BaseParserOptions] = None
+            try:
+                options_class = registry.get_parser_options_class(detected_format)
+                if options_class is not None:
+                    from all2md.options.common import AttachmentOptionsMixin
+
+                    # Extract attachment options from the options dict (if present)
+                    attachment_opts = {
+                        k: v
+                        for k, v in options_dict.items()
+                        if k
+                        in (
+                            "attachment_mode",
+                            "alt_text_mode",
+                            "attachment_output_dir",
+                            "attachment_base_url",
+                            "max_asset_size_bytes",
+                            "attachment_filename_template",
+                            "attachment_overwrite",
+                            "attachment_deduplicate_by_hash",
+                            "attachments_footnotes_section",
+                        )
+                    }
 
-                # Create options with attachment fields if the class supports them
-                if attachment_opts and issubclass(options_class, AttachmentOptionsMixin):
-                    default_options = options_class()
-                    parser_options = cast(BaseParserOptions, default_options.create_updated(**attachment_opts))
-        except Exception:
-            # If option creation fails, continue without options
-            pass
+                    # Create options with attachment fields if the class supports them
+                    if attachment_opts and issubclass(options_class, AttachmentOptionsMixin):
+                        default_options = options_class()
+                        parser_options = cast(BaseParserOptions, default_options.create_updated(**attachment_opts))
+            except Exception:
+                # If option creation fails, continue without options
+                pass
 
-        # Convert using the detected format with attachment options (no progress callback in parallel mode)
-        doc = to_ast(file_obj, source_format=detected_format, parser_options=parser_options, progress_callback=None)
+            # Convert using the detected format with attachment options (no progress callback in parallel mode)
+            doc = to_ast(file_obj, source_format=detected_format, parser_options=parser_options, progress_callback=None)
 
         return (file_path, doc, None)
 
@@ -413,59 +414,32 @@ class ZipToAstConverter(BaseParser):
         # Add all attachment options for nested file parsing
         options_dict.update(self._get_attachment_options_dict())
 
-        # Read all files into memory for parallel processing
-        file_data_map: dict[str, bytes] = {}
-        for file_path in file_list:
-            try:
-                file_data_map[file_path] = zf.read(file_path)
-            except Exception as e:
-                logger.warning(f"Failed to read file {file_path}: {e}")
-                self._failed_files.append(
-                    {
-                        "file_path": file_path,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e),
-                    }
-                )
-
-        # Process files in parallel
+        # Members are read lazily and only a bounded number are in flight; large
+        # ones reach the workers through spill files instead of pickled bytes.
         max_workers = self.options.max_workers
-        results_map: dict[str, tuple[Document | None, dict[str, Any] | None]] = {}
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {}
-            for file_path, file_data in file_data_map.items():
-                if not file_data and self.options.skip_empty_files:
-                    logger.debug(f"Skipping empty file: {file_path}")
-                    continue
-                future = executor.submit(_process_zip_file_worker, file_path, file_data, options_dict)
-                future_to_file[future] = file_path
-
-            # Track progress
-            total_files = len(future_to_file)
-            completed_count = 0
-
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+        total_files = len(file_list)
+        completed_count = 0
+
+        with (
+            tempfile.TemporaryDirectory(prefix="all2md-zip-") as spill_dir,
+            ProcessPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            in_order = submit_in_order(
+                executor,
+                self._iter_member_payloads(zf, file_list, Path(spill_dir)),
+                _process_zip_file_worker,
+                options_dict,
+                limit=in_flight_limit(max_workers),
+                bypass=lambda payload: self._is_resource_file(payload.file_path),
+            )
+            # Results are collected in archive order, so the document is built as they arrive
+            for payload, future in in_order:
+                file_path = payload.file_path
                 try:
-                    result_file_path, doc, error_dict = future.result()
-                    results_map[result_file_path] = (doc, error_dict)
-
-                    # Emit progress event as each file completes
-                    completed_count += 1
-                    self._emit_progress(
-                        "file_processing",
-                        f"Completed {result_file_path}",
-                        current=completed_count,
-                        total=total_files,
-                        file_path=result_file_path,
-                    )
-
-                    # Track errors
-                    if error_dict:
-                        self._failed_files.append(error_dict)
+                    if future is None:
+                        doc, error_dict = None, None
+                    else:
+                        _, doc, error_dict = future.result()
                 except Exception as e:
                     logger.warning(f"Worker exception for {file_path}: {e}")
                     completed_count += 1
@@ -483,45 +457,25 @@ class ZipToAstConverter(BaseParser):
                             "error_message": str(e),
                         }
                     )
+                    payload.discard()
+                    continue
 
-        # Reconstruct document in original order
-        for file_path in file_list:
-            if file_path not in results_map:
-                # File was skipped or failed to read
-                continue
-
-            doc, error_dict = results_map[file_path]
-
-            # Handle resource files (doc is None but no error)
-            if doc is None and error_dict is None:
-                # This is a resource file
-                if self.options.extract_resource_files and self.options.attachment_output_dir:
-                    file_data = file_data_map.get(file_path, b"")
-                    self._extract_resource_file(file_path, file_data)
-                continue
+                # Emit progress event as each file completes
+                completed_count += 1
+                self._emit_progress(
+                    "file_processing",
+                    f"Completed {file_path}",
+                    current=completed_count,
+                    total=total_files,
+                    file_path=file_path,
+                )
 
-            # Handle conversion errors (error_dict is not None)
-            if error_dict:
-                if not self.options.skip_empty_files:
-                    display_path = self._get_display_path(file_path)
-                    if self.options.create_section_headings:
-                        children.append(Heading(level=2, content=[Text(content=display_path)]))
-                    error_msg = f"(Error processing file: {error_dict['error_message']})"
-                    children.append(Paragraph(content=[Text(content=error_msg)]))
-                continue
+                # Track errors
+                if error_dict:
+                    self._failed_files.append(error_dict)
 
-            # Add successfully converted content
-            if doc and doc.children:
-                if self.options.create_section_headings:
-                    display_path = self._get_display_path(file_path)
-                    children.append(Heading(level=2, content=[Text(content=display_path)]))
-                children.extend(doc.children)
-            elif not self.options.skip_empty_files:
-                display_path = self._get_display_path(file_path)
-                if self.options.create_section_headings:
-                    children.append(Heading(level=2, content=[Text(content=display_path)]))
-                children.append(Paragraph(content=[Text(content="(Could not parse this file)")]))
-                self._record_degraded("unparsed_member", detail=display_path, severity="warn")
+                self._append_member_result(children, payload, doc, error_dict)
+                payload.discard()
 
         # Add resource manifest if requested and resources were extracted
         if self.options.include_resource_manifest and self.options.extract_resource_files and self._extracted_resources:
@@ -533,6 +487,99 @@ class ZipToAstConverter(BaseParser):
 
         return Document(children=children)
 
+    def _iter_member_payloads(
+        self, zf: zipfile.ZipFile, file_list: list[str], spill_dir: Path
+    ) -> Iterator[MemberPayload]:
+        """Read members one at a time for the parallel path, in archive order.
+
+        Parameters
+        ----------
+        zf : zipfile.ZipFile
+            Opened ZIP file object
+        file_list : list[str]
+            List of files to process
+        spill_dir : Path
+            Directory for members too large to pass to workers by value
+
+        Yields
+        ------
+        MemberPayload
+            Each readable member; unreadable ones are recorded as failed and
+            empty ones are skipped when ``skip_empty_files`` is set
+
+        """
+        for sequence, file_path in enumerate(file_list):
+            try:
+                with zf.open(file_path) as stream:
+                    payload = spool_member(file_path, stream, spill_dir, sequence)
+            except Exception as e:
+                logger.warning(f"Failed to read file {file_path}: {e}")
+                self._failed_files.append(
+                    {
+                        "file_path": file_path,
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                    }
+                )
+                continue
+            if not payload.size and self.options.skip_empty_files:
+                logger.debug(f"Skipping empty file: {file_path}")
+                continue
+            yield payload
+
+    def _append_member_result(
+        self,
+        children: list[Node],
+        payload: MemberPayload,
+        doc: Document | None,
+        error_dict: dict[str, Any] | None,
+    ) -> None:
+        """Append the nodes for one parallel-processed member to ``children``.
+
+        Parameters
+        ----------
+        children : list[Node]
+            Document children being assembled
+        payload : MemberPayload
+            The member the result belongs to
+        doc : Document or None
+            Converted member, or None for resources and failures
+        error_dict : dict[str, Any] or None
+            Conversion error details, if the worker failed
+
+        """
+        file_path = payload.file_path
+
+        # Handle resource files (doc is None but no error)
+        if doc is None and error_dict is None:
+            # This is a resource file
+            if self.options.extract_resource_files and self.options.attachment_output_dir:
+                self._extract_resource_file(file_path, payload.read_bytes())
+            return
+
+        # Handle conversion errors (error_dict is not None)
+        if error_dict:
+            if not self.options.skip_empty_files:
+                display_path = self._get_display_path(file_path)
+                if self.options.create_section_headings:
+                    children.append(Heading(level=2, content=[Text(content=display_path)]))
+                error_msg = f"(Error processing file: {error_dict['error_message']})"
+                children.append(Paragraph(content=[Text(content=error_msg)]))
+            return
+
+        # Add successfully converted content
+        if doc and doc.children:
+            if self.options.create_section_headings:
+                display_path = self._get_display_path(file_path)
+                children.append(Heading(level=2, content=[Text(content=display_path)]))
+            children.extend(doc.children)
+        elif not self.options.skip_empty_files:
+            display_path = self._get_display_path(file_path)
+            if self.options.create_section_headings:
+                children.append(Heading(level=2, content=[Text(content=display_path)]))
+            children.append(Paragraph(content=[Text(content="(Could not parse this file)")]))
+            self._record_degraded("unparsed_member", detail=display_path, severity="warn")
+
     def _get_file_list(self, zf: zipfile.ZipFile) -> list[str]:
         """Get filtered list of files to process from archive.
 
@@ -17,10 +17,10 @@ from __future__ import annotations
 
 import html
 import re
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Any, Union
+from typing import IO, Any, Union, cast
 
 from all2md.ast.nodes import (
     BlockQuote,
@@ -81,6 +81,7 @@ from all2md.utils.flavors import (
 )
 from all2md.utils.html_sanitizer import sanitize_html_content
 from all2md.utils.html_utils import render_math_html
+from all2md.utils.io_utils import is_binary_stream
 from all2md.utils.metadata import (
     format_json_frontmatter,
     format_toml_frontmatter,
@@ -126,6 +127,55 @@ def _interrupts_paragraph(node: Node) -> bool:
     return isinstance(node, List) and node.ordered and node.start != 1
 
 
+class _StreamingCleanup:
+    """Incremental equivalent of ``MarkdownRenderer._cleanup_output``.
+
+    Text arrives in block-sized pieces. Trailing whitespace of everything seen
+    so far is held back rather than written: it is dropped if the document
+    ends (the final ``rstrip``), and otherwise rejoined with the next piece
+    before line endings are normalized and blank-line runs collapsed, so a
+    CRLF pair or a run of newlines split across pieces is handled as one.
+    Because written text always ends in a non-whitespace character, no run
+    can straddle what was written and what is pending. Output starts only
+    once non-whitespace has arrived, so leading blank lines are dropped too.
+
+    ``written`` counts the characters handed to ``write`` so far and
+    ``content_start`` is where the latest piece's first non-blank line begins
+    in that output, which is what the block spans of
+    :meth:`MarkdownRenderer.render_to_string_with_spans` are made of.
+    """
+
+    _LEADING_BLANK_LINES = re.compile(r"\A(?:[ \t]*\n)+")
+    _BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
+    def __init__(self, write: Callable[[str], Any], *, collapse_blank_lines: bool) -> None:
+        self._write = write
+        self._collapse_blank_lines = collapse_blank_lines
+        self._pending = ""
+        self._started = False
+        self.written = 0
+        self.content_start = 0
+
+    def write(self, text: str) -> None:
+        text = self._pending + text
+        body = text.rstrip()
+        if not body:
+            self._pending = text
+            return
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if self._collapse_blank_lines:
+            text = self._BLANK_LINE_RUN.sub("\n\n", text)
+        if not self._started:
+            text = self._LEADING_BLANK_LINES.sub("", text)
+            self._started = True
+        body = text.rstrip()
+        self._pending = text[len(body) :]
+        leading = len(body) - len(body.lstrip())
+        self.content_start = self.written + body.rfind("\n", 0, leading) + 1
+        self.written += len(body)
+        self._write(body)
+
+
 class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
     """Render AST nodes to markdown text.
 
@@ -175,6 +225,10 @@ class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
         # True while rendering inline content that must stay on one source line
         # (a table cell, a heading). See _single_line().
         self._in_single_line: bool = False
+        # Set only during render_to_stream(); receives each finished top-level block.
+        self._stream_cleanup: _StreamingCleanup | None = None
+        # Set only during render_to_string_with_spans(); one (start, end) per top-level block.
+        self._block_spans: list[tuple[int, int]] | None = None
 
     @staticmethod
     def _get_flavor(flavor_name: str) -> MarkdownFlavor:
@@ -215,6 +269,83 @@ class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
             Markdown text
 
         """
+        self._reset_render_state()
+        try:
+            document.accept(self)
+            self._output.append(self._end_of_document_references())
+            result = "".join(self._output)
+        finally:
+            self._clear_render_state()
+
+        return self._cleanup_output(result)
+
+    def render_to_stream(self, document: Document, stream: IO[str]) -> None:
+        """Render a document AST to a text stream, one top-level block at a time.
+
+        Produces exactly the text :meth:`render_to_string` returns, but each
+        top-level block is written to ``stream`` as soon as it is rendered
+        instead of the whole document being joined and cleaned up in memory.
+        Blank-line collapsing and leading/trailing whitespace cleanup happen
+        incrementally at block boundaries, and reference-style link definitions
+        placed at the end of the document are kept in a separate (url -> id)
+        table and written last.
+
+        Parameters
+        ----------
+        document : Document
+            The document node to render
+        stream : IO[str]
+            Text stream to write to (an open file, a socket's text wrapper,
+            ``sys.stdout``...). It is neither flushed nor closed.
+
+        """
+        self._render_streaming(document, stream.write)
+
+    def render_to_string_with_spans(self, document: Document) -> tuple[str, list[tuple[int, int]]]:
+        """Render a document AST to markdown and report where each top-level block landed.
+
+        The text is exactly what :meth:`render_to_string` returns. Alongside it
+        comes one ``(start, end)`` offset pair per entry of ``document.children``,
+        in order: ``text[start:end]`` is that block as it appears in the output,
+        without the blank lines separating it from its neighbours. A block that
+        renders to nothing gets an empty span where it would have been. Any run
+        of consecutive blocks can therefore be sliced out of the one rendering
+        instead of being rendered again on its own.
+
+        Parameters
+        ----------
+        document : Document
+            The document node to render
+
+        Returns
+        -------
+        tuple of (str, list of tuple of (int, int))
+            Markdown text and the span of each top-level block within it
+
+        """
+        parts: list[str] = []
+        spans: list[tuple[int, int]] = []
+        self._block_spans = spans
+        try:
+            self._render_streaming(document, parts.append)
+        finally:
+            self._block_spans = None
+        return "".join(parts), spans
+
+    def _render_streaming(self, document: Document, write: Callable[[str], Any]) -> None:
+        """Render ``document`` handing each cleaned-up top-level block to ``write``."""
+        self._reset_render_state()
+        self._stream_cleanup = _StreamingCleanup(write, collapse_blank_lines=self.options.collapse_blank_lines)
+        try:
+            document.accept(self)
+            self._output.append(self._end_of_document_references())
+            self._flush_top_level_block()
+        finally:
+            self._stream_cleanup = None
+            self._clear_render_state()
+
+    def _reset_render_state(self) -> None:
+        """Reset per-document rendering state before a render."""
         self._output = []
         self._indent_level = 0
         self._in_list = False
@@ -227,28 +358,44 @@ class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
         self._in_single_line = False
         self._strikethrough_depth = 0
 
-        document.accept(self)
-
-        # Append link references if using reference style with end_of_document placement
-        if (
-            self.options.link_style == "reference"
-            and self.options.reference_link_placement == "end_of_document"
-            and self._link_references
-        ):
-            self._output.append("\n\n")
-            for url, ref_id in sorted(self._link_references.items(), key=lambda x: x[1]):
-                self._output.append(f"[{ref_id}]: {url}\n")
-
-        result = "".join(self._output)
-
-        # Clear state to prevent memory leaks in long-running processes
+    def _clear_render_state(self) -> None:
+        """Clear state to prevent memory leaks in long-running processes."""
         self._link_references.clear()
         self._block_link_references.clear()
         self._output.clear()
         self._list_marker_stack.clear()
         self._marker_width_stack.clear()
 
-        return self._cleanup_output(result)
+    def _end_of_document_references(self) -> str:
+        """Return the reference-link definitions that go after the last block, if any."""
+        if (
+            self.options.link_style != "reference"
+            or self.options.reference_link_placement != "end_of_document"
+            or not self._link_references
+        ):
+            return ""
+        definitions = "".join(
+            f"[{ref_id}]: {url}\n" for url, ref_id in sorted(self._link_references.items(), key=lambda x: x[1])
+        )
+        return "\n\n" + definitions
+
+    def _flush_top_level_block(self) -> None:
+        """Hand the output rendered so far to the stream, when streaming."""
+        if self._stream_cleanup is None or not self._output:
+            return
+        text = "".join(self._output)
+        self._output.clear()
+        self._stream_cleanup.write(text)
+
+    def _record_block_span(self, written_before: int) -> None:
+        """Note where the top-level block just flushed sits in the output, when asked to."""
+        if self._block_spans is None or self._stream_cleanup is None:
+            return
+        cleanup = self._stream_cleanup
+        if cleanup.written > written_before:
+            self._block_spans.append((cleanup.content_start, cleanup.written))
+        else:
+            self._block_spans.append((written_before, written_before))
 
     def _get_plain_text_from_nodes(self, nodes: list) -> str:
         """Extract plain text from a list of inline nodes for length calculation.
@@ -711,11 +858,15 @@ class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
         if self.options.metadata_frontmatter:
             self._render_frontmatter(node.metadata)
             # Frontmatter formatters already include trailing newlines
+            self._flush_top_level_block()
 
         for i, child in enumerate(node.children):
+            written_before = self._stream_cleanup.written if self._stream_cleanup is not None else 0
             child.accept(self)
             if i < len(node.children) - 1:
                 self._output.append("\n\n")
+            self._flush_top_level_block()
+            self._record_block_span(written_before)
 
     def _render_frontmatter(self, metadata: dict | None) -> None:
         """Render metadata as frontmatter in the configured format.
@@ -2363,16 +2514,25 @@ class MarkdownRenderer(NodeVisitor, InlineContentMixin, BaseRenderer):
             self._output.append("\n")
         self._output.append("$$")
 
-    def render(self, doc: Document, output: Union[str, Path, IO[bytes]]) -> None:
+    def render(self, doc: Document, output: Union[str, Path, IO[bytes], IO[str]]) -> None:
         """Render AST to markdown and write to output.
 
+        The markdown is streamed block by block (see :meth:`render_to_stream`),
+        so the full document text is never held in memory.
+
         Parameters
         ----------
         doc : Document
             AST Document node to render
-        output : str, Path, or IO[bytes]
+        output : str, Path, IO[bytes], or IO[str]
             Output destination (file path or file-like object)
 
         """
-        markdown_text = self.render_to_string(doc)
-        self.write_text_output(markdown_text, output)
+        if isinstance(output, (str, Path)):
+            with open(output, "w", encoding="utf-8") as handle:
+                self.render_to_stream(doc, handle)
+        elif is_binary_stream(output):
+            binary_output = cast(IO[bytes], output)
+            self._render_streaming(doc, lambda text: binary_output.write(text.encode("utf-8")))
+        else:
+            self.render_to_stream(doc, cast(IO[str], output))
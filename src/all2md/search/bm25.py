@@ -1,19 +1,41 @@
-"""BM25 keyword search index backed by rank-bm25."""
+"""BM25 keyword search index backed by a native inverted index.
+
+Each term maps to a postings list held in compact ``array`` buffers: the
+ascending ids of the chunks it occurs in and its frequency in each. Queries are
+evaluated document-at-a-time with MaxScore pruning, so a chunk is only fully
+scored while it can still enter the top ``k`` kept in a heap. ``save`` writes the
+postings to ``postings.bin`` next to ``chunks.jsonl``; ``load`` reads them back
+instead of re-tokenizing the corpus.
+"""
 
 from __future__ import annotations
 
+import heapq
 import json
+import logging
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from itertools import accumulate
 from pathlib import Path
-from typing import Callable, Mapping, Sequence
-
-from all2md.constants import DEPS_SEARCH_BM25
-from all2md.utils.decorators import requires_dependencies
+from typing import Callable, Iterable, Mapping, Sequence
 
 from .index import BaseIndex
 from .types import Chunk, SearchMode, SearchQuery, SearchResult
 
+logger = logging.getLogger(__name__)
+
+_POSTINGS_FILE = "postings.bin"
+_POSTINGS_MAGIC = b"A2BM"
+_POSTINGS_VERSION = 1
+# magic, format version, chunk count, vocabulary size, total postings
+_POSTINGS_HEADER = struct.Struct("<4sH2xIIQ")
+
 
 @dataclass
 class KeywordIndexConfig:
@@ -45,58 +67,207 @@ class BM25Index(BaseIndex):
         super().__init__(mode=SearchMode.KEYWORD, index_id=index_id, options_snapshot=options_snapshot)
         self.config = cfg
         self._tokenizer = tokenizer or _default_tokenizer
-        self._tokenized_corpus: list[list[str]] = []
-        self._backend = None
-        self._bm25_constructor: type | None = None
+        # Term ids index the per-term arrays below; postings hold ascending chunk ids.
+        self._vocabulary: dict[str, int] = {}
+        self._terms: list[str] = []
+        self._postings: list[array] = []
+        self._frequencies: list[array] = []
+        # Per-term maximum frequency and shortest containing chunk bound each
+        # term's score contribution for MaxScore without depending on k1, b or
+        # the average chunk length, so they stay valid as the corpus grows.
+        self._max_tf = array("I")
+        self._min_length = array("I")
+        self._doc_lengths = array("I")
+        self._total_length = 0
+
+    def _build_backend(self) -> None:
+        """Index the chunks appended since the last build."""
+        for doc_id in range(len(self._doc_lengths), len(self._chunks)):
+            self._index_tokens(doc_id, self._tokenizer(self._chunks[doc_id].text))
 
-    @requires_dependencies("search_bm25", DEPS_SEARCH_BM25)
-    def _ensure_backend(self) -> None:
-        if self._bm25_constructor is None:
-            from rank_bm25 import BM25Okapi
+    def _index_tokens(self, doc_id: int, tokens: Iterable[str]) -> None:
+        counts = Counter(tokens)
+        length = sum(counts.values())
+        self._doc_lengths.append(length)
+        self._total_length += length
+        for term, tf in counts.items():
+            term_id = self._vocabulary.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self._vocabulary[term] = term_id
+                self._terms.append(term)
+                self._postings.append(array("I"))
+                self._frequencies.append(array("I"))
+                self._max_tf.append(tf)
+                self._min_length.append(length)
+            else:
+                if tf > self._max_tf[term_id]:
+                    self._max_tf[term_id] = tf
+                if length < self._min_length[term_id]:
+                    self._min_length[term_id] = length
+            self._postings[term_id].append(doc_id)
+            self._frequencies[term_id].append(tf)
 
-            self._bm25_constructor = BM25Okapi
+    def _remove_from_backend(self, positions: Sequence[int]) -> None:
+        """Drop the removed chunks' postings and renumber the chunks after them.
+
+        Postings lists that end before the first removed chunk are left untouched,
+        as are the per-term score bounds: a bound taken over a superset of the
+        remaining postings is still an upper bound.
+        """
+        first = positions[0]
+        removed = set(positions)
+        remap = array("l", range(len(self._doc_lengths)))
+        shift = 0
+        for doc_id in range(first, len(remap)):
+            if doc_id in removed:
+                shift += 1
+                remap[doc_id] = -1
+            else:
+                remap[doc_id] = doc_id - shift
+
+        for term_id, doc_ids in enumerate(self._postings):
+            if not doc_ids or doc_ids[-1] < first:
+                continue
+            tfs = self._frequencies[term_id]
+            start = bisect_left(doc_ids, first)
+            kept_ids = doc_ids[:start]
+            kept_tfs = tfs[:start]
+            for pos in range(start, len(doc_ids)):
+                new_id = remap[doc_ids[pos]]
+                if new_id >= 0:
+                    kept_ids.append(new_id)
+                    kept_tfs.append(tfs[pos])
+            self._postings[term_id] = kept_ids
+            self._frequencies[term_id] = kept_tfs
+
+        self._total_length -= sum(self._doc_lengths[pos] for pos in positions)
+        self._doc_lengths = array(
+            "I", (length for doc_id, length in enumerate(self._doc_lengths) if doc_id not in removed)
+        )
 
-    def _build_backend(self) -> None:
-        """Recompute the BM25 corpus after chunks change."""
-        self._ensure_backend()
-        if self._bm25_constructor is None:
-            return
-
-        self._tokenized_corpus = [list(self._tokenizer(chunk.text)) for chunk in self._chunks]
-        if not self._tokenized_corpus:
-            self._backend = None
-            return
-        self._backend = self._bm25_constructor(self._tokenized_corpus, k1=self.config.k1, b=self.config.b)
-
-    @requires_dependencies("search_bm25", DEPS_SEARCH_BM25)
     def search(self, query: SearchQuery, *, top_k: int = 10) -> list[SearchResult]:
-        """Return the top ``top_k`` chunks ranked by BM25 score for ``query``."""
-        if self._backend is None:
+        """Return the top ``top_k`` chunks ranked by BM25 score for ``query``.
+
+        Only chunks containing at least one query term are returned.
+        """
+        if not self._doc_lengths or top_k <= 0:
             return []
 
-        tokens = list(self._tokenizer(query.raw_text))  # type: ignore[unreachable]
+        tokens = list(self._tokenizer(query.raw_text))
         if not tokens:
             return []
 
-        scores = self._backend.get_scores(tokens)
-        ranked = sorted(
-            ((idx, float(score)) for idx, score in enumerate(scores)), key=lambda pair: pair[1], reverse=True
-        )
-        results: list[SearchResult] = []
-        for idx, score in ranked[:top_k]:
-            results.append(
-                SearchResult(
-                    chunk=self._chunks[idx],
-                    score=score,
-                    metadata={"backend": self.backend_name, "mode": self.mode.name},
-                )
+        return [
+            SearchResult(
+                chunk=self._chunks[doc_id],
+                score=score,
+                metadata={"backend": self.backend_name, "mode": self.mode.name},
             )
-        return results
+            for score, doc_id in self._top_k(Counter(tokens), top_k)
+        ]
+
+    def _top_k(self, query_terms: Mapping[str, int], k: int) -> list[tuple[float, int]]:
+        """Score the best ``k`` chunks for ``query_terms`` with MaxScore pruning.
+
+        Query terms are ordered by their score upper bound. Once the heap is full,
+        the lowest-bound terms whose bounds sum to at most the current threshold
+        are "non-essential": a chunk matching only those cannot enter the top
+        ``k``, so candidates are drawn from the essential lists alone and the
+        non-essential lists are only probed (by bisection) while the candidate's
+        partial score plus their remaining bounds still beats the threshold.
+
+        Returns ``(score, chunk_id)`` pairs, best first; ties keep corpus order.
+        """
+        doc_count = len(self._doc_lengths)
+        k1 = self.config.k1
+        k1_plus_one = k1 + 1.0
+        average_length = self._total_length / doc_count or 1.0
+        norm_base = k1 * (1.0 - self.config.b)
+        norm_slope = k1 * self.config.b / average_length
+
+        cursors: list[tuple[float, float, array, array]] = []
+        for term, query_tf in query_terms.items():
+            term_id = self._vocabulary.get(term)
+            if term_id is None:
+                continue
+            doc_ids = self._postings[term_id]
+            df = len(doc_ids)
+            if not df:
+                continue
+            # Lucene-style idf: always positive, which MaxScore bounds rely on.
+            weight = query_tf * math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+            max_tf = self._max_tf[term_id]
+            bound = weight * max_tf * k1_plus_one / (max_tf + norm_base + norm_slope * self._min_length[term_id])
+            cursors.append((bound, weight, doc_ids, self._frequencies[term_id]))
+        if not cursors:
+            return []
+
+        cursors.sort(key=lambda cursor: cursor[0])
+        weights = [cursor[1] for cursor in cursors]
+        postings = [cursor[2] for cursor in cursors]
+        frequencies = [cursor[3] for cursor in cursors]
+        ends = [len(doc_ids) for doc_ids in postings]
+        # bound_prefix[i]: the most lists 0..i can add to any chunk's score.
+        bound_prefix = list(accumulate(cursor[0] for cursor in cursors))
+        positions = [0] * len(cursors)
+        lengths = self._doc_lengths
+
+        heap: list[tuple[float, int]] = []
+        threshold = -1.0  # every score beats this until the heap is full
+        first_essential = 0
+        term_count = len(cursors)
+        while first_essential < term_count:
+            candidate = doc_count
+            for i in range(first_essential, term_count):
+                pos = positions[i]
+                if pos < ends[i] and postings[i][pos] < candidate:
+                    candidate = postings[i][pos]
+            if candidate == doc_count:
+                break
+
+            length_norm = norm_base + norm_slope * lengths[candidate]
+            score = 0.0
+            for i in range(first_essential, term_count):
+                pos = positions[i]
+                if pos < ends[i] and postings[i][pos] == candidate:
+                    tf = frequencies[i][pos]
+                    score += weights[i] * tf * k1_plus_one / (tf + length_norm)
+                    positions[i] = pos + 1
+            for i in range(first_essential - 1, -1, -1):
+                if score + bound_prefix[i] <= threshold:
+                    break
+                pos = bisect_left(postings[i], candidate, positions[i], ends[i])
+                positions[i] = pos
+                if pos < ends[i] and postings[i][pos] == candidate:
+                    tf = frequencies[i][pos]
+                    score += weights[i] * tf * k1_plus_one / (tf + length_norm)
+
+            # Negated ids make the heap evict the later chunk among equal scores.
+            entry = (score, -candidate)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+                if len(heap) < k:
+                    continue
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            else:
+                continue
+            threshold = heap[0][0]
+            while first_essential < term_count and bound_prefix[first_essential] <= threshold:
+                first_essential += 1
+
+        return [(score, -negated_id) for score, negated_id in sorted(heap, reverse=True)]
 
     def save(self, directory: Path) -> None:
-        """Persist BM25 corpus, chunks, and configuration to ``directory``."""
+        """Persist BM25 postings, chunks, and configuration to ``directory``."""
         directory.mkdir(parents=True, exist_ok=True)
-        payload = {"backend": self.backend_name, "k1": self.config.k1, "b": self.config.b}
+        payload = {
+            "backend": self.backend_name,
+            "k1": self.config.k1,
+            "b": self.config.b,
+            "postings": _POSTINGS_FILE,
+        }
         self._write_manifest(directory, backend_payload=payload)
 
         chunks_path = directory / "chunks.jsonl"
@@ -109,9 +280,107 @@ class BM25Index(BaseIndex):
                 }
                 handle.write(json.dumps(record, ensure_ascii=False) + "\n")
 
+        self._write_postings(directory / _POSTINGS_FILE)
+
+    def _write_postings(self, path: Path) -> None:
+        encoded_terms = [term.encode("utf-8") for term in self._terms]
+        doc_ids = array("I")
+        tfs = array("I")
+        for term_postings, term_frequencies in zip(self._postings, self._frequencies, strict=True):
+            doc_ids.extend(term_postings)
+            tfs.extend(term_frequencies)
+        sections = [
+            array("I", [len(term) for term in encoded_terms]),
+            array("I", [len(term_postings) for term_postings in self._postings]),
+            self._max_tf,
+            self._min_length,
+            self._doc_lengths,
+            doc_ids,
+            tfs,
+        ]
+        header = _POSTINGS_HEADER.pack(
+            _POSTINGS_MAGIC, _POSTINGS_VERSION, len(self._doc_lengths), len(self._terms), len(doc_ids)
+        )
+        with path.open("wb") as handle:
+            handle.write(header)
+            handle.write(_little_endian(sections[0]).tobytes())
+            handle.write(b"".join(encoded_terms))
+            for section in sections[1:]:
+                handle.write(_little_endian(section).tobytes())
+
+    def _read_postings(self, path: Path) -> None:
+        """Load postings written by ``_write_postings``.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a compatible postings file for the loaded chunks.
+
+        """
+        data = memoryview(path.read_bytes())
+        if len(data) < _POSTINGS_HEADER.size:
+            raise ValueError("postings file is truncated")
+        magic, version, doc_count, vocab_size, posting_count = _POSTINGS_HEADER.unpack_from(data)
+        if magic != _POSTINGS_MAGIC:
+            raise ValueError("postings file has a bad magic number")
+        if version != _POSTINGS_VERSION:
+            raise ValueError(f"postings format version {version} is not supported")
+        if doc_count != len(self._chunks):
+            raise ValueError(f"postings cover {doc_count} chunks but {len(self._chunks)} were loaded")
+
+        offset = _POSTINGS_HEADER.size
+
+        def take(count: int) -> array:
+            nonlocal offset
+            section = array("I")
+            end = offset + count * section.itemsize
+            if end > len(data):
+                raise ValueError("postings file is truncated")
+            section.frombytes(data[offset:end])
+            offset = end
+            return _little_endian(section)
+
+        term_lengths = take(vocab_size)
+        terms: list[str] = []
+        for term_length in term_lengths:
+            end = offset + term_length
+            if end > len(data):
+                raise ValueError("postings file is truncated")
+            terms.append(str(data[offset:end], "utf-8"))
+            offset = end
+        document_frequencies = take(vocab_size)
+        max_tf = take(vocab_size)
+        min_length = take(vocab_size)
+        doc_lengths = take(doc_count)
+        doc_ids = take(posting_count)
+        tfs = take(posting_count)
+        if offset != len(data) or sum(document_frequencies) != posting_count:
+            raise ValueError("postings file is inconsistent")
+
+        postings: list[array] = []
+        frequencies: list[array] = []
+        start = 0
+        for df in document_frequencies:
+            postings.append(doc_ids[start : start + df])
+            frequencies.append(tfs[start : start + df])
+            start += df
+
+        self._terms = terms
+        self._vocabulary = {term: term_id for term_id, term in enumerate(terms)}
+        self._postings = postings
+        self._frequencies = frequencies
+        self._max_tf = max_tf
+        self._min_length = min_length
+        self._doc_lengths = doc_lengths
+        self._total_length = sum(doc_lengths)
+
     @classmethod
     def load(cls, directory: Path) -> "BM25Index":
-        """Restore a BM25 index that was previously saved to ``directory``."""
+        """Restore a BM25 index that was previously saved to ``directory``.
+
+        Indexes saved without ``postings.bin`` (or with an unreadable one) are
+        re-tokenized from ``chunks.jsonl``.
+        """
         manifest = cls._read_manifest(directory)
         backend = manifest.backend or {}
         config = KeywordIndexConfig(k1=float(backend.get("k1", 1.5)), b=float(backend.get("b", 0.75)))
@@ -128,10 +397,27 @@ class BM25Index(BaseIndex):
                     if not isinstance(metadata, dict):
                         metadata = {}
                     index._chunks.append(Chunk(chunk_id=raw["chunk_id"], text=raw["text"], metadata=metadata))
+
+        postings_path = directory / str(backend.get("postings", _POSTINGS_FILE))
+        if postings_path.exists():
+            try:
+                index._read_postings(postings_path)
+                return index
+            except ValueError as exc:
+                logger.warning(f"Ignoring BM25 postings at {postings_path} ({exc}); re-indexing chunks")
         index._build_backend()
         return index
 
 
+def _little_endian(values: array) -> array:
+    """Return ``values`` in little-endian byte order (copying only on big-endian hosts)."""
+    if sys.byteorder == "little":
+        return values
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
+
+
 def _serialize_metadata(metadata: Mapping[str, object]) -> dict[str, object]:
     """Convert metadata mapping into JSON-serializable values."""
     serialized: dict[str, object] = {}
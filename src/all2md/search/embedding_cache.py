@@ -0,0 +1,268 @@
+"""Persistent store of chunk embeddings keyed by content hash.
+
+Re-encoding a corpus with sentence-transformers dominates vector index builds on
+CPU-only hosts, yet a rebuild usually sees mostly the same chunk texts again.
+:class:`EmbeddingCache` keeps every embedding it has been given, keyed by
+``(model_name, normalize flag, sha256(chunk text))``, so
+:meth:`VectorIndex._encode_texts <all2md.search.vector.VectorIndex._encode_texts>`
+only sends the misses to the model.
+
+Each ``(model_name, normalize)`` pair gets one append-only file named after a
+hash of the pair. After a small header (magic, format version, dimension) the
+file is a flat array of fixed-size records, each a 32-byte SHA-256 digest
+followed by the float32 vector. Reads memory-map the file as a structured
+numpy array, so a warm cache of millions of embeddings costs one key-index
+scan rather than a load into RAM. Key and vector live in the same record, and
+every append -- trimming a torn final record first, then writing the batch --
+runs under an exclusive OS-level lock on a sidecar ``.lock`` file, so processes
+sharing a directory never misalign them. A torn final record (a writer died
+mid-write, or is still writing) is ignored on read.
+
+The file can be deleted at any time; it only ever costs re-encoding.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Sequence
+
+logger = logging.getLogger(__name__)
+
+_ENV_DIR = "ALL2MD_EMBEDDING_CACHE_DIR"
+_APP_NAME = "all2md"
+_MAGIC = b"A2EM"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sH2xI")
+_KEY_BYTES = 32
+
+
+def default_embedding_cache_dir() -> Path:
+    """Return the embedding-cache directory.
+
+    Honors ``ALL2MD_EMBEDDING_CACHE_DIR`` when set; otherwise an ``embeddings``
+    subdirectory of the per-OS user cache directory (e.g.
+    ``~/.cache/all2md/embeddings`` on Linux).
+    """
+    override = os.environ.get(_ENV_DIR)
+    if override:
+        return Path(override).expanduser()
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir(_APP_NAME, appauthor=False)) / "embeddings"
+
+
+@contextmanager
+def _exclusive_file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (created if missing), across processes, for the block."""
+    with path.open("a+b") as handle:
+        if sys.platform == "win32":
+            import msvcrt
+
+            # Locks byte 0; LK_LOCK retries for about ten seconds before raising OSError.
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def text_key(text: str) -> bytes:
+    """Return the cache key (SHA-256 digest) for a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Append-only, memory-mapped embedding store for one model configuration.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory holding the cache files; created on first write.
+    model_name : str
+        Embedding model the vectors come from.
+    normalize : bool
+        Whether the stored vectors are L2-normalized.
+
+    Notes
+    -----
+    Lookups and writes are best-effort: I/O errors and unreadable files are
+    logged at debug level and behave like misses, never failing an index build.
+
+    """
+
+    def __init__(self, directory: Path, *, model_name: str, normalize: bool) -> None:
+        """Bind the cache to ``directory`` for ``model_name``/``normalize`` vectors."""
+        import numpy as np
+
+        self._np = np
+        self.directory = Path(directory)
+        self.model_name = model_name
+        self.normalize = normalize
+        namespace = hashlib.sha256(f"{model_name}\0{int(normalize)}".encode("utf-8")).hexdigest()[:24]
+        self.path = self.directory / f"{namespace}.emb"
+        self._lock_path = self.directory / f"{namespace}.emb.lock"
+        self._lock = threading.Lock()
+        self._dimension: int | None = None
+        self._records: Any = None
+        self._rows: dict[bytes, int] = {}
+
+    @property
+    def dimension(self) -> int | None:
+        """Embedding width stored in the cache file, or None while it is empty."""
+        with self._lock:
+            self._refresh_locked()
+            return self._dimension
+
+    def __len__(self) -> int:
+        """Return the number of cached embeddings."""
+        with self._lock:
+            self._refresh_locked()
+            return len(self._rows)
+
+    def get(self, keys: Sequence[bytes]) -> tuple[Any, list[int]]:
+        """Look up ``keys`` and return the cached vectors and the miss positions.
+
+        Returns
+        -------
+        tuple[numpy.ndarray | None, list[int]]
+            A ``(len(keys), dimension)`` float32 matrix whose rows at hit
+            positions hold the cached vectors (miss rows are uninitialized), or
+            None when the cache holds nothing yet; and the positions in ``keys``
+            that missed, in order.
+
+        """
+        with self._lock:
+            self._refresh_locked()
+            if self._records is None:
+                return None, list(range(len(keys)))
+            vectors = self._np.empty((len(keys), self._dimension), dtype=self._np.float32)
+            hits: list[int] = []
+            rows: list[int] = []
+            misses: list[int] = []
+            for position, key in enumerate(keys):
+                row = self._rows.get(key)
+                if row is None:
+                    misses.append(position)
+                else:
+                    hits.append(position)
+                    rows.append(row)
+            if hits:
+                vectors[hits] = self._records["vector"][rows]
+            return vectors, misses
+
+    def put(self, keys: Sequence[bytes], vectors: Any) -> int:
+        """Append embeddings for keys not already cached; return how many were written."""
+        vectors = self._np.ascontiguousarray(vectors, dtype="<f4")
+        if vectors.ndim != 2 or vectors.shape[0] != len(keys) or not len(keys):
+            return 0
+        dimension = int(vectors.shape[1])
+        with self._lock:
+            try:
+                self._refresh_locked()
+                if self._dimension is None:
+                    self._create_locked(dimension)
+                if self._dimension != dimension:
+                    logger.debug(
+                        "Embedding cache %s holds %s-dim vectors; not storing %s-dim ones",
+                        self.path,
+                        self._dimension,
+                        dimension,
+                    )
+                    return 0
+                fresh: dict[bytes, int] = {}
+                for position, key in enumerate(keys):
+                    if key not in self._rows and key not in fresh:
+                        fresh[key] = position
+                if not fresh:
+                    return 0
+                block = self._np.empty(len(fresh), dtype=self._record_dtype(dimension))
+                block["key"] = [self._np.void(key) for key in fresh]
+                block["vector"] = vectors[list(fresh.values())]
+                self._append_locked(block.tobytes())
+            except OSError as exc:
+                logger.debug("Embedding cache: failed to store %d vectors in %s: %s", len(keys), self.path, exc)
+                return 0
+            return len(fresh)
+
+    # ------------------------------------------------------------------
+    # File handling; callers hold ``self._lock``
+    # ------------------------------------------------------------------
+
+    def _record_dtype(self, dimension: int) -> Any:
+        return self._np.dtype([("key", f"V{_KEY_BYTES}"), ("vector", "<f4", (dimension,))])
+
+    def _refresh_locked(self) -> None:
+        """Map records appended since the last refresh (by any process) and index their keys."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            self._dimension, self._records, self._rows = None, None, {}
+            return
+        if self._dimension is None:
+            if size < _HEADER.size:
+                return
+            with self.path.open("rb") as handle:
+                magic, version, dimension = _HEADER.unpack(handle.read(_HEADER.size))
+            if magic != _MAGIC or version != _FORMAT_VERSION or not dimension:
+                logger.debug("Embedding cache %s has an incompatible header; ignoring it", self.path)
+                return
+            self._dimension = int(dimension)
+
+        dtype = self._record_dtype(self._dimension)
+        count = (size - _HEADER.size) // dtype.itemsize
+        indexed = len(self._records) if self._records is not None else 0
+        if count == indexed:
+            return
+        self._records = self._np.memmap(self.path, dtype=dtype, mode="r", offset=_HEADER.size, shape=(count,))
+        # Slicing one bytes object is far cheaper than a numpy scalar per row.
+        raw = self._np.ascontiguousarray(self._records["key"][indexed:count]).tobytes()
+        for row, start in enumerate(range(0, len(raw), _KEY_BYTES), start=indexed):
+            self._rows.setdefault(raw[start : start + _KEY_BYTES], row)
+
+    def _create_locked(self, dimension: int) -> None:
+        """Create the cache file with its header, unless another process just did."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(_HEADER.pack(_MAGIC, _FORMAT_VERSION, dimension))
+        try:
+            # ``link`` fails if the target exists, so concurrent creators cannot
+            # clobber each other or expose a header-less file to appenders.
+            os.link(tmp, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._refresh_locked()
+
+    def _append_locked(self, payload: bytes) -> None:
+        record_size = self._record_dtype(self._dimension or 0).itemsize
+        # Every appender, in any process, holds this lock, so a torn tail seen here
+        # belongs to a writer that died rather than one that is still writing.
+        with _exclusive_file_lock(self._lock_path), self.path.open("ab") as handle:
+            tail = (handle.seek(0, os.SEEK_END) - _HEADER.size) % record_size
+            if tail:
+                # Drop the dead writer's torn bytes so new records stay aligned.
+                handle.truncate(handle.tell() - tail)
+            handle.write(payload)
+        self._refresh_locked()
+
+
+__all__ = ["EmbeddingCache", "default_embedding_cache_dir", "text_key"]
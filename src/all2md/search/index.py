@@ -90,10 +90,37 @@ class BaseIndex(ABC):
         if chunks:
             self._build_backend()
 
+    def remove_chunks(self, positions: Iterable[int]) -> int:
+        """Remove the chunks stored at ``positions`` (insertion-order indices).
+
+        Remaining chunks keep their relative order; the backend drops the removed
+        chunks' entries in place rather than rebuilding.
+
+        Returns
+        -------
+        int
+            Number of chunks removed.
+
+        """
+        doomed = sorted({pos for pos in positions if 0 <= pos < len(self._chunks)})
+        if not doomed:
+            return 0
+        self._remove_from_backend(doomed)
+        removed = set(doomed)
+        self._chunks = [chunk for pos, chunk in enumerate(self._chunks) if pos not in removed]
+        return len(doomed)
+
     @abstractmethod
     def _build_backend(self) -> None:
         """Rebuild underlying backend structures after corpus mutation."""
 
+    @abstractmethod
+    def _remove_from_backend(self, positions: Sequence[int]) -> None:
+        """Drop backend entries for the chunks at sorted ``positions``.
+
+        Called by :meth:`remove_chunks` before the chunks themselves are removed.
+        """
+
     @abstractmethod
     def search(self, query: SearchQuery, *, top_k: int = 10) -> list[SearchResult]:
         """Execute search query and return ranked results."""
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, MutableMapping, Sequence, cast
+from typing import Iterable, Iterator, Mapping, MutableMapping, Sequence, cast
 
 from all2md.api import to_ast
 from all2md.ast.nodes import Document
 from all2md.ast.sections import get_all_sections, get_preamble
 from all2md.ast.utils import extract_text
 from all2md.constants import DocumentFormat
+from all2md.conversion_cache import install_worker_cache, worker_cache_settings
 from all2md.options.search import SearchOptions
 from all2md.progress import ProgressCallback, ProgressEvent
 from all2md.search.bm25 import BM25Index, KeywordIndexConfig
@@ -20,12 +26,19 @@ from all2md.search.chunking import ChunkingContext, chunk_document
 from all2md.search.hybrid import blend_results
 from all2md.search.types import Chunk, SearchMode, SearchQuery, SearchResult
 from all2md.search.vector import VectorIndex, VectorIndexConfig
-from all2md.utils.fingerprint import corpus_fingerprint
+from all2md.utils.fingerprint import corpus_fingerprint, signatures_fingerprint, source_signature
+from all2md.utils.parallel import in_flight_limit, submit_in_order
+
+logger = logging.getLogger(__name__)
 
 # Name of the sidecar manifest recording the corpus fingerprint a persisted
 # index was built from, so a stale index can be detected and rebuilt.
 _CORPUS_MANIFEST_NAME = "corpus.json"
 
+# Chunks buffered before a streaming build feeds them to the indexes: large
+# enough to amortize per-batch index work (encoder calls, FAISS adds).
+_STREAM_BATCH_CHUNKS = 1024
+
 # Option fields that change the *content* of the index (chunk boundaries or
 # scoring), and so must invalidate a persisted index when altered. Grep/display
 # options are deliberately excluded — changing them should not force a rebuild.
@@ -40,6 +53,12 @@ _INDEX_RELEVANT_OPTION_KEYS: tuple[str, ...] = (
     "bm25_b",
     "vector_model_name",
     "vector_normalize_embeddings",
+    "vector_index_type",
+    "vector_nlist",
+    "vector_hnsw_m",
+    "vector_hnsw_ef_construction",
+    "vector_pq_m",
+    "vector_pq_nbits",
 )
 
 
@@ -66,6 +85,32 @@ class SearchDocumentInput:
     metadata: Mapping[str, object] | None = None
 
 
+@dataclass(frozen=True)
+class IndexedDocument:
+    """Record of one source document and the chunks it contributed to an index.
+
+    ``key`` identifies the source (its resolved path, or a content hash for
+    in-memory bytes) and ``signature`` is its change-signature at indexing time.
+    Each document's chunks are stored contiguously, in record order.
+    """
+
+    key: str
+    signature: Mapping[str, object]
+    document_id: str
+    chunk_count: int
+
+
+@dataclass(frozen=True)
+class IndexUpdateSummary:
+    """Outcome of :meth:`SearchService.update_indexes`."""
+
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    rebuilt: bool = False
+
+
 @dataclass
 class SearchIndexState:
     """Container for the active index backends."""
@@ -74,6 +119,12 @@ class SearchIndexState:
     documents: list[tuple[Document, SearchDocumentInput]] | None = None
     keyword_index: BM25Index | None = None
     vector_index: VectorIndex | None = None
+    sources: list[IndexedDocument] | None = None
+    index_options: Mapping[str, object] | None = None
+    # Set by streaming builds, which drop ASTs: the inputs grep re-parses.
+    document_inputs: list[SearchDocumentInput] | None = None
+    # A JSON Lines file that already holds exactly ``chunks`` (see ``spill_path``).
+    chunks_file: Path | None = None
 
     def available_modes(self) -> set[SearchMode]:
         """Get available modes of search."""
@@ -113,8 +164,36 @@ class SearchService:
         *,
         modes: Iterable[SearchMode] | None = None,
         progress_callback: ProgressCallback | None = None,
+        spill_path: Path | None = None,
     ) -> SearchIndexState:
-        """Convert sources into chunks and materialise requested indexes."""
+        """Convert sources into chunks and materialise requested indexes.
+
+        By default every parsed document is kept for AST-based grep, and the
+        indexes are built once all chunks are gathered. With
+        ``options.streaming_build`` each document's AST is dropped as soon as it
+        is chunked and chunks are fed to the indexes in batches as they arrive,
+        so peak memory no longer scales with the corpus's ASTs; grep re-parses
+        the sources on demand instead (cheap when the conversion cache is active).
+
+        Parameters
+        ----------
+        documents : Sequence[SearchDocumentInput]
+            Sources to index.
+        modes : Iterable[SearchMode], optional
+            Index modes to build. Defaults to ``options.default_mode``.
+        progress_callback : ProgressCallback, optional
+            Receives ``started``/``item_done``/``error``/``finished`` events.
+        spill_path : Path, optional
+            Append each document's chunk records to this JSON Lines file as soon
+            as it is chunked. :meth:`save` then moves (or copies) the file into
+            place as ``chunks.jsonl`` instead of serializing the chunks again.
+
+        Returns
+        -------
+        SearchIndexState
+            The new index state.
+
+        """
         requested_modes = set(modes or {self._default_mode()})
         if SearchMode.HYBRID in requested_modes:
             requested_modes.update({SearchMode.KEYWORD, SearchMode.VECTOR})
@@ -130,97 +209,383 @@ class SearchService:
                 )
             )
 
+        streaming = self.options.streaming_build
+        keyword_index = self._new_keyword_index() if SearchMode.KEYWORD in requested_modes else None
+        vector_index = self._new_vector_index() if SearchMode.VECTOR in requested_modes else None
+        indexes = [index for index in (keyword_index, vector_index) if index is not None]
+
         all_chunks: list[Chunk] = []
-        parsed_documents: list[tuple[Document, SearchDocumentInput]] = []
-        for idx, doc_input in enumerate(documents, start=1):
-            document_id = doc_input.document_id or _derive_document_id(doc_input.source)
-            document_path = Path(doc_input.source) if isinstance(doc_input.source, (str, Path)) else None
-            source_fmt: DocumentFormat = cast(DocumentFormat, doc_input.source_format or "auto")
-            ast_doc = to_ast(
-                doc_input.source,
-                source_format=source_fmt,
-                progress_callback=progress_callback,
+        indexed_upto = 0
+        parsed_documents: list[tuple[Document, SearchDocumentInput]] | None = None if streaming else []
+        document_inputs: list[SearchDocumentInput] | None = [] if streaming else None
+        sources: list[IndexedDocument] = []
+        # Signatures are taken before parsing, so an edit made mid-build is
+        # picked up by the next update rather than masked.
+        signatures = [source_signature(doc_input.source) for doc_input in documents]
+        pending = list(enumerate(documents, start=1))
+        if spill_path is not None:
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with spill_path.open("w", encoding="utf-8") if spill_path is not None else nullcontext() as spill:
+            for idx, doc_input, ast_doc, chunks in self._convert_documents(
+                pending, keep_documents=not streaming, progress_callback=progress_callback
+            ):
+                if parsed_documents is not None and ast_doc is not None:
+                    parsed_documents.append((ast_doc, doc_input))
+                if document_inputs is not None:
+                    document_inputs.append(doc_input)
+                del ast_doc
+                sources.append(_indexed_document(doc_input, signatures[idx - 1], len(chunks)))
+                all_chunks.extend(chunks)
+                if spill is not None:
+                    spill.writelines(_chunk_line(chunk) for chunk in chunks)
+                if progress_callback:
+                    progress_callback(
+                        ProgressEvent(
+                            event_type="item_done",
+                            message=f"Indexed document {sources[-1].document_id}",
+                            current=idx,
+                            total=len(documents),
+                            metadata={"item_type": "document", "chunks": len(chunks)},
+                        )
+                    )
+                if streaming and len(all_chunks) - indexed_upto >= _STREAM_BATCH_CHUNKS:
+                    for index in indexes:
+                        index.add_chunks(all_chunks[indexed_upto:], progress_callback=progress_callback)
+                    indexed_upto = len(all_chunks)
+
+        if len(all_chunks) > indexed_upto:
+            for index in indexes:
+                index.add_chunks(all_chunks[indexed_upto:], progress_callback=progress_callback)
+        if not all_chunks:
+            keyword_index = vector_index = None
+
+        self._state = SearchIndexState(
+            chunks=all_chunks,
+            documents=parsed_documents,
+            keyword_index=keyword_index,
+            vector_index=vector_index,
+            sources=sources,
+            index_options=_index_relevant_options(self.options),
+            document_inputs=document_inputs,
+            chunks_file=spill_path,
+        )
+
+        if progress_callback:
+            progress_callback(
+                ProgressEvent(
+                    event_type="finished",
+                    message="Indexing completed",
+                    current=len(documents),
+                    total=len(documents),
+                    metadata={"chunks": len(all_chunks)},
+                )
             )
-            parsed_documents.append((ast_doc, doc_input))
 
-            context_metadata: MutableMapping[str, object] = {"document_index": idx}
-            if doc_input.metadata:
-                context_metadata.update(doc_input.metadata)
-            if doc_input.source_format and doc_input.source_format != "auto":
-                context_metadata["source_format"] = str(doc_input.source_format)
+        return self._state
 
-            chunk_context = ChunkingContext(
-                document_id=document_id,
-                document_path=document_path,
-                metadata=context_metadata,
+    def _new_keyword_index(self) -> BM25Index:
+        return BM25Index(
+            config=KeywordIndexConfig(k1=self.options.bm25_k1, b=self.options.bm25_b),
+            options_snapshot=_options_snapshot(self.options),
+        )
+
+    def _new_vector_index(self) -> VectorIndex:
+        return VectorIndex(
+            config=VectorIndexConfig(
+                model_name=self.options.vector_model_name,
+                batch_size=self.options.vector_batch_size,
+                device=self.options.vector_device,
+                normalize_embeddings=self.options.vector_normalize_embeddings,
+                index_type=self.options.vector_index_type,
+                nlist=self.options.vector_nlist,
+                nprobe=self.options.vector_nprobe,
+                hnsw_m=self.options.vector_hnsw_m,
+                hnsw_ef_construction=self.options.vector_hnsw_ef_construction,
+                hnsw_ef_search=self.options.vector_hnsw_ef_search,
+                pq_m=self.options.vector_pq_m,
+                pq_nbits=self.options.vector_pq_nbits,
+                embedding_cache_dir=self.options.vector_embedding_cache_dir,
+            ),
+            options_snapshot=_options_snapshot(self.options),
+        )
+
+    def _convert_document(
+        self,
+        doc_input: SearchDocumentInput,
+        document_index: int,
+        *,
+        keep_document: bool = True,
+        progress_callback: ProgressCallback | None = None,
+    ) -> tuple[Document | None, list[Chunk]]:
+        """Parse one source and split it into chunks."""
+        return _parse_and_chunk(
+            doc_input,
+            document_index,
+            self.options,
+            keep_document=keep_document,
+            progress_callback=progress_callback,
+        )
+
+    def _convert_documents(
+        self,
+        pending: Sequence[tuple[int, SearchDocumentInput]],
+        *,
+        keep_documents: bool = True,
+        progress_callback: ProgressCallback | None = None,
+    ) -> Iterator[tuple[int, SearchDocumentInput, Document | None, list[Chunk]]]:
+        """Parse and chunk ``(document_index, input)`` pairs, yielding results in input order.
+
+        With ``options.workers`` other than 1 the work fans out to a process pool;
+        at most a few documents per worker are in flight, and results are still
+        yielded in submission order. Parser- and chunker-level progress events
+        are only emitted for in-process conversion. A document that fails is
+        re-raised, or reported as an ``error`` event and skipped when
+        ``options.skip_failed_documents`` is set. Without ``keep_documents`` the
+        AST is yielded as None, and a worker never sends it back to this process.
+        """
+        workers = _resolve_workers(self.options.workers, len(pending))
+        if workers <= 1:
+            for idx, doc_input in pending:
+                try:
+                    ast_doc, chunks = self._convert_document(
+                        doc_input, idx, keep_document=keep_documents, progress_callback=progress_callback
+                    )
+                except Exception as exc:
+                    if not self.options.skip_failed_documents:
+                        raise
+                    self._report_failed_document(doc_input, exc, progress_callback)
+                    continue
+                yield idx, doc_input, ast_doc, chunks
+            return
+
+        # Each worker opens the parent's conversion cache once, for every document it parses.
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=install_worker_cache, initargs=(worker_cache_settings(),)
+        )
+        try:
+            in_order = submit_in_order(
+                executor,
+                pending,
+                _parse_and_chunk_worker,
+                self.options,
+                keep_documents,
+                limit=in_flight_limit(workers),
+            )
+            for (idx, doc_input), future in in_order:
+                assert future is not None  # no document bypasses the pool
+                try:
+                    ast_doc, chunks = future.result()
+                except Exception as exc:
+                    if not self.options.skip_failed_documents:
+                        raise
+                    self._report_failed_document(doc_input, exc, progress_callback)
+                    continue
+                yield idx, doc_input, ast_doc, chunks
+        finally:
+            # Abandon queued work on error (or an early-closed generator) instead
+            # of parsing documents nobody will read.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _report_failed_document(
+        self,
+        doc_input: SearchDocumentInput,
+        exc: Exception,
+        progress_callback: ProgressCallback | None,
+    ) -> None:
+        document_id = doc_input.document_id or _derive_document_id(doc_input.source)
+        logger.warning("Skipping document %s: %s", document_id, exc)
+        if progress_callback:
+            progress_callback(
+                ProgressEvent(
+                    event_type="error",
+                    message=f"Skipped document {document_id}: {exc}",
+                    metadata={"item_type": "document", "document_id": document_id, "error": str(exc)},
+                )
             )
-            chunks = chunk_document(
-                ast_doc,
-                context=chunk_context,
-                chunk_size_tokens=self.options.chunk_size_tokens,
-                chunk_overlap_tokens=self.options.chunk_overlap_tokens,
-                min_chunk_tokens=self.options.min_chunk_tokens,
-                include_preamble=self.options.include_preamble,
-                heading_merge=self.options.heading_merge,
-                max_heading_level=self.options.max_heading_level,
-                progress_callback=progress_callback,
+
+    def update_indexes(
+        self,
+        documents: Sequence[SearchDocumentInput],
+        *,
+        modes: Iterable[SearchMode] | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ) -> IndexUpdateSummary:
+        """Bring the active indexes in line with ``documents`` without a full rebuild.
+
+        Each document's change-signature is compared with the one recorded when it
+        was indexed. Only new and changed documents are parsed and chunked; their
+        chunks are appended to the existing keyword/vector indexes, and the chunks
+        of changed or deleted documents are dropped from them in place.
+
+        Falls back to :meth:`build_indexes` (reported as ``rebuilt``) when there is
+        nothing to update incrementally: no per-document records (e.g. an index
+        persisted by an older version), index-relevant options that differ from
+        the ones the index was built with, a requested mode whose index does not
+        exist yet, or a source listed more than once.
+
+        Parameters
+        ----------
+        documents : Sequence[SearchDocumentInput]
+            The complete current corpus, not just the documents that changed.
+        modes : Iterable[SearchMode], optional
+            Modes that must be available afterwards. Defaults to the modes of the
+            active indexes.
+        progress_callback : ProgressCallback, optional
+            Receives the same events as :meth:`build_indexes`, for the documents
+            that are (re)indexed.
+
+        Returns
+        -------
+        IndexUpdateSummary
+            Counts of added, changed, removed and unchanged documents.
+
+        """
+        state = self._state
+        present_modes: set[SearchMode] = set()
+        if state.keyword_index:
+            present_modes.add(SearchMode.KEYWORD)
+        if state.vector_index:
+            present_modes.add(SearchMode.VECTOR)
+        requested_modes = set(modes or present_modes)
+        if SearchMode.HYBRID in requested_modes:
+            requested_modes.discard(SearchMode.HYBRID)
+            requested_modes.update({SearchMode.KEYWORD, SearchMode.VECTOR})
+
+        incoming = [(_document_key(doc.source), doc) for doc in documents]
+        incoming_keys = {key for key, _doc in incoming}
+        recorded_keys = {record.key for record in state.sources or ()}
+        if (
+            state.sources is None
+            or not present_modes
+            or not requested_modes <= present_modes
+            or state.index_options != _index_relevant_options(self.options)
+            or len(incoming_keys) != len(incoming)
+            or len(recorded_keys) != len(state.sources)
+        ):
+            self.build_indexes(documents, modes=requested_modes | present_modes, progress_callback=progress_callback)
+            return IndexUpdateSummary(added=len(documents), rebuilt=True)
+
+        recorded = {record.key: record for record in state.sources}
+        pending: list[tuple[int, SearchDocumentInput, Mapping[str, object]]] = []
+        changed_keys: set[str] = set()
+        for idx, (key, doc_input) in enumerate(incoming, start=1):
+            signature = source_signature(doc_input.source)
+            record = recorded.get(key)
+            if record is not None:
+                document_id = doc_input.document_id or _derive_document_id(doc_input.source)
+                if record.signature == signature and record.document_id == document_id:
+                    continue
+                changed_keys.add(key)
+            pending.append((idx, doc_input, signature))
+
+        # Chunks of changed and deleted documents leave the indexes in place.
+        drop_positions: list[int] = []
+        kept_sources: list[IndexedDocument] = []
+        cursor = 0
+        for record in state.sources:
+            if record.key in incoming_keys and record.key not in changed_keys:
+                kept_sources.append(record)
+            else:
+                drop_positions.extend(range(cursor, cursor + record.chunk_count))
+            cursor += record.chunk_count
+        removed_count = len(state.sources) - len(kept_sources) - len(changed_keys)
+
+        if drop_positions:
+            for index in (state.keyword_index, state.vector_index):
+                if index is not None:
+                    index.remove_chunks(drop_positions)
+            dropped = set(drop_positions)
+            state.chunks = [chunk for pos, chunk in enumerate(state.chunks) if pos not in dropped]
+            state.chunks_file = None
+        kept_keys = {record.key for record in kept_sources}
+        if state.documents is not None:
+            state.documents = [
+                (ast_doc, doc_input)
+                for ast_doc, doc_input in state.documents
+                if _document_key(doc_input.source) in kept_keys
+            ]
+        if state.document_inputs is not None:
+            state.document_inputs = [
+                doc_input for doc_input in state.document_inputs if _document_key(doc_input.source) in kept_keys
+            ]
+
+        if progress_callback:
+            progress_callback(
+                ProgressEvent(
+                    event_type="started",
+                    message="Updating indexes",
+                    current=0,
+                    total=len(pending),
+                    metadata={"item_type": "indexing"},
+                )
             )
-            all_chunks.extend(chunks)
+
+        new_chunks: list[Chunk] = []
+        signatures = {idx: signature for idx, _doc_input, signature in pending}
+        converted = self._convert_documents(
+            [(idx, doc_input) for idx, doc_input, _signature in pending],
+            keep_documents=state.documents is not None,
+            progress_callback=progress_callback,
+        )
+        for done, (idx, doc_input, ast_doc, chunks) in enumerate(converted, start=1):
+            kept_sources.append(_indexed_document(doc_input, signatures[idx], len(chunks)))
+            if state.documents is not None and ast_doc is not None:
+                state.documents.append((ast_doc, doc_input))
+            if state.document_inputs is not None:
+                state.document_inputs.append(doc_input)
+            new_chunks.extend(chunks)
             if progress_callback:
                 progress_callback(
                     ProgressEvent(
                         event_type="item_done",
-                        message=f"Indexed document {document_id}",
-                        current=idx,
-                        total=len(documents),
+                        message=f"Indexed document {kept_sources[-1].document_id}",
+                        current=done,
+                        total=len(pending),
                         metadata={"item_type": "document", "chunks": len(chunks)},
                     )
                 )
 
-        keyword_index: BM25Index | None = None
-        vector_index: VectorIndex | None = None
-
-        if SearchMode.KEYWORD in requested_modes and all_chunks:
-            keyword_index = BM25Index(
-                config=KeywordIndexConfig(k1=self.options.bm25_k1, b=self.options.bm25_b),
-                options_snapshot=_options_snapshot(self.options),
-            )
-            keyword_index.add_chunks(all_chunks, progress_callback=progress_callback)
-
-        if SearchMode.VECTOR in requested_modes and all_chunks:
-            vector_index = VectorIndex(
-                config=VectorIndexConfig(
-                    model_name=self.options.vector_model_name,
-                    batch_size=self.options.vector_batch_size,
-                    device=self.options.vector_device,
-                    normalize_embeddings=self.options.vector_normalize_embeddings,
-                ),
-                options_snapshot=_options_snapshot(self.options),
-            )
-            vector_index.add_chunks(all_chunks, progress_callback=progress_callback)
-
-        self._state = SearchIndexState(
-            chunks=all_chunks, documents=parsed_documents, keyword_index=keyword_index, vector_index=vector_index
+        if new_chunks:
+            state.chunks.extend(new_chunks)
+            state.chunks_file = None
+            for index in (state.keyword_index, state.vector_index):
+                if index is not None:
+                    index.add_chunks(new_chunks, progress_callback=progress_callback)
+        state.sources = kept_sources
+
+        summary = IndexUpdateSummary(
+            added=len(pending) - len(changed_keys),
+            changed=len(changed_keys),
+            removed=removed_count,
+            unchanged=len(incoming) - len(pending),
         )
-
         if progress_callback:
             progress_callback(
                 ProgressEvent(
                     event_type="finished",
-                    message="Indexing completed",
-                    current=len(documents),
-                    total=len(documents),
-                    metadata={"chunks": len(all_chunks)},
+                    message="Index update completed",
+                    current=len(pending),
+                    total=len(pending),
+                    metadata={"chunks": len(state.chunks), **asdict(summary)},
                 )
             )
-
-        return self._state
+        return summary
 
     def save(self, directory: Path) -> None:
         """Persist all active indexes to disk."""
         directory.mkdir(parents=True, exist_ok=True)
         chunk_path = directory / "chunks.jsonl"
-        _write_chunks(chunk_path, self._state.chunks)
+        spilled = self._state.chunks_file
+        if spilled is None or not spilled.exists():
+            _write_chunks(chunk_path, self._state.chunks)
+        elif spilled.resolve() != chunk_path.resolve():
+            # A spill file next to the target is moved into place; one elsewhere
+            # (e.g. an earlier save) is copied and left alone.
+            if spilled.parent.resolve() == directory.resolve():
+                os.replace(spilled, chunk_path)
+            else:
+                shutil.copyfile(spilled, chunk_path)
+            self._state.chunks_file = chunk_path
 
         if self._state.keyword_index:
             self._state.keyword_index.save(directory / "keyword")
@@ -228,13 +593,19 @@ class SearchService:
             self._state.vector_index.save(directory / "vector")
 
         # Record the corpus fingerprint so a later load can tell whether the
-        # persisted index still matches the documents/options it was built from.
-        if self._state.documents is not None:
-            fingerprint = corpus_fingerprint(
-                [doc_input.source for _doc, doc_input in self._state.documents],
-                extra=_index_relevant_options(self.options),
+        # persisted index still matches the documents/options it was built from,
+        # plus the per-document signatures that let update_indexes() find the
+        # documents that changed.
+        if self._state.sources is not None:
+            index_options = dict(self._state.index_options or _index_relevant_options(self.options))
+            fingerprint = signatures_fingerprint(
+                (record.signature for record in self._state.sources), extra=index_options
             )
-            manifest = {"fingerprint": fingerprint}
+            manifest = {
+                "fingerprint": fingerprint,
+                "options": index_options,
+                "documents": [asdict(record) for record in self._state.sources],
+            }
             (directory / _CORPUS_MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
 
     @staticmethod
@@ -283,10 +654,25 @@ class SearchService:
         vector_dir = directory / "vector"
         if vector_dir.exists():
             vector_index = VectorIndex.load(vector_dir)
+            # Query-time knobs and the embedding cache come from the caller's
+            # options, not the build.
+            vector_index.set_search_params(
+                nprobe=service.options.vector_nprobe, ef_search=service.options.vector_hnsw_ef_search
+            )
+            vector_index.config.embedding_cache_dir = service.options.vector_embedding_cache_dir
             if not chunks:
                 chunks = list(vector_index.iter_chunks())
 
-        service._state = SearchIndexState(chunks=chunks, keyword_index=keyword_index, vector_index=vector_index)
+        sources, index_options = _read_corpus_manifest(directory)
+        if sources is not None and sum(record.chunk_count for record in sources) != len(chunks):
+            sources = None
+        service._state = SearchIndexState(
+            chunks=chunks,
+            keyword_index=keyword_index,
+            vector_index=vector_index,
+            sources=sources,
+            index_options=index_options,
+        )
         return service
 
     def search(
@@ -365,10 +751,14 @@ class SearchService:
         context_after: int,
         regex: bool,
     ) -> list[SearchResult]:
-        # Use AST-based grep if documents are available (preferred)
-        if self._state.documents:
+        # Use AST-based grep if documents are available (preferred); a streaming
+        # build kept only the inputs, so re-parse them one at a time.
+        documents: Iterable[tuple[Document, SearchDocumentInput]] | None = self._state.documents or None
+        if documents is None and self._state.document_inputs:
+            documents = self._reparse_documents(self._state.document_inputs)
+        if documents is not None:
             return _grep_ast_documents(
-                self._state.documents,
+                documents,
                 query,
                 regex=regex,
                 context_before=context_before,
@@ -388,6 +778,21 @@ class SearchService:
             regex=regex,
         )
 
+    def _reparse_documents(
+        self, document_inputs: Sequence[SearchDocumentInput]
+    ) -> Iterator[tuple[Document, SearchDocumentInput]]:
+        """Yield freshly parsed ASTs for ``document_inputs``, holding one at a time."""
+        for doc_input in document_inputs:
+            source_fmt: DocumentFormat = cast(DocumentFormat, doc_input.source_format or "auto")
+            try:
+                ast_doc = to_ast(doc_input.source, source_format=source_fmt)
+            except Exception as exc:
+                if not self.options.skip_failed_documents:
+                    raise
+                logger.warning("Skipping document %s in grep: %s", _derive_document_id(doc_input.source), exc)
+                continue
+            yield ast_doc, doc_input
+
     def _keyword_search(self, query: str, *, top_k: int) -> list[SearchResult]:
         assert self._state.keyword_index is not None
         base_results = self._state.keyword_index.search(SearchQuery(raw_text=query), top_k=top_k)
@@ -428,6 +833,114 @@ class SearchService:
         return self._resolve_mode(self.options.default_mode)
 
 
+def _parse_and_chunk(
+    doc_input: SearchDocumentInput,
+    document_index: int,
+    options: SearchOptions,
+    *,
+    keep_document: bool = True,
+    progress_callback: ProgressCallback | None = None,
+) -> tuple[Document | None, list[Chunk]]:
+    """Parse one source and split it into chunks according to ``options``.
+
+    With ``keep_document`` False only the chunks are returned (the document is
+    None), so a pool worker does not pickle the whole AST back to the parent.
+    """
+    document_id = doc_input.document_id or _derive_document_id(doc_input.source)
+    document_path = Path(doc_input.source) if isinstance(doc_input.source, (str, Path)) else None
+    source_fmt: DocumentFormat = cast(DocumentFormat, doc_input.source_format or "auto")
+    ast_doc = to_ast(
+        doc_input.source,
+        source_format=source_fmt,
+        progress_callback=progress_callback,
+    )
+
+    context_metadata: MutableMapping[str, object] = {"document_index": document_index}
+    if doc_input.metadata:
+        context_metadata.update(doc_input.metadata)
+    if doc_input.source_format and doc_input.source_format != "auto":
+        context_metadata["source_format"] = str(doc_input.source_format)
+
+    chunk_context = ChunkingContext(
+        document_id=document_id,
+        document_path=document_path,
+        metadata=context_metadata,
+    )
+    chunks = chunk_document(
+        ast_doc,
+        context=chunk_context,
+        chunk_size_tokens=options.chunk_size_tokens,
+        chunk_overlap_tokens=options.chunk_overlap_tokens,
+        min_chunk_tokens=options.min_chunk_tokens,
+        include_preamble=options.include_preamble,
+        heading_merge=options.heading_merge,
+        max_heading_level=options.max_heading_level,
+        progress_callback=progress_callback,
+    )
+    return (ast_doc if keep_document else None), chunks
+
+
+def _parse_and_chunk_worker(
+    item: tuple[int, SearchDocumentInput], options: SearchOptions, keep_document: bool
+) -> tuple[Document | None, list[Chunk]]:
+    """Process-pool entry point for :func:`_parse_and_chunk` on one ``(document_index, input)`` pair."""
+    document_index, doc_input = item
+    return _parse_and_chunk(doc_input, document_index, options, keep_document=keep_document)
+
+
+def _resolve_workers(workers: int, document_count: int) -> int:
+    """Return the process count for ``document_count`` documents (``0`` = one per CPU)."""
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, document_count))
+
+
+def _document_key(source: str | Path | bytes) -> str:
+    """Identify a source across index updates: its resolved path or content hash."""
+    if isinstance(source, (bytes, bytearray)):
+        return f"sha256:{source_signature(bytes(source))['sha256']}"
+    return str(Path(source).resolve())
+
+
+def _indexed_document(
+    doc_input: SearchDocumentInput, signature: Mapping[str, object], chunk_count: int
+) -> IndexedDocument:
+    return IndexedDocument(
+        key=_document_key(doc_input.source),
+        signature=signature,
+        document_id=doc_input.document_id or _derive_document_id(doc_input.source),
+        chunk_count=chunk_count,
+    )
+
+
+def _read_corpus_manifest(directory: Path) -> tuple[list[IndexedDocument] | None, Mapping[str, object] | None]:
+    """Return the per-document records and index options saved in ``corpus.json``.
+
+    Either is None when the manifest is missing, unreadable or predates them.
+    """
+    try:
+        raw = json.loads((directory / _CORPUS_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, None
+    if not isinstance(raw, dict):
+        return None, None
+    options = raw.get("options")
+    index_options = dict(options) if isinstance(options, dict) else None
+    try:
+        sources = [
+            IndexedDocument(
+                key=str(entry["key"]),
+                signature=dict(entry["signature"]),
+                document_id=str(entry["document_id"]),
+                chunk_count=int(entry["chunk_count"]),
+            )
+            for entry in raw["documents"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None, index_options
+    return sources, index_options
+
+
 def _derive_document_id(source: str | Path | bytes) -> str:
     if isinstance(source, bytes):  # Ends up bytes if stdin, no filename
         return "stdin"
@@ -587,7 +1100,7 @@ def _truncate_to_match(
 
 
 def _grep_ast_documents(
-    documents: Sequence[tuple[Document, SearchDocumentInput]],
+    documents: Iterable[tuple[Document, SearchDocumentInput]],
     query: str,
     *,
     regex: bool,
@@ -604,7 +1117,7 @@ def _grep_ast_documents(
 
     Parameters
     ----------
-    documents : Sequence[tuple[Document, SearchDocumentInput]]
+    documents : Iterable[tuple[Document, SearchDocumentInput]]
         Documents and their metadata to search
     query : str
         Search query text or regex pattern
@@ -952,13 +1465,16 @@ def _write_chunks(path: Path, chunks: Sequence[Chunk]) -> None:
         return
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
-        for chunk in chunks:
-            payload = {
-                "chunk_id": chunk.chunk_id,
-                "text": chunk.text,
-                "metadata": _serialize_metadata(chunk.metadata),
-            }
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        handle.writelines(_chunk_line(chunk) for chunk in chunks)
+
+
+def _chunk_line(chunk: Chunk) -> str:
+    payload = {
+        "chunk_id": chunk.chunk_id,
+        "text": chunk.text,
+        "metadata": _serialize_metadata(chunk.metadata),
+    }
+    return json.dumps(payload, ensure_ascii=False) + "\n"
 
 
 def _read_chunks(path: Path) -> list[Chunk]:
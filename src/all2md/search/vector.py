@@ -3,26 +3,128 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Mapping, Sequence, cast
 
-from all2md.constants import DEPS_SEARCH_VECTOR
+from all2md.constants import DEPS_SEARCH_VECTOR, VECTOR_INDEX_TYPES, VectorIndexType
 from all2md.utils.decorators import requires_dependencies
 
+from .embedding_cache import EmbeddingCache, text_key
 from .index import BaseIndex
 from .types import Chunk, SearchMode, SearchQuery, SearchResult
 
+logger = logging.getLogger(__name__)
+
+_FAISS_INDEX_FILE = "index.faiss"
+# FAISS k-means warns below ~39 training points per centroid; IVF lists are
+# capped so every centroid gets at least that many.
+_MIN_POINTS_PER_CENTROID = 39
+
 
 @dataclass
 class VectorIndexConfig:
-    """Runtime configuration for vector search."""
+    """Runtime configuration for vector search.
+
+    ``index_type`` selects the FAISS structure: ``"flat"`` (exact, brute
+    force), ``"ivf_flat"`` (inverted lists over k-means cells), ``"hnsw"``
+    (navigable small-world graph) or ``"ivf_pq"`` (inverted lists with
+    product-quantized codes). IVF indexes are trained on the vectors they are
+    built from and fall back to ``"flat"`` until enough vectors exist to train.
+    ``nprobe`` and ``hnsw_ef_search`` only affect queries and can be changed
+    on a built index with :meth:`VectorIndex.set_search_params`.
+    ``embedding_cache_dir`` enables a persistent
+    :class:`~all2md.search.embedding_cache.EmbeddingCache` there, so rebuilds
+    only encode chunks whose text was never embedded before.
+    """
 
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
     batch_size: int = 32
     device: str | None = None
     normalize_embeddings: bool = True
+    index_type: VectorIndexType = "flat"
+    nlist: int = 1024
+    nprobe: int = 16
+    hnsw_m: int = 32
+    hnsw_ef_construction: int = 200
+    hnsw_ef_search: int = 64
+    pq_m: int = 16
+    pq_nbits: int = 8
+    embedding_cache_dir: str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the index type and its tuning parameters."""
+        if self.index_type not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {', '.join(VECTOR_INDEX_TYPES)}; got {self.index_type!r}")
+        for name in ("nlist", "nprobe", "hnsw_m", "hnsw_ef_construction", "hnsw_ef_search", "pq_m"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if not (1 <= self.pq_nbits <= 16):
+            raise ValueError("pq_nbits must be between 1 and 16")
+
+
+def _ivf_list_count(config: VectorIndexConfig, vector_count: int) -> int:
+    """Return the number of IVF lists to train for ``vector_count`` vectors."""
+    return min(config.nlist, vector_count // _MIN_POINTS_PER_CENTROID)
+
+
+def _buildable_index_type(config: VectorIndexConfig, vector_count: int) -> str:
+    """Return the index type that can actually be built from ``vector_count`` vectors."""
+    if config.index_type in ("ivf_flat", "ivf_pq"):
+        if _ivf_list_count(config, vector_count) < 1:
+            return "flat"
+        if config.index_type == "ivf_pq" and vector_count < (1 << config.pq_nbits):
+            return "flat"
+    return config.index_type
+
+
+def _build_faiss_index(faiss: Any, vectors: Any, config: VectorIndexConfig) -> tuple[Any, str, int]:
+    """Create, train and fill a FAISS index for ``vectors`` under ``config``.
+
+    Returns
+    -------
+    tuple[Any, str, int]
+        The populated index, the index type that was built (``"flat"`` when an
+        IVF type lacks training data) and the number of IVF lists (0 otherwise).
+
+    """
+    count, dimension = int(vectors.shape[0]), int(vectors.shape[1])
+    inner_product = config.normalize_embeddings
+    metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+    flat_cls = faiss.IndexFlatIP if inner_product else faiss.IndexFlatL2
+    built_type = _buildable_index_type(config, count)
+    nlist = 0
+
+    if built_type == "flat":
+        index = flat_cls(dimension)
+    elif built_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config.hnsw_m, metric)
+        index.hnsw.efConstruction = config.hnsw_ef_construction
+    else:
+        nlist = _ivf_list_count(config, count)
+        quantizer = flat_cls(dimension)
+        if built_type == "ivf_pq":
+            if dimension % config.pq_m:
+                raise ValueError(f"pq_m ({config.pq_m}) must divide the embedding dimension ({dimension})")
+            index = faiss.IndexIVFPQ(quantizer, dimension, nlist, config.pq_m, config.pq_nbits, metric)
+        else:
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist, metric)
+        index.train(vectors)
+
+    _apply_search_params(index, built_type, config)
+    if count:
+        index.add(vectors)
+    return index, built_type, nlist
+
+
+def _apply_search_params(index: Any, built_type: str, config: VectorIndexConfig) -> None:
+    """Set the query-time accuracy knobs for ``built_type`` on ``index``."""
+    if built_type == "hnsw":
+        index.hnsw.efSearch = config.hnsw_ef_search
+    elif built_type in ("ivf_flat", "ivf_pq"):
+        index.nprobe = min(config.nprobe, index.nlist)
 
 
 class VectorIndex(BaseIndex):
@@ -40,17 +142,52 @@ class VectorIndex(BaseIndex):
         """Create a vector index using the provided configuration options."""
         super().__init__(mode=SearchMode.VECTOR, index_id=index_id, options_snapshot=options_snapshot)
         self.config = config or VectorIndexConfig()
-        self._vectors: Any = None
+        # Embedding rows live in ``_matrix[:_vector_count]``; spare capacity
+        # lets repeated appends grow the matrix geometrically instead of copying
+        # it on every batch.
+        self._matrix: Any = None
         self._vector_count = 0
         self._dimension: int | None = None
         self._faiss_index: Any = None
+        self._built_index_type = "flat"
+        self._trained_nlist = 0
         self._encoder: Any = None
+        self._embedding_cache: EmbeddingCache | None = None
         # Lazily-loaded optional modules/classes (typed as Any to avoid
         # mypy issues with conditional imports across different environments)
         self._np: Any = None
         self._faiss: Any = None
         self._sentence_transformers: Any = None
 
+    @property
+    def _vectors(self) -> Any:
+        """Stored embeddings, one row per chunk (a view; None before the first add)."""
+        if self._matrix is None:
+            return None
+        return self._matrix[: self._vector_count]
+
+    @_vectors.setter
+    def _vectors(self, vectors: Any) -> None:
+        self._matrix = vectors
+        self._vector_count = 0 if vectors is None else int(vectors.shape[0])
+
+    def _append_vectors(self, embeddings: Any) -> None:
+        """Append ``embeddings`` rows, doubling the matrix capacity when it is full."""
+        stored = self._vector_count if self._matrix is not None else 0
+        needed = stored + int(embeddings.shape[0])
+        if self._matrix is None or needed > self._matrix.shape[0]:
+            grown = self._np.empty((max(needed, 2 * stored), embeddings.shape[1]), dtype=self._np.float32)
+            if stored:
+                grown[:stored] = self._matrix[:stored]
+            self._matrix = grown
+        self._matrix[stored:needed] = embeddings
+        self._vector_count = needed
+
+    @property
+    def built_index_type(self) -> str:
+        """Index type currently backing searches (may be ``"flat"`` until IVF can train)."""
+        return self._built_index_type
+
     @requires_dependencies("search_vector", DEPS_SEARCH_VECTOR)
     def _ensure_backends(self) -> None:
         if self._np is None:
@@ -67,7 +204,7 @@ class VectorIndex(BaseIndex):
             self._sentence_transformers = SentenceTransformer
 
     def _build_backend(self) -> None:
-        """Encode any new chunks and rebuild the FAISS index."""
+        """Encode any new chunks and append them to the FAISS index in place."""
         self._ensure_backends()
         if self._np is None:
             return
@@ -75,32 +212,79 @@ class VectorIndex(BaseIndex):
         new_chunks = self._chunks[self._vector_count :]
         if new_chunks:
             embeddings = self._encode_texts([chunk.text for chunk in new_chunks])
-            if self.config.normalize_embeddings:
-                embeddings = self._normalize_embeddings(embeddings)
 
-            if self._vectors is None:
-                self._vectors = embeddings
+            self._append_vectors(embeddings)
+            self._dimension = int(embeddings.shape[1])
+
+            if self._faiss_index is None or self._needs_retrain():
+                self._rebuild_faiss_index()
             else:
-                self._vectors = self._np.vstack([self._vectors, embeddings])
-            self._vector_count = len(self._chunks)
+                self._faiss_index.add(embeddings)
 
         if self._vectors is None or not len(self._chunks):
             self._faiss_index = None
             self._dimension = None
-            return
 
-        self._dimension = int(self._vectors.shape[1])
-        vectors32 = self._vectors.astype(self._np.float32)
-        self._faiss_index = self._create_index(self._dimension)
-        self._faiss_index.reset()
-        self._faiss_index.add(vectors32)
-
-    def _create_index(self, dimension: int):  # type: ignore[no-untyped-def]
+    def _needs_retrain(self) -> bool:
+        """Return True when the corpus has outgrown the trained IVF structure.
+
+        A flat fallback is replaced as soon as the configured IVF type can be
+        trained, and IVF indexes are retrained once the target list count has
+        doubled, so retraining cost stays amortized over appends.
+        """
+        target = _buildable_index_type(self.config, self._vector_count)
+        if target != self._built_index_type:
+            return True
+        if target in ("ivf_flat", "ivf_pq"):
+            return _ivf_list_count(self.config, self._vector_count) >= 2 * self._trained_nlist
+        return False
+
+    def _rebuild_faiss_index(self) -> None:
+        """Create (and train) the configured FAISS index over every stored vector."""
         if self._faiss is None:
             raise RuntimeError("FAISS backend not initialised")
-        if self.config.normalize_embeddings:
-            return self._faiss.IndexFlatIP(dimension)
-        return self._faiss.IndexFlatL2(dimension)
+        self._faiss_index, self._built_index_type, self._trained_nlist = _build_faiss_index(
+            self._faiss, self._vectors, self.config
+        )
+
+    def _remove_from_backend(self, positions: Sequence[int]) -> None:
+        """Drop the removed chunks' vectors from the matrix and the FAISS index."""
+        if self._vectors is None or self._faiss_index is None:
+            return
+        ids = self._np.asarray(positions, dtype=self._np.int64)
+        self._vectors = self._np.delete(self._vectors, ids, axis=0)
+        if self._built_index_type == "flat":
+            # Flat indexes compact on removal exactly like ``np.delete``, so
+            # FAISS ids keep matching chunk positions.
+            self._faiss_index.remove_ids(ids)
+        else:
+            # IVF and HNSW ids do not renumber on removal; re-add the survivors.
+            # ``reset`` keeps IVF training, so no k-means pass is repeated.
+            self._faiss_index.reset()
+            if self._vector_count:
+                self._faiss_index.add(self._vectors)
+
+    def set_search_params(self, *, nprobe: int | None = None, ef_search: int | None = None) -> None:
+        """Change query-time accuracy knobs without rebuilding the index.
+
+        Parameters
+        ----------
+        nprobe : int, optional
+            Number of IVF lists scanned per query (IVF index types).
+        ef_search : int, optional
+            Size of the HNSW candidate queue per query (``"hnsw"``).
+
+        """
+        if nprobe is not None:
+            if nprobe <= 0:
+                raise ValueError("nprobe must be positive")
+            self.config.nprobe = nprobe
+        if ef_search is not None:
+            if ef_search <= 0:
+                raise ValueError("ef_search must be positive")
+            self.config.hnsw_ef_search = ef_search
+        if self._faiss_index is not None:
+            _apply_search_params(self._faiss_index, self._built_index_type, self.config)
 
     def _get_encoder(self):  # type: ignore[no-untyped-def]
         if self._encoder is None:
@@ -108,7 +292,40 @@ class VectorIndex(BaseIndex):
             self._encoder = self._sentence_transformers(self.config.model_name, device=self.config.device)
         return self._encoder
 
+    def _get_embedding_cache(self) -> EmbeddingCache | None:
+        if self._embedding_cache is None and self.config.embedding_cache_dir:
+            self._embedding_cache = EmbeddingCache(
+                Path(self.config.embedding_cache_dir),
+                model_name=self.config.model_name,
+                normalize=self.config.normalize_embeddings,
+            )
+        return self._embedding_cache
+
     def _encode_texts(self, texts: Sequence[str]):  # type: ignore[no-untyped-def]
+        """Return float32 embeddings for ``texts`` (normalized when configured).
+
+        With an embedding cache configured, only texts whose content hash is
+        not cached are sent to the model, and their embeddings are stored.
+        """
+        cache = self._get_embedding_cache()
+        if cache is None:
+            return self._run_encoder(texts)
+        keys = [text_key(text) for text in texts]
+        embeddings, misses = cache.get(keys)
+        if not misses:
+            return embeddings
+        fresh = self._run_encoder([texts[pos] for pos in misses])
+        cache.put([keys[pos] for pos in misses], fresh)
+        if embeddings is None:
+            return fresh
+        if embeddings.shape[1] != fresh.shape[1]:
+            # The cache file holds vectors of another width (e.g. a model that
+            # changed under the same name); bypass it rather than mix them.
+            return self._run_encoder(texts)
+        embeddings[misses] = fresh
+        return embeddings
+
+    def _run_encoder(self, texts: Sequence[str]):  # type: ignore[no-untyped-def]
         self._ensure_backends()
         encoder = self._get_encoder()  # type: ignore[no-untyped-call]
         encode_kwargs: dict[str, object] = {
@@ -118,8 +335,10 @@ class VectorIndex(BaseIndex):
         }
         if self.config.device:
             encode_kwargs["device"] = self.config.device
-        embeddings = encoder.encode(texts, **encode_kwargs)
-        return self._np.asarray(embeddings, dtype=self._np.float32)
+        embeddings = self._np.asarray(encoder.encode(texts, **encode_kwargs), dtype=self._np.float32)
+        if self.config.normalize_embeddings:
+            embeddings = self._normalize_embeddings(embeddings)
+        return embeddings
 
     def _normalize_embeddings(self, vectors: Any) -> Any:
         norms = self._np.linalg.norm(vectors, axis=1, keepdims=True)
@@ -132,10 +351,8 @@ class VectorIndex(BaseIndex):
         if self._faiss_index is None or self._np is None or self._dimension is None:
             return []
 
-        query_vec = self._encode_texts([query.raw_text])
-        if self.config.normalize_embeddings:
-            query_vec = self._normalize_embeddings(query_vec)
-        query_vec = query_vec.astype(self._np.float32)
+        # Queries bypass the embedding cache: they rarely repeat and would only bloat it.
+        query_vec = self._run_encoder([query.raw_text])
 
         scores, indices = self._faiss_index.search(query_vec, top_k)
         results: list[SearchResult] = []
@@ -169,6 +386,16 @@ class VectorIndex(BaseIndex):
             "normalize": self.config.normalize_embeddings,
             "batch_size": self.config.batch_size,
             "dimension": self._dimension,
+            "index_type": self.config.index_type,
+            "nlist": self.config.nlist,
+            "nprobe": self.config.nprobe,
+            "hnsw_m": self.config.hnsw_m,
+            "hnsw_ef_construction": self.config.hnsw_ef_construction,
+            "hnsw_ef_search": self.config.hnsw_ef_search,
+            "pq_m": self.config.pq_m,
+            "pq_nbits": self.config.pq_nbits,
+            "built_index_type": self._built_index_type,
+            "trained_nlist": self._trained_nlist,
         }
         self._write_manifest(directory, backend_payload=backend_payload)
 
@@ -186,6 +413,14 @@ class VectorIndex(BaseIndex):
         vectors = self._vectors if self._vectors is not None else self._np.zeros((0, 0), dtype=self._np.float32)
         self._np.save(vectors_path, vectors)
 
+        # The serialized FAISS index carries IVF centroids/PQ codebooks and the
+        # HNSW graph, so loading skips training and graph construction.
+        faiss_path = directory / _FAISS_INDEX_FILE
+        if self._faiss_index is not None:
+            self._faiss.write_index(self._faiss_index, str(faiss_path))
+        elif faiss_path.exists():
+            faiss_path.unlink()
+
     @classmethod
     @requires_dependencies("search_vector", DEPS_SEARCH_VECTOR)
     def load(cls, directory: Path) -> "VectorIndex":
@@ -197,6 +432,14 @@ class VectorIndex(BaseIndex):
             model_name=str(backend.get("model_name", default_cfg.model_name)),
             batch_size=int(backend.get("batch_size", default_cfg.batch_size)),
             normalize_embeddings=bool(backend.get("normalize", default_cfg.normalize_embeddings)),
+            index_type=cast(VectorIndexType, str(backend.get("index_type", default_cfg.index_type))),
+            nlist=int(backend.get("nlist", default_cfg.nlist)),
+            nprobe=int(backend.get("nprobe", default_cfg.nprobe)),
+            hnsw_m=int(backend.get("hnsw_m", default_cfg.hnsw_m)),
+            hnsw_ef_construction=int(backend.get("hnsw_ef_construction", default_cfg.hnsw_ef_construction)),
+            hnsw_ef_search=int(backend.get("hnsw_ef_search", default_cfg.hnsw_ef_search)),
+            pq_m=int(backend.get("pq_m", default_cfg.pq_m)),
+            pq_nbits=int(backend.get("pq_nbits", default_cfg.pq_nbits)),
         )
 
         index = cls(config=config, index_id=manifest.index_id, options_snapshot=manifest.options)
@@ -221,13 +464,31 @@ class VectorIndex(BaseIndex):
                 if config.normalize_embeddings:
                     vectors = index._normalize_embeddings(vectors)
                 index._vectors = vectors
-                index._vector_count = vectors.shape[0]
                 index._dimension = vectors.shape[1]
-                index._faiss_index = index._create_index(index._dimension)
-                index._faiss_index.reset()
-                index._faiss_index.add(vectors.astype(index._np.float32))
+                index._vectors = index._vectors.astype(index._np.float32)
+                if not index._read_faiss_index(directory / _FAISS_INDEX_FILE, backend):
+                    index._rebuild_faiss_index()
         return index
 
+    def _read_faiss_index(self, path: Path, backend: Mapping[str, Any]) -> bool:
+        """Load a persisted FAISS index if it matches the stored vectors."""
+        built_type = backend.get("built_index_type")
+        if not path.exists() or built_type not in VECTOR_INDEX_TYPES:
+            return False
+        try:
+            faiss_index = self._faiss.read_index(str(path))
+        except RuntimeError as exc:
+            logger.warning("Could not read FAISS index %s (%s); rebuilding from vectors", path, exc)
+            return False
+        if faiss_index.ntotal != self._vector_count or faiss_index.d != self._dimension:
+            logger.warning("FAISS index %s does not match the stored vectors; rebuilding", path)
+            return False
+        self._faiss_index = faiss_index
+        self._built_index_type = str(built_type)
+        self._trained_nlist = int(backend.get("trained_nlist", 0))
+        _apply_search_params(faiss_index, self._built_index_type, self.config)
+        return True
+
 
 def _serialize_metadata(metadata: Mapping[str, object]) -> dict[str, object]:
     serialized: dict[str, object] = {}
@@ -50,7 +50,8 @@ Complex pipeline:
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, Union
+from pathlib import Path
+from typing import IO, Any, Optional, Union, cast, overload
 
 from all2md.ast.nodes import Document, Node
 from all2md.ast.transforms import NodeTransformer
@@ -62,6 +63,10 @@ from all2md.renderers import MarkdownRenderer
 from all2md.renderers.base import BaseRendererOptions
 from all2md.transforms.hooks import HookCallable, HookContext, HookManager, HookTarget
 from all2md.transforms.registry import transform_registry
+from all2md.utils.io_utils import is_binary_stream, replace_on_success, write_content
+
+#: Where a pipeline can write its rendered output instead of returning it
+OutputTarget = Union[str, Path, IO[bytes], IO[str]]
 
 logger = logging.getLogger(__name__)
 
@@ -670,6 +675,41 @@ class Pipeline:
             f"either render_to_string() or render_to_bytes()"
         )
 
+    def _can_stream_to(self, output: OutputTarget) -> bool:
+        """Check whether the renderer can stream straight to ``output``.
+
+        Streaming needs a renderer with ``render_to_stream`` (Markdown), a file
+        path or text stream to write to, and no ``post_render`` hooks -- those
+        receive, and may replace, the complete rendered text.
+        """
+        if not callable(getattr(self.renderer, "render_to_stream", None)):
+            return False
+        if self.hook_manager.has_hooks("post_render"):
+            return False
+        return isinstance(output, (str, Path)) or not is_binary_stream(output)
+
+    def _render_to_output(self, document: Document, output: OutputTarget) -> None:
+        """Render document block by block straight into ``output``.
+
+        A path is written through :func:`~all2md.utils.io_utils.replace_on_success`,
+        so a render that fails halfway leaves the previous file in place, as
+        rendering to a string first used to. Errors are translated the way
+        :meth:`_render` translates them.
+        """
+        renderer = self.renderer
+        assert renderer is not None  # _can_stream_to found render_to_stream on it
+        logger.debug(f"Streaming document using {renderer.__class__.__name__}")
+        try:
+            if isinstance(output, (str, Path)):
+                with replace_on_success(output) as handle:
+                    renderer.render_to_stream(document, handle)
+            else:
+                renderer.render_to_stream(document, cast(IO[str], output))
+        except All2MdError:
+            raise
+        except Exception as e:
+            raise self._rendering_error(e) from e
+
     def get_diagnostics(self) -> dict[str, Any]:
         """Get diagnostic information about the pipeline configuration.
 
@@ -744,7 +784,13 @@ class Pipeline:
 
         return diagnostics
 
-    def execute(self, document: Document) -> Union[str, bytes]:
+    @overload
+    def execute(self, document: Document, output: None = None) -> Union[str, bytes]: ...
+
+    @overload
+    def execute(self, document: Document, output: OutputTarget) -> None: ...
+
+    def execute(self, document: Document, output: Optional[OutputTarget] = None) -> Union[str, bytes, None]:
         """Execute complete pipeline.
 
         This method runs the full transformation and rendering pipeline:
@@ -762,17 +808,27 @@ class Pipeline:
         ----------
         document : Document
             Document to process
+        output : str, Path, IO[bytes], IO[str], or None, default None
+            Where to write the rendered output. With a file path or text
+            stream, a renderer that supports it (Markdown) streams the
+            document block by block instead of building the whole text in
+            memory; ``post_render`` hooks need the whole text and turn
+            streaming off. Otherwise the rendered output is written in one go.
 
         Returns
         -------
-        str or bytes
-            Rendered output (type depends on renderer)
+        str, bytes, or None
+            Rendered output (type depends on renderer), or None when it was
+            written to ``output``
 
         Examples
         --------
         >>> pipeline = Pipeline(transforms=['remove-images'])
         >>> output = pipeline.execute(document)
 
+        Stream straight to a file:
+            >>> pipeline.execute(document, output="document.md")
+
         """
         logger.info("Starting pipeline execution")
 
@@ -865,7 +921,12 @@ class Pipeline:
             )
 
             # Render
-            output = self._render(document)
+            rendered: Union[str, bytes, None]
+            if output is not None and self._can_stream_to(output):
+                self._render_to_output(document, output)
+                rendered = None
+            else:
+                rendered = self._render(document)
 
             current_stage += 1
             self._emit_progress(
@@ -876,12 +937,12 @@ class Pipeline:
                 metadata={"item_type": "render", "renderer": self.renderer.__class__.__name__},
             )
 
-            # Post-render hook
-            if self.hook_manager.has_hooks("post_render"):
+            # Post-render hook (never set when streaming; see _can_stream_to)
+            if rendered is not None and self.hook_manager.has_hooks("post_render"):
                 logger.debug("Executing post_render hooks")
-                output = self.hook_manager.execute_hooks("post_render", output, context)
+                rendered = self.hook_manager.execute_hooks("post_render", rendered, context)
 
-                if output is None:
+                if rendered is None:
                     raise ValueError("post_render hook removed output")
 
                 current_stage += 1
@@ -896,8 +957,12 @@ class Pipeline:
             # Emit finished event
             self._emit_progress("finished", "Pipeline execution complete", current=stage_count, total=stage_count)
 
+            if rendered is not None and output is not None:
+                write_content(rendered, output)
+                rendered = None
+
             logger.info("Pipeline execution complete")
-            return output
+            return rendered
 
         except Exception as e:
             # Emit error event
@@ -1155,6 +1220,36 @@ def apply(
         raise
 
 
+@overload
+def render(
+    document: Document,
+    transforms: Optional[list[Union[str, NodeTransformer]]] = None,
+    hooks: Optional[dict[HookTarget, list[HookCallable]]] = None,
+    renderer: Optional[Union[str, type, Any]] = None,
+    options: Optional[Union[BaseRendererOptions, MarkdownRendererOptions]] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    strict_hooks: bool = False,
+    *,
+    output: None = None,
+    **kwargs: Any,
+) -> Union[str, bytes]: ...
+
+
+@overload
+def render(
+    document: Document,
+    transforms: Optional[list[Union[str, NodeTransformer]]] = None,
+    hooks: Optional[dict[HookTarget, list[HookCallable]]] = None,
+    renderer: Optional[Union[str, type, Any]] = None,
+    options: Optional[Union[BaseRendererOptions, MarkdownRendererOptions]] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    strict_hooks: bool = False,
+    *,
+    output: OutputTarget,
+    **kwargs: Any,
+) -> None: ...
+
+
 def render(
     document: Document,
     transforms: Optional[list[Union[str, NodeTransformer]]] = None,
@@ -1163,8 +1258,10 @@ def render(
     options: Optional[Union[BaseRendererOptions, MarkdownRendererOptions]] = None,
     progress_callback: Optional[ProgressCallback] = None,
     strict_hooks: bool = False,
+    *,
+    output: Optional[OutputTarget] = None,
     **kwargs: Any,
-) -> Union[str, bytes]:
+) -> Union[str, bytes, None]:
     """Render document with transforms and hooks using specified renderer.
 
     This is the high-level entry point for the transformation pipeline.
@@ -1195,14 +1292,17 @@ def render(
         Enable strict mode for hook exception handling. If True, hook exceptions
         are re-raised and abort the pipeline. If False (default), exceptions are
         logged and execution continues.
+    output : str, Path, IO[bytes], IO[str], or None, default None
+        Write the rendered output here instead of returning it; Markdown is
+        streamed block by block (see :meth:`Pipeline.execute`)
     **kwargs
         Additional keyword arguments passed to MarkdownOptions if
         options is not provided and renderer is markdown
 
     Returns
     -------
-    str or bytes
-        Rendered output (type depends on renderer)
+    str, bytes, or None
+        Rendered output (type depends on renderer), or None when written to ``output``
 
     Raises
     ------
@@ -1275,7 +1375,7 @@ def render(
         strict_hooks=strict_hooks,
     )
 
-    return pipeline.execute(document)
+    return pipeline.execute(document, output)
 
 
 __all__ = [
@@ -23,7 +23,7 @@ import json
 from pathlib import Path
 from typing import Iterable, Mapping
 
-__all__ = ["file_signature", "bytes_signature", "corpus_fingerprint"]
+__all__ = ["file_signature", "bytes_signature", "source_signature", "signatures_fingerprint", "corpus_fingerprint"]
 
 _HASH_READ_CHUNK = 1 << 20  # 1 MiB
 
@@ -91,6 +91,40 @@ def _normalize_extra(mapping: Mapping[str, object]) -> dict[str, object]:
     return normalized
 
 
+def source_signature(source: str | Path | bytes, *, content_hash: bool = False) -> dict[str, object]:
+    """Return the change-signature :func:`corpus_fingerprint` records for one source.
+
+    ``bytes`` sources are content-hashed; path sources use :func:`file_signature`,
+    and a missing / unstat-able path yields a ``{"path", "missing"}`` sentinel
+    instead of raising, so its disappearance still changes a digest.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return bytes_signature(bytes(source))
+    try:
+        return file_signature(source, content_hash=content_hash)
+    except OSError:
+        return {"path": str(source), "missing": True}
+
+
+def signatures_fingerprint(
+    signatures: Iterable[Mapping[str, object]],
+    *,
+    extra: Mapping[str, object] | None = None,
+) -> str:
+    """Return the :func:`corpus_fingerprint` digest of already-computed signatures.
+
+    Lets a caller that stored per-source signatures (e.g. a persisted index
+    manifest) recompute the corpus digest without touching the sources again.
+    """
+    entries = [dict(signature) for signature in signatures]
+    # Sort by a canonical rendering so ordering of the sources is irrelevant.
+    entries.sort(key=lambda entry: json.dumps(entry, sort_keys=True))
+
+    payload = {"entries": entries, "extra": _normalize_extra(extra or {})}
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
 def corpus_fingerprint(
     sources: Iterable[str | Path | bytes],
     *,
@@ -121,19 +155,7 @@ def corpus_fingerprint(
         Hex SHA-256 digest of the normalized ``(entries, extra)`` payload.
 
     """
-    entries: list[dict[str, object]] = []
-    for source in sources:
-        if isinstance(source, (bytes, bytearray)):
-            entries.append(bytes_signature(bytes(source)))
-            continue
-        try:
-            entries.append(file_signature(source, content_hash=content_hash))
-        except OSError:
-            entries.append({"path": str(source), "missing": True})
-
-    # Sort by a canonical rendering so ordering of ``sources`` is irrelevant.
-    entries.sort(key=lambda entry: json.dumps(entry, sort_keys=True))
-
-    payload = {"entries": entries, "extra": _normalize_extra(extra or {})}
-    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(blob).hexdigest()
+    return signatures_fingerprint(
+        (source_signature(source, content_hash=content_hash) for source in sources),
+        extra=extra,
+    )
@@ -33,6 +33,9 @@ from all2md.utils.security import is_url_scheme_dangerous
 
 logger = logging.getLogger(__name__)
 
+# One str.startswith call checks every framework prefix at once.
+_FRAMEWORK_PREFIXES = tuple(FRAMEWORK_ATTRIBUTE_PREFIXES)
+
 
 def _is_style_safe(style_value: str) -> bool:
     """Check if a CSS style attribute value is safe.
@@ -705,19 +708,11 @@ def is_element_safe(element: Any, *, strip_framework_attributes: bool = False) -
                 if attr_name_lower in FRAMEWORK_ATTRIBUTES:
                     return False
 
-                # Check framework attribute prefixes
-                # Note: Some prefixes like @ and : need special handling since they may
-                # appear at the start of the attribute name in some parsers
-                for prefix in FRAMEWORK_ATTRIBUTE_PREFIXES:
-                    if attr_name.startswith(prefix) or attr_name_lower.startswith(prefix):
-                        # Special handling for Angular bracket/paren syntax
-                        if prefix in ("[", "(") and (
-                            attr_name.startswith(prefix) or attr_name.endswith("]" if prefix == "[" else ")")
-                        ):
-                            return False
-                        # Standard prefix matching
-                        elif prefix not in ("[", "("):
-                            return False
+                # Check framework attribute prefixes (Angular's [prop]/(event) bindings
+                # included). The original spelling is checked too, for parsers that keep
+                # the case of @/: shorthand attributes.
+                if attr_name_lower.startswith(_FRAMEWORK_PREFIXES) or attr_name.startswith(_FRAMEWORK_PREFIXES):
+                    return False
 
             # Enhanced URL scheme checking for href and src attributes
             if isinstance(attr_value, str):
@@ -11,10 +11,46 @@ output destinations (files, file-like objects, or returning as file-like objects
 from __future__ import annotations
 
 import io
+import os
+import secrets
 import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Union, cast
+from typing import IO, Any, Union, cast
+
+
+def is_binary_stream(output: Any) -> bool:
+    """Return whether a writable file-like object expects bytes rather than str.
+
+    Parameters
+    ----------
+    output : Any
+        File-like object with a ``write`` method
+
+    Returns
+    -------
+    bool
+        True for binary streams, False for text streams or when the mode
+        cannot be determined (text is the safer default for str content)
+
+    """
+    # Strategy 1: Check concrete types first (most reliable)
+    if isinstance(output, BytesIO):
+        return True
+    if isinstance(output, StringIO):
+        return False
+    # Strategy 2: Check io module base classes (robust for standard streams)
+    if isinstance(output, io.TextIOBase):
+        return False
+    if isinstance(output, (io.BufferedIOBase, io.RawIOBase)):
+        return True
+    # Strategy 3: Check mode attribute (fallback for file objects)
+    if hasattr(output, "mode"):
+        mode = getattr(output, "mode", "")
+        return isinstance(mode, str) and "b" in mode
+    return False
 
 
 def write_content(
@@ -95,24 +131,7 @@ def write_content(
 
     # If output is a file-like object, write to it
     if hasattr(output, "write"):
-        # Detect if binary or text mode using multiple strategies
-        # Strategy 1: Check concrete types first (most reliable)
-        if isinstance(output, BytesIO):
-            is_binary_mode = True
-        elif isinstance(output, StringIO):
-            is_binary_mode = False
-        # Strategy 2: Check io module base classes (robust for standard streams)
-        elif isinstance(output, io.TextIOBase):
-            is_binary_mode = False
-        elif isinstance(output, (io.BufferedIOBase, io.RawIOBase)):
-            is_binary_mode = True
-        # Strategy 3: Check mode attribute (fallback for file objects)
-        elif hasattr(output, "mode"):
-            mode = getattr(output, "mode", "")
-            is_binary_mode = isinstance(mode, str) and "b" in mode
-        else:
-            # Default to text mode if we can't determine (safest for str content)
-            is_binary_mode = False
+        is_binary_mode = is_binary_stream(output)
 
         if is_binary_mode:
             # Binary mode - write bytes
@@ -170,4 +189,46 @@ def backup_file(path: Path) -> Path | None:
     return candidate
 
 
-__all__ = ["backup_file", "write_content"]
+@contextmanager
+def replace_on_success(path: Union[str, Path]) -> Iterator[IO[str]]:
+    """Open a UTF-8 text file that takes the place of ``path`` only if the block succeeds.
+
+    For writers that stream their output: the text goes to a hidden temporary
+    file in the same directory, which is moved onto ``path`` when the block
+    exits normally and deleted when it raises, so a failed run leaves whatever
+    was at ``path`` before untouched instead of a truncated file. A replaced
+    file keeps its permission bits. Anything that is not a regular file (a
+    symlink, ``/dev/stdout``, a FIFO) is written to directly, since replacing
+    it would swap the link or device for a plain file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Destination file.
+
+    Yields
+    ------
+    IO[str]
+        Text handle to write to.
+
+    """
+    target = Path(path)
+    if target.is_symlink() or (target.exists() and not target.is_file()):
+        with open(target, "w", encoding="utf-8") as handle:
+            yield handle
+        return
+
+    # Opened with "x" rather than via tempfile so a new file gets the usual umask-derived mode
+    temporary = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(temporary, "x", encoding="utf-8") as handle:
+            yield handle
+        if target.exists():
+            shutil.copymode(target, temporary)
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+__all__ = ["backup_file", "is_binary_stream", "replace_on_success", "write_content"]
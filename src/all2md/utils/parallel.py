@@ -0,0 +1,81 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+#
+# src/all2md/utils/parallel.py
+"""Bounded, ordered submission of work to a process pool.
+
+The archive, mailbox, chunking and search pipelines all fan work out to a
+``ProcessPoolExecutor`` while still producing results in input order. This
+module holds the one window they share: inputs are pulled lazily, only a
+fixed number of them are submitted ahead of the result being awaited, and
+futures come back in submission order.
+
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, TypeVar
+
+__all__ = ["in_flight_limit", "submit_in_order"]
+
+T = TypeVar("T")
+
+# Items submitted ahead of the one whose result is awaited, per worker. Two
+# keeps every worker busy while a result is being assembled without letting
+# read-ahead grow with the input.
+_IN_FLIGHT_PER_WORKER = 2
+
+
+def in_flight_limit(max_workers: int | None) -> int:
+    """Return how many items may be submitted ahead for ``max_workers`` workers."""
+    return max(1, (max_workers or os.cpu_count() or 1) * _IN_FLIGHT_PER_WORKER)
+
+
+def submit_in_order(
+    executor: Executor,
+    items: Iterable[T],
+    worker: Callable[..., Any],
+    *args: Any,
+    limit: int,
+    bypass: Callable[[T], bool] | None = None,
+) -> Iterator[tuple[T, Future[Any] | None]]:
+    """Submit items to ``executor`` lazily and yield them with their futures in order.
+
+    ``items`` is only advanced while fewer than ``limit`` items are waiting,
+    so at most ``limit`` items are alive at once. The caller is expected to
+    wait on each yielded future before pulling the next pair.
+
+    Parameters
+    ----------
+    executor : Executor
+        Pool the worker runs in
+    items : Iterable[T]
+        Inputs in the order results are wanted, ideally produced lazily
+    worker : callable
+        Picklable ``worker(item, *args)`` function
+    *args : Any
+        Extra arguments forwarded to every worker call
+    limit : int
+        Maximum number of items submitted but not yet yielded
+    bypass : callable, optional
+        Predicate for items the caller handles itself; they keep their place
+        in the order but are yielded with a ``None`` future instead of being
+        sent to a worker.
+
+    Yields
+    ------
+    tuple[T, Future or None]
+        Each item and its pending result, in the order of ``items``
+
+    """
+    window: deque[tuple[T, Future[Any] | None]] = deque()
+    for item in items:
+        future = None if bypass is not None and bypass(item) else executor.submit(worker, item, *args)
+        window.append((item, future))
+        if len(window) >= limit:
+            yield window.popleft()
+    while window:
+        yield window.popleft()
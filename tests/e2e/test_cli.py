@@ -217,7 +217,6 @@ def example_function():
         assert any("<<" in entry["text"] for entry in data)
 
     @pytest.mark.search
-    @pytest.mark.skipif(importlib.util.find_spec("rank_bm25") is None, reason="rank_bm25 not installed")
     def test_search_cli_keyword(self):
         """Test search CLI keyword mode with persistence."""
         doc = self.temp_dir / "doc.md"
@@ -4,12 +4,13 @@ This module tests the serve command functionality, including HTTP server setup,
 directory/file serving, theme support, and proper shutdown.
 """
 
+import gzip
 import subprocess
 import sys
 import time
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
 import pytest
 from utils import cleanup_test_dir, create_test_temp_dir
@@ -617,27 +618,62 @@ More content.
         assert "This has changed!" in html3
 
     def test_serve_with_cache_single_file(self):
-        """Test that without --no-cache, file is cached and not re-converted."""
+        """Test that without --no-cache, a page is reused until its file changes."""
         # Create a markdown file
         md_file = self._create_test_markdown()
 
         self._start_server(["serve", str(md_file), "--port", "8016"])
 
-        # Fetch the content once to populate cache
-        content1 = self._fetch_url("http://127.0.0.1:8016/")
-        html1 = content1.decode("utf-8")
+        # The same rendering is served twice (same entity tag).
+        with urlopen("http://127.0.0.1:8016/", timeout=5) as first:
+            html1 = first.read().decode("utf-8")
+            etag1 = first.headers["ETag"]
+        with urlopen("http://127.0.0.1:8016/", timeout=5) as second:
+            assert second.headers["ETag"] == etag1
 
         assert "Test Document" in html1
 
-        # Modify the file
+        # Modify the file: its signature changes, so the cached page no longer matches
         md_file.write_text("# Updated Content\n\nThis has changed!", encoding="utf-8")
 
-        # Fetch again - should still show old content due to cache
         content2 = self._fetch_url("http://127.0.0.1:8016/")
         html2 = content2.decode("utf-8")
 
-        assert "Test Document" in html2
-        assert "Updated Content" not in html2
+        assert "Updated Content" in html2
+        assert "Test Document" not in html2
+
+    def test_serve_conditional_get(self):
+        """A request carrying the page's ETag or a later date gets 304 Not Modified."""
+        md_file = self._create_test_markdown()
+
+        self._start_server(["serve", str(md_file), "--port", "8034"])
+
+        with urlopen("http://127.0.0.1:8034/", timeout=5) as response:
+            etag = response.headers["ETag"]
+            last_modified = response.headers["Last-Modified"]
+        assert etag and last_modified
+
+        for header, value in (("If-None-Match", etag), ("If-Modified-Since", last_modified)):
+            request = Request("http://127.0.0.1:8034/", headers={header: value})
+            with pytest.raises(HTTPError) as excinfo:
+                urlopen(request, timeout=5)
+            assert excinfo.value.code == 304
+
+        request = Request("http://127.0.0.1:8034/", headers={"If-None-Match": '"stale"'})
+        with urlopen(request, timeout=5) as response:
+            assert response.status == 200
+
+    def test_serve_gzip_encoding(self):
+        """Clients accepting gzip get the precompressed body."""
+        md_file = self._create_test_markdown()
+
+        self._start_server(["serve", str(md_file), "--port", "8035"])
+
+        plain = self._fetch_url("http://127.0.0.1:8035/")
+        request = Request("http://127.0.0.1:8035/", headers={"Accept-Encoding": "gzip"})
+        with urlopen(request, timeout=5) as response:
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(response.read()) == plain
 
     def test_serve_no_cache_directory(self):
         """Test that --no-cache re-scans directory on each request."""
@@ -0,0 +1,100 @@
+"""Integration tests for page-parallel PDF parsing.
+
+Parallel mode must be an implementation detail: the document, the confidence
+signals and the per-page progress events all have to match the serial loop.
+"""
+
+import pymupdf
+import pytest
+from fixtures.generators.pdf_test_fixtures import create_test_pdf_bytes
+
+from all2md.ast.serialization import ast_to_json
+from all2md.options import PdfOptions
+from all2md.parsers.pdf import PdfToAstConverter
+
+
+def _multi_page_pdf_bytes() -> bytes:
+    """Concatenate the generated fixtures into one ten-page document."""
+    combined = pymupdf.open()
+    for _ in range(2):
+        for pdf_type in ("tables", "formatting", "complex", "figures"):
+            part = pymupdf.open(stream=create_test_pdf_bytes(pdf_type), filetype="pdf")
+            combined.insert_pdf(part)
+            part.close()
+    data = combined.write()
+    combined.close()
+    return data
+
+
+def _parse(pdf_bytes: bytes, events: list | None = None, **overrides):
+    options = PdfOptions(layout_analysis_mode="disabled", include_page_numbers=True, **overrides)
+    parser = PdfToAstConverter(options, progress_callback=events.append if events is not None else None)
+    doc = parser.parse(pdf_bytes)
+    return parser, doc
+
+
+@pytest.mark.integration
+@pytest.mark.pdf
+@pytest.mark.parallel
+class TestPdfPageParallelConversion:
+    def test_output_matches_serial(self):
+        pdf_bytes = _multi_page_pdf_bytes()
+
+        serial_parser, serial_doc = _parse(pdf_bytes)
+        parallel_parser, parallel_doc = _parse(
+            pdf_bytes, enable_parallel_processing=True, max_workers=2, parallel_threshold=2
+        )
+
+        assert ast_to_json(parallel_doc) == ast_to_json(serial_doc)
+        assert parallel_parser._quality_signals == serial_parser._quality_signals
+        assert parallel_parser._degraded_events == serial_parser._degraded_events
+
+    def test_progress_events_cover_every_page(self):
+        pdf_bytes = _multi_page_pdf_bytes()
+        page_count = pymupdf.open(stream=pdf_bytes, filetype="pdf").page_count
+
+        events: list = []
+        _parse(pdf_bytes, events, enable_parallel_processing=True, max_workers=2, parallel_threshold=2)
+
+        page_events = [e for e in events if e.event_type == "item_done"]
+        assert sorted(e.metadata["page"] for e in page_events) == list(range(1, page_count + 1))
+        assert [e.current for e in page_events] == list(range(1, page_count + 1))
+        assert events[0].event_type == "started"
+        assert events[-1].event_type == "finished"
+
+    def test_below_threshold_stays_serial(self, monkeypatch):
+        pdf_bytes = create_test_pdf_bytes("tables")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("page-parallel path should not run below the threshold")
+
+        monkeypatch.setattr(PdfToAstConverter, "_render_pages_parallel", fail)
+        _, doc = _parse(pdf_bytes, enable_parallel_processing=True, parallel_threshold=50)
+        assert doc.children
+
+    def test_worker_error_is_reported_and_raised(self, monkeypatch):
+        # A thread pool stands in for the process pool so the patched page method
+        # is the one the workers run; the dispatch and error path are unchanged.
+        import concurrent.futures
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor)
+        original = PdfToAstConverter._process_page_to_ast
+
+        def fail_on_third_page(self, page, page_num, *args, **kwargs):
+            if page_num == 2:
+                raise RuntimeError("page exploded")
+            return original(self, page, page_num, *args, **kwargs)
+
+        monkeypatch.setattr(PdfToAstConverter, "_process_page_to_ast", fail_on_third_page)
+
+        events: list = []
+        with pytest.raises(RuntimeError, match="page exploded"):
+            _parse(
+                _multi_page_pdf_bytes(), events, enable_parallel_processing=True, max_workers=2, parallel_threshold=2
+            )
+
+        errors = [e for e in events if e.event_type == "error"]
+        assert len(errors) == 1
+        assert errors[0].metadata["page"] == 3
+        assert errors[0].metadata["stage"] == "page_processing"
+        assert "page exploded" in errors[0].metadata["error"]
@@ -25,7 +25,6 @@ def test_search_service_grep_roundtrip(tmp_path: Path) -> None:
 
 @pytest.mark.integration
 @pytest.mark.search
-@pytest.mark.skipif(importlib.util.find_spec("rank_bm25") is None, reason="rank_bm25 not installed")
 def test_search_service_keyword_roundtrip(tmp_path: Path) -> None:
     source = FIXTURE_DIR / "basic.md"
     service = SearchService()
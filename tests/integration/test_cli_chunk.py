@@ -147,6 +147,18 @@ class TestChunkCLI:
             if ln.strip():
                 json.loads(ln)
 
+    def test_failed_run_keeps_existing_out_file(self, sample_file, tmp_path):
+        """A run that fails part-way leaves the previous --out file untouched."""
+        out = tmp_path / "chunks.jsonl"
+        out.write_text("previous\n", encoding="utf-8")
+        result = _run(
+            [str(sample_file), str(tmp_path / "missing.md"), "--token-counter", "whitespace", "--out", str(out)],
+            cwd=sample_file.parent,
+        )
+        assert result.returncode != 0
+        assert out.read_text(encoding="utf-8") == "previous\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["chunks.jsonl", "doc.md"]
+
     def test_stdin(self, sample_file):
         """Reading from stdin labels the document 'stdin'."""
         proc = subprocess.run(
@@ -191,6 +203,24 @@ class TestChunkCLI:
         assert "--drop-elements" in result.stdout
         assert "--elide-data-uris" in result.stdout
 
+    def test_parallel_matches_sequential(self, sample_file, table_file):
+        """--parallel writes the same records, in input order, as an in-process run."""
+        args = [str(sample_file), str(table_file), "--strategy", "paragraph", "--token-counter", "whitespace"]
+        sequential = _run(args, cwd=sample_file.parent)
+        parallel = _run([*args, "--parallel", "2"], cwd=sample_file.parent)
+        assert parallel.returncode == 0, parallel.stderr
+        assert parallel.stdout == sequential.stdout
+        assert [json.loads(ln)["document_id"] for ln in parallel.stdout.splitlines()][0] == "doc"
+
+    def test_skip_errors(self, sample_file):
+        """--skip-errors carries on past a missing input."""
+        args = [str(sample_file.parent / "missing.md"), str(sample_file), "--token-counter", "whitespace"]
+        args += ["--strategy", "section"]
+        assert _run(args, cwd=sample_file.parent).returncode != 0
+        result = _run([*args, "--skip-errors"], cwd=sample_file.parent)
+        assert result.returncode == 0, result.stderr
+        assert {json.loads(ln)["document_id"] for ln in result.stdout.splitlines()} == {"doc"}
+
 
 class TestChunkElementHandling:
     """Flags governing tables, dropped elements, and attachments."""
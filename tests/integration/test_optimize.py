@@ -190,6 +190,25 @@ class TestOptimizeApi:
         assert report.source_format == "pdf"
         assert report.evaluated > 0
 
+    @pytest.mark.parallel
+    def test_worker_processes_report_what_a_sequential_run_does(self, gnarly_pdf):
+        sequential = optimize_options(gnarly_pdf)
+        parallel = optimize_options(gnarly_pdf, workers=2)
+
+        assert parallel.to_dict() == sequential.to_dict()
+
+    @pytest.mark.parallel
+    def test_worker_processes_share_the_conversion_cache(self, gnarly_pdf, tmp_path):
+        from all2md.conversion_cache import ConversionCache, use_conversion_cache
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path / "cache"):
+            report = optimize_options(gnarly_pdf, workers=2)
+
+        # Each worker merges its counters into the lifetime stats once, as it exits.
+        lifetime = ConversionCache(tmp_path / "cache").lifetime_stats()
+        assert lifetime.writes == lifetime.misses > 0
+        assert lifetime.hits + lifetime.misses >= report.evaluated
+
     def test_rejects_a_format_with_no_knobs(self, tmp_path):
         from all2md.exceptions import FormatError
 
@@ -270,3 +289,9 @@ class TestOptimizeCli:
 
         assert handle_optimize_command([gnarly_pdf, "--rounds", "0"]) != 0
         assert "--rounds" in capsys.readouterr().err
+
+    def test_rejects_negative_workers(self, gnarly_pdf, capsys):
+        from all2md.cli.commands.optimize import handle_optimize_command
+
+        assert handle_optimize_command([gnarly_pdf, "--workers", "-1"]) != 0
+        assert "--workers" in capsys.readouterr().err
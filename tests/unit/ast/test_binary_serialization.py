@@ -0,0 +1,136 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+"""Tests for the compact binary AST format."""
+
+import math
+import struct
+
+import pytest
+
+from all2md.ast import (
+    CodeBlock,
+    Document,
+    Emphasis,
+    Heading,
+    Image,
+    Link,
+    List,
+    ListItem,
+    Paragraph,
+    SourceLocation,
+    Strong,
+    Table,
+    TableCell,
+    TableRow,
+    Text,
+)
+from all2md.ast.binary_serialization import (
+    BINARY_FORMAT_VERSION,
+    ast_to_bytes,
+    bytes_to_ast,
+    read_ast_file,
+    write_ast_file,
+)
+from all2md.ast.serialization import ast_to_json
+
+
+def _sample_document() -> Document:
+    location = SourceLocation(format="pdf", page=3, metadata={"bbox": (72.0, -0.0, 540.25, 91.5)})
+    return Document(
+        metadata={"title": "Sample", "author": "Ada", "tags": ["a", "b"], "nested": {"depth": -7, "ok": True}},
+        children=[
+            Heading(level=1, content=[Text(content="Title", source_location=location)]),
+            Paragraph(
+                content=[
+                    Text(content="Plain "),
+                    Strong(content=[Text(content="bold")]),
+                    Text(content=" and "),
+                    Emphasis(content=[Text(content="ünïcødé \U0001f600")]),
+                    Link(url="https://example.com", content=[Text(content="link")], title=None),
+                ]
+            ),
+            List(
+                ordered=True,
+                start=3,
+                items=[ListItem(children=[Paragraph(content=[Text(content="Plain ")])]) for _ in range(3)],
+            ),
+            Table(
+                header=TableRow(cells=[TableCell(content=[Text(content="H")])], is_header=True),
+                rows=[TableRow(cells=[TableCell(content=[Text(content="1")], colspan=2)])],
+                alignments=["left"],
+                caption="Caption",
+            ),
+            CodeBlock(content="print('x')\n", language="python"),
+            Image(url="img.png", alt_text="", width=640, metadata={"scale": 1.5, "missing": None}),
+        ],
+    )
+
+
+@pytest.mark.unit
+class TestBinaryRoundTrip:
+    """Round-trip documents through the binary format."""
+
+    def test_document_roundtrip_is_equal(self) -> None:
+        doc = _sample_document()
+        restored = bytes_to_ast(ast_to_bytes(doc))
+        assert restored == doc
+        assert ast_to_json(restored) == ast_to_json(doc)
+
+    def test_tuples_and_signed_zero_survive(self) -> None:
+        doc = _sample_document()
+        restored = bytes_to_ast(ast_to_bytes(doc))
+        bbox = restored.children[0].content[0].source_location.metadata["bbox"]
+        assert isinstance(bbox, tuple)
+        assert math.copysign(1.0, bbox[1]) == -1.0
+
+    def test_repeated_strings_are_interned(self) -> None:
+        run = "repeated text " * 20
+        doc = Document(children=[Paragraph(content=[Text(content=run)]) for _ in range(50)])
+        assert ast_to_bytes(doc).count(run.encode("utf-8")) == 1
+
+    def test_file_roundtrip_through_mmap(self, tmp_path) -> None:
+        doc = _sample_document()
+        path = tmp_path / "doc.a2mb"
+        write_ast_file(doc, path)
+        assert read_ast_file(path) == doc
+
+    def test_unsupported_value_raises_type_error(self) -> None:
+        doc = Document(metadata={"when": object()})
+        with pytest.raises(TypeError):
+            ast_to_bytes(doc)
+
+
+@pytest.mark.unit
+class TestBinaryRejection:
+    """Blobs that are not a compatible binary AST raise ``ValueError``."""
+
+    def test_version_mismatch(self) -> None:
+        blob = bytearray(ast_to_bytes(_sample_document()))
+        struct.pack_into("<H", blob, 4, BINARY_FORMAT_VERSION + 1)
+        with pytest.raises(ValueError, match="format version"):
+            bytes_to_ast(bytes(blob))
+
+    def test_schema_digest_mismatch(self) -> None:
+        blob = bytearray(ast_to_bytes(_sample_document()))
+        blob[8:16] = bytes(8)
+        with pytest.raises(ValueError, match="node schema"):
+            bytes_to_ast(bytes(blob))
+
+    def test_bad_magic(self) -> None:
+        with pytest.raises(ValueError, match="magic"):
+            bytes_to_ast(b'{"node_type": "Document", "children": []}')
+
+    @pytest.mark.parametrize("cut", [3, 20, -1])
+    def test_truncated_blob(self, cut: int) -> None:
+        blob = ast_to_bytes(_sample_document())
+        with pytest.raises(ValueError, match="truncated"):
+            bytes_to_ast(blob[:cut])
+
+    def test_trailing_bytes(self) -> None:
+        with pytest.raises(ValueError, match="trailing"):
+            bytes_to_ast(ast_to_bytes(_sample_document()) + b"\x00")
+
+    def test_empty_file(self, tmp_path) -> None:
+        path = tmp_path / "empty.a2mb"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="empty"):
+            read_ast_file(path)
@@ -5,6 +5,7 @@ import pytest
 
 import all2md
 from all2md.chunking import ProvenanceChunk
+from all2md.exceptions import ValidationError
 
 pytestmark = pytest.mark.unit
 
@@ -85,3 +86,56 @@ def test_converter_options_forwarded():
         md, source_format="markdown", strategy="section", attachment_mode="skip", token_counter="whitespace"
     )
     assert chunks
+
+
+def test_chunk_many_is_exported():
+    """`all2md.chunk_many` is part of the public API."""
+    assert "chunk_many" in all2md.__all__
+
+
+def _corpus(tmp_path, count=4):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc{i}.md"
+        path.write_bytes(SAMPLE.replace(b"Intro", b"Intro %d" % i))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_chunk_many_matches_chunk_in_input_order(tmp_path, workers):
+    """Each source is chunked exactly as chunk() would, documents in input order."""
+    paths = _corpus(tmp_path)
+    expected = [
+        c.to_dict() for path in paths for c in all2md.chunk(str(path), strategy="paragraph", token_counter="whitespace")
+    ]
+    got = all2md.chunk_many((str(p) for p in paths), workers=workers, strategy="paragraph", token_counter="whitespace")
+    assert [c.to_dict() for c in got] == expected
+
+
+def test_chunk_many_numbers_bytes_sources():
+    """Bytes sources get distinct, position-based document ids."""
+    chunks = list(
+        all2md.chunk_many([SAMPLE, SAMPLE], source_format="markdown", strategy="section", token_counter="whitespace")
+    )
+    assert {c.document_id for c in chunks} == {"document-1", "document-2"}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_chunk_many_failures(tmp_path, workers):
+    """A failing document raises by default and is skipped with skip_errors."""
+    paths = [str(p) for p in _corpus(tmp_path, count=2)]
+    sources = [paths[0], str(tmp_path / "missing.md"), paths[1]]
+    with pytest.raises(Exception):
+        list(all2md.chunk_many(sources, workers=workers, strategy="section", token_counter="whitespace"))
+
+    chunks = list(
+        all2md.chunk_many(sources, workers=workers, skip_errors=True, strategy="section", token_counter="whitespace")
+    )
+    assert {c.document_id for c in chunks} == {"doc0", "doc1"}
+
+
+def test_chunk_many_rejects_negative_workers():
+    """A negative worker count is rejected."""
+    with pytest.raises(ValidationError, match="workers"):
+        list(all2md.chunk_many([SAMPLE], workers=-1))
@@ -5,9 +5,12 @@ import pytest
 
 from all2md.chunking.primitives import (
     ChunkerFactory,
+    LineChunker,
+    LineIndex,
     ParagraphChunker,
     SectionChunker,
     SentenceChunker,
+    TokenOffsets,
     WordChunker,
     reconstruct_document,
 )
@@ -49,6 +52,69 @@ class TestCountOnlyChunkers:
             assert LONG_PARAGRAPHS[c.position.start : c.position.end] == c.content
 
 
+class TestLineIndex:
+    """Line/column lookups by binary search over line starts."""
+
+    @pytest.mark.parametrize("text", ["", "one line", "a\nbc\n\ndef\n", "\n\n"])
+    def test_matches_counting_newlines(self, text):
+        """Every offset maps to the same line/column as counting the newlines before it."""
+        index = LineIndex(text)
+        for position in range(len(text) + 1):
+            before = text[:position]
+            expected = (before.count("\n") + 1, position - (before.rfind("\n") + 1) + 1)
+            assert index.line_column(position) == expected
+
+    def test_clamps_past_the_end(self):
+        """Offsets past the end resolve to the end of the text."""
+        assert LineIndex("ab\ncd").line_column(99) == (2, 3)
+
+    def test_split_chunks_report_their_own_lines(self):
+        """An over-long line split by words keeps line numbers relative to the whole text."""
+        text = "short\nshort\n" + " ".join(f"w{i}" for i in range(30)) + "\n"
+        chunks = LineChunker(max_tokens=8, counter=WS).chunk(text)
+        split = [c for c in chunks if c.position.start >= text.index("w0")]
+        assert len(split) > 1
+        assert all(c.position.line == 3 for c in split)
+        for c in chunks:
+            assert text[c.position.start : c.position.end] == c.content
+
+
+class _ByteEncoding:
+    """A byte-level stand-in for a tiktoken encoding, without ``decode_with_offsets``."""
+
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens):
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+class TestTokenOffsets:
+    """Token index -> character offset map."""
+
+    def test_cumulative_decode_fallback(self):
+        """Without decode_with_offsets, offsets come from per-token decode lengths."""
+        offsets = TokenOffsets("ab c", _ByteEncoding())
+        assert len(offsets) == 4
+        assert [offsets.char_offset(i) for i in range(6)] == [0, 1, 2, 3, 4, 4]
+
+    @pytest.mark.skipif(not tiktoken_available(), reason="tiktoken not installed")
+    def test_tiktoken_offsets_land_on_character_starts(self):
+        """Tokens inside a multi-byte character map to the character's own offset."""
+        import tiktoken
+
+        encoding = tiktoken.Encoding(
+            name="bytes",
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+        text = "né 日本"
+        offsets = TokenOffsets(text, encoding)
+        starts = [offsets.char_offset(i) for i in range(len(offsets) + 1)]
+        assert starts == [0, 1, 1, 2, 3, 3, 3, 4, 4, 4, 5]
+
+
 class TestSectionChunker:
     """Section chunker forbids overlap and keeps small sections whole."""
 
@@ -144,6 +144,26 @@ class TestProvenanceDerivation:
         assert chunks[0].page == 3
         assert chunks[0].page_end == 5
 
+    def test_each_window_reports_only_the_nodes_it_covers(self):
+        """A window's page span comes from the nodes its text was sliced from, not the whole section."""
+        doc = Document(
+            children=[
+                Heading(
+                    level=1, content=[Text(content="Chapter")], source_location=SourceLocation(format="pdf", page=1)
+                ),
+                *(
+                    Paragraph(
+                        content=[Text(content=f"Paragraph {page} sits alone on its own page.")],
+                        source_location=SourceLocation(format="pdf", page=page),
+                    )
+                    for page in (2, 3, 4)
+                ),
+            ]
+        )
+        chunks = chunk_ast(doc, strategy="paragraph", max_tokens=9, token_counter="whitespace")
+
+        assert [(c.page, c.page_end) for c in chunks] == [(1, 1), (2, 2), (3, 3), (4, 4)]
+
     def test_no_provenance_when_absent(self, doc):
         """Formats without page info leave page fields None."""
         chunks = chunk_ast(doc, strategy="paragraph", max_tokens=50, token_counter="whitespace")
@@ -236,9 +256,9 @@ class TestCharSpansIndexTheSectionText:
 
     def _section_text(self, nodes):
         """The string the spans are documented to index into."""
-        from all2md.chunking.provenance import _render_markdown
+        from all2md.api import from_ast
 
-        return _render_markdown(list(nodes))
+        return from_ast(Document(children=list(nodes)), "markdown")
 
     def _doc_with_table(self):
         """A section shaped prose / table / prose."""
@@ -335,29 +355,36 @@ class TestCharSpansIndexTheSectionText:
             assert chunk.char_basis == "section_text"
             assert section_text[chunk.char_start : chunk.char_end] == chunk.text
 
-    def test_an_unlocatable_segment_admits_its_basis(self, monkeypatch):
-        """Rendering a fragment is not always a substring of rendering the whole.
+    def test_the_document_is_rendered_once(self, monkeypatch):
+        """Sections and segments are sliced out of one rendering, not re-rendered."""
+        from all2md.renderers.markdown import MarkdownRenderer
 
-        Footnote definitions, for one, are collected at the end of whatever document
-        they are rendered in. Rather than report a section offset that is wrong, such a
-        chunk keeps its segment-relative span and renames the basis.
-        """
-        from all2md.chunking import provenance
+        sections = {"Data": self._doc_with_table().children, "Code": self._doc_with_code().children}
+        doc = Document(children=[*sections["Data"], *sections["Code"]])
+        expected = {heading: self._section_text(nodes) for heading, nodes in sections.items()}
+        calls = []
+        original = MarkdownRenderer.render_to_string_with_spans
 
-        doc = self._doc_with_table()
-        whole = len(doc.children)
-        original = provenance._render_markdown
-
-        def render_fragments_differently(nodes, elide_data_uris=True):
-            text = original(nodes, elide_data_uris)
-            return text if len(nodes) == whole else f"<<<{text}"
+        def counting(renderer, document):
+            calls.append(document)
+            return original(renderer, document)
 
-        monkeypatch.setattr(provenance, "_render_markdown", render_fragments_differently)
-        chunks = chunk_ast(doc, strategy="paragraph", max_tokens=8, avoid_table_split=True, token_counter="whitespace")
+        monkeypatch.setattr(MarkdownRenderer, "render_to_string_with_spans", counting)
+        monkeypatch.setattr(MarkdownRenderer, "render_to_string", None)
+        chunks = chunk_ast(
+            doc,
+            strategy="paragraph",
+            max_tokens=8,
+            avoid_table_split=True,
+            avoid_code_split=True,
+            token_counter="whitespace",
+        )
 
-        assert chunks
-        assert {c.char_basis for c in chunks} == {"segment_text"}
-        assert chunks[0].char_start == 0
+        assert len(calls) == 1
+        assert {c.section_heading for c in chunks} == set(sections)
+        for chunk in chunks:
+            assert chunk.char_basis == "section_text"
+            assert expected[chunk.section_heading][chunk.char_start : chunk.char_end] == chunk.text
 
 
 class TestDataUriElision:
@@ -383,6 +410,21 @@ class TestDataUriElision:
         assert "AAAA" not in joined
         assert "elided" in joined
 
+    def test_spans_index_the_elided_section_text(self):
+        """Eliding shortens the text; the spans are moved to match."""
+        from all2md.api import from_ast
+        from all2md.chunking.provenance import _elide_data_uris
+
+        doc = self._doc_with_data_uri()
+        doc.children.append(Paragraph(content=[Text(content="After image.")]))
+        section_text, _ = _elide_data_uris(from_ast(Document(children=list(doc.children)), "markdown"), [])
+
+        chunks = chunk_ast(doc, strategy="paragraph", max_tokens=3, token_counter="whitespace")
+
+        assert chunks[-1].text == "After image."
+        for chunk in chunks:
+            assert section_text[chunk.char_start : chunk.char_end] == chunk.text
+
     def test_kept_when_disabled(self):
         """elide_data_uris=False leaves the raw base64 in place."""
         doc = self._doc_with_data_uri()
@@ -0,0 +1,69 @@
+"""Unit tests for the ``all2md cache`` command."""
+
+import json
+import os
+import time
+
+import pytest
+
+from all2md import to_ast
+from all2md.cli.commands import dispatch_command
+from all2md.cli.commands.cache import handle_cache_command
+from all2md.conversion_cache import ConversionCache
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def populated_cache(tmp_path):
+    cache = ConversionCache(tmp_path)
+    doc = to_ast(b"# Title\n\nBody text.\n", source_format="markdown")
+    for index in range(5):
+        key = f"{index:02d}aa"
+        cache.put(key, doc)
+        stamp = time.time() - (100 - index)
+        os.utime(cache._entry_path(key), (stamp, stamp))
+    cache.get("04aa")
+    cache.flush_stats()
+    return tmp_path
+
+
+def test_stats_json(populated_cache, capsys):
+    assert handle_cache_command(["stats", "--cache-dir", str(populated_cache), "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["entries"] == 5
+    assert payload["bytes"] > 0
+    assert payload["lifetime"]["writes"] == 5
+    assert payload["lifetime"]["hits"] == 1
+
+
+def test_stats_pretty(populated_cache, capsys):
+    assert handle_cache_command(["stats", "--cache-dir", str(populated_cache)]) == 0
+    out = capsys.readouterr().out
+    assert "entries:      5" in out
+    assert "hits:         1" in out
+
+
+def test_prune_keeps_most_recent(populated_cache, capsys):
+    assert handle_cache_command(["prune", "--cache-dir", str(populated_cache), "--max-entries", "2"]) == 0
+    assert "Pruned 3 entries" in capsys.readouterr().out
+    cache = ConversionCache(populated_cache)
+    assert cache.usage()[0] == 2
+    assert cache.get("04aa") is not None
+    assert cache.lifetime_stats().evictions == 3
+
+
+def test_clear_removes_everything(populated_cache, capsys):
+    assert dispatch_command(["cache", "clear", "--cache-dir", str(populated_cache)]) == 0
+    assert "Cleared 5 entries" in capsys.readouterr().out
+    cache = ConversionCache(populated_cache)
+    assert cache.usage() == (0, 0)
+    assert cache.lifetime_stats().writes == 0
+
+
+def test_missing_action_is_an_error(capsys):
+    assert handle_cache_command([]) != 0
+
+
+def test_invalid_size_is_rejected(tmp_path):
+    assert handle_cache_command(["prune", "--cache-dir", str(tmp_path), "--max-size", "huge"]) != 0
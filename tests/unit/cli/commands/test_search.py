@@ -125,6 +125,44 @@ class TestHandleSearchCommand:
         with pytest.raises(SystemExit):
             handle_search_command(["query", "file.md", "--grep", "-A", "-1"])
 
+    def test_search_update_without_index_dir(self, capsys):
+        """Test --update requires --index-dir."""
+        with pytest.raises(SystemExit):
+            handle_search_command(["query", "file.md", "--update"])
+        assert "--update requires --index-dir" in capsys.readouterr().err
+
+    def test_search_update_syncs_persisted_index(self, tmp_path, capsys):
+        """Test --update reindexes only new documents and saves the index."""
+        first = tmp_path / "first.md"
+        first.write_text("# First\n\nThe alpha protocol.\n", encoding="utf-8")
+        index_dir = tmp_path / "index"
+        assert (
+            handle_search_command(["alpha", str(first), "--keyword", "--index-dir", str(index_dir), "--persist"]) == 0
+        )
+
+        second = tmp_path / "second.md"
+        second.write_text("# Second\n\nThe omega protocol.\n", encoding="utf-8")
+        capsys.readouterr()
+        args = ["omega", str(first), str(second), "--keyword", "--index-dir", str(index_dir), "--update", "--json"]
+        assert handle_search_command(args) == 0
+        captured = capsys.readouterr()
+        assert "1 added, 0 changed, 0 removed, 1 unchanged" in captured.err
+        assert "omega" in captured.out
+
+        assert handle_search_command(["omega", "--keyword", "--index-dir", str(index_dir), "--json"]) == 0
+        assert "omega" in capsys.readouterr().out
+
+    def test_search_streaming_persist_spills_chunks(self, tmp_path, capsys):
+        """Test --streaming writes chunks.jsonl into the index directory and leaves no spill file."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Doc\n\nThe alpha protocol.\n", encoding="utf-8")
+        index_dir = tmp_path / "index"
+        args = ["alpha", str(doc), "--keyword", "--streaming", "--index-dir", str(index_dir), "--persist", "--json"]
+        assert handle_search_command(args) == 0
+        assert "alpha" in capsys.readouterr().out
+        assert (index_dir / "chunks.jsonl").read_text(encoding="utf-8").strip()
+        assert not (index_dir / "chunks.jsonl.partial").exists()
+
 
 @pytest.mark.unit
 class TestHandleGrepCommand:
@@ -532,6 +570,32 @@ class TestCollectSearchOverrides:
         assert "bm25_k1" not in overrides
 
 
+@pytest.mark.unit
+class TestEmbeddingCacheFlags:
+    """``--embedding-cache`` resolves to a cache directory in the search options."""
+
+    def _options(self, argv, monkeypatch, tmp_path):
+        from all2md.cli.commands.search import _build_search_argument_parser, _load_search_options_from_config
+
+        monkeypatch.delenv("ALL2MD_CONFIG", raising=False)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ALL2MD_EMBEDDING_CACHE_DIR", str(tmp_path / "default-emb"))
+        options, error = _load_search_options_from_config(_build_search_argument_parser().parse_args(["query", *argv]))
+        assert error is None
+        return options
+
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        assert self._options([], monkeypatch, tmp_path).vector_embedding_cache_dir is None
+
+    def test_flag_uses_default_dir(self, monkeypatch, tmp_path):
+        options = self._options(["--embedding-cache"], monkeypatch, tmp_path)
+        assert options.vector_embedding_cache_dir == str(tmp_path / "default-emb")
+
+    def test_explicit_dir_wins(self, monkeypatch, tmp_path):
+        options = self._options(["--embedding-cache", "--embedding-cache-dir", "emb"], monkeypatch, tmp_path)
+        assert options.vector_embedding_cache_dir == "emb"
+
+
 @pytest.mark.unit
 class TestCreateSearchDocuments:
     """Test search document creation from CLI input items."""
@@ -0,0 +1,205 @@
+"""Unit tests for the serve command's rendered-page cache and HTTP validators."""
+
+import gzip
+import os
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from all2md.cli.commands.serve_cache import (
+    RenderedPage,
+    RenderedPageCache,
+    choose_encoding,
+    file_signature,
+    is_not_modified,
+    prewarm_order,
+)
+from all2md.cli.commands.server import INDEX_FILE_NAMES, _create_serve_parser
+
+BIG_HTML = "<html><body>" + "<p>All work and no play.</p>" * 200 + "</body></html>"
+
+
+def _page(html: str = BIG_HTML, last_modified: float | None = 1_700_000_000.0) -> RenderedPage:
+    return RenderedPage.build(html, last_modified)
+
+
+@pytest.mark.unit
+class TestRenderedPage:
+    def test_gzip_body_decompresses_to_the_page(self):
+        page = _page()
+        assert gzip.decompress(page.encodings["gzip"]) == page.body
+        assert page.size == len(page.body) + sum(len(data) for data in page.encodings.values())
+
+    def test_small_pages_are_not_compressed(self):
+        assert _page("<p>hi</p>").encodings == {}
+
+    def test_etag_follows_the_content(self):
+        assert _page().etag == _page().etag
+        assert _page().etag != _page(BIG_HTML + " ").etag
+
+
+@pytest.mark.unit
+class TestChooseEncoding:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "gzip"),
+            ("*, gzip;q=0", None),
+        ],
+    )
+    def test_negotiation(self, header, expected):
+        page = _page()
+        page = RenderedPage(page.body, page.etag, page.last_modified, {"gzip": page.encodings["gzip"]})
+        assert choose_encoding(page, header) == expected
+
+    def test_brotli_preferred_when_stored(self):
+        page = _page()
+        page = RenderedPage(page.body, page.etag, page.last_modified, {"gzip": b"g", "br": b"b"})
+        assert choose_encoding(page, "gzip, br") == "br"
+
+
+@pytest.mark.unit
+class TestIsNotModified:
+    def test_matching_etag(self):
+        page = _page()
+        assert is_not_modified(page, page.etag, None)
+        assert is_not_modified(page, f'"other", W/{page.etag}', None)
+        assert is_not_modified(page, "*", None)
+        assert not is_not_modified(page, '"other"', None)
+
+    def test_if_none_match_takes_precedence_over_dates(self):
+        page = _page()
+        assert not is_not_modified(page, '"other"', formatdate(page.last_modified + 60, usegmt=True))
+
+    def test_if_modified_since(self):
+        page = _page(last_modified=1_700_000_000.5)
+        assert is_not_modified(page, None, formatdate(1_700_000_000, usegmt=True))
+        assert not is_not_modified(page, None, formatdate(1_699_999_999, usegmt=True))
+        assert not is_not_modified(page, None, "not a date")
+        assert not is_not_modified(_page(last_modified=None), None, formatdate(1_700_000_000, usegmt=True))
+
+
+@pytest.mark.unit
+class TestRenderedPageCache:
+    def test_an_edited_file_misses(self):
+        cache = RenderedPageCache()
+        cache.put("/a.md", (10, 1), _page())
+
+        assert cache.get("/a.md", (10, 1)) is not None
+        assert cache.get("/a.md", (11, 2)) is None
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        page = _page()
+        cache = RenderedPageCache(max_bytes=page.size * 2)
+        cache.put("/a", None, page)
+        cache.put("/b", None, page)
+        cache.get("/a", None)  # touch /a
+        cache.put("/c", None, page)
+
+        assert cache.get("/b", None) is None
+        assert cache.get("/a", None) is not None
+        assert cache.total_bytes == page.size * 2
+
+    def test_a_page_over_the_budget_is_not_kept(self):
+        cache = RenderedPageCache(max_bytes=10)
+        cache.put("/a", None, _page())
+        assert len(cache) == 0 and cache.total_bytes == 0
+
+    def test_concurrent_requests_render_once(self):
+        cache = RenderedPageCache()
+        calls = []
+
+        def render():
+            calls.append(1)
+            time.sleep(0.05)
+            return _page()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_render("/a", (1, 1), render))) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(page) for page in results}) == 1
+
+    def test_a_failed_render_is_not_stored(self):
+        cache = RenderedPageCache()
+
+        def broken():
+            raise RuntimeError("corrupt file")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_render("/a", (1, 1), broken)
+        assert cache.get_or_render("/a", (1, 1), _page) is not None
+
+    def test_prewarm_fills_unused_budget_without_evicting(self):
+        page = _page()
+        cache = RenderedPageCache(max_bytes=page.size * 2)
+        cache.get_or_render("/viewed", None, _page)
+
+        assert cache.prewarm("/index", None, _page) is True
+        assert cache.prewarm("/deep", None, _page) is False
+        assert cache.get("/viewed", None) is not None
+        assert cache.get("/index", None) is not None
+        assert cache.get("/deep", None) is None
+
+    def test_prewarm_renders_nothing_once_the_cache_is_full(self):
+        page = _page()
+        cache = RenderedPageCache(max_bytes=page.size)
+        cache.put("/a", None, page)
+        calls = []
+
+        def render():
+            calls.append(1)
+            return _page()
+
+        assert cache.prewarm("/b", None, render) is False
+        assert calls == []
+        assert cache.prewarm("/a", None, render) is True
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.unit
+class TestPrewarmOrder:
+    def test_index_files_then_shallow_then_recent(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        files = {}
+        for url, rel, mtime in (
+            ("/old.md", "old.md", 100),
+            ("/new.md", "new.md", 200),
+            ("/sub/deep.md", "sub/deep.md", 300),
+            ("/README.md", "README.md", 50),
+        ):
+            path = tmp_path / rel
+            path.write_text("x")
+            os.utime(path, (mtime, mtime))
+            files[url] = path
+
+        assert prewarm_order(files, tmp_path, INDEX_FILE_NAMES) == ["/README.md", "/new.md", "/old.md", "/sub/deep.md"]
+
+
+@pytest.mark.unit
+def test_file_signature_tracks_size_and_mtime(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("one")
+    first = file_signature(path)
+    path.write_text("three")
+    assert file_signature(path) != first
+    assert file_signature(tmp_path / "missing.md") is None
+
+
+@pytest.mark.unit
+def test_serve_parser_cache_flags():
+    parsed = _create_serve_parser().parse_args(["docs", "--html-cache-size", "64MB", "--prewarm-workers", "0"])
+    assert parsed.html_cache_size == 64 * 1024**2
+    assert parsed.prewarm_workers == 0
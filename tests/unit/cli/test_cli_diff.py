@@ -8,6 +8,7 @@ import pytest
 from all2md.cli.commands.diff import (
     _create_diff_parser,
     _validate_context_lines,
+    _validate_timeout,
     handle_diff_command,
 )
 
@@ -38,6 +39,23 @@ class TestValidateContextLines:
             _validate_context_lines("3.5")
 
 
+@pytest.mark.unit
+class TestValidateTimeout:
+    """Test _validate_timeout() helper function."""
+
+    def test_valid_values(self):
+        """Test seconds, fractions and zero are accepted."""
+        assert _validate_timeout("2.5") == 2.5
+        assert _validate_timeout("0") == 0.0
+
+    def test_invalid_values(self):
+        """Test negative and non-numeric values are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError, match="non-negative"):
+            _validate_timeout("-1")
+        with pytest.raises(argparse.ArgumentTypeError, match="number of seconds"):
+            _validate_timeout("soon")
+
+
 @pytest.mark.unit
 class TestCreateDiffParser:
     """Test _create_diff_parser() function."""
@@ -73,6 +91,7 @@ class TestCreateDiffParser:
         assert args.color == "auto"
         assert args.ignore_whitespace is False
         assert args.show_context is True
+        assert args.timeout == 10.0
 
     def test_parser_all_options(self):
         """Test parser with all options."""
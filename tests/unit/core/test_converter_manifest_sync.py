@@ -51,6 +51,8 @@ def _normalized_view(metadata: ConverterMetadata, *, from_scan: bool) -> dict:
         "mime_types": list(metadata.mime_types),
         "magic_bytes": list(metadata.magic_bytes),
         "content_detector_path": content_detector_path,
+        "zip_members": list(metadata.zip_members),
+        "zip_mimetypes": list(metadata.zip_mimetypes),
         "parser_class": ConverterMetadata.normalize_class_spec(metadata.parser_class, f"all2md.parsers.{fmt}"),
         "renderer_class": ConverterMetadata.normalize_class_spec(metadata.renderer_class, f"all2md.renderers.{fmt}"),
         "parser_options_class": ConverterMetadata.normalize_class_spec(metadata.parser_options_class, _OPTIONS_MODULE),
@@ -555,6 +555,107 @@ class TestDetectionCacheInvalidation:
         # unregister() must invalidate the cache too, so detection reverts.
         assert registry.detect_format("file.zzcachetest") == "plaintext"
 
+    def test_magic_table_invalidated_on_register_and_unregister(self):
+        """The compiled magic-byte table picks up newly registered signatures."""
+        from all2md.converter_metadata import ConverterMetadata
+
+        sample = b"ZZMAGIC-cache-test payload"
+        assert registry.detect_format(sample) == "plaintext"
+
+        registry.register(
+            ConverterMetadata(
+                format_name="test_magic_invalidation",
+                magic_bytes=[(b"MAGIC", 2)],
+                parser_class="all2md.parsers.html.HtmlToAstConverter",
+                priority=10,
+            )
+        )
+        try:
+            assert registry.detect_format(sample) == "test_magic_invalidation"
+        finally:
+            assert registry.unregister("test_magic_invalidation") is True
+
+        assert registry.detect_format(sample) == "plaintext"
+
+
+def _zip_bytes(members: dict[str, bytes]) -> bytes:
+    """Build an in-memory, uncompressed ZIP with ``members`` in order."""
+    import io
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+# A large first member pushes the identifying member names past the 1KB sample.
+_PADDING = {"[Content_Types].xml": b"<Types/>" * 512}
+
+_ZIP_CONTAINERS = {
+    "docx": _zip_bytes({**_PADDING, "word/document.xml": b"<w:document/>"}),
+    "xlsx": _zip_bytes({**_PADDING, "xl/workbook.xml": b"<workbook/>"}),
+    "pptx": _zip_bytes({**_PADDING, "ppt/presentation.xml": b"<p:presentation/>"}),
+    "epub": _zip_bytes({"mimetype": b"application/epub+zip", "META-INF/container.xml": b"<container/>"}),
+    "odt": _zip_bytes({"mimetype": b"application/vnd.oasis.opendocument.text", "content.xml": b"<x/>"}),
+    "ods": _zip_bytes({"mimetype": b"application/vnd.oasis.opendocument.spreadsheet", "content.xml": b"<x/>"}),
+    "odp": _zip_bytes({"mimetype": b"application/vnd.oasis.opendocument.presentation", "content.xml": b"<x/>"}),
+    "zip": _zip_bytes({"notes/readme.txt": b"hello"}),
+}
+
+
+class TestContentDetection:
+    """Content-only detection: compiled magic table, ZIP containers and batches."""
+
+    def setup_method(self):
+        """Ensure registry is initialized."""
+        registry.auto_discover()
+
+    @pytest.mark.parametrize("expected", sorted(_ZIP_CONTAINERS))
+    def test_zip_based_formats_are_told_apart(self, expected):
+        """Formats sharing the ZIP signature are resolved from the central directory."""
+        assert registry.detect_format(_ZIP_CONTAINERS[expected]) == expected
+
+    def test_stream_detection_reads_container_and_restores_position(self):
+        """A seekable stream is read for its central directory and left where it was."""
+        import io
+
+        stream = io.BytesIO(_ZIP_CONTAINERS["xlsx"])
+        stream.seek(7)
+        assert registry.detect_format(stream) == "xlsx"
+        assert stream.tell() == 7
+
+    def test_truncated_sample_falls_back_to_priority(self):
+        """Without a readable central directory the highest-priority ZIP format wins, as before."""
+        sample = _ZIP_CONTAINERS["xlsx"][:1024]
+        best_zip_format = next(
+            name for name, metadata in registry._sorted_converter_list() if metadata.matches_magic_bytes(sample)
+        )
+        assert registry._detect_by_content(sample) == best_zip_format
+
+    def test_magic_table_matches_linear_scan(self):
+        """The compiled table picks the same converter as checking each converter in turn."""
+        samples = [b"%PDF-1.7", b"{\\rtf1 x}", b"<?xml version='1.0'?>", b"From: a@b", b"PK", b"", b"\x1f\x8b\x08"]
+        converters = registry._sorted_converter_list()
+        for sample in samples:
+            expected = next((name for name, metadata in converters if metadata.matches_magic_bytes(sample)), None)
+            ranks = registry._magic_table().match(sample)
+            assert (converters[ranks[0]][0] if ranks else None) == expected
+
+    def test_detect_formats_matches_detect_format(self, tmp_path):
+        """Batch detection gives the per-file answers, in order, including for missing files."""
+        paths = []
+        for name, data in _ZIP_CONTAINERS.items():
+            path = tmp_path / f"blob_{name}"  # no extension: content decides
+            path.write_bytes(data)
+            paths.append(path)
+        (tmp_path / "page.html").write_text("<html><body>x</body></html>")
+        paths.extend([tmp_path / "page.html", tmp_path / "missing.pdf"])
+
+        assert registry.detect_formats(paths) == [registry.detect_format(path) for path in paths]
+        assert registry.detect_formats(paths)[: len(_ZIP_CONTAINERS)] == list(_ZIP_CONTAINERS)
+
 
 class TestFormatSynchronization:
     """Test that DocumentFormat Literal stays in sync with registry."""
@@ -0,0 +1,188 @@
+"""Unit tests for the scalable line diff engine."""
+
+import difflib
+import random
+
+import pytest
+
+from all2md.ast.nodes import Document, Heading, Paragraph, Text
+from all2md.diff import sequence
+from all2md.diff.sequence import diff_sequences, group_opcodes, intern_lines, unified_diff
+from all2md.diff.text_diff import compare_documents
+
+
+def _assert_valid(a, b, opcodes):
+    """Opcodes must tile both sequences, and every equal block must really be equal."""
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+
+
+def _lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for index, y in enumerate(b):
+            current.append(previous[index] + 1 if x == y else max(previous[index + 1], current[index]))
+        previous = current
+    return previous[-1]
+
+
+def _mutate(rng, items, alphabet):
+    items = list(items)
+    for _ in range(rng.randint(0, 6)):
+        action = rng.random()
+        if action < 0.3 and items:
+            del items[rng.randrange(len(items))]
+        elif action < 0.6:
+            items.insert(rng.randint(0, len(items)), rng.choice(alphabet))
+        elif items:
+            items[rng.randrange(len(items))] = rng.choice(alphabet)
+    return items
+
+
+class TestDiffSequences:
+    """Tests for diff_sequences."""
+
+    def test_identical_sequences(self):
+        result = diff_sequences(["a", "b"], ["a", "b"])
+        assert result.opcodes == [("equal", 0, 2, 0, 2)]
+        assert not result.timed_out
+
+    def test_empty_sequences(self):
+        assert diff_sequences([], []).opcodes == []
+        assert diff_sequences([], ["x"]).opcodes == [("insert", 0, 0, 0, 1)]
+        assert diff_sequences(["x"], []).opcodes == [("delete", 0, 1, 0, 0)]
+
+    def test_random_edits_produce_valid_opcodes(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            alphabet = "abcdefg"[: rng.randint(1, 7)]
+            a = [rng.choice(alphabet) for _ in range(rng.randint(0, 30))]
+            b = _mutate(rng, a, alphabet)
+            _assert_valid(a, b, diff_sequences(a, b).opcodes)
+            sections = sorted(rng.sample(range(len(a) + 1), min(3, len(a) + 1)))
+            _assert_valid(a, b, diff_sequences(a, b, a_sections=sections, b_sections=sections).opcodes)
+
+    def test_myers_fallback_is_minimal(self, monkeypatch):
+        # With no unique lines to anchor on, every region goes through Myers.
+        monkeypatch.setattr(sequence, "_patience_anchors", lambda *args: [])
+        rng = random.Random(3)
+        for _ in range(300):
+            a = [rng.choice("abc") for _ in range(rng.randint(0, 20))]
+            b = [rng.choice("abc") for _ in range(rng.randint(0, 20))]
+            opcodes = diff_sequences(a, b).opcodes
+            _assert_valid(a, b, opcodes)
+            assert sum(i2 - i1 for tag, i1, i2, _j1, _j2 in opcodes if tag == "equal") == _lcs_length(a, b)
+
+    def test_unique_lines_anchor_moved_blocks(self):
+        a = ["intro", "}", "alpha", "}", "beta", "}"]
+        b = ["intro", "}", "beta", "}", "alpha", "}"]
+        opcodes = diff_sequences(a, b).opcodes
+        _assert_valid(a, b, opcodes)
+        assert ("equal", 0, 2, 0, 2) in opcodes
+
+    def test_unchanged_sections_are_matched_whole(self, monkeypatch):
+        a = ["# One", "x", "y", "# Two", "x", "y", "# Three", "x", "y"]
+        b = ["# One", "x", "y", "# Two", "x", "z", "# Three", "x", "y"]
+        regions = []
+        run = sequence._Engine.run
+
+        def spy(engine, region):
+            regions.append(region)
+            run(engine, region)
+
+        monkeypatch.setattr(sequence._Engine, "run", spy)
+        result = diff_sequences(a, b, a_sections=[0, 3, 6], b_sections=[0, 3, 6])
+
+        _assert_valid(a, b, result.opcodes)
+        assert ("replace", 5, 6, 5, 6) in result.opcodes
+        # Only the changed section reaches the line-level diff.
+        assert (3, 6, 3, 6) in regions
+        assert not any(region[0] < 3 or region[1] > 6 for region in regions if region != (0, 3, 0, 3))
+
+    def test_timeout_falls_back_to_a_coarse_but_valid_diff(self, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr(sequence.time, "monotonic", lambda: next(clock))
+        a = ["same", "a", "b", "c", "end"]
+        b = ["same", "c", "a", "b", "end"]
+
+        result = diff_sequences(a, b, timeout=0.5)
+
+        assert result.timed_out
+        assert result.opcodes == [("equal", 0, 1, 0, 1), ("replace", 1, 4, 1, 4), ("equal", 4, 5, 4, 5)]
+
+    def test_no_timeout(self):
+        assert not diff_sequences(["a"], ["b"], timeout=None).timed_out
+
+
+class TestUnifiedDiff:
+    """unified_diff must print exactly what difflib prints for the same opcodes."""
+
+    @pytest.mark.parametrize("n", [0, 1, 3])
+    def test_matches_difflib_format(self, n):
+        rng = random.Random(11)
+        for _ in range(200):
+            a = [rng.choice("abcdef") for _ in range(rng.randint(0, 25))]
+            b = _mutate(rng, a, "abcdef")
+            opcodes = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+            ours = list(unified_diff(a, b, opcodes, fromfile="old", tofile="new", n=n, lineterm=""))
+            assert ours == list(difflib.unified_diff(a, b, "old", "new", n=n, lineterm=""))
+
+    def test_group_opcodes_matches_difflib(self):
+        matcher = difflib.SequenceMatcher(None, list("abcdefghijklmnop"), list("abXdefghijklmnYp"))
+        assert list(group_opcodes(matcher.get_opcodes(), 2)) == list(matcher.get_grouped_opcodes(2))
+
+
+def test_intern_lines_shares_ids_across_sequences():
+    a, b = intern_lines(["x", "y", "x"], ["y", "z"])
+    assert a[0] == a[2] and a[1] == b[0]
+    assert len({*a, *b}) == 3
+
+
+class TestCompareDocumentsSections:
+    """compare_documents records top-level sections for the pre-pass."""
+
+    def test_section_starts_follow_top_level_headings(self):
+        doc = Document(
+            children=[
+                Paragraph(content=[Text("Preamble")]),
+                Heading(level=1, content=[Text("One")]),
+                Paragraph(content=[Text("Body")]),
+                Heading(level=2, content=[Text("Two")]),
+            ]
+        )
+        result = compare_documents(doc, doc)
+        assert result.old_sections == [1, 3]
+        assert not result.timed_out
+        assert list(result) == []
+
+    def test_word_granularity_change_inside_one_section(self):
+        old = Document(
+            children=[
+                Heading(level=1, content=[Text("Scope")]),
+                Paragraph(content=[Text("The operator shall file an annual report.")]),
+                Heading(level=1, content=[Text("Penalties")]),
+                Paragraph(content=[Text("The fine is one hundred dollars.")]),
+            ]
+        )
+        new = Document(
+            children=[
+                Heading(level=1, content=[Text("Scope")]),
+                Paragraph(content=[Text("The operator shall file a quarterly report.")]),
+                Heading(level=1, content=[Text("Penalties")]),
+                Paragraph(content=[Text("The fine is one hundred dollars.")]),
+            ]
+        )
+
+        changes = [
+            line
+            for line in compare_documents(old, new, granularity="word", context_lines=0)
+            if line[:1] in "+-" and line[:3] not in {"+++", "---"}
+        ]
+
+        assert changes == ["-an", "-annual", "+a", "+quarterly"]
@@ -0,0 +1,34 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+"""Unit tests for the bounded archive-member hand-off used by the archive parsers."""
+
+import io
+
+from all2md.parsers import _archive_members
+from all2md.parsers._archive_members import spool_member
+
+
+class TestSpoolMember:
+    """Small members stay in memory, large ones are spilled to disk."""
+
+    def test_small_member_is_kept_in_memory(self, tmp_path):
+        payload = spool_member("docs/a.txt", io.BytesIO(b"hello"), tmp_path, 0)
+
+        assert payload.data == b"hello"
+        assert payload.spill_path is None
+        assert payload.size == 5
+        with payload.open() as stream:
+            assert stream.name == "docs/a.txt"
+            assert stream.read() == b"hello"
+
+    def test_large_member_is_spilled_with_its_suffix(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_archive_members, "SPILL_THRESHOLD_BYTES", 8)
+        payload = spool_member("docs/report.pdf", io.BytesIO(b"0123456789abcdef"), tmp_path, 3)
+
+        assert payload.data is None
+        assert payload.size == 16
+        assert payload.spill_path is not None and payload.spill_path.endswith("00000003.pdf")
+        assert payload.read_bytes() == b"0123456789abcdef"
+
+        payload.discard()
+        payload.discard()
+        assert list(tmp_path.iterdir()) == []
@@ -328,6 +328,26 @@ class TestArchiveParser:
             assert 1 <= event.current <= event.total
             assert event.total == 12
 
+    def test_parallel_processing_keeps_archive_order_and_spills_large_members(self, monkeypatch):
+        """Large members go through spill files and results stay in archive order."""
+        from all2md.ast import Paragraph, Text
+
+        monkeypatch.setattr("all2md.parsers._archive_members.SPILL_THRESHOLD_BYTES", 64)
+        files = {f"file{i:02d}.txt": (f"Content {i} " + "x" * (200 if i % 3 == 0 else 0)).encode() for i in range(12)}
+        tar_data = create_test_tar(files)
+
+        options = ArchiveOptions(enable_parallel_processing=True, max_workers=2)
+        doc = ArchiveToAstConverter(options=options).parse(tar_data)
+
+        headings = [node.content[0].content for node in doc.children if isinstance(node, Heading)]
+        assert headings == list(files)
+        texts = [
+            node.content[0].content
+            for node in doc.children
+            if isinstance(node, Paragraph) and isinstance(node.content[0], Text)
+        ]
+        assert [text.split()[1] for text in texts] == [str(i) for i in range(12)]
+
 
 @pytest.mark.skipif(
     not pytest.importorskip("py7zr", reason="py7zr not installed"), reason="Requires py7zr for 7Z support"
@@ -777,6 +777,35 @@ class TestHtmlOptions:
         assert isinstance(doc, Document)
         assert len(doc.children) >= 1
 
+    def test_custom_sanitization_in_one_walk(self) -> None:
+        """Unsafe subtrees are dropped, disallowed wrappers unwrapped and attributes filtered together."""
+        from bs4 import BeautifulSoup
+
+        html = (
+            '<section class="s"><p class="keep" data-x="1">Kept <span id="i">text</span></p>'
+            '<div onclick="alert()" class="c"><p>Handler subtree</p></div>'
+            "<article><script>bad()</script><form><p>In form</p></form>"
+            '<a href="javascript:alert(1)">js</a><a href="/ok" rel="x">ok</a></article></section>'
+        )
+        options = HtmlOptions(
+            strip_dangerous_elements=True,
+            allowed_elements=("p", "a", "div"),
+            allowed_attributes={"p": ("class",), "a": ("href",)},
+        )
+        soup = HtmlToAstConverter(options)._apply_custom_sanitization(BeautifulSoup(html, "html.parser"))
+
+        assert str(soup) == '<p class="keep">Kept text</p><a href="/ok">ok</a>'
+
+    def test_custom_sanitization_without_stripping_keeps_dangerous_elements(self) -> None:
+        """Allowlists alone never remove content, only unwrap and filter attributes."""
+        from bs4 import BeautifulSoup
+
+        html = '<div onclick="alert()"><script>x()</script><p id="p">Text</p></div>'
+        options = HtmlOptions(allowed_elements=("div", "p", "script"), allowed_attributes=("onclick",))
+        soup = HtmlToAstConverter(options)._apply_custom_sanitization(BeautifulSoup(html, "html.parser"))
+
+        assert str(soup) == '<div onclick="alert()"><script>x()</script><p>Text</p></div>'
+
 
 @pytest.mark.unit
 class TestEdgeCases:
@@ -6,10 +6,12 @@ appropriate trade-offs between speed and standards compliance.
 """
 
 import pytest
+from fixtures import FIXTURES_PATH
 
 from all2md import to_markdown
 from all2md.exceptions import DependencyError
 from all2md.options.html import HtmlOptions
+from all2md.parsers.html import HtmlToAstConverter
 
 
 class TestHtmlParserChoice:
@@ -157,3 +159,65 @@ class TestHtmlParserChoice:
         with pytest.raises(Exception):
             # This should fail when BeautifulSoup tries to use the invalid parser
             to_markdown(html, source_format="html", parser_options=options)
+
+
+# Markup where bs4's lxml builder does something the direct tree has to mirror:
+# whitespace-only strings, comments, script/ruby string classes, multi-valued
+# attributes, recovered broken nesting and entities.
+_DIRECT_TREE_CASES = {
+    "whitespace": "<p>a</p>\n  <p> </p><pre>  \n <b> </b></pre><textarea>  </textarea><div>\t</div>",
+    "comments": "<body><!----><!-- --><p>a<!--c-->b</p></body>",
+    "string_classes": "<div>a<script>x=1</script><style>p{}</style>b<ruby>漢<rp>(</rp><rt>kan</rt></ruby></div>",
+    "attributes": '<p class=" a  b " rel="x y" id="q r"><a href="/x" title="t">link</a></p><td headers="h1 h2">c</td>',
+    "broken": "<table><tr><th>h<td>a<td>b</table><p>x<div>y</p></div><ul><li>1<li>2</ul>",
+    "entities": "<body><p>&amp; &nbsp; &lt;x&gt; &copy; &bogus;</p></body>",
+    "metadata": (
+        "<html><head><title>T</title><meta charset='utf-8'><meta property='og:title' content='O'>"
+        '<script type=\'application/ld+json\'>{"@type": "Thing"}</script></head>'
+        "<body><h1>H</h1><div itemscope><span itemprop='name'>N</span></div>"
+        "<figure><img src='a.png' alt='A'><figcaption>Cap</figcaption></figure></body></html>"
+    ),
+}
+
+
+class TestDirectLxmlTree:
+    """Test that walking lxml's tree directly matches the BeautifulSoup lxml tree."""
+
+    @pytest.fixture(autouse=True)
+    def _require_lxml(self):
+        pytest.importorskip("lxml")
+
+    @staticmethod
+    def _convert(html, **options):
+        return HtmlToAstConverter(HtmlOptions(html_parser="lxml", **options)).convert_to_ast(html)
+
+    @pytest.mark.parametrize("html", list(_DIRECT_TREE_CASES.values()), ids=list(_DIRECT_TREE_CASES))
+    @pytest.mark.parametrize("options", [{}, {"extract_title": True, "strip_comments": False}])
+    def test_same_ast_as_beautifulsoup(self, html, options):
+        """Test that both trees convert to the same AST."""
+        assert self._convert(html, **options) == self._convert(html, direct_lxml_tree=False, **options)
+
+    def test_same_ast_on_fixture(self):
+        """Test parity on the HTML fixture documents."""
+        for path in (FIXTURES_PATH / "documents").glob("*.html"):
+            html = path.read_text(encoding="utf-8")
+            assert self._convert(html, extract_title=True) == self._convert(
+                html, extract_title=True, direct_lxml_tree=False
+            ), path.name
+
+    def test_direct_tree_used_only_when_safe(self):
+        """Test that sanitization, html-mode figures and bodiless documents keep BeautifulSoup."""
+        from bs4 import BeautifulSoup
+
+        from all2md.parsers._html_lxml_tree import LxmlDocument
+
+        def tree(html, **options):
+            return HtmlToAstConverter(HtmlOptions(html_parser="lxml", **options))._parse_document(html)
+
+        assert isinstance(tree("<p>x</p>"), LxmlDocument)
+        assert isinstance(tree("<p>x</p>", direct_lxml_tree=False), BeautifulSoup)
+        assert isinstance(tree("<p>x</p>", strip_dangerous_elements=True), BeautifulSoup)
+        assert isinstance(tree("<p>x</p>", allowed_attributes=("href",)), BeautifulSoup)
+        assert isinstance(tree("<p>x</p>", figures_parsing="html"), BeautifulSoup)
+        assert isinstance(tree("<title>only a head</title>"), BeautifulSoup)
+        assert isinstance(tree(""), BeautifulSoup)
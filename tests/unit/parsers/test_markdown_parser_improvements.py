@@ -341,3 +341,41 @@ class TestMarkdownNullAttrsHandling:
             cells = converter._process_table_row_cells({"children": [cell_token]})
             assert len(cells) == 1
             assert cells[0].alignment is None
+
+
+class TestMistuneParserReuse:
+    """The mistune instance is built once per plugin configuration and thread."""
+
+    def test_same_plugin_options_share_one_instance(self) -> None:
+        from all2md.parsers.markdown import _cached_mistune_parser
+
+        first = _cached_mistune_parser(MarkdownParserOptions())
+        # parse_frontmatter does not change the plugin set
+        assert _cached_mistune_parser(MarkdownParserOptions(parse_frontmatter=False)) is first
+        assert _cached_mistune_parser(MarkdownParserOptions(parse_tables=False)) is not first
+
+    def test_each_thread_gets_its_own_instance(self) -> None:
+        import threading
+
+        from all2md.parsers.markdown import _cached_mistune_parser
+
+        main_instance = _cached_mistune_parser(MarkdownParserOptions())
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(_cached_mistune_parser(MarkdownParserOptions())))
+        worker.start()
+        worker.join()
+        assert seen and seen[0] is not main_instance
+
+    def test_reused_instance_does_not_leak_state_between_documents(self) -> None:
+        converter = MarkdownToAstConverter()
+        first = converter.parse("Text[^1] and [link][ref].\n\n[^1]: Note.\n\n[ref]: https://example.com\n")
+        second = converter.parse("Plain [link][ref] and [^1].\n")
+        assert any(child.__class__.__name__ == "FootnoteDefinition" for child in first.children)
+        assert not any(child.__class__.__name__ == "FootnoteDefinition" for child in second.children)
+        assert "Link" not in repr(second.children[0].content)
+
+    def test_disabled_plugin_is_honored_after_enabled_parse(self) -> None:
+        table = "| a | b |\n|---|---|\n| 1 | 2 |\n"
+        assert MarkdownToAstConverter().parse(table).children[0].__class__.__name__ == "Table"
+        no_tables = MarkdownToAstConverter(MarkdownParserOptions(parse_tables=False))
+        assert no_tables.parse(table).children[0].__class__.__name__ == "Paragraph"
@@ -336,3 +336,160 @@ class TestMboxAttachmentAndMarkdownBodyParity:
         mbox_md = self._render(MboxToAstConverter(MboxOptions()).parse(mbox_file))
 
         assert eml_md == mbox_md
+
+
+def _dated_mbox(path, count: int = 4):
+    """Write an mbox of ``count`` messages with ascending dates and a ``From``-prefixed body line."""
+    mbox = mailbox.mbox(str(path))
+    for i in range(count):
+        msg = mailbox.mboxMessage()
+        msg["From"] = f"sender{i}@example.com"
+        msg["To"] = "recipient@example.com"
+        msg["Subject"] = f"Message {i}"
+        msg["Date"] = f"Mon, 0{i + 1} Jan 2024 12:00:00 +0000"
+        msg.set_payload(f"Body {i}\n\nFrom the archive\n")
+        mbox.add(msg)
+    mbox.close()
+    return path
+
+
+@pytest.mark.unit
+class TestIterMessagesAsAst:
+    """One-document-per-message iteration with resume support."""
+
+    def _render(self, doc) -> str:
+        from all2md.renderers.markdown import MarkdownRenderer
+
+        return MarkdownRenderer().render_to_string(doc)
+
+    def test_raw_messages_match_stdlib_mailbox(self, tmp_path):
+        """The forward reader splits messages exactly where ``mailbox.mbox`` does."""
+        from all2md.parsers.mbox import _iter_mbox_file
+
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        stdlib = mailbox.mbox(str(mbox_file))
+        expected = [stdlib.get_bytes(key) for key in stdlib.iterkeys()]
+        stdlib.close()
+
+        # get_bytes drops the envelope ``From`` line; the forward reader keeps it.
+        actual = [raw.split(b"\n", 1)[1] for _, _, raw in _iter_mbox_file(mbox_file)]
+        assert actual == expected
+
+    def test_messages_render_like_full_parse(self, tmp_path):
+        """Concatenated per-message output equals the single-document parse."""
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        parser = MboxToAstConverter()
+
+        messages = list(parser.iter_messages_as_ast(mbox_file))
+
+        assert [m.document.metadata["title"] for m in messages] == [f"Message {i}" for i in range(4)]
+        streamed = "\n\n".join(self._render(m.document) for m in messages)
+        assert streamed == self._render(parser.parse(mbox_file))
+
+    def test_resume_from_end_offset(self, tmp_path):
+        """``end_offset`` of a message resumes right after it."""
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        parser = MboxToAstConverter()
+        first_two = list(parser.iter_messages_as_ast(mbox_file, start_offset=0))[:2]
+
+        rest = list(parser.iter_messages_as_ast(mbox_file, start_offset=first_two[-1].end_offset))
+
+        assert [m.document.metadata["title"] for m in rest] == ["Message 2", "Message 3"]
+        assert rest[0].key == str(first_two[-1].end_offset)
+
+    def test_resume_after_key_with_max_messages(self, tmp_path):
+        """``after_key`` skips through that message; ``max_messages`` counts from there."""
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        keys = [m.key for m in MboxToAstConverter().iter_messages_as_ast(mbox_file)]
+
+        parser = MboxToAstConverter(MboxOptions(max_messages=1))
+        resumed = list(parser.iter_messages_as_ast(mbox_file, after_key=keys[0]))
+
+        assert [m.key for m in resumed] == [keys[1]]
+
+    def test_unknown_key_and_offset_on_maildir_are_rejected(self, tmp_path):
+        """Resume arguments that cannot apply raise ValidationError."""
+        from all2md.exceptions import ValidationError
+
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        with pytest.raises(ValidationError):
+            list(MboxToAstConverter().iter_messages_as_ast(mbox_file, after_key="nope"))
+
+        maildir = mailbox.Maildir(str(tmp_path / "maildir"))
+        maildir.close()
+        with pytest.raises(ValidationError):
+            list(MboxToAstConverter().iter_messages_as_ast(tmp_path / "maildir", start_offset=0))
+
+    def test_maildir_keys_resume(self, tmp_path):
+        """Directory mailboxes use stdlib keys and hierarchical mode adds one folder heading."""
+        maildir = mailbox.Maildir(str(tmp_path / "maildir"))
+        for i in range(3):
+            msg = mailbox.MaildirMessage()
+            msg["Subject"] = f"Message {i}"
+            msg.set_payload(f"Content {i}")
+            maildir.add(msg)
+        maildir.close()
+
+        parser = MboxToAstConverter(MboxOptions(output_structure="hierarchical"))
+        messages = list(parser.iter_messages_as_ast(tmp_path / "maildir"))
+        assert len(messages) == 3
+        assert all(m.end_offset is None for m in messages)
+        first_heading = messages[0].document.children[0]
+        assert isinstance(first_heading, Heading) and first_heading.level == 1
+        assert not any(isinstance(n, Heading) and n.level == 1 for n in messages[1].document.children)
+
+        resumed = list(parser.iter_messages_as_ast(tmp_path / "maildir", after_key=messages[0].key))
+        assert [m.key for m in resumed] == [m.key for m in messages[1:]]
+
+    def test_parallel_workers_preserve_order(self, tmp_path):
+        """Worker processes produce the same documents in the same order."""
+        mbox_file = _dated_mbox(tmp_path / "test.mbox", count=6)
+        parser = MboxToAstConverter()
+
+        sequential = [self._render(m.document) for m in parser.iter_messages_as_ast(mbox_file)]
+        parallel = [self._render(m.document) for m in parser.iter_messages_as_ast(mbox_file, workers=2)]
+
+        assert parallel == sequential
+
+
+@pytest.mark.unit
+class TestMailboxCommand:
+    """The ``all2md mailbox`` subcommand writes messages incrementally and resumes."""
+
+    def test_markdown_output_and_resume_hint(self, tmp_path, capsys):
+        from all2md.cli.commands.mailbox import handle_mailbox_command
+
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        out = tmp_path / "out.md"
+
+        assert handle_mailbox_command([str(mbox_file), "--max-messages", "2", "--out", str(out)]) == 0
+        err = capsys.readouterr().err
+        assert "Done: 2 message(s)." in err
+        offset = err.split("--start-offset ")[1].split()[0]
+
+        assert handle_mailbox_command([str(mbox_file), "--start-offset", offset, "--out", str(out)]) == 0
+        from all2md.renderers.markdown import MarkdownRenderer
+
+        expected = MarkdownRenderer().render_to_string(MboxToAstConverter().parse(mbox_file))
+        assert out.read_text(encoding="utf-8") == expected + "\n"
+
+    def test_jsonl_output(self, tmp_path, capsys):
+        import json
+
+        from all2md.cli.commands.mailbox import handle_mailbox_command
+
+        mbox_file = _dated_mbox(tmp_path / "test.mbox", count=3)
+        assert handle_mailbox_command([str(mbox_file), "--format", "jsonl", "--batch-size", "2"]) == 0
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["subject"] for r in records] == ["Message 0", "Message 1", "Message 2"]
+        assert records[0]["key"] == "0"
+        assert records[1]["key"] == str(records[0]["end_offset"])
+        assert records[0]["markdown"].startswith("# Message 0")
+
+    def test_bad_resume_key_is_a_validation_error(self, tmp_path, capsys):
+        from all2md.cli.builder import EXIT_VALIDATION_ERROR
+        from all2md.cli.commands.mailbox import handle_mailbox_command
+
+        mbox_file = _dated_mbox(tmp_path / "test.mbox")
+        assert handle_mailbox_command([str(mbox_file), "--after-key", "missing"]) == EXIT_VALIDATION_ERROR
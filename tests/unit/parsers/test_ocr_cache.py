@@ -0,0 +1,183 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+
+"""Tests for the persistent OCR cache and the OCR prefetcher.
+
+Neither Tesseract nor EasyOCR is a test dependency, so the recognizers here are
+fakes. What is under test is the plumbing around them: that a cached result is
+served without recognizing again, that the key covers everything that changes
+the output, and that prefetching changes when OCR runs but never what it returns.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from all2md.conversion_cache import use_conversion_cache
+from all2md.options.common import OCROptions
+from all2md.options.pdf import PdfOptions
+from all2md.parsers._ocr import OcrLine, OcrPage, OcrParagraph, prefetch
+from all2md.parsers._ocr import cache as ocr_cache
+
+pytestmark = pytest.mark.unit
+
+
+def _page(samples: bytes = b"\x00\x01\x02" * 4, language: str = "eng") -> OcrPage:
+    return OcrPage(samples=samples, width=2, height=2, rect=(0.0, 0.0, 72.0, 72.0), language=language)
+
+
+def _options(**ocr) -> PdfOptions:
+    return PdfOptions(ocr=OCROptions(enabled=True, **ocr))
+
+
+@pytest.fixture
+def known_versions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ocr_cache, "engine_version", lambda engine: f"{engine} 1.0")
+
+
+class TestCachedOcr:
+    def test_without_a_conversion_cache_nothing_is_stored(self, known_versions) -> None:
+        recognize = Mock(return_value="text")
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        wrapped(_page(), _options())
+        wrapped(_page(), _options())
+
+        assert recognize.call_count == 2
+
+    def test_a_repeated_page_is_recognized_once(self, tmp_path, known_versions) -> None:
+        recognize = Mock(return_value="text")
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            assert wrapped(_page(), _options()) == "text"
+            assert wrapped(_page(), _options()) == "text"
+
+        assert recognize.call_count == 1
+
+    def test_layout_results_roundtrip(self, tmp_path, known_versions) -> None:
+        paragraphs = [OcrParagraph(lines=(OcrLine("Hello world", (1.0, 2.0, 30.0, 9.0)),), bbox=(1.0, 2.0, 30.0, 9.0))]
+        recognize = Mock(return_value=paragraphs)
+        wrapped = ocr_cache.cached_ocr("layout")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            wrapped(_page(), _options())
+            assert wrapped(_page(), _options()) == paragraphs
+
+        assert recognize.call_count == 1
+
+    @pytest.mark.parametrize(
+        "page, options",
+        [
+            (_page(samples=b"\xff" * 12), _options()),
+            (_page(language="fra"), _options()),
+            (_page(), _options(dpi=150)),
+            (_page(), _options(tesseract_config="--psm 6")),
+            (_page(), _options(engine="easyocr")),
+        ],
+    )
+    def test_anything_that_changes_the_output_changes_the_key(self, tmp_path, known_versions, page, options) -> None:
+        recognize = Mock(side_effect=["first", "second"])
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            wrapped(_page(), _options())
+            assert wrapped(page, options) == "second"
+
+    def test_an_engine_upgrade_misses(self, tmp_path, monkeypatch) -> None:
+        recognize = Mock(side_effect=["old", "new"])
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            monkeypatch.setattr(ocr_cache, "engine_version", lambda engine: "tesseract 4.1")
+            wrapped(_page(), _options())
+            monkeypatch.setattr(ocr_cache, "engine_version", lambda engine: "tesseract 5.3")
+            assert wrapped(_page(), _options()) == "new"
+
+    def test_unknown_engine_version_is_never_cached(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(ocr_cache, "engine_version", lambda engine: None)
+        recognize = Mock(return_value="text")
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            wrapped(_page(), _options())
+            wrapped(_page(), _options())
+
+        assert recognize.call_count == 2
+
+    def test_empty_results_are_not_stored(self, tmp_path, known_versions) -> None:
+        # The adapters return "" for a failed page too; a retry must get a real chance.
+        recognize = Mock(side_effect=["", "text"])
+        wrapped = ocr_cache.cached_ocr("text")(recognize)
+
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path):
+            wrapped(_page(), _options())
+            assert wrapped(_page(), _options()) == "text"
+
+
+class TestRecognizePage:
+    def test_prefers_layout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        paragraphs = [OcrParagraph(lines=(OcrLine("x", (0, 0, 1, 1)),), bbox=(0, 0, 1, 1))]
+        monkeypatch.setattr(prefetch, "recognize_layout", Mock(return_value=paragraphs))
+        text = Mock(return_value="flat")
+        monkeypatch.setattr(prefetch, "recognize_text", text)
+
+        result = prefetch.recognize_page(_page(), _options())
+
+        assert result.paragraphs == paragraphs
+        text.assert_not_called()
+
+    def test_falls_back_to_flat_text(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(prefetch, "recognize_layout", Mock(side_effect=RuntimeError("no layout")))
+        monkeypatch.setattr(prefetch, "recognize_text", Mock(return_value="flat"))
+
+        result = prefetch.recognize_page(_page(), _options())
+
+        assert (result.paragraphs, result.text) == (None, "flat")
+
+
+def _scanned_pdf(pages: int) -> bytes:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for number in range(pages):
+        page = doc.new_page(width=200, height=200)
+        page.draw_rect(pymupdf.Rect(20, 20, 180, 40 + number * 20), fill=(0, 0, 0))
+    return doc.tobytes()
+
+
+@pytest.mark.pdf
+class TestPrefetchInTheParser:
+    def test_prefetched_pages_convert_exactly_like_inline_ones(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from all2md.ast.serialization import ast_to_json
+        from all2md.parsers.pdf import PdfToAstConverter
+
+        pdf_bytes = _scanned_pdf(3)
+        recognized: list[int] = []
+
+        def fake_recognize_text(page: OcrPage, options: PdfOptions) -> str:
+            recognized.append(page.width)
+            return "Recognized words on a scanned page."
+
+        monkeypatch.setattr(prefetch, "recognize_layout", Mock(return_value=None))
+        monkeypatch.setattr(prefetch, "recognize_text", fake_recognize_text)
+        inline_text = Mock(return_value="Recognized words on a scanned page.")
+        monkeypatch.setattr(PdfToAstConverter, "_ocr_page_to_layout", staticmethod(Mock(return_value=None)))
+        monkeypatch.setattr(PdfToAstConverter, "_ocr_page_to_text", staticmethod(inline_text))
+
+        def convert(workers: int) -> str:
+            options = PdfOptions(ocr=OCROptions(enabled=True, mode="force", workers=workers))
+            return ast_to_json(PdfToAstConverter(options).parse(pdf_bytes))
+
+        inline = convert(0)
+        assert inline_text.call_count == 3 and not recognized
+
+        inline_text.reset_mock()
+        assert convert(2) == inline
+        assert len(recognized) == 3
+        inline_text.assert_not_called()
+
+    def test_rejects_negative_workers(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            OCROptions(workers=-1)
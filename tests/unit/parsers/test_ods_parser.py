@@ -291,3 +291,130 @@ class TestOdsOptions:
         for cell in table.header.cells:
             text_content = cell.content[0].content
             assert text_content.isupper()
+
+
+def create_ods_with_spans_and_repeats() -> bytes:
+    """A sheet exercising nested spans, repeated columns and trailing empty rows."""
+    from odf.table import CoveredTableCell
+    from odf.text import S, Span
+
+    doc = OpenDocumentSpreadsheet()
+    table = OdfTable(name="Alpha")
+    for r in range(9):
+        row = TableRow()
+        for c in range(5):
+            cell = TableCell()
+            if (r + c) % 3:
+                paragraph = P(text=f"r{r}c{c} ")
+                if c == 2:
+                    paragraph.addElement(Span(text="span"))
+                    paragraph.addText(" tail")
+                    paragraph.addElement(S())
+                    paragraph.addText("after")
+                cell.addElement(paragraph)
+            row.addElement(cell)
+        if r == 3:
+            row.addElement(CoveredTableCell())
+            repeated = TableCell(numbercolumnsrepeated=3)
+            repeated.addElement(P(text="rep"))
+            row.addElement(repeated)
+        table.addElement(row)
+    for _ in range(3):
+        row = TableRow()
+        row.addElement(TableCell(numbercolumnsrepeated=20))
+        table.addElement(row)
+    doc.spreadsheet.addElement(table)
+
+    beta = OdfTable(name="Beta")
+    row = TableRow()
+    cell = TableCell()
+    cell.addElement(P(text="solo"))
+    row.addElement(cell)
+    beta.addElement(row)
+    doc.spreadsheet.addElement(beta)
+
+    output = BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not HAS_ODFPY, reason="odfpy not installed")
+class TestOdsStreaming:
+    """Reading content.xml row by row must convert exactly like the odfpy document."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"max_rows": 2},
+            {"max_rows": 8},
+            {"max_cols": 3},
+            {"has_header": False, "max_cols": 2},
+            {"trim_empty": "none"},
+            {"sheets": "^B"},
+        ],
+    )
+    def test_matches_odfpy_path(self, options) -> None:
+        from all2md.renderers.markdown import MarkdownRenderer
+
+        data = create_ods_with_spans_and_repeats()
+        full = OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(streaming=False, **options)).parse(data)
+        streamed = OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(streaming=True, **options)).parse(data)
+
+        renderer = MarkdownRenderer()
+        assert renderer.render_to_string(streamed) == renderer.render_to_string(full)
+        assert streamed.metadata == full.metadata
+
+    def test_sheet_with_image_uses_odfpy_document(self, monkeypatch) -> None:
+        """A drawing frame in a selected sheet sends the file to odfpy, unless nothing renders it."""
+        from odf import opendocument
+        from odf.draw import Frame
+        from odf.draw import Image as OdfImage
+
+        doc = OpenDocumentSpreadsheet()
+        table = OdfTable(name="Pictures")
+        row = TableRow()
+        cell = TableCell()
+        cell.addElement(P(text="Logo"))
+        frame = Frame(name="logo", width="1cm", height="1cm")
+        frame.addElement(OdfImage(href=doc.addPicture("logo.png", "image/png", b"\x89PNG\r\n\x1a\n")))
+        cell.addElement(frame)
+        row.addElement(cell)
+        table.addElement(row)
+        doc.spreadsheet.addElement(table)
+        output = BytesIO()
+        doc.save(output)
+
+        loads = []
+        original = opendocument.load
+        monkeypatch.setattr(opendocument, "load", lambda *a, **kw: loads.append(a) or original(*a, **kw))
+
+        rendered = OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(attachment_mode="alt_text")).parse(
+            output.getvalue()
+        )
+        assert len(loads) == 1
+        skipped = OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(attachment_mode="skip")).parse(output.getvalue())
+        assert len(loads) == 1
+        assert skipped.children == rendered.children
+
+    def test_entity_declarations_are_rejected(self) -> None:
+        """content.xml is untrusted; an entity-expansion payload must not be parsed."""
+        import zipfile
+
+        from all2md.exceptions import MalformedFileError
+
+        output = BytesIO()
+        with zipfile.ZipFile(BytesIO(create_ods_with_spans_and_repeats())) as source:
+            with zipfile.ZipFile(output, "w") as target:
+                for item in source.infolist():
+                    data = source.read(item)
+                    if item.filename == "content.xml":
+                        data = (
+                            b'<?xml version="1.0"?>\n<!DOCTYPE lol [<!ENTITY lol "lol">'
+                            b'<!ENTITY lol2 "&lol;&lol;&lol;&lol;">]>\n' + data.split(b"?>", 1)[1]
+                        )
+                    target.writestr(item, data)
+
+        with pytest.raises(MalformedFileError, match="EntitiesForbidden"):
+            OdsSpreadsheetToAstConverter(OdsSpreadsheetOptions(streaming=True)).parse(output.getvalue())
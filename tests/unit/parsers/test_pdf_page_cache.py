@@ -0,0 +1,120 @@
+"""Tests for the page-stage cache the optimizer shares across PDF parses.
+
+The cache is only worth having if it is invisible: a parse that reuses cached
+stages must produce exactly the document a cold parse does, whatever options
+the two parses differ in.
+"""
+
+from __future__ import annotations
+
+import pytest
+from fixtures.generators.pdf_test_fixtures import create_test_pdf_bytes
+
+from all2md.ast.serialization import ast_to_json
+from all2md.options.pdf import PdfOptions
+from all2md.parsers._pdf_page_cache import PageStageCache, get_active_page_cache, use_page_cache
+from all2md.parsers.pdf import PdfToAstConverter
+
+
+def _parse(pdf_bytes: bytes, **overrides) -> str:
+    options = PdfOptions(layout_analysis_mode="disabled", **overrides)
+    return ast_to_json(PdfToAstConverter(options).parse(pdf_bytes))
+
+
+@pytest.mark.unit
+class TestPageStageCache:
+    def test_computes_once_per_key(self):
+        cache = PageStageCache()
+        calls: list[int] = []
+
+        def compute() -> int:
+            calls.append(1)
+            return 42
+
+        assert cache.get_or_compute(("doc", 0, "stage"), compute) == 42
+        assert cache.get_or_compute(("doc", 0, "stage"), compute) == 42
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_copy_protects_the_stored_value(self):
+        cache = PageStageCache()
+
+        first = cache.get_or_compute(("doc", 0, "blocks"), lambda: [{"n": 1}], copy=list)
+        first.append({"n": 2})
+        second = cache.get_or_compute(("doc", 0, "blocks"), lambda: [], copy=list)
+
+        assert second == [{"n": 1}]
+
+    def test_evicts_least_recently_used(self):
+        cache = PageStageCache(max_entries=2)
+        cache.get_or_compute(("a",), lambda: 1)
+        cache.get_or_compute(("b",), lambda: 2)
+        cache.get_or_compute(("a",), lambda: 0)  # touch "a"
+        cache.get_or_compute(("c",), lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_compute(("a",), lambda: -1) == 1
+        assert cache.get_or_compute(("b",), lambda: -1) == -1
+
+    def test_a_failed_stage_is_not_cached(self):
+        cache = PageStageCache()
+
+        def broken() -> int:
+            raise RuntimeError("unreadable page")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute(("doc", 0, "stage"), broken)
+        assert len(cache) == 0
+
+    def test_nested_blocks_share_the_outer_cache(self):
+        assert get_active_page_cache() is None
+        with use_page_cache() as outer:
+            with use_page_cache() as inner:
+                assert inner is outer
+        assert get_active_page_cache() is None
+
+
+@pytest.mark.unit
+@pytest.mark.pdf
+class TestParsingThroughTheCache:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"table_detection_mode": "pymupdf"},
+            {"table_detection_mode": "ruling"},
+            {"detect_columns": False},
+            {"enable_table_fallback_detection": False},
+        ],
+    )
+    def test_cached_parses_match_cold_parses(self, overrides):
+        pdf_bytes = create_test_pdf_bytes("tables")
+        expected = _parse(pdf_bytes, **overrides)
+
+        with use_page_cache() as cache:
+            # Warm the cache with different options, then parse twice more.
+            _parse(pdf_bytes, table_detection_mode="both", trim_headers_footers=True)
+            assert _parse(pdf_bytes, **overrides) == expected
+            assert _parse(pdf_bytes, **overrides) == expected
+
+        assert cache.hits > 0
+
+    def test_find_tables_runs_once_per_page_across_candidates(self, monkeypatch):
+        import pymupdf
+
+        calls: list[int] = []
+        original = pymupdf.Page.find_tables
+
+        def counting_find_tables(page, *args, **kwargs):
+            calls.append(page.number)
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(pymupdf.Page, "find_tables", counting_find_tables)
+        pdf_bytes = create_test_pdf_bytes("tables")
+
+        with use_page_cache():
+            for trim in (False, True):
+                _parse(pdf_bytes, table_detection_mode="pymupdf", trim_headers_footers=trim)
+
+        assert calls
+        assert sorted(calls) == sorted(set(calls))
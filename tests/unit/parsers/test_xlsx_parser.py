@@ -364,3 +364,121 @@ class TestXlsxOptions:
         # Should not have heading for sheet title
         headings = [child for child in ast_doc.children if isinstance(child, Heading)]
         assert len(headings) == 0
+
+
+def _render(doc: Document) -> str:
+    from all2md.renderers.markdown import MarkdownRenderer
+
+    return MarkdownRenderer().render_to_string(doc)
+
+
+def _parse_both_modes(data: bytes, **options) -> tuple[str, str]:
+    """Render ``data`` with full-mode and read-only-mode loading."""
+    full = XlsxToAstConverter(XlsxOptions(streaming=False, **options)).parse(data)
+    streamed = XlsxToAstConverter(XlsxOptions(streaming=True, **options)).parse(BytesIO(data))
+    return _render(full), _render(streamed)
+
+
+def create_xlsx_with_merges_and_links() -> bytes:
+    """A sheet with merged ranges, external/internal/empty-cell hyperlinks and a second sheet."""
+    from openpyxl.styles import Alignment as XlsxAlignment
+    from openpyxl.worksheet.hyperlink import Hyperlink
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for r in range(1, 12):
+        ws.append([f"r{r}c{c}" if (r + c) % 4 else None for c in range(1, 7)])
+    ws.merge_cells("A3:C4")
+    ws.merge_cells("E6:F9")
+    ws["B2"].hyperlink = "https://example.com/b2"
+    ws["D5"] = None
+    ws["D5"].hyperlink = "https://example.com/empty"
+    ws["A10"].hyperlink = Hyperlink(ref="A10", location="Other!A1")
+    ws["A1"].alignment = XlsxAlignment(horizontal="right")
+    other = wb.create_sheet("Other")
+    other["C3"] = "only"
+    output = BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl not installed")
+class TestXlsxStreaming:
+    """Read-only (streaming) loading must convert exactly like full-mode loading."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"max_rows": 4},
+            {"max_cols": 3},
+            {"merged_cell_mode": "skip"},
+            {"trim_empty": "both"},
+            {"sheets": ["Other"]},
+        ],
+    )
+    def test_matches_full_mode(self, options) -> None:
+        full, streamed = _parse_both_modes(create_xlsx_with_merges_and_links(), **options)
+        assert streamed == full
+
+    def test_merged_and_linked_cells_survive_streaming(self) -> None:
+        _, streamed = _parse_both_modes(create_xlsx_with_merges_and_links())
+        assert "[https://example.com/empty](https://example.com/empty)" in streamed
+        assert "[r10c1](#Other!A1)" in streamed
+        assert "r3c2" not in streamed  # merged follower flattened
+
+    def test_missing_dimension_matches_full_mode(self) -> None:
+        import re
+        import zipfile
+
+        source = zipfile.ZipFile(BytesIO(create_xlsx_with_merges_and_links()))
+        output = BytesIO()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+            for item in source.infolist():
+                body = source.read(item.filename)
+                if item.filename.startswith("xl/worksheets/sheet"):
+                    body = re.sub(rb"<dimension[^>]*/>", b"", body)
+                target.writestr(item, body)
+
+        for options in ({}, {"max_rows": 4}, {"max_cols": 3}):
+            full, streamed = _parse_both_modes(output.getvalue(), **options)
+            assert streamed == full
+
+    def test_max_rows_stops_reading_early(self, monkeypatch) -> None:
+        """Streaming never converts rows past ``max_rows + 1``."""
+        import all2md.parsers.xlsx as xlsx_module
+
+        calls = []
+        original = xlsx_module.sanitize_cell_text
+        monkeypatch.setattr(xlsx_module, "sanitize_cell_text", lambda *a: calls.append(a) or original(*a))
+
+        wb = openpyxl.Workbook()
+        for r in range(500):
+            wb.active.append([r, r + 1])
+        output = BytesIO()
+        wb.save(output)
+
+        doc = XlsxToAstConverter(XlsxOptions(max_rows=5)).parse(output.getvalue())
+        assert len(calls) == 5 * 2
+        assert "*...*" in _render(doc)
+
+    def test_sheet_with_image_falls_back_to_full_mode(self) -> None:
+        """Read-only mode has no drawings, so a sheet with an image is loaded in full."""
+        doc = XlsxToAstConverter(XlsxOptions(attachment_mode="alt_text")).parse(create_xlsx_with_image())
+        assert any(isinstance(child, Image) for child in doc.children)
+
+    def test_drawings_are_ignored_when_nothing_renders_them(self, monkeypatch) -> None:
+        """With images and charts skipped, a sheet with a drawing is still streamed."""
+        import openpyxl as openpyxl_module
+
+        modes = []
+        original = openpyxl_module.load_workbook
+        monkeypatch.setattr(
+            openpyxl_module, "load_workbook", lambda *a, **kw: modes.append(kw.get("read_only")) or original(*a, **kw)
+        )
+
+        XlsxToAstConverter(XlsxOptions(attachment_mode="skip")).parse(create_xlsx_with_image())
+        XlsxToAstConverter(XlsxOptions(attachment_mode="alt_text")).parse(create_xlsx_with_image())
+        assert modes == [True, True, None]
@@ -228,6 +228,18 @@ class TestZipParser:
         headings = [node for node in doc.children if isinstance(node, Heading)]
         assert len(headings) == 1
 
+    def test_parallel_processing_keeps_archive_order_and_spills_large_members(self, monkeypatch):
+        """Parallel mode reads members lazily, spills large ones and keeps archive order."""
+        monkeypatch.setattr("all2md.parsers._archive_members.SPILL_THRESHOLD_BYTES", 64)
+        files = {f"file{i:02d}.txt": (f"Content {i} " + "x" * (200 if i % 3 == 0 else 0)).encode() for i in range(12)}
+        zip_data = create_test_zip(files)
+
+        options = ZipOptions(enable_parallel_processing=True, max_workers=2)
+        doc = ZipToAstConverter(options=options).parse(zip_data)
+
+        headings = [node.content[0].content for node in doc.children if isinstance(node, Heading)]
+        assert headings == list(files)
+
 
 class TestZipMetadata:
     """Tests for ZIP metadata extraction."""
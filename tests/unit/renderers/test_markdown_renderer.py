@@ -2021,3 +2021,120 @@ class TestCommentModeDefault:
         ast = to_ast("<!-- please review -->\n", source_format="markdown")
         rendered = MarkdownRenderer(options=MarkdownRendererOptions(comment_mode="blockquote")).render_to_string(ast)
         assert "> please review" in rendered
+
+
+class _RecordingStream:
+    """Text sink that keeps each ``write`` call separately."""
+
+    def __init__(self):
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return len(text)
+
+
+@pytest.mark.unit
+class TestStreamingRender:
+    """render_to_stream writes block by block and matches render_to_string."""
+
+    @staticmethod
+    def _document():
+        return Document(
+            metadata={"title": "Streamed"},
+            children=[
+                Paragraph(content=[Text(content="   ")]),
+                Heading(level=1, content=[Text(content="Title")]),
+                Paragraph(content=[Link(url="https://a.example", content=[Text(content="first")])]),
+                HTMLBlock(content="<div>\r\n\r\n\r\n</div>\r"),
+                Paragraph(content=[Link(url="https://b.example", content=[Text(content="second")])]),
+                Paragraph(content=[Text(content="trailing  ")]),
+            ],
+        )
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            MarkdownRendererOptions(),
+            MarkdownRendererOptions(metadata_frontmatter=True, collapse_blank_lines=False),
+            MarkdownRendererOptions(link_style="reference", reference_link_placement="end_of_document"),
+            MarkdownRendererOptions(link_style="reference", reference_link_placement="after_block"),
+        ],
+    )
+    def test_stream_matches_render_to_string(self, options):
+        from io import StringIO
+
+        doc = self._document()
+        stream = StringIO()
+        MarkdownRenderer(options).render_to_stream(doc, stream)
+        assert stream.getvalue() == MarkdownRenderer(options).render_to_string(doc)
+
+    def test_blocks_are_written_as_they_finish(self):
+        doc = Document(children=[Paragraph(content=[Text(content=f"Block {i}")]) for i in range(3)])
+        stream = _RecordingStream()
+        MarkdownRenderer().render_to_stream(doc, stream)
+        assert stream.writes == ["Block 0", "\n\nBlock 1", "\n\nBlock 2"]
+
+    def test_end_of_document_references_are_written_last(self):
+        options = MarkdownRendererOptions(link_style="reference", reference_link_placement="end_of_document")
+        stream = _RecordingStream()
+        MarkdownRenderer(options).render_to_stream(self._document(), stream)
+        assert stream.writes[-1].endswith("\n\n[1]: https://a.example\n[2]: https://b.example")
+        assert all("]: https://" not in text for text in stream.writes[:-1])
+
+    def test_render_streams_to_path_and_binary_stream(self, tmp_path):
+        from io import BytesIO
+
+        doc = self._document()
+        expected = MarkdownRenderer().render_to_string(doc)
+
+        target = tmp_path / "out.md"
+        MarkdownRenderer().render(doc, target)
+        assert target.read_text(encoding="utf-8") == expected
+
+        buffer = BytesIO()
+        MarkdownRenderer().render(doc, buffer)
+        assert buffer.getvalue() == expected.encode("utf-8")
+
+
+@pytest.mark.unit
+class TestBlockSpans:
+    """render_to_string_with_spans maps each top-level block into the one rendering."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            MarkdownRendererOptions(),
+            MarkdownRendererOptions(metadata_frontmatter=True, collapse_blank_lines=False),
+            MarkdownRendererOptions(link_style="reference", reference_link_placement="after_block"),
+        ],
+    )
+    def test_text_matches_render_to_string(self, options):
+        doc = TestStreamingRender._document()
+        text, spans = MarkdownRenderer(options).render_to_string_with_spans(doc)
+        assert text == MarkdownRenderer(options).render_to_string(doc)
+        assert len(spans) == len(doc.children)
+
+    def test_each_span_is_the_block_rendered_alone(self):
+        children = [
+            Paragraph(content=[Text(content="Intro")]),
+            CodeBlock(content="run()", language="python"),
+            Heading(level=2, content=[Text(content="Next")]),
+            Paragraph(content=[Text(content="   ")]),
+            Paragraph(content=[Text(content="Last")]),
+        ]
+        text, spans = MarkdownRenderer().render_to_string_with_spans(Document(children=children))
+
+        for child, (start, end) in zip(children, spans, strict=True):
+            assert text[start:end] == MarkdownRenderer().render_to_string(Document(children=[child]))
+        assert spans[3][0] == spans[3][1] == spans[2][1]
+        # A run of blocks slices out exactly as that run renders on its own.
+        assert text[spans[1][0] : spans[4][1]] == MarkdownRenderer().render_to_string(Document(children=children[1:]))
+
+    def test_frontmatter_is_outside_every_span(self):
+        doc = Document(metadata={"title": "T"}, children=[Paragraph(content=[Text(content="Body")])])
+        text, spans = MarkdownRenderer(MarkdownRendererOptions(metadata_frontmatter=True)).render_to_string_with_spans(
+            doc
+        )
+        assert text.startswith("---")
+        assert text[spans[0][0] : spans[0][1]] == "Body"
@@ -1,6 +1,8 @@
 """Unit tests for BM25 keyword search index."""
 
-import importlib.util
+import math
+import random
+from collections import Counter
 from pathlib import Path
 
 import pytest
@@ -19,7 +21,6 @@ def sample_chunks() -> list[Chunk]:
     ]
 
 
-@pytest.mark.skipif(importlib.util.find_spec("rank_bm25") is None, reason="rank_bm25 not installed")
 @pytest.mark.unit
 class TestBM25Index:
     """Test BM25Index class."""
@@ -138,6 +139,151 @@ class TestBM25Index:
         results = index.search(query, top_k=3)
         assert len(results) > 0
 
+    def test_non_matching_chunks_are_not_returned(self, sample_chunks):
+        """Chunks without any query term are not padded into the results."""
+        from all2md.search.bm25 import BM25Index
+
+        index = BM25Index()
+        index.add_chunks(sample_chunks)
+
+        results = index.search(SearchQuery(raw_text="python"), top_k=4)
+        assert [result.chunk.chunk_id for result in results] == ["chunk2"]
+        assert index.search(SearchQuery(raw_text="nonexistent"), top_k=4) == []
+
+    def test_incremental_add_matches_single_build(self, sample_chunks):
+        """Appending chunks in batches yields the same ranking as one build."""
+        from all2md.search.bm25 import BM25Index
+
+        whole = BM25Index()
+        whole.add_chunks(sample_chunks)
+        batched = BM25Index()
+        batched.add_chunks(sample_chunks[:2])
+        batched.add_chunks(sample_chunks[2:])
+
+        query = SearchQuery(raw_text="the quick fox")
+        assert [(r.chunk.chunk_id, r.score) for r in batched.search(query, top_k=4)] == [
+            (r.chunk.chunk_id, r.score) for r in whole.search(query, top_k=4)
+        ]
+
+    def test_remove_chunks_matches_fresh_build(self, sample_chunks):
+        """Removing chunks in place ranks exactly like an index built without them."""
+        from all2md.search.bm25 import BM25Index
+
+        index = BM25Index()
+        index.add_chunks(sample_chunks)
+        assert index.remove_chunks([0, 2]) == 2
+        index.add_chunks([Chunk(chunk_id="chunk5", text="a quick python fox", metadata={})])
+
+        fresh = BM25Index()
+        fresh.add_chunks(
+            [sample_chunks[1], sample_chunks[3], Chunk(chunk_id="chunk5", text="a quick python fox", metadata={})]
+        )
+        for text in ("quick fox", "python", "lazy dog"):
+            query = SearchQuery(raw_text=text)
+            assert [(r.chunk.chunk_id, r.score) for r in index.search(query, top_k=5)] == [
+                (r.chunk.chunk_id, r.score) for r in fresh.search(query, top_k=5)
+            ]
+
+
+@pytest.mark.unit
+class TestBM25Pruning:
+    """MaxScore top-k must return exactly what exhaustive scoring would."""
+
+    @staticmethod
+    def _exhaustive(texts: list[str], query: str, k: int, k1: float = 1.5, b: float = 0.75):
+        docs = [Counter(text.lower().split()) for text in texts]
+        lengths = [sum(doc.values()) for doc in docs]
+        avg_length = sum(lengths) / len(lengths)
+        scored = []
+        for doc_id, doc in enumerate(docs):
+            score = 0.0
+            matched = False
+            for term, query_tf in Counter(query.lower().split()).items():
+                tf = doc.get(term, 0)
+                if not tf:
+                    continue
+                matched = True
+                df = sum(1 for other in docs if term in other)
+                idf = math.log(1.0 + (len(docs) - df + 0.5) / (df + 0.5))
+                score += query_tf * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[doc_id] / avg_length))
+            if matched:
+                scored.append((doc_id, score))
+        scored.sort(key=lambda pair: (-pair[1], pair[0]))
+        return scored[:k]
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_exhaustive_ranking(self, seed):
+        from all2md.search.bm25 import BM25Index
+
+        rng = random.Random(seed)
+        vocabulary = [f"w{i}" for i in range(40)]
+        weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+        texts = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(1, 30))) for _ in range(300)]
+        index = BM25Index()
+        index.add_chunks([Chunk(chunk_id=f"c{i}", text=text, metadata={}) for i, text in enumerate(texts)])
+
+        for _ in range(20):
+            query = " ".join(rng.choices(vocabulary, k=rng.randint(1, 5)))
+            k = rng.choice([1, 3, 10])
+            expected = self._exhaustive(texts, query, k)
+            results = index.search(SearchQuery(raw_text=query), top_k=k)
+            assert [r.chunk.chunk_id for r in results] == [f"c{doc_id}" for doc_id, _ in expected]
+            assert [r.score for r in results] == pytest.approx([score for _, score in expected])
+
+
+@pytest.mark.unit
+class TestBM25Persistence:
+    """Binary postings persisted next to ``chunks.jsonl``."""
+
+    def test_load_reads_postings_without_tokenizing(self, sample_chunks, tmp_path: Path, monkeypatch):
+        from all2md.search import bm25
+        from all2md.search.bm25 import BM25Index
+
+        index = BM25Index()
+        index.add_chunks(sample_chunks)
+        index.save(tmp_path)
+        assert (tmp_path / "postings.bin").exists()
+
+        calls = []
+
+        def counting_tokenizer(text: str) -> list[str]:
+            calls.append(text)
+            return text.lower().split()
+
+        monkeypatch.setattr(bm25, "_default_tokenizer", counting_tokenizer)
+        loaded = BM25Index.load(tmp_path)
+        assert calls == []
+
+        query = SearchQuery(raw_text="quick fox")
+        assert [(r.chunk.chunk_id, r.score) for r in loaded.search(query, top_k=4)] == [
+            (r.chunk.chunk_id, r.score) for r in index.search(query, top_k=4)
+        ]
+        assert calls == ["quick fox"]
+
+    def test_corrupt_postings_fall_back_to_reindexing(self, sample_chunks, tmp_path: Path):
+        from all2md.search.bm25 import BM25Index
+
+        index = BM25Index()
+        index.add_chunks(sample_chunks)
+        index.save(tmp_path)
+        postings = tmp_path / "postings.bin"
+        postings.write_bytes(postings.read_bytes()[:-3])
+
+        loaded = BM25Index.load(tmp_path)
+        results = loaded.search(SearchQuery(raw_text="fox"), top_k=2)
+        assert {r.chunk.chunk_id for r in results} == {"chunk1", "chunk4"}
+
+    def test_legacy_index_without_postings_still_loads(self, sample_chunks, tmp_path: Path):
+        from all2md.search.bm25 import BM25Index
+
+        index = BM25Index()
+        index.add_chunks(sample_chunks)
+        index.save(tmp_path)
+        (tmp_path / "postings.bin").unlink()
+
+        loaded = BM25Index.load(tmp_path)
+        assert loaded.search(SearchQuery(raw_text="python"), top_k=1)[0].chunk.chunk_id == "chunk2"
+
 
 @pytest.mark.unit
 class TestKeywordIndexConfig:
@@ -0,0 +1,148 @@
+"""Unit tests for the persistent embedding cache."""
+
+import importlib.util
+
+import pytest
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+pytestmark = [pytest.mark.unit, pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")]
+
+
+def _vectors(rows: int, dimension: int = 8, offset: float = 0.0):
+    import numpy as np
+
+    return (np.arange(rows * dimension, dtype=np.float32).reshape(rows, dimension) + offset) / 10
+
+
+def _cache(tmp_path, model_name: str = "model-a", normalize: bool = True):
+    from all2md.search.embedding_cache import EmbeddingCache
+
+    return EmbeddingCache(tmp_path, model_name=model_name, normalize=normalize)
+
+
+class TestEmbeddingCache:
+    """Lookups, appends and persistence of cached embeddings."""
+
+    def test_empty_cache_misses_everything(self, tmp_path):
+        from all2md.search.embedding_cache import text_key
+
+        vectors, misses = _cache(tmp_path).get([text_key("a"), text_key("b")])
+        assert vectors is None
+        assert misses == [0, 1]
+
+    def test_put_then_get_returns_hits_and_miss_positions(self, tmp_path):
+        import numpy as np
+
+        from all2md.search.embedding_cache import text_key
+
+        cache = _cache(tmp_path)
+        stored = _vectors(2)
+        assert cache.put([text_key("a"), text_key("b")], stored) == 2
+
+        vectors, misses = cache.get([text_key("b"), text_key("new"), text_key("a")])
+        assert misses == [1]
+        np.testing.assert_array_equal(vectors[0], stored[1])
+        np.testing.assert_array_equal(vectors[2], stored[0])
+
+    def test_duplicates_are_not_stored_twice(self, tmp_path):
+        from all2md.search.embedding_cache import text_key
+
+        cache = _cache(tmp_path)
+        cache.put([text_key("a"), text_key("a")], _vectors(2))
+        assert cache.put([text_key("a"), text_key("b")], _vectors(2)) == 1
+        assert len(cache) == 2
+
+    def test_entries_persist_and_are_seen_by_other_instances(self, tmp_path):
+        import numpy as np
+
+        from all2md.search.embedding_cache import text_key
+
+        writer = _cache(tmp_path)
+        reader = _cache(tmp_path)
+        assert reader.get([text_key("a")])[1] == [0]
+
+        writer.put([text_key("a")], _vectors(1))
+        vectors, misses = reader.get([text_key("a")])
+        assert misses == []
+        np.testing.assert_array_equal(vectors[0], _vectors(1)[0])
+
+    def test_model_and_normalize_flag_are_separate_namespaces(self, tmp_path):
+        from all2md.search.embedding_cache import text_key
+
+        _cache(tmp_path).put([text_key("a")], _vectors(1))
+        assert _cache(tmp_path, model_name="model-b").get([text_key("a")])[1] == [0]
+        assert _cache(tmp_path, normalize=False).get([text_key("a")])[1] == [0]
+
+    def test_dimension_mismatch_is_not_stored(self, tmp_path):
+        from all2md.search.embedding_cache import text_key
+
+        cache = _cache(tmp_path)
+        cache.put([text_key("a")], _vectors(1, dimension=8))
+        assert cache.put([text_key("b")], _vectors(1, dimension=4)) == 0
+        assert cache.dimension == 8
+
+    def test_torn_record_is_ignored_and_trimmed(self, tmp_path):
+        import numpy as np
+
+        from all2md.search.embedding_cache import text_key
+
+        cache = _cache(tmp_path)
+        cache.put([text_key("a")], _vectors(1))
+        with cache.path.open("ab") as handle:
+            handle.write(b"\x01" * 13)
+
+        fresh = _cache(tmp_path)
+        assert len(fresh) == 1
+        fresh.put([text_key("b")], _vectors(1, offset=5))
+        vectors, misses = _cache(tmp_path).get([text_key("a"), text_key("b")])
+        assert misses == []
+        np.testing.assert_array_equal(vectors[1], _vectors(1, offset=5)[0])
+
+    def test_append_waits_for_a_writer_mid_record(self, tmp_path):
+        import threading
+
+        import numpy as np
+
+        from all2md.search.embedding_cache import _exclusive_file_lock, text_key
+
+        cache = _cache(tmp_path)
+        cache.put([text_key("a")], _vectors(1))
+        block = np.empty(1, dtype=cache._record_dtype(8))
+        block["key"] = [np.void(text_key("b"))]
+        block["vector"] = _vectors(1, offset=5)
+        payload = block.tobytes()
+
+        # Another writer (its own handle, as in a second process) is half-way through a record.
+        other = _cache(tmp_path)
+        with _exclusive_file_lock(cache._lock_path), cache.path.open("ab") as handle:
+            handle.write(payload[:13])
+            handle.flush()
+            writer = threading.Thread(target=other.put, args=([text_key("c")], _vectors(1, offset=9)))
+            writer.start()
+            writer.join(timeout=0.3)
+            assert writer.is_alive()
+            handle.write(payload[13:])
+        writer.join()
+
+        vectors, misses = _cache(tmp_path).get([text_key("a"), text_key("b"), text_key("c")])
+        assert misses == []
+        np.testing.assert_array_equal(vectors[1], _vectors(1, offset=5)[0])
+        np.testing.assert_array_equal(vectors[2], _vectors(1, offset=9)[0])
+
+    def test_foreign_file_is_treated_as_empty(self, tmp_path):
+        from all2md.search.embedding_cache import text_key
+
+        cache = _cache(tmp_path)
+        cache.directory.mkdir(parents=True, exist_ok=True)
+        cache.path.write_bytes(b"not an embedding cache at all")
+
+        assert cache.get([text_key("a")]) == (None, [0])
+        assert cache.put([text_key("a")], _vectors(1)) == 0
+        assert cache.path.read_bytes() == b"not an embedding cache at all"
+
+    def test_default_dir_honors_environment(self, tmp_path, monkeypatch):
+        from all2md.search.embedding_cache import default_embedding_cache_dir
+
+        monkeypatch.setenv("ALL2MD_EMBEDDING_CACHE_DIR", str(tmp_path / "emb"))
+        assert default_embedding_cache_dir() == tmp_path / "emb"
@@ -17,6 +17,9 @@ class ConcreteIndex(BaseIndex):
     def _build_backend(self) -> None:
         pass
 
+    def _remove_from_backend(self, positions) -> None:
+        self.removed_positions = list(positions)
+
     def search(self, query: SearchQuery, *, top_k: int = 10) -> list[SearchResult]:
         # Simple substring search for testing
         results = []
@@ -153,6 +156,25 @@ class TestBaseIndex:
 
         assert index.chunk_count == 2
 
+    def test_remove_chunks_passes_sorted_valid_positions_to_backend(self, sample_chunks):
+        """The backend sees each in-range position once, in order, before the chunks go."""
+        index = ConcreteIndex(mode=SearchMode.GREP)
+        index.add_chunks(sample_chunks)
+
+        assert index.remove_chunks([]) == 0
+        assert index.remove_chunks([1, 5, 0, 1]) == 2
+        assert index.removed_positions == [0, 1]
+        assert index.chunk_count == 0
+
+    def test_backend_must_implement_removal(self):
+        """Removal is part of the index contract, not an optional runtime stub."""
+
+        class NoRemoval(ConcreteIndex):
+            _remove_from_backend = BaseIndex._remove_from_backend
+
+        with pytest.raises(TypeError, match="_remove_from_backend"):
+            NoRemoval(mode=SearchMode.GREP)
+
     def test_add_chunks_with_progress(self, sample_chunks):
         """Test adding chunks with progress callback."""
         events = []
@@ -1,8 +1,10 @@
-import importlib
+import json
+import os
 from pathlib import Path
 
 import pytest
 
+from all2md.exceptions import All2MdError
 from all2md.options.search import SearchOptions
 from all2md.search.service import SearchDocumentInput, SearchService
 from all2md.search.types import SearchMode
@@ -25,7 +27,6 @@ def test_search_service_grep(sample_markdown: Path) -> None:
     assert any("keyword" in result.chunk.text.lower() for result in results)
 
 
-@pytest.mark.skipif(importlib.util.find_spec("rank_bm25") is None, reason="rank_bm25 not installed")
 def test_search_service_keyword_mode(sample_markdown: Path) -> None:
     service = SearchService(options=SearchOptions())
     document = SearchDocumentInput(source=sample_markdown, document_id="sample")
@@ -36,7 +37,6 @@ def test_search_service_keyword_mode(sample_markdown: Path) -> None:
     assert results[0].metadata.get("backend") == "keyword"
 
 
-@pytest.mark.skipif(importlib.util.find_spec("rank_bm25") is None, reason="rank_bm25 not installed")
 def test_build_search_service_api(sample_markdown: Path) -> None:
     from all2md.search import build_search_service, search_with_service
 
@@ -44,3 +44,230 @@ def test_build_search_service_api(sample_markdown: Path) -> None:
     service = build_search_service([document], modes={SearchMode.KEYWORD})
     results = search_with_service(service, "keyword", mode=SearchMode.KEYWORD)
     assert results
+
+
+def _write_corpus(root: Path) -> list[Path]:
+    paths = []
+    for name, body in (("alpha", "alpha protocol handshake"), ("beta", "beta ledger audit"), ("gamma", "gamma ray")):
+        path = root / f"{name}.md"
+        path.write_text(f"# {name.title()}\n\nThe {body} is documented here.\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _count_conversions(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    from all2md.search import service as service_module
+
+    converted: list[str] = []
+    original = service_module.to_ast
+
+    def counting_to_ast(source, *args, **kwargs):
+        converted.append(Path(source).name)
+        return original(source, *args, **kwargs)
+
+    monkeypatch.setattr(service_module, "to_ast", counting_to_ast)
+    return converted
+
+
+def _ranking(service: SearchService, query: str) -> list[tuple[str, float]]:
+    return [(r.chunk.chunk_id, r.score) for r in service.search(query, mode=SearchMode.KEYWORD, top_k=10)]
+
+
+def test_update_indexes_reparses_only_changed_documents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    alpha, beta, gamma = _write_corpus(corpus)
+    service = SearchService()
+    service.build_indexes([SearchDocumentInput(source=p) for p in (alpha, beta, gamma)], modes={SearchMode.KEYWORD})
+    service.save(tmp_path / "index")
+
+    beta.write_text("# Beta\n\nThe beta ledger now mentions the alpha protocol.\n", encoding="utf-8")
+    os.utime(beta, ns=(beta.stat().st_atime_ns, beta.stat().st_mtime_ns + 1_000_000))
+    gamma.unlink()
+    delta = corpus / "delta.md"
+    delta.write_text("# Delta\n\nDelta notes on the alpha rollout.\n", encoding="utf-8")
+    current = [SearchDocumentInput(source=p) for p in (alpha, beta, delta)]
+
+    converted = _count_conversions(monkeypatch)
+    reloaded = SearchService.load(tmp_path / "index")
+    summary = reloaded.update_indexes(current)
+
+    assert (summary.added, summary.changed, summary.removed, summary.unchanged) == (1, 1, 1, 1)
+    assert not summary.rebuilt
+    assert sorted(converted) == ["beta.md", "delta.md"]
+    assert {chunk.metadata["document_id"] for chunk in reloaded.state.chunks} == {"alpha", "beta", "delta"}
+
+    fresh = SearchService()
+    fresh.build_indexes(current, modes={SearchMode.KEYWORD})
+    assert sorted(_ranking(reloaded, "alpha protocol")) == sorted(_ranking(fresh, "alpha protocol"))
+    assert reloaded.search("gamma", mode=SearchMode.KEYWORD) == []
+
+    # The saved manifest is again current for the updated corpus.
+    reloaded.save(tmp_path / "index")
+    assert SearchService.persisted_index_matches(tmp_path / "index", current, SearchOptions())
+
+
+def test_update_indexes_noop_when_corpus_unchanged(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    documents = [SearchDocumentInput(source=p) for p in _write_corpus(tmp_path)]
+    service = SearchService()
+    service.build_indexes(documents, modes={SearchMode.KEYWORD})
+    before = _ranking(service, "alpha")
+
+    converted = _count_conversions(monkeypatch)
+    summary = service.update_indexes(documents)
+
+    assert summary.unchanged == 3
+    assert converted == []
+    assert _ranking(service, "alpha") == before
+
+
+def test_update_indexes_rebuilds_without_document_records(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    documents = [SearchDocumentInput(source=p) for p in _write_corpus(tmp_path)]
+    service = SearchService()
+    service.build_indexes(documents, modes={SearchMode.KEYWORD})
+    service.save(tmp_path / "index")
+    manifest_path = tmp_path / "index" / "corpus.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest_path.write_text(json.dumps({"fingerprint": manifest["fingerprint"]}), encoding="utf-8")
+
+    converted = _count_conversions(monkeypatch)
+    summary = SearchService.load(tmp_path / "index").update_indexes(documents)
+
+    assert summary.rebuilt
+    assert len(converted) == 3
+
+
+def test_update_indexes_rebuilds_when_index_options_change(tmp_path: Path) -> None:
+    documents = [SearchDocumentInput(source=p) for p in _write_corpus(tmp_path)]
+    service = SearchService()
+    service.build_indexes(documents, modes={SearchMode.KEYWORD})
+    service.save(tmp_path / "index")
+
+    reloaded = SearchService.load(tmp_path / "index", options=SearchOptions(bm25_k1=2.0))
+    assert reloaded.update_indexes(documents).rebuilt
+
+
+def _chunk_records(service: SearchService) -> list[tuple[str, str, dict]]:
+    return [(chunk.chunk_id, chunk.text, dict(chunk.metadata)) for chunk in service.state.chunks]
+
+
+def test_parallel_build_matches_sequential_order(tmp_path: Path) -> None:
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    sequential = SearchService()
+    sequential.build_indexes(documents, modes={SearchMode.KEYWORD})
+
+    events = []
+    parallel = SearchService(options=SearchOptions(workers=2))
+    parallel.build_indexes(documents, modes={SearchMode.KEYWORD}, progress_callback=events.append)
+
+    assert _chunk_records(parallel) == _chunk_records(sequential)
+    assert [record.key for record in parallel.state.sources] == [record.key for record in sequential.state.sources]
+    document_events = [e for e in events if e.event_type == "item_done" and e.metadata.get("item_type") == "document"]
+    assert [e.current for e in document_events] == [1, 2, 3]
+    assert events[-1].event_type == "finished"
+
+
+def test_parallel_build_shares_the_conversion_cache(tmp_path: Path) -> None:
+    from all2md.conversion_cache import ConversionCache, use_conversion_cache
+
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        with use_conversion_cache(enabled=True, cache_dir=cache_dir):
+            SearchService(options=SearchOptions(workers=2)).build_indexes(documents, modes={SearchMode.KEYWORD})
+
+    # Worker counters are merged into the lifetime stats as each worker exits.
+    lifetime = ConversionCache(cache_dir).lifetime_stats()
+    assert (lifetime.misses, lifetime.writes, lifetime.hits) == (3, 3, 3)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_document_aborts_build_by_default(tmp_path: Path, workers: int) -> None:
+    paths = _write_corpus(tmp_path)
+    documents = [SearchDocumentInput(source=p) for p in [paths[0], tmp_path / "missing.md", paths[1]]]
+
+    with pytest.raises(All2MdError):
+        SearchService(options=SearchOptions(workers=workers)).build_indexes(documents, modes={SearchMode.KEYWORD})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_document_is_skipped_when_requested(tmp_path: Path, workers: int) -> None:
+    paths = _write_corpus(tmp_path)
+    documents = [SearchDocumentInput(source=p) for p in [paths[0], tmp_path / "missing.md", paths[1]]]
+    events = []
+    service = SearchService(options=SearchOptions(workers=workers, skip_failed_documents=True))
+    service.build_indexes(documents, modes={SearchMode.KEYWORD}, progress_callback=events.append)
+
+    assert [record.document_id for record in service.state.sources] == ["alpha", "beta"]
+    errors = [e for e in events if e.event_type == "error"]
+    assert len(errors) == 1
+    assert errors[0].metadata["document_id"] == "missing"
+    assert service.search("ledger", mode=SearchMode.KEYWORD)
+
+
+def test_workers_must_be_non_negative() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        SearchOptions(workers=-1)
+
+
+def test_streaming_build_matches_batch_build_without_keeping_asts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from all2md.search import service as service_module
+
+    monkeypatch.setattr(service_module, "_STREAM_BATCH_CHUNKS", 1)
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    batch = SearchService()
+    batch.build_indexes(documents, modes={SearchMode.KEYWORD})
+    streaming = SearchService(options=SearchOptions(streaming_build=True))
+    streaming.build_indexes(documents, modes={SearchMode.KEYWORD})
+
+    assert streaming.state.documents is None
+    assert streaming.state.document_inputs == documents
+    assert _chunk_records(streaming) == _chunk_records(batch)
+    for query in ("ledger audit", "documented", "gamma"):
+        expected = [(r.chunk.chunk_id, r.score) for r in batch.search(query, mode=SearchMode.KEYWORD)]
+        assert [(r.chunk.chunk_id, r.score) for r in streaming.search(query, mode=SearchMode.KEYWORD)] == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streaming_build_does_not_return_asts_from_workers(tmp_path: Path, workers: int) -> None:
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    service = SearchService(options=SearchOptions(workers=workers, streaming_build=True))
+    pending = list(enumerate(documents, start=1))
+
+    converted = list(service._convert_documents(pending, keep_documents=False))
+
+    assert [ast_doc for _idx, _doc_input, ast_doc, _chunks in converted] == [None, None, None]
+    assert all(chunks for _idx, _doc_input, _ast_doc, chunks in converted)
+
+
+def test_streaming_grep_reparses_sources(tmp_path: Path) -> None:
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    batch = SearchService()
+    batch.build_indexes(documents, modes={SearchMode.GREP})
+    streaming = SearchService(options=SearchOptions(streaming_build=True))
+    streaming.build_indexes(documents, modes={SearchMode.GREP})
+
+    expected = [r.chunk.text for r in batch.search("ledger", mode=SearchMode.GREP)]
+    assert expected
+    assert [r.chunk.text for r in streaming.search("ledger", mode=SearchMode.GREP)] == expected
+
+
+def test_spilled_chunks_are_moved_into_place_on_save(tmp_path: Path) -> None:
+    documents = [SearchDocumentInput(source=path) for path in _write_corpus(tmp_path)]
+    index_dir = tmp_path / "index"
+    spill = index_dir / "chunks.jsonl.partial"
+    service = SearchService(options=SearchOptions(streaming_build=True))
+    service.build_indexes(documents, modes={SearchMode.KEYWORD}, spill_path=spill)
+    assert len(spill.read_text(encoding="utf-8").splitlines()) == service.state.chunk_count
+
+    service.save(index_dir)
+    assert not spill.exists()
+    assert service.state.chunks_file == index_dir / "chunks.jsonl"
+    reloaded = SearchService.load(index_dir)
+    assert _chunk_records(reloaded) == _chunk_records(service)
+
+    service.save(tmp_path / "copy")
+    assert (index_dir / "chunks.jsonl").exists()
+    assert _chunk_records(SearchService.load(tmp_path / "copy")) == _chunk_records(service)
@@ -128,6 +128,256 @@ class TestVectorIndex:
         assert len(results) > 0
 
 
+HAS_FAISS = importlib.util.find_spec("numpy") is not None and importlib.util.find_spec("faiss") is not None
+
+
+class _HashingEncoder:
+    """Deterministic bag-of-words embedder standing in for a sentence-transformers model."""
+
+    dimension = 64
+
+    def encode(self, texts, **kwargs):
+        import zlib
+
+        import numpy as np
+
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                vectors[row, zlib.crc32(token.encode()) % self.dimension] += 1.0
+        return vectors
+
+
+class _CountingEncoder(_HashingEncoder):
+    """Hashing encoder that records every text it is asked to embed."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return super().encode(texts, **kwargs)
+
+
+def _hashing_index(**config_kwargs):
+    """Build a VectorIndex on the real numpy/FAISS backends with a stand-in encoder."""
+    from all2md.search.vector import VectorIndex, VectorIndexConfig
+
+    index = VectorIndex(config=VectorIndexConfig(**config_kwargs))
+    index._np = importlib.import_module("numpy")
+    index._faiss = importlib.import_module("faiss")
+    index._encoder = _HashingEncoder()
+    index._ensure_backends = lambda: None  # the model package is not needed with a stand-in encoder
+    return index
+
+
+def _nearest(index, text: str, k: int = 3) -> list[tuple[str, float]]:
+    query = index._normalize_embeddings(index._encode_texts([text]))
+    scores, ids = index._faiss_index.search(query, k)
+    return [(index._chunks[i].chunk_id, float(score)) for i, score in zip(ids[0], scores[0], strict=True) if i >= 0]
+
+
+@pytest.mark.skipif(not HAS_FAISS, reason="numpy/faiss not installed")
+@pytest.mark.unit
+class TestVectorIndexMutation:
+    """Appending and removing chunks keeps FAISS ids aligned with chunk positions."""
+
+    def test_add_appends_without_re_adding(self, sample_chunks):
+        index = _hashing_index()
+        index.add_chunks(sample_chunks[:2])
+        faiss_index = index._faiss_index
+        index.add_chunks(sample_chunks[2:])
+
+        assert index._faiss_index is faiss_index
+        assert faiss_index.ntotal == 4
+
+    def test_batched_appends_grow_capacity_geometrically(self):
+        chunks = _corpus(100)
+        index = _hashing_index()
+        capacities = set()
+        for start in range(0, len(chunks), 3):
+            index.add_chunks(chunks[start : start + 3])
+            capacities.add(index._matrix.shape[0])
+
+        fresh = _hashing_index()
+        fresh.add_chunks(chunks)
+        assert index._vectors.shape == fresh._vectors.shape
+        assert len(capacities) <= 7
+        for chunk in chunks[:10]:
+            assert _nearest(index, chunk.text) == _nearest(fresh, chunk.text)
+
+    def test_remove_chunks_matches_fresh_build(self, sample_chunks):
+        index = _hashing_index()
+        index.add_chunks(sample_chunks)
+        assert index.remove_chunks([1]) == 1
+
+        fresh = _hashing_index()
+        fresh.add_chunks([sample_chunks[0], sample_chunks[2], sample_chunks[3]])
+        assert index._faiss_index.ntotal == 3
+        for text in ("python programming", "machine learning", "quick fox"):
+            assert _nearest(index, text) == _nearest(fresh, text)
+
+
+@pytest.mark.skipif(not HAS_FAISS, reason="numpy/faiss not installed")
+@pytest.mark.unit
+class TestEmbeddingCacheIntegration:
+    """``_encode_texts`` serves cached chunk texts and encodes only the misses."""
+
+    def test_rebuild_encodes_only_new_chunks(self, sample_chunks, tmp_path):
+        import numpy as np
+
+        first = _hashing_index(embedding_cache_dir=str(tmp_path))
+        first.add_chunks(sample_chunks[:3])
+
+        second = _hashing_index(embedding_cache_dir=str(tmp_path))
+        second._encoder = _CountingEncoder()
+        second.add_chunks(sample_chunks)
+
+        assert second._encoder.encoded == [sample_chunks[3].text]
+        np.testing.assert_allclose(second._vectors[:3], first._vectors, rtol=1e-6)
+        assert _nearest(second, "python programming") == _nearest(first, "python programming")
+
+    def test_queries_are_not_cached(self, sample_chunks, tmp_path):
+        from all2md.search.embedding_cache import EmbeddingCache
+
+        index = _hashing_index(embedding_cache_dir=str(tmp_path))
+        index.add_chunks(sample_chunks)
+        index._run_encoder(["an ad-hoc query"])
+
+        cache = EmbeddingCache(tmp_path, model_name=index.config.model_name, normalize=True)
+        assert len(cache) == len(sample_chunks)
+
+
+def _corpus(count: int) -> list[Chunk]:
+    """Chunks drawn from a small vocabulary so neighbourhoods overlap realistically."""
+    import random
+
+    rng = random.Random(7)
+    words = [f"w{i}" for i in range(300)]
+    return [Chunk(chunk_id=f"c{i}", text=" ".join(rng.choices(words, k=12)), metadata={}) for i in range(count)]
+
+
+@pytest.mark.skipif(not HAS_FAISS, reason="numpy/faiss not installed")
+@pytest.mark.unit
+class TestApproximateIndexes:
+    """IVF/HNSW/PQ index types build, grow, shrink and persist consistently."""
+
+    def test_ivf_falls_back_to_flat_until_trainable(self):
+        index = _hashing_index(index_type="ivf_flat", nlist=8)
+        index.add_chunks(_corpus(20))
+        assert index.built_index_type == "flat"
+
+        index.add_chunks(_corpus(400)[20:])
+        assert index.built_index_type == "ivf_flat"
+        assert index._faiss_index.nlist == 8
+        assert index._faiss_index.ntotal == 400
+
+    def test_ivf_retrains_only_when_lists_double(self):
+        index = _hashing_index(index_type="ivf_flat", nlist=64)
+        chunks = _corpus(400)
+        index.add_chunks(chunks[:100])
+        trained = index._faiss_index
+        assert index._trained_nlist == 2
+
+        index.add_chunks(chunks[100:150])
+        assert index._faiss_index is trained
+
+        index.add_chunks(chunks[150:])
+        assert index._faiss_index is not trained
+        assert index._trained_nlist == 400 // 39
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"index_type": "ivf_flat", "nlist": 4, "nprobe": 4},
+            {"index_type": "hnsw", "hnsw_m": 16},
+            {"index_type": "ivf_pq", "nlist": 2, "nprobe": 2, "pq_m": 64, "pq_nbits": 4},
+        ],
+    )
+    def test_exhaustive_settings_match_flat(self, config):
+        chunks = _corpus(300)
+        flat = _hashing_index()
+        flat.add_chunks(chunks)
+        approximate = _hashing_index(**config)
+        approximate.add_chunks(chunks)
+
+        assert approximate.built_index_type == config["index_type"]
+        hits = total = 0
+        for chunk in chunks[:20]:
+            expected = {cid for cid, _ in _nearest(flat, chunk.text, k=5)}
+            hits += len(expected & {cid for cid, _ in _nearest(approximate, chunk.text, k=5)})
+            total += len(expected)
+        # PQ codes are lossy; IVF with every list probed and HNSW on a tiny graph are near exact.
+        assert hits / total >= (0.6 if config["index_type"] == "ivf_pq" else 0.95)
+
+    @pytest.mark.parametrize("index_type", ["ivf_flat", "hnsw"])
+    def test_remove_chunks_keeps_ids_aligned(self, index_type):
+        chunks = _corpus(200)
+        index = _hashing_index(index_type=index_type, nlist=4, nprobe=4)
+        index.add_chunks(chunks)
+        index.remove_chunks(range(0, 200, 2))
+
+        assert index._faiss_index.ntotal == 100
+        for chunk in chunks[1:20:2]:
+            assert _nearest(index, chunk.text, k=1)[0][0] == chunk.chunk_id
+
+    def test_pq_m_must_divide_dimension(self):
+        index = _hashing_index(index_type="ivf_pq", nlist=2, pq_m=7, pq_nbits=4)
+        with pytest.raises(ValueError, match="pq_m"):
+            index.add_chunks(_corpus(100))
+
+    def test_set_search_params_updates_built_index(self):
+        index = _hashing_index(index_type="ivf_flat", nlist=4, nprobe=1)
+        index.add_chunks(_corpus(200))
+        index.set_search_params(nprobe=3)
+        assert index._faiss_index.nprobe == 3
+
+        hnsw = _hashing_index(index_type="hnsw")
+        hnsw.add_chunks(_corpus(50))
+        hnsw.set_search_params(ef_search=128)
+        assert hnsw._faiss_index.hnsw.efSearch == 128
+
+    def test_trained_index_round_trips_through_write_index(self, tmp_path: Path, monkeypatch):
+        from all2md.search.vector import VectorIndex
+
+        def numpy_faiss_backends(self):
+            self._np = importlib.import_module("numpy")
+            self._faiss = importlib.import_module("faiss")
+
+        monkeypatch.setattr(VectorIndex, "_ensure_backends", numpy_faiss_backends)
+        index = _hashing_index(index_type="ivf_flat", nlist=4, nprobe=2)
+        index.add_chunks(_corpus(200))
+        # ``save``/``load`` also demand sentence-transformers, which the stand-in encoder replaces.
+        VectorIndex.save.__wrapped__(index, tmp_path)
+        assert (tmp_path / "index.faiss").exists()
+
+        monkeypatch.setattr("all2md.search.vector._build_faiss_index", None)  # loading must not retrain
+        loaded = VectorIndex.load.__wrapped__(VectorIndex, tmp_path)
+        loaded._encoder = _HashingEncoder()
+        assert loaded.built_index_type == "ivf_flat"
+        assert loaded.config.index_type == "ivf_flat"
+        assert loaded._faiss_index.nprobe == 2
+        for chunk in _corpus(200)[:10]:
+            assert _nearest(loaded, chunk.text) == _nearest(index, chunk.text)
+
+    def test_stale_faiss_file_is_rebuilt(self, tmp_path: Path, monkeypatch):
+        from all2md.search.vector import VectorIndex
+
+        def numpy_faiss_backends(self):
+            self._np = importlib.import_module("numpy")
+            self._faiss = importlib.import_module("faiss")
+
+        monkeypatch.setattr(VectorIndex, "_ensure_backends", numpy_faiss_backends)
+        index = _hashing_index(index_type="hnsw")
+        index.add_chunks(_corpus(40))
+        VectorIndex.save.__wrapped__(index, tmp_path)
+        (tmp_path / "index.faiss").write_bytes(b"not a faiss index")
+
+        loaded = VectorIndex.load.__wrapped__(VectorIndex, tmp_path)
+        assert loaded.built_index_type == "hnsw"
+        assert loaded._faiss_index.ntotal == 40
+
+
 @pytest.mark.unit
 class TestVectorIndexConfig:
     """Test VectorIndexConfig dataclass."""
@@ -157,6 +407,21 @@ class TestVectorIndexConfig:
         assert config.device == "cuda"
         assert config.normalize_embeddings is False
 
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"index_type": "lsh"}, "index_type"),
+            ({"nlist": 0}, "nlist"),
+            ({"hnsw_ef_search": -1}, "hnsw_ef_search"),
+            ({"pq_nbits": 17}, "pq_nbits"),
+        ],
+    )
+    def test_invalid_index_parameters(self, kwargs, match):
+        from all2md.search.vector import VectorIndexConfig
+
+        with pytest.raises(ValueError, match=match):
+            VectorIndexConfig(**kwargs)
+
 
 @pytest.mark.unit
 class TestSerializeMetadata:
@@ -1,15 +1,28 @@
 """Unit tests for the opt-in conversion cache."""
 
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from all2md import to_ast
+from all2md.ast.binary_serialization import BINARY_FORMAT_VERSION
 from all2md.ast.nodes import Document
 from all2md.conversion_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
     ConversionCache,
     cache_enabled_by_env,
+    cache_limits_from_env,
     get_active_cache,
+    install_worker_cache,
     make_cache_key,
+    memory_limit_from_env,
+    parse_size,
     use_conversion_cache,
+    worker_cache_settings,
 )
 
 pytestmark = pytest.mark.unit
@@ -22,6 +35,11 @@ def _write(path, text=SAMPLE):
     return path
 
 
+def _convert_in_worker(path) -> int:
+    to_ast(path)
+    return id(get_active_cache())
+
+
 class TestActivation:
     def test_disabled_by_default(self):
         assert get_active_cache() is None
@@ -49,6 +67,23 @@ class TestActivation:
             assert cache is None
 
 
+class TestWorkerCache:
+    def test_worker_keeps_one_cache_and_flushes_on_exit(self, tmp_path):
+        src = _write(tmp_path / "doc.md")
+        cache_dir = tmp_path / "cache"
+        with use_conversion_cache(enabled=True, cache_dir=cache_dir, max_bytes=10**6):
+            settings = worker_cache_settings()
+            with ProcessPoolExecutor(max_workers=1, initializer=install_worker_cache, initargs=(settings,)) as pool:
+                cache_ids = list(pool.map(_convert_in_worker, [src] * 3))
+        assert len(set(cache_ids)) == 1
+        lifetime = ConversionCache(cache_dir).lifetime_stats()
+        assert (lifetime.hits, lifetime.misses, lifetime.writes) == (2, 1, 1)
+
+    def test_no_settings_is_a_no_op(self):
+        install_worker_cache(None)
+        assert get_active_cache() is None
+
+
 class TestConversionCacheStore:
     def test_put_get_roundtrip(self, tmp_path):
         cache = ConversionCache(tmp_path)
@@ -68,6 +103,43 @@ class TestConversionCacheStore:
         entry.write_text("{not valid ast json", encoding="utf-8")
         assert cache.get("cafef00d") is None  # swallowed, treated as miss
 
+    def test_entries_are_binary_and_roundtrip_exactly(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        doc = to_ast(SAMPLE.encode("utf-8"), source_format="markdown")
+        cache.put("deadbeef", doc)
+        assert cache._entry_path("deadbeef").read_bytes()[:4] == b"A2MB"
+        assert cache.get("deadbeef") == doc
+
+    def test_format_version_mismatch_is_a_miss(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        cache.put("deadbeef", to_ast(SAMPLE.encode("utf-8"), source_format="markdown"))
+        entry = cache._entry_path("deadbeef")
+        blob = bytearray(entry.read_bytes())
+        struct.pack_into("<H", blob, 4, BINARY_FORMAT_VERSION + 1)
+        entry.write_bytes(bytes(blob))
+        assert cache.get("deadbeef") is None
+
+    def test_schema_digest_mismatch_is_a_miss(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        cache.put("deadbeef", to_ast(SAMPLE.encode("utf-8"), source_format="markdown"))
+        entry = cache._entry_path("deadbeef")
+        blob = bytearray(entry.read_bytes())
+        blob[8:16] = bytes(8)  # a build whose node classes had other fields
+        entry.write_bytes(bytes(blob))
+        assert cache.get("deadbeef") is None
+
+    def test_artifacts_share_the_directory_and_its_bounds(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        cache.put("deadbeef", to_ast(SAMPLE.encode("utf-8"), source_format="markdown"))
+        cache.put_artifact("deadbeef", b"ocr output")
+
+        assert cache.get_artifact("deadbeef") == b"ocr output"
+        assert cache.get("deadbeef") is not None  # same key, separate entry
+        assert cache.get_artifact("cafebabe") is None
+        assert cache.usage()[0] == 2
+        assert cache.clear()[0] == 2
+        assert cache.get_artifact("deadbeef") is None
+
 
 class TestKeying:
     def test_key_changes_with_options_and_format(self, tmp_path):
@@ -84,7 +156,7 @@ class TestToAstIntegration:
         src = _write(tmp_path / "doc.md")
 
         def entry_count():
-            return len(list(cache_dir.rglob("*.json")))
+            return len(list(cache_dir.rglob("*.a2mb")))
 
         with use_conversion_cache(enabled=True, cache_dir=cache_dir):
             to_ast(src)
@@ -111,3 +183,221 @@ class TestToAstIntegration:
         with use_conversion_cache(enabled=True, cache_dir=cache_dir):
             to_ast(SAMPLE.encode("utf-8"), source_format="markdown")
         assert not cache_dir.exists()
+
+
+def _doc(text: str = SAMPLE) -> Document:
+    return to_ast(text.encode("utf-8"), source_format="markdown")
+
+
+def _age(cache: ConversionCache, key: str, seconds_ago: float) -> None:
+    path = cache._entry_path(key)
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+class TestEviction:
+    def test_entry_bound_evicts_least_recently_used(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_entries=3)
+        for index, key in enumerate(["aa01", "bb02", "cc03"]):
+            cache.put(key, _doc())
+            _age(cache, key, 100 - index)
+        # A hit refreshes recency, so the oldest write survives the next eviction.
+        assert cache.get("aa01") is not None
+        cache.put("dd04", _doc())
+        assert cache.get("bb02") is None
+        assert cache.get("aa01") is not None
+        assert cache.usage()[0] <= 3
+        assert cache.stats.evictions >= 1
+
+    def test_size_bound_evicts_to_low_water(self, tmp_path):
+        probe = ConversionCache(tmp_path / "probe")
+        probe.put("ff00", _doc())
+        entry_size = probe.usage()[1]
+
+        cache = ConversionCache(tmp_path / "cache", max_bytes=entry_size * 4)
+        for index in range(10):
+            key = f"{index:02d}ab"
+            cache.put(key, _doc())
+            _age(cache, key, 100 - index)
+        count, total = cache.usage()
+        assert total <= entry_size * 4
+        assert cache.get("09ab") is not None  # newest survives
+        assert cache.get("00ab") is None
+        assert cache.stats.bytes_evicted >= entry_size * 6
+
+    def test_unbounded_cache_never_evicts(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        for index in range(5):
+            cache.put(f"{index:02d}cd", _doc())
+        assert cache.usage()[0] == 5
+        assert cache.stats.evictions == 0
+
+    def test_legacy_json_entries_are_evicted_first(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_entries=2)
+        legacy = tmp_path / "ee" / "ee99.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text("{}", encoding="utf-8")
+        cache.put("aa01", _doc())
+        cache.put("bb02", _doc())
+        assert not legacy.exists()
+        assert cache.get("bb02") is not None
+
+    def test_prune_and_clear(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        for index in range(6):
+            key = f"{index:02d}ef"
+            cache.put(key, _doc())
+            _age(cache, key, 100 - index)
+        removed, freed = cache.prune(max_entries=2)
+        assert removed == 4 and freed > 0
+        assert cache.get("05ef") is not None
+        assert cache.clear()[0] == 2
+        assert cache.usage() == (0, 0)
+
+    def test_concurrent_puts_and_gets_stay_within_bounds(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_entries=8)
+        doc = _doc()
+        errors: list[BaseException] = []
+
+        def worker(offset: int) -> None:
+            try:
+                for index in range(25):
+                    key = f"{(offset * 25 + index) % 40:02d}{offset:02x}"
+                    cache.put(key, doc)
+                    cache.get(key)
+            except BaseException as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert cache.usage()[0] <= 8
+        stats = cache.stats
+        assert stats.writes == 100
+        assert stats.hits + stats.misses == 100
+        assert not list(tmp_path.rglob("*.tmp"))
+
+
+class TestStats:
+    def test_counters_track_hits_misses_and_bytes(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        assert cache.get("aa01") is None
+        cache.put("aa01", _doc())
+        cache.get("aa01")
+        cache.get("aa01")
+        stats = cache.stats
+        size = cache._entry_path("aa01").stat().st_size
+        assert (stats.hits, stats.misses, stats.writes) == (2, 1, 1)
+        assert stats.bytes_written == size
+        assert stats.bytes_read == 2 * size
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_active_cache_exposes_stats_and_flushes_lifetime(self, tmp_path):
+        src = _write(tmp_path / "doc.md")
+        cache_dir = tmp_path / "cache"
+        for _ in range(2):
+            with use_conversion_cache(enabled=True, cache_dir=cache_dir):
+                to_ast(src)
+                to_ast(src)
+                active = get_active_cache()
+                assert active is not None
+        assert active.stats.hits == 2  # the second block's hits only
+        lifetime = ConversionCache(cache_dir).lifetime_stats()
+        assert (lifetime.hits, lifetime.misses, lifetime.writes) == (3, 1, 1)
+
+    def test_limits_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ALL2MD_CACHE_MAX_SIZE", "1.5K")
+        monkeypatch.setenv("ALL2MD_CACHE_MAX_ENTRIES", "7")
+        assert cache_limits_from_env() == (1536, 7)
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path) as cache:
+            assert (cache.max_bytes, cache.max_entries) == (1536, 7)
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path, max_bytes=0, max_entries=3) as cache:
+            assert (cache.max_bytes, cache.max_entries) == (None, 3)
+        monkeypatch.delenv("ALL2MD_CACHE_MAX_SIZE")
+        monkeypatch.delenv("ALL2MD_CACHE_MAX_ENTRIES")
+        assert cache_limits_from_env() == (DEFAULT_CACHE_MAX_BYTES, None)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("1048576", 1048576), ("500MB", 500 * 1024**2), ("2g", 2 * 1024**3), ("1.5GiB", int(1.5 * 1024**3))],
+    )
+    def test_parse_size(self, text, expected):
+        assert parse_size(text) == expected
+
+    def test_parse_size_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            parse_size("lots")
+
+
+class TestMemoryTier:
+    def test_hit_is_served_from_memory(self, tmp_path):
+        cache = ConversionCache(tmp_path, memory_max_bytes=1024**2)
+        doc = _doc()
+        cache.put("aa01", doc)
+        cache._entry_path("aa01").unlink()  # only the in-process tier can answer now
+        assert cache.get("aa01") == doc
+        assert cache.stats.memory_hits == 1
+
+    def test_disk_hit_is_promoted(self, tmp_path):
+        ConversionCache(tmp_path).put("aa01", _doc())
+        cache = ConversionCache(tmp_path, memory_max_bytes=1024**2)
+        cache.get("aa01")
+        assert cache.memory_usage[0] == 1
+        cache.get("aa01")
+        assert (cache.stats.hits, cache.stats.memory_hits) == (2, 1)
+
+    def test_mutating_a_hit_does_not_poison_the_cache(self, tmp_path):
+        cache = ConversionCache(tmp_path, memory_max_bytes=1024**2)
+        original = _doc()
+        cache.put("aa01", original)
+        pristine = cache.get("aa01")
+
+        first = cache.get("aa01")
+        first.metadata["title"] = "stamped by the caller"
+        first.children.clear()
+        original.children.append(first)  # the caller's own document, after put
+
+        assert cache.get("aa01") == pristine
+        assert cache.get("aa01") is not cache.get("aa01")
+
+    def test_budget_evicts_least_recently_used(self, tmp_path):
+        sized = ConversionCache(tmp_path / "probe", memory_max_bytes=1024**2)
+        sized.put("ff00", _doc())
+        one = sized.memory_usage[1]
+
+        cache = ConversionCache(tmp_path / "cache", memory_max_bytes=one * 2)
+        for key in ("aa01", "bb02"):
+            cache.put(key, _doc())
+        cache.get("aa01")  # most recently used now
+        cache.put("cc03", _doc())
+        assert cache.memory_usage == (2, one * 2)
+        cache._entry_path("bb02").unlink()
+        cache._entry_path("aa01").unlink()
+        assert cache.get("aa01") is not None
+        assert cache.get("bb02") is None
+
+    def test_oversized_document_is_not_held(self, tmp_path):
+        cache = ConversionCache(tmp_path, memory_max_bytes=16)
+        cache.put("aa01", _doc())
+        assert cache.memory_usage == (0, 0)
+        assert cache.get("aa01") is not None  # still served from disk
+
+    def test_disabled_tier_and_clear(self, tmp_path, monkeypatch):
+        cache = ConversionCache(tmp_path)
+        cache.put("aa01", _doc())
+        cache.get("aa01")
+        assert cache.memory_usage == (0, 0)
+
+        monkeypatch.setenv("ALL2MD_CACHE_MEMORY_SIZE", "0")
+        assert memory_limit_from_env() is None
+        monkeypatch.setenv("ALL2MD_CACHE_MEMORY_SIZE", "64M")
+        with use_conversion_cache(enabled=True, cache_dir=tmp_path) as active:
+            assert active.memory_max_bytes == 64 * 1024**2
+            active.get("aa01")
+            assert active.memory_usage[0] == 1
+            active.clear()
+            assert active.memory_usage == (0, 0)
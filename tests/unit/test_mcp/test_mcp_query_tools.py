@@ -1,7 +1,5 @@
 """Unit tests for MCP query tool implementations (search, diff, outline)."""
 
-import importlib.util
-
 import pytest
 
 from all2md.mcp.config import MCPConfig
@@ -17,8 +15,6 @@ from all2md.mcp.schemas import (
 )
 from all2md.mcp.security import MCPSecurityError, prepare_allowlist_dirs
 
-HAS_BM25 = importlib.util.find_spec("rank_bm25") is not None
-
 SAMPLE_MD = """# Introduction
 
 The alpha protocol governs the handshake.
@@ -195,7 +191,6 @@ class TestSearch:
         with pytest.raises(ValueError, match="No readable documents"):
             search_documents_impl(SearchDocumentsInput(query="alpha", mode="grep", paths=[str(empty)]), config)
 
-    @pytest.mark.skipif(not HAS_BM25, reason="rank-bm25 not installed")
     def test_keyword_mode_ranks_results(self, tmp_path):
         _write_corpus(tmp_path)
         config = _make_config(tmp_path)
@@ -207,7 +202,6 @@ class TestSearch:
         # The alpha-heavy document should be among the results
         assert any("alpha" in item.snippet.lower() for item in result.results)
 
-    @pytest.mark.skipif(not HAS_BM25, reason="rank-bm25 not installed")
     def test_keyword_persistence_creates_and_reuses_index(self, tmp_path):
         corpus = tmp_path / "corpus"
         corpus.mkdir()
@@ -232,7 +226,6 @@ class TestSearch:
         )
         assert second.total >= 1
 
-    @pytest.mark.skipif(not HAS_BM25, reason="rank-bm25 not installed")
     def test_keyword_persistence_rebuilds_when_corpus_changes(self, tmp_path):
         """A persisted index must not serve stale results after the corpus changes."""
         corpus = tmp_path / "corpus"
@@ -258,7 +251,6 @@ class TestSearch:
         assert fresh.total >= 1
         assert any("zeta" in item.snippet.lower() for item in fresh.results)
 
-    @pytest.mark.skipif(not HAS_BM25, reason="rank-bm25 not installed")
     def test_index_dir_outside_write_allowlist_denied(self, tmp_path):
         corpus = tmp_path / "corpus"
         corpus.mkdir()
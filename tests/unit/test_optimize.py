@@ -474,6 +474,23 @@ class TestSearch:
 
         assert not any(c.origin.startswith("preset:") for c in report.candidates)
 
+    def test_an_executor_changes_nothing_but_the_schedule(self):
+        """Batched evaluation must walk the same path and report the same pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        knobs = {"a": [True, False], "b": ["x", "y", "z"], "irrelevant": [1, 2]}
+
+        def evaluate(options):
+            words = 10 + (5 if options.get("a") else 0) + (3 if options.get("b") == "y" else 0)
+            return DocumentMetrics(blocks=1, words=words, unique_words=words)
+
+        presets = {"quality": {"a": True, "irrelevant": 2}}
+        sequential = search(knobs, evaluate, presets=presets, rounds=2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batched = search(knobs, evaluate, presets=presets, rounds=2, executor=executor)
+
+        assert batched.to_dict() == sequential.to_dict()
+
 
 @pytest.mark.unit
 def test_tunable_knobs_is_empty_for_an_untuned_format():
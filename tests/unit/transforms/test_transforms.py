@@ -1,6 +1,8 @@
 #  Copyright (c) 2025 Tom Villani, Ph.D.
 """Integration tests for transform pipeline."""
 
+import io
+
 import pytest
 
 from all2md.ast import Document, Heading, Image, Link, Paragraph, Text
@@ -420,6 +422,64 @@ class TestPipelineClass:
         assert result == b"rendered as bytes"
         assert isinstance(result, bytes)
 
+    def test_pipeline_streams_to_text_stream(self, sample_document):
+        """Test that Markdown is written to a text stream as it is rendered."""
+
+        class RecordingStream(io.StringIO):
+            """StringIO that records every write."""
+
+            def __init__(self):
+                super().__init__()
+                self.chunks = []
+
+            def write(self, s):
+                self.chunks.append(s)
+                return super().write(s)
+
+        expected = Pipeline().execute(sample_document)
+        stream = RecordingStream()
+        result = Pipeline().execute(sample_document, output=stream)
+
+        assert result is None
+        assert stream.getvalue() == expected
+        assert len(stream.chunks) > 1
+        assert stream.chunks[0] in expected and stream.chunks[0] != expected
+
+    def test_pipeline_streams_to_path(self, sample_document, tmp_path):
+        """Test that a path target receives the rendered Markdown."""
+        expected = Pipeline().execute(sample_document)
+        target = tmp_path / "out.md"
+
+        assert Pipeline().execute(sample_document, output=target) is None
+        assert target.read_text(encoding="utf-8") == expected
+
+    def test_failed_render_leaves_existing_file(self, sample_document, tmp_path, monkeypatch):
+        """Test that a render failure does not truncate an existing output file."""
+        from all2md.exceptions import RenderingError
+        from all2md.renderers.markdown import MarkdownRenderer
+
+        def fail_midway(self, document, stream):
+            stream.write("partial")
+            raise ValueError("boom")
+
+        monkeypatch.setattr(MarkdownRenderer, "render_to_stream", fail_midway)
+        target = tmp_path / "out.md"
+        target.write_text("previous", encoding="utf-8")
+
+        with pytest.raises(RenderingError):
+            Pipeline().execute(sample_document, output=target)
+
+        assert target.read_text(encoding="utf-8") == "previous"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_post_render_hook_applies_with_output(self, sample_document):
+        """Test that post_render hooks still run when an output target is given."""
+        pipeline = Pipeline(hooks={"post_render": [lambda text, ctx: text.upper()]})
+        stream = io.StringIO()
+
+        assert pipeline.execute(sample_document, output=stream) is None
+        assert stream.getvalue().startswith("# TITLE")
+
 
 # Dependency resolution tests
 
@@ -2,7 +2,13 @@
 
 import pytest
 
-from all2md.utils.fingerprint import bytes_signature, corpus_fingerprint, file_signature
+from all2md.utils.fingerprint import (
+    bytes_signature,
+    corpus_fingerprint,
+    file_signature,
+    signatures_fingerprint,
+    source_signature,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -69,3 +75,15 @@ class TestCorpusFingerprint:
         # Same bytes → same digest; different bytes → different digest.
         assert corpus_fingerprint([b"payload"]) == corpus_fingerprint([b"payload"])
         assert corpus_fingerprint([b"payload"]) != corpus_fingerprint([b"other"])
+
+
+class TestSignaturesFingerprint:
+    def test_matches_corpus_fingerprint(self, tmp_path):
+        a = _write(tmp_path / "a.txt", "alpha")
+        missing = tmp_path / "gone.txt"
+        sources = [a, missing, b"raw"]
+        signatures = [source_signature(source) for source in sources]
+        assert signatures[1] == {"path": str(missing), "missing": True}
+        assert signatures_fingerprint(reversed(signatures), extra={"k": 1}) == corpus_fingerprint(
+            sources, extra={"k": 1}
+        )
@@ -0,0 +1,45 @@
+#  Copyright (c) 2025 Tom Villani, Ph.D.
+"""Unit tests for the bounded, ordered process-pool submission helper."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from all2md.utils.parallel import in_flight_limit, submit_in_order
+
+
+def _scale(item: int, factor: int) -> int:
+    return item * factor
+
+
+class TestSubmitInOrder:
+    """Items are pulled lazily, bounded by the in-flight limit, and yielded in order."""
+
+    def test_results_come_back_in_order_with_bounded_read_ahead(self):
+        pulled: list[int] = []
+        yielded: list[int] = []
+
+        def items():
+            for i in range(10):
+                pulled.append(i)
+                # Never more than ``limit`` items read ahead of the consumer
+                assert len(pulled) - len(yielded) <= 3
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for item, future in submit_in_order(executor, items(), _scale, 10, limit=3):
+                yielded.append(item)
+                assert future is not None
+                assert future.result() == item * 10
+
+        assert yielded == list(range(10))
+
+    def test_bypassed_items_keep_their_place_without_a_future(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pairs = list(submit_in_order(executor, [1, 2, 3], _scale, 2, limit=2, bypass=lambda item: item == 2))
+
+        assert [item for item, _ in pairs] == [1, 2, 3]
+        assert [future is None for _, future in pairs] == [False, True, False]
+
+
+def test_in_flight_limit_scales_with_workers():
+    assert in_flight_limit(3) == 6
+    assert in_flight_limit(None) >= 2